@@ -4,6 +4,10 @@ Creates and configures the FastAPI application with middleware,
 exception handlers, and route registration.
 """
 
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
@@ -11,32 +15,64 @@ from fastapi.responses import JSONResponse
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from pydantic import ValidationError
 
-from ruche.api.dependencies import get_settings
+from ruche.api.dependencies import (
+    close_audit_store,
+    get_settings,
+    start_embedding_worker,
+    stop_embedding_worker,
+)
 from ruche.api.exceptions import FocalAPIError
 from ruche.api.middleware.context import RequestContextMiddleware
 from ruche.api.middleware.rate_limit import RateLimitMiddleware
 from ruche.api.models.errors import ErrorBody, ErrorCode, ErrorDetail, ErrorResponse
 from ruche.api.routes import register_routes
-from ruche.observability.logging import get_logger
+from ruche.api.warmup import run_warmup
+from ruche.observability.logging import get_logger, setup_logging_from_config
 from ruche.observability.middleware import LoggingContextMiddleware
 
 logger = get_logger(__name__)
 
 
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Run startup warm-up in the background; /ready flips when it finishes.
+
+    The embedding job worker runs for the app's lifetime. On shutdown,
+    buffered audit records are flushed.
+    """
+    warmup_task = asyncio.create_task(run_warmup(get_settings()))
+    try:
+        await start_embedding_worker()
+    except Exception as e:
+        logger.error("embedding_worker_start_failed", error=str(e))
+    try:
+        yield
+    finally:
+        if not warmup_task.done():
+            warmup_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await warmup_task
+        await stop_embedding_worker()
+        await close_audit_store()
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application.
 
     This factory function creates a fully configured FastAPI app with:
+    - Structured logging configured from settings
     - CORS middleware
     - Request context middleware
     - Global exception handlers
     - OpenTelemetry instrumentation
     - All API routes registered
+    - Startup warm-up (readiness reported on /ready)
 
     Returns:
         Configured FastAPI application
     """
     settings = get_settings()
+    setup_logging_from_config(settings.observability.logging)
 
     app = FastAPI(
         title="Focal API",
@@ -45,6 +81,7 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        lifespan=_lifespan,
     )
 
     # Configure CORS
@@ -66,7 +103,7 @@ def create_app() -> FastAPI:
     app.add_middleware(
         RateLimitMiddleware,
         enabled=settings.api.rate_limit.enabled,
-        exclude_paths=["/health", "/metrics", "/docs", "/redoc", "/openapi.json"],
+        exclude_paths=["/health", "/ready", "/metrics", "/docs", "/redoc", "/openapi.json"],
     )
 
     # Register exception handlers
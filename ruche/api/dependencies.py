@@ -17,6 +17,7 @@ from ruche.brains.focal.stores.inmemory import InMemoryAgentConfigStore
 from ruche.brains.focal.stores.postgres import PostgresAgentConfigStore
 from ruche.audit.store import AuditStore
 from ruche.audit.stores.inmemory import InMemoryAuditStore
+from ruche.audit.stores.batch_writer import AuditBatchWriter
 from ruche.audit.stores.postgres import PostgresAuditStore
 from ruche.config.loader import load_config
 from ruche.config.settings import Settings, set_toml_config
@@ -26,10 +27,17 @@ from ruche.conversation.stores.redis import RedisSessionStore
 from ruche.infrastructure.db.pool import PostgresPool
 from ruche.observability.logging import get_logger
 from ruche.infrastructure.providers.embedding import EmbeddingProvider
+from ruche.infrastructure.providers.llm import LLMResponseCache
 from ruche.infrastructure.stores.memory.interface import MemoryStore
 from ruche.infrastructure.stores.memory.inmemory import InMemoryMemoryStore
 from ruche.infrastructure.stores.memory.postgres import PostgresMemoryStore
 from ruche.vector import VectorStore, EmbeddingManager, create_vector_store
+from ruche.vector.jobs import (
+    EmbeddingJobQueue,
+    EmbeddingJobWorker,
+    InMemoryEmbeddingJobQueue,
+    PostgresEmbeddingJobQueue,
+)
 
 logger = get_logger(__name__)
 
@@ -45,6 +53,9 @@ _memory_store: MemoryStore | None = None
 _vector_store: VectorStore | None = None
 _embedding_provider: EmbeddingProvider | None = None
 _embedding_manager: EmbeddingManager | None = None
+_embedding_job_queue: EmbeddingJobQueue | None = None
+_embedding_job_worker: EmbeddingJobWorker | None = None
+_llm_response_cache: LLMResponseCache | None = None
 _alignment_engine: AlignmentEngine | None = None
 
 
@@ -116,7 +127,7 @@ async def get_config_store() -> AgentConfigStore:
     if _config_store is None:
         try:
             pool = await get_postgres_pool()
-            _config_store = PostgresAgentConfigStore(pool)
+            _config_store = PostgresAgentConfigStore(pool, get_settings().storage.ann)
             logger.info("config_store_initialized", store_type="postgres")
         except Exception as e:
             logger.warning(
@@ -141,7 +152,9 @@ async def get_session_store() -> SessionStore:
     if _session_store is None:
         try:
             client = await get_redis_client()
-            _session_store = RedisSessionStore(client)
+            _session_store = RedisSessionStore(
+                client, persistence=get_settings().storage.session_persistence
+            )
             logger.info("session_store_initialized", store_type="redis")
         except Exception as e:
             logger.warning(
@@ -156,7 +169,8 @@ async def get_session_store() -> SessionStore:
 async def get_audit_store() -> AuditStore:
     """Get the AuditStore instance.
 
-    Uses PostgresAuditStore with shared connection pool.
+    Uses PostgresAuditStore with shared connection pool, writing through
+    an AuditBatchWriter unless storage.audit_writer.enabled is off.
     Falls back to InMemoryAuditStore if database unavailable.
 
     Returns:
@@ -166,7 +180,10 @@ async def get_audit_store() -> AuditStore:
     if _audit_store is None:
         try:
             pool = await get_postgres_pool()
-            _audit_store = PostgresAuditStore(pool)
+            writer_config = get_settings().storage.audit_writer
+            writer = AuditBatchWriter(pool, writer_config) if writer_config.enabled else None
+            store = PostgresAuditStore(pool, writer=writer)
+            _audit_store = store
             logger.info("audit_store_initialized", store_type="postgres")
         except Exception as e:
             logger.warning(
@@ -175,9 +192,22 @@ async def get_audit_store() -> AuditStore:
             )
             _audit_store = InMemoryAuditStore()
             logger.info("audit_store_initialized", store_type="inmemory")
+        else:
+            try:
+                await store.ensure_partitions(writer_config.partition_months_ahead)
+            except Exception as e:
+                logger.warning("audit_partitions_not_ensured", error=str(e))
     return _audit_store
 
 
+async def close_audit_store() -> None:
+    """Flush and close the AuditStore, if one was created."""
+    global _audit_store
+    if _audit_store is not None:
+        await _audit_store.close()
+        _audit_store = None
+
+
 async def get_memory_store() -> MemoryStore:
     """Get the MemoryStore instance.
 
@@ -191,7 +221,8 @@ async def get_memory_store() -> MemoryStore:
     if _memory_store is None:
         try:
             pool = await get_postgres_pool()
-            _memory_store = PostgresMemoryStore(pool)
+            storage = get_settings().storage
+            _memory_store = PostgresMemoryStore(pool, storage.ann, storage.text_search)
             logger.info("memory_store_initialized", store_type="postgres")
         except Exception as e:
             logger.warning(
@@ -295,12 +326,101 @@ def get_embedding_manager(
     return _embedding_manager
 
 
+async def get_embedding_job_queue() -> EmbeddingJobQueue:
+    """Get the EmbeddingJobQueue instance.
+
+    Uses PostgresEmbeddingJobQueue with shared connection pool.
+    Falls back to InMemoryEmbeddingJobQueue if database unavailable.
+
+    Returns:
+        EmbeddingJobQueue for rule, scenario and intent embedding jobs
+    """
+    global _embedding_job_queue
+    if _embedding_job_queue is None:
+        try:
+            pool = await get_postgres_pool()
+            _embedding_job_queue = PostgresEmbeddingJobQueue(pool)
+            logger.info("embedding_job_queue_initialized", store_type="postgres")
+        except Exception as e:
+            logger.warning(
+                "embedding_job_queue_postgres_failed_using_inmemory",
+                error=str(e),
+            )
+            _embedding_job_queue = InMemoryEmbeddingJobQueue()
+            logger.info("embedding_job_queue_initialized", store_type="inmemory")
+    return _embedding_job_queue
+
+
+async def start_embedding_worker() -> None:
+    """Start the embedding job worker unless jobs.embeddings.enabled is off."""
+    global _embedding_job_worker
+    settings = get_settings()
+    if not settings.jobs.embeddings.enabled or _embedding_job_worker is not None:
+        return
+
+    embedding_provider = get_embedding_provider(settings)
+    embedding_manager = None
+    if settings.storage.vector.sync_to_vector_store:
+        embedding_manager = get_embedding_manager(get_vector_store(settings), embedding_provider)
+    _embedding_job_worker = EmbeddingJobWorker(
+        queue=await get_embedding_job_queue(),
+        config_store=await get_config_store(),
+        embedding_provider=embedding_provider,
+        embedding_manager=embedding_manager,
+        config=settings.jobs.embeddings,
+    )
+    await _embedding_job_worker.start()
+
+
+async def stop_embedding_worker() -> None:
+    """Stop the embedding job worker, if one was started."""
+    global _embedding_job_worker
+    if _embedding_job_worker is not None:
+        await _embedding_job_worker.stop()
+        _embedding_job_worker = None
+
+
+async def get_llm_response_cache(
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> LLMResponseCache | None:
+    """Get the shared LLM response cache.
+
+    Returns None unless pipeline.response_cache is enabled. Uses the shared
+    Redis client as L2 when configured, falling back to in-process only.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        LLMResponseCache or None
+    """
+    global _llm_response_cache
+    cache_config = settings.pipeline.response_cache
+    if not cache_config.enabled:
+        return None
+    if _llm_response_cache is None:
+        redis_client = None
+        if cache_config.l2_enabled:
+            try:
+                redis_client = await get_redis_client()
+            except Exception as e:
+                logger.warning("llm_cache_redis_unavailable", error=str(e))
+        _llm_response_cache = LLMResponseCache(cache_config, redis=redis_client)
+        logger.info(
+            "llm_response_cache_initialized",
+            l2=redis_client is not None,
+            steps=cache_config.steps,
+        )
+    return _llm_response_cache
+
+
 def get_alignment_engine(
     config_store: Annotated[AgentConfigStore, Depends(get_config_store)],
     session_store: Annotated[SessionStore, Depends(get_session_store)],
     audit_store: Annotated[AuditStore, Depends(get_audit_store)],
     embedding_provider: Annotated[EmbeddingProvider, Depends(get_embedding_provider)],
     settings: Annotated[Settings, Depends(get_settings)],
+    response_cache: Annotated[LLMResponseCache | None, Depends(get_llm_response_cache)] = None,
 ) -> AlignmentEngine:
     """Get the AlignmentEngine instance.
 
@@ -313,18 +433,26 @@ def get_alignment_engine(
         audit_store: Store for audit records
         embedding_provider: Embedding provider
         settings: Application settings
+        response_cache: Shared LLM response cache (None when disabled)
 
     Returns:
         AlignmentEngine for processing turns
     """
     global _alignment_engine
     if _alignment_engine is None:
+        embedding_manager = None
+        if settings.storage.vector.sync_to_vector_store:
+            embedding_manager = get_embedding_manager(
+                get_vector_store(settings), embedding_provider
+            )
         _alignment_engine = AlignmentEngine(
             config_store=config_store,
             embedding_provider=embedding_provider,
             session_store=session_store,
             audit_store=audit_store,
             pipeline_config=settings.pipeline,
+            response_cache=response_cache,
+            embedding_manager=embedding_manager,
         )
         logger.info("alignment_engine_initialized")
     return _alignment_engine
@@ -339,6 +467,7 @@ MemoryStoreDep = Annotated[MemoryStore, Depends(get_memory_store)]
 VectorStoreDep = Annotated[VectorStore, Depends(get_vector_store)]
 EmbeddingProviderDep = Annotated[EmbeddingProvider, Depends(get_embedding_provider)]
 EmbeddingManagerDep = Annotated[EmbeddingManager, Depends(get_embedding_manager)]
+EmbeddingJobQueueDep = Annotated[EmbeddingJobQueue, Depends(get_embedding_job_queue)]
 AlignmentEngineDep = Annotated[AlignmentEngine, Depends(get_alignment_engine)]
 
 
@@ -349,10 +478,13 @@ async def reset_dependencies() -> None:
     Closes connections before resetting.
     """
     global _config_store, _session_store, _audit_store, _memory_store, _alignment_engine
-    global _vector_store, _embedding_provider, _embedding_manager
-    global _postgres_pool, _redis_client
+    global _vector_store, _embedding_provider, _embedding_manager, _llm_response_cache
+    global _embedding_job_queue, _postgres_pool, _redis_client
+
+    # Close connections (buffered audit records are flushed first)
+    await stop_embedding_worker()
+    await close_audit_store()
 
-    # Close connections
     if _postgres_pool is not None:
         await _postgres_pool.close()
         _postgres_pool = None
@@ -368,5 +500,7 @@ async def reset_dependencies() -> None:
     _vector_store = None
     _embedding_provider = None
     _embedding_manager = None
+    _embedding_job_queue = None
+    _llm_response_cache = None
     _alignment_engine = None
     get_settings.cache_clear()
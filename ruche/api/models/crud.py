@@ -317,6 +317,7 @@ class PublishStatusResponse(BaseModel):
     last_published_at: str | None
     last_published_by: str | None
     changes_since_publish: dict[str, int]
+    embeddings_pending: int = Field(default=0, description="Embedding jobs not yet processed")
 
 
 class PublishRequest(BaseModel):
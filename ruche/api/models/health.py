@@ -36,3 +36,19 @@ class HealthResponse(BaseModel):
 
     timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
     """When this health check was performed."""
+
+
+class ReadinessResponse(BaseModel):
+    """Readiness status response for GET /ready."""
+
+    status: Literal["ready", "warming_up"]
+    """Whether startup warm-up has finished."""
+
+    stages: dict[str, str] = Field(default_factory=dict)
+    """Outcome of each warm-up stage."""
+
+    started_at: datetime | None = None
+    """When warm-up started."""
+
+    completed_at: datetime | None = None
+    """When warm-up finished."""
@@ -27,14 +27,17 @@ class PaginatedResponse(BaseModel, Generic[T]):
             "total": 100,
             "limit": 20,
             "offset": 0,
-            "has_more": true
+            "has_more": true,
+            "next_cursor": "eyJrIjoi..."
         }
     """
 
     items: list[T]
     """List of items for this page."""
 
-    total: int = Field(..., ge=0, description="Total number of items across all pages")
+    total: int | None = Field(
+        ..., ge=0, description="Total number of items across all pages (None if not counted)"
+    )
 
     limit: int = Field(..., ge=1, description="Number of items requested per page")
 
@@ -44,6 +47,14 @@ class PaginatedResponse(BaseModel, Generic[T]):
         default=False, description="Whether there are more items after this page"
     )
 
+    next_cursor: str | None = Field(
+        default=None, description="Cursor for the next page (keyset-paginated listings)"
+    )
+
+    total_is_estimate: bool = Field(
+        default=False, description="Whether total was capped and is a lower bound"
+    )
+
     @classmethod
     def create(
         cls, items: list[T], total: int, limit: int, offset: int
@@ -13,7 +13,8 @@ from ruche.api.dependencies import (
     SessionStoreDep,
     SettingsDep,
 )
-from ruche.api.models.health import ComponentHealth, HealthResponse
+from ruche.api.models.health import ComponentHealth, HealthResponse, ReadinessResponse
+from ruche.api.warmup import get_warmup_state
 from ruche.observability.logging import get_logger
 
 logger = get_logger(__name__)
@@ -109,6 +110,31 @@ async def health_check(
     return response
 
 
+@router.get("/ready", response_model=ReadinessResponse)
+async def readiness_check(response: Response) -> ReadinessResponse:
+    """Report whether startup warm-up has finished.
+
+    Returns 503 while warm-up is running so load balancers keep traffic
+    away from cold instances; /health stays a pure liveness check.
+
+    Args:
+        response: Response (status code set to 503 while warming up)
+
+    Returns:
+        ReadinessResponse with warm-up progress
+    """
+    state = get_warmup_state()
+    if not state.ready:
+        response.status_code = 503
+
+    return ReadinessResponse(
+        status="ready" if state.ready else "warming_up",
+        stages=dict(state.stages),
+        started_at=state.started_at,
+        completed_at=state.completed_at,
+    )
+
+
 @router.get("/metrics")
 async def get_metrics() -> Response:
     """Get Prometheus metrics.
@@ -5,7 +5,7 @@ from uuid import UUID
 from fastapi import APIRouter, BackgroundTasks
 
 from ruche.brains.focal.models import PublishJob
-from ruche.api.dependencies import AgentConfigStoreDep
+from ruche.api.dependencies import AgentConfigStoreDep, EmbeddingJobQueueDep, get_settings
 from ruche.api.exceptions import (
     AgentNotFoundError,
     PublishInProgressError,
@@ -30,11 +30,17 @@ router = APIRouter(prefix="/agents/{agent_id}/publish")
 _publish_service: PublishService | None = None
 
 
-def _get_publish_service(config_store: AgentConfigStoreDep) -> PublishService:
+def _get_publish_service(
+    config_store: AgentConfigStoreDep, embedding_jobs: EmbeddingJobQueueDep
+) -> PublishService:
     """Get or create the publish service."""
     global _publish_service
     if _publish_service is None:
-        _publish_service = PublishService(config_store)
+        _publish_service = PublishService(
+            config_store,
+            embedding_jobs,
+            embedding_wait_seconds=get_settings().jobs.embeddings.publish_wait_seconds,
+        )
     return _publish_service
 
 
@@ -72,6 +78,7 @@ async def get_publish_status(
     agent_id: UUID,
     tenant_context: TenantContextDep,
     config_store: AgentConfigStoreDep,
+    embedding_jobs: EmbeddingJobQueueDep,
 ) -> PublishStatusResponse:
     """Get current publish status for an agent."""
     logger.debug(
@@ -82,7 +89,7 @@ async def get_publish_status(
 
     await _verify_agent_exists(config_store, tenant_context.tenant_id, agent_id)
 
-    service = _get_publish_service(config_store)
+    service = _get_publish_service(config_store, embedding_jobs)
     status = await service.get_publish_status(tenant_context.tenant_id, agent_id)
 
     return PublishStatusResponse(
@@ -92,6 +99,7 @@ async def get_publish_status(
         last_published_at=status.get("last_published_at"),
         last_published_by=status.get("last_published_by"),
         changes_since_publish=status.get("changes_since_publish", {}),
+        embeddings_pending=status.get("embeddings_pending", 0),
     )
 
 
@@ -101,6 +109,7 @@ async def initiate_publish(
     request: PublishRequest,
     tenant_context: TenantContextDep,
     config_store: AgentConfigStoreDep,
+    embedding_jobs: EmbeddingJobQueueDep,
     background_tasks: BackgroundTasks,
 ) -> PublishJobResponse:
     """Initiate a publish operation.
@@ -116,7 +125,7 @@ async def initiate_publish(
 
     await _verify_agent_exists(config_store, tenant_context.tenant_id, agent_id)
 
-    service = _get_publish_service(config_store)
+    service = _get_publish_service(config_store, embedding_jobs)
 
     try:
         job = await service.create_publish_job(
@@ -146,11 +155,12 @@ async def get_publish_job(
     publish_id: UUID,
     tenant_context: TenantContextDep,
     config_store: AgentConfigStoreDep,
+    embedding_jobs: EmbeddingJobQueueDep,
 ) -> PublishJobResponse:
     """Get the status of a publish job."""
     await _verify_agent_exists(config_store, tenant_context.tenant_id, agent_id)
 
-    service = _get_publish_service(config_store)
+    service = _get_publish_service(config_store, embedding_jobs)
     job = await service.get_job(tenant_context.tenant_id, publish_id)
 
     if job is None:
@@ -165,6 +175,7 @@ async def rollback_to_version(
     request: RollbackRequest,
     tenant_context: TenantContextDep,
     config_store: AgentConfigStoreDep,
+    embedding_jobs: EmbeddingJobQueueDep,
 ) -> PublishJobResponse:
     """Rollback agent configuration to a previous version."""
     logger.info(
@@ -176,7 +187,7 @@ async def rollback_to_version(
 
     await _verify_agent_exists(config_store, tenant_context.tenant_id, agent_id)
 
-    service = _get_publish_service(config_store)
+    service = _get_publish_service(config_store, embedding_jobs)
 
     try:
         job = await service.rollback_to_version(
@@ -3,27 +3,31 @@
 from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Query
+from fastapi import APIRouter, Query
 
 from ruche.brains.focal.models import Rule, Scope
-from ruche.api.dependencies import AgentConfigStoreDep
-from ruche.api.exceptions import AgentNotFoundError, RuleNotFoundError
+from ruche.api.dependencies import AgentConfigStoreDep, EmbeddingJobQueueDep, SettingsDep
+from ruche.api.exceptions import AgentNotFoundError, InvalidRequestError, RuleNotFoundError
 from ruche.api.middleware.auth import TenantContextDep
 from ruche.api.models.bulk import BulkRequest, BulkResponse, BulkResult
 from ruche.api.models.crud import RuleCreate, RuleResponse, RuleUpdate
 from ruche.api.models.pagination import PaginatedResponse
+from ruche.config.settings import Settings
 from ruche.observability.logging import get_logger
+from ruche.vector.jobs import EmbeddingJob
+from ruche.vector.stores.base import EntityType
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/agents/{agent_id}/rules")
 
 
-def _map_rule_to_response(rule: Rule) -> RuleResponse:
+def _map_rule_to_response(rule: Rule, has_embedding: bool | None = None) -> RuleResponse:
     """Map Rule model to RuleResponse.
 
     Args:
         rule: Rule domain model
+        has_embedding: Embedding presence, for rules listed without their vector
 
     Returns:
         RuleResponse for API
@@ -42,12 +46,31 @@ def _map_rule_to_response(rule: Rule) -> RuleResponse:
         is_hard_constraint=rule.is_hard_constraint,
         attached_tool_ids=rule.attached_tool_ids,
         attached_template_ids=rule.attached_template_ids,
-        has_embedding=rule.embedding is not None,
+        has_embedding=rule.embedding is not None if has_embedding is None else has_embedding,
         created_at=rule.created_at,
         updated_at=rule.updated_at,
     )
 
 
+def _embedding_job(rule: Rule, settings: Settings) -> EmbeddingJob:
+    """Build the job (re)computing a rule's embedding.
+
+    Args:
+        rule: Saved rule
+        settings: Application settings
+
+    Returns:
+        EmbeddingJob for the rule
+    """
+    return EmbeddingJob.for_entity(
+        rule.tenant_id,
+        rule.agent_id,
+        EntityType.RULE,
+        rule.id,
+        coalesce_ms=settings.jobs.embeddings.coalesce_ms,
+    )
+
+
 async def _verify_agent_exists(
     config_store: AgentConfigStoreDep, tenant_id: UUID, agent_id: UUID
 ) -> None:
@@ -73,6 +96,8 @@ async def list_rules(
     config_store: AgentConfigStoreDep,
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, description="next_cursor of the previous page"),
+    include_total: bool = Query(default=True, description="Count matching rules"),
     scope: Scope | None = Query(default=None, description="Filter by scope"),
     enabled: bool | None = Query(default=None, description="Filter by enabled status"),
     priority_min: int | None = Query(default=None, ge=-100, le=100),
@@ -84,14 +109,18 @@ async def list_rules(
 ) -> PaginatedResponse[RuleResponse]:
     """List rules for an agent.
 
-    Retrieve a paginated list of rules with optional filtering and sorting.
+    Retrieve a page of rules with optional filtering and sorting. Filtering,
+    sorting and paging run in the config store; pass next_cursor back as
+    cursor to fetch the following page (offset is kept for compatibility).
 
     Args:
         agent_id: Agent identifier
         tenant_context: Authenticated tenant context
         config_store: Configuration store
         limit: Maximum number of rules to return
-        offset: Number of rules to skip
+        offset: Number of rules to skip (ignored when cursor is given)
+        cursor: Cursor from the previous page
+        include_total: Whether to count matching rules
         scope: Filter by scope level
         enabled: Filter by enabled status
         priority_min: Minimum priority filter
@@ -101,6 +130,9 @@ async def list_rules(
 
     Returns:
         Paginated list of rules
+
+    Raises:
+        InvalidRequestError: If the cursor is invalid for this sort
     """
     logger.debug(
         "list_rules_request",
@@ -111,48 +143,37 @@ async def list_rules(
 
     await _verify_agent_exists(config_store, tenant_context.tenant_id, agent_id)
 
-    # Get rules with optional scope filter (enabled_only=False to apply our own filter)
-    rules = await config_store.get_rules(
-        tenant_context.tenant_id,
-        agent_id,
-        scope=scope,
-        enabled_only=False,
-    )
+    try:
+        page = await config_store.list_rules(
+            tenant_context.tenant_id,
+            agent_id,
+            scope=scope,
+            enabled=enabled,
+            priority_min=priority_min,
+            priority_max=priority_max,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            include_total=include_total,
+        )
+    except ValueError as e:
+        raise InvalidRequestError(str(e)) from e
 
-    # Apply filters
-    if enabled is not None:
-        rules = [r for r in rules if r.enabled == enabled]
-    if priority_min is not None:
-        rules = [r for r in rules if r.priority >= priority_min]
-    if priority_max is not None:
-        rules = [r for r in rules if r.priority <= priority_max]
-
-    # Apply sorting
-    reverse = sort_order == "desc"
-    if sort_by == "name":
-        rules = sorted(rules, key=lambda r: r.name.lower(), reverse=reverse)
-    elif sort_by == "priority":
-        rules = sorted(rules, key=lambda r: r.priority, reverse=reverse)
-    elif sort_by == "created_at":
-        rules = sorted(rules, key=lambda r: r.created_at, reverse=reverse)
-    elif sort_by == "updated_at":
-        rules = sorted(rules, key=lambda r: r.updated_at, reverse=reverse)
-
-    # Get total before pagination
-    total = len(rules)
-
-    # Apply pagination
-    paginated = rules[offset : offset + limit]
-
-    # Map to response
-    items = [_map_rule_to_response(rule) for rule in paginated]
+    items = [
+        _map_rule_to_response(rule, has_embedding=rule.id in page.embedded_ids)
+        for rule in page.items
+    ]
 
     return PaginatedResponse[RuleResponse](
         items=items,
-        total=total,
+        total=page.total,
         limit=limit,
         offset=offset,
-        has_more=offset + len(paginated) < total,
+        has_more=page.next_cursor is not None,
+        next_cursor=page.next_cursor,
+        total_is_estimate=page.total_is_estimate,
     )
 
 
@@ -162,19 +183,21 @@ async def create_rule(
     request: RuleCreate,
     tenant_context: TenantContextDep,
     config_store: AgentConfigStoreDep,
-    _background_tasks: BackgroundTasks,  # For future async embedding computation
+    embedding_jobs: EmbeddingJobQueueDep,
+    settings: SettingsDep,
 ) -> RuleResponse:
     """Create a new rule.
 
-    Creates a rule for the specified agent. Embedding computation is
-    triggered asynchronously in the background.
+    Creates a rule for the specified agent and enqueues its embedding job;
+    the embedding worker computes the vector asynchronously.
 
     Args:
         agent_id: Agent identifier
         request: Rule creation request
         tenant_context: Authenticated tenant context
         config_store: Configuration store
-        _background_tasks: FastAPI background tasks (for future embedding)
+        embedding_jobs: Embedding job queue
+        settings: Application settings
 
     Returns:
         Created rule
@@ -206,16 +229,9 @@ async def create_rule(
         attached_template_ids=request.attached_template_ids,
     )
 
-    # Save rule
+    # Save rule, then queue its embedding
     await config_store.save_rule(rule)
-
-    # Schedule async embedding computation
-    # Note: In production, we'd inject the embedding service properly
-    # For MVP, we skip embedding if provider not available
-    logger.debug(
-        "embedding_computation_scheduled",
-        rule_id=str(rule.id),
-    )
+    await embedding_jobs.enqueue([_embedding_job(rule, settings)])
 
     logger.info(
         "rule_created",
@@ -271,12 +287,13 @@ async def update_rule(
     request: RuleUpdate,
     tenant_context: TenantContextDep,
     config_store: AgentConfigStoreDep,
-    _background_tasks: BackgroundTasks,  # For future async embedding computation
+    embedding_jobs: EmbeddingJobQueueDep,
+    settings: SettingsDep,
 ) -> RuleResponse:
     """Update a rule.
 
-    If condition_text or action_text changes, embedding recomputation
-    is triggered asynchronously.
+    If condition_text or action_text changes, an embedding job is enqueued
+    and the embedding is recomputed asynchronously.
 
     Args:
         agent_id: Agent identifier
@@ -284,7 +301,8 @@ async def update_rule(
         request: Rule update request
         tenant_context: Authenticated tenant context
         config_store: Configuration store
-        _background_tasks: FastAPI background tasks (for future embedding)
+        embedding_jobs: Embedding job queue
+        settings: Application settings
 
     Returns:
         Updated rule
@@ -340,16 +358,14 @@ async def update_rule(
     if text_changed:
         rule.embedding = None
         rule.embedding_model = None
-        logger.debug(
-            "embedding_recomputation_scheduled",
-            rule_id=str(rule.id),
-        )
 
     # Touch updated_at
     rule.touch()
 
     # Save changes
     await config_store.save_rule(rule)
+    if text_changed:
+        await embedding_jobs.enqueue([_embedding_job(rule, settings)])
 
     logger.info(
         "rule_updated",
@@ -411,17 +427,23 @@ async def bulk_rule_operations(
     request: BulkRequest[RuleCreate],
     tenant_context: TenantContextDep,
     config_store: AgentConfigStoreDep,
+    embedding_jobs: EmbeddingJobQueueDep,
+    settings: SettingsDep,
 ) -> BulkResponse[RuleResponse]:
     """Execute bulk rule operations.
 
     Supports create, update, and delete operations in a single request.
     Operations are processed in order, with partial success handling.
+    Embedding jobs of created rules are enqueued together at the end, so
+    the embedding worker embeds the whole import in batched calls.
 
     Args:
         agent_id: Agent identifier
         request: Bulk operation request
         tenant_context: Authenticated tenant context
         config_store: Configuration store
+        embedding_jobs: Embedding job queue
+        settings: Application settings
 
     Returns:
         Bulk operation results
@@ -436,6 +458,7 @@ async def bulk_rule_operations(
     await _verify_agent_exists(config_store, tenant_context.tenant_id, agent_id)
 
     results: list[BulkResult[RuleResponse]] = []
+    jobs: list[EmbeddingJob] = []
 
     for i, operation in enumerate(request.operations):
         try:
@@ -468,6 +491,7 @@ async def bulk_rule_operations(
                     attached_template_ids=operation.data.attached_template_ids,
                 )
                 await config_store.save_rule(rule)
+                jobs.append(_embedding_job(rule, settings))
                 results.append(
                     BulkResult(
                         index=i,
@@ -518,6 +542,9 @@ async def bulk_rule_operations(
                 )
             )
 
+    # One enqueue for the whole batch
+    await embedding_jobs.enqueue(jobs)
+
     successful = sum(1 for r in results if r.success)
     failed = len(results) - successful
 
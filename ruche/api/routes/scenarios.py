@@ -6,10 +6,11 @@ from uuid import UUID, uuid4
 from fastapi import APIRouter, Query
 
 from ruche.brains.focal.models import Scenario, ScenarioStep, StepTransition
-from ruche.api.dependencies import AgentConfigStoreDep
+from ruche.api.dependencies import AgentConfigStoreDep, EmbeddingJobQueueDep, SettingsDep
 from ruche.api.exceptions import (
     AgentNotFoundError,
     EntryStepDeletionError,
+    InvalidRequestError,
     ScenarioNotFoundError,
 )
 from ruche.api.middleware.auth import TenantContextDep
@@ -24,6 +25,8 @@ from ruche.api.models.crud import (
 )
 from ruche.api.models.pagination import PaginatedResponse
 from ruche.observability.logging import get_logger
+from ruche.vector.jobs import EmbeddingJob
+from ruche.vector.stores.base import EntityType
 
 logger = get_logger(__name__)
 
@@ -90,12 +93,14 @@ async def list_scenarios(
     config_store: AgentConfigStoreDep,
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, description="next_cursor of the previous page"),
+    include_total: bool = Query(default=True, description="Count matching scenarios"),
     tag: str | None = Query(default=None, description="Filter by tag"),
     enabled: bool | None = Query(default=None),
     sort_by: Literal["name", "created_at", "updated_at"] = Query(default="created_at"),
     sort_order: Literal["asc", "desc"] = Query(default="desc"),
 ) -> PaginatedResponse[ScenarioResponse]:
-    """List scenarios for an agent."""
+    """List scenarios for an agent, paged by the config store."""
     logger.debug(
         "list_scenarios_request",
         tenant_id=str(tenant_context.tenant_id),
@@ -104,35 +109,30 @@ async def list_scenarios(
 
     await _verify_agent_exists(config_store, tenant_context.tenant_id, agent_id)
 
-    scenarios = await config_store.get_scenarios(
-        tenant_context.tenant_id, agent_id, enabled_only=False
-    )
-
-    # Apply filters
-    if tag is not None:
-        scenarios = [s for s in scenarios if tag in s.tags]
-    if enabled is not None:
-        scenarios = [s for s in scenarios if s.enabled == enabled]
-
-    # Apply sorting
-    reverse = sort_order == "desc"
-    if sort_by == "name":
-        scenarios = sorted(scenarios, key=lambda s: s.name.lower(), reverse=reverse)
-    elif sort_by == "created_at":
-        scenarios = sorted(scenarios, key=lambda s: s.created_at, reverse=reverse)
-    elif sort_by == "updated_at":
-        scenarios = sorted(scenarios, key=lambda s: s.updated_at, reverse=reverse)
-
-    total = len(scenarios)
-    paginated = scenarios[offset : offset + limit]
-    items = [_map_scenario_to_response(s) for s in paginated]
+    try:
+        page = await config_store.list_scenarios(
+            tenant_context.tenant_id,
+            agent_id,
+            enabled=enabled,
+            tag=tag,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            include_total=include_total,
+        )
+    except ValueError as e:
+        raise InvalidRequestError(str(e)) from e
 
     return PaginatedResponse[ScenarioResponse](
-        items=items,
-        total=total,
+        items=[_map_scenario_to_response(s) for s in page.items],
+        total=page.total,
         limit=limit,
         offset=offset,
-        has_more=offset + len(paginated) < total,
+        has_more=page.next_cursor is not None,
+        next_cursor=page.next_cursor,
+        total_is_estimate=page.total_is_estimate,
     )
 
 
@@ -142,8 +142,14 @@ async def create_scenario(
     request: ScenarioCreate,
     tenant_context: TenantContextDep,
     config_store: AgentConfigStoreDep,
+    embedding_jobs: EmbeddingJobQueueDep,
+    settings: SettingsDep,
 ) -> ScenarioResponse:
-    """Create a new scenario with steps."""
+    """Create a new scenario with steps.
+
+    A scenario with an entry condition gets an embedding job; the entry
+    embedding is computed asynchronously by the embedding worker.
+    """
     logger.info(
         "create_scenario_request",
         tenant_id=str(tenant_context.tenant_id),
@@ -215,6 +221,18 @@ async def create_scenario(
     )
 
     await config_store.save_scenario(scenario)
+    if scenario.entry_condition_text:
+        await embedding_jobs.enqueue(
+            [
+                EmbeddingJob.for_entity(
+                    scenario.tenant_id,
+                    agent_id,
+                    EntityType.SCENARIO,
+                    scenario.id,
+                    coalesce_ms=settings.jobs.embeddings.coalesce_ms,
+                )
+            ]
+        )
 
     logger.info(
         "scenario_created",
@@ -248,8 +266,14 @@ async def update_scenario(
     request: ScenarioUpdate,
     tenant_context: TenantContextDep,
     config_store: AgentConfigStoreDep,
+    embedding_jobs: EmbeddingJobQueueDep,
+    settings: SettingsDep,
 ) -> ScenarioResponse:
-    """Update a scenario."""
+    """Update a scenario.
+
+    Changing the entry condition clears the entry embedding and enqueues
+    an embedding job to recompute it.
+    """
     logger.info(
         "update_scenario_request",
         tenant_id=str(tenant_context.tenant_id),
@@ -266,8 +290,13 @@ async def update_scenario(
         scenario.name = request.name
     if request.description is not None:
         scenario.description = request.description
-    if request.entry_condition_text is not None:
+    entry_changed = (
+        request.entry_condition_text is not None
+        and request.entry_condition_text != scenario.entry_condition_text
+    )
+    if entry_changed:
         scenario.entry_condition_text = request.entry_condition_text
+        scenario.entry_condition_embedding = None
     if request.entry_step_id is not None:
         scenario.entry_step_id = request.entry_step_id
     if request.tags is not None:
@@ -278,6 +307,18 @@ async def update_scenario(
     scenario.version += 1
     scenario.touch()
     await config_store.save_scenario(scenario)
+    if entry_changed and scenario.entry_condition_text:
+        await embedding_jobs.enqueue(
+            [
+                EmbeddingJob.for_entity(
+                    scenario.tenant_id,
+                    agent_id,
+                    EntityType.SCENARIO,
+                    scenario.id,
+                    coalesce_ms=settings.jobs.embeddings.coalesce_ms,
+                )
+            ]
+        )
 
     logger.info(
         "scenario_updated",
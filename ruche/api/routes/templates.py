@@ -8,7 +8,7 @@ from fastapi import APIRouter, Query
 
 from ruche.brains.focal.models import Scope, Template, TemplateResponseMode
 from ruche.api.dependencies import AgentConfigStoreDep
-from ruche.api.exceptions import AgentNotFoundError, TemplateNotFoundError
+from ruche.api.exceptions import AgentNotFoundError, InvalidRequestError, TemplateNotFoundError
 from ruche.api.middleware.auth import TenantContextDep
 from ruche.api.models.crud import (
     TemplateCreate,
@@ -65,12 +65,14 @@ async def list_templates(
     config_store: AgentConfigStoreDep,
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, description="next_cursor of the previous page"),
+    include_total: bool = Query(default=True, description="Count matching templates"),
     mode: TemplateResponseMode | None = Query(default=None, description="Filter by mode"),
     scope: Scope | None = Query(default=None, description="Filter by scope"),
     sort_by: Literal["name", "created_at", "updated_at"] = Query(default="created_at"),
     sort_order: Literal["asc", "desc"] = Query(default="desc"),
 ) -> PaginatedResponse[TemplateResponse]:
-    """List templates for an agent."""
+    """List templates for an agent, paged by the config store."""
     logger.debug(
         "list_templates_request",
         tenant_id=str(tenant_context.tenant_id),
@@ -79,33 +81,30 @@ async def list_templates(
 
     await _verify_agent_exists(config_store, tenant_context.tenant_id, agent_id)
 
-    templates = await config_store.get_templates(
-        tenant_context.tenant_id, agent_id, scope=scope
-    )
-
-    # Apply mode filter
-    if mode is not None:
-        templates = [t for t in templates if t.mode == mode]
-
-    # Apply sorting
-    reverse = sort_order == "desc"
-    if sort_by == "name":
-        templates = sorted(templates, key=lambda t: t.name.lower(), reverse=reverse)
-    elif sort_by == "created_at":
-        templates = sorted(templates, key=lambda t: t.created_at, reverse=reverse)
-    elif sort_by == "updated_at":
-        templates = sorted(templates, key=lambda t: t.updated_at, reverse=reverse)
-
-    total = len(templates)
-    paginated = templates[offset : offset + limit]
-    items = [_map_template_to_response(t) for t in paginated]
+    try:
+        page = await config_store.list_templates(
+            tenant_context.tenant_id,
+            agent_id,
+            scope=scope,
+            mode=mode,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            include_total=include_total,
+        )
+    except ValueError as e:
+        raise InvalidRequestError(str(e)) from e
 
     return PaginatedResponse[TemplateResponse](
-        items=items,
-        total=total,
+        items=[_map_template_to_response(t) for t in page.items],
+        total=page.total,
         limit=limit,
         offset=offset,
-        has_more=offset + len(paginated) < total,
+        has_more=page.next_cursor is not None,
+        next_cursor=page.next_cursor,
+        total_is_estimate=page.total_is_estimate,
     )
 
 
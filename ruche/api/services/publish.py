@@ -1,5 +1,7 @@
 """Publish job orchestration service."""
 
+import asyncio
+import time
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
@@ -7,6 +9,7 @@ from uuid import UUID
 from ruche.brains.focal.models import PublishJob
 from ruche.brains.focal.stores.agent_config_store import AgentConfigStore
 from ruche.observability.logging import get_logger
+from ruche.vector.jobs import EmbeddingJobQueue
 
 logger = get_logger(__name__)
 
@@ -18,13 +21,26 @@ class PublishService:
     the multi-stage publish process.
     """
 
-    def __init__(self, config_store: AgentConfigStore) -> None:
+    def __init__(
+        self,
+        config_store: AgentConfigStore,
+        embedding_jobs: EmbeddingJobQueue | None = None,
+        *,
+        embedding_wait_seconds: float = 120.0,
+        embedding_poll_seconds: float = 0.5,
+    ) -> None:
         """Initialize publish service.
 
         Args:
             config_store: Store for configuration data
+            embedding_jobs: Embedding job queue the compile stage waits on
+            embedding_wait_seconds: How long compile waits for pending embeddings
+            embedding_poll_seconds: Interval between pending-embedding checks
         """
         self._config_store = config_store
+        self._embedding_jobs = embedding_jobs
+        self._embedding_wait_seconds = embedding_wait_seconds
+        self._embedding_poll_seconds = embedding_poll_seconds
         # In-memory job storage for MVP - would be Redis in production
         self._jobs: dict[UUID, PublishJob] = {}
 
@@ -42,6 +58,10 @@ class PublishService:
         if agent is None:
             return {}
 
+        embeddings_pending = 0
+        if self._embedding_jobs is not None:
+            embeddings_pending = await self._embedding_jobs.pending_count(tenant_id, agent_id)
+
         # For MVP, we don't track draft changes separately
         # In production, this would compare draft vs published state
         return {
@@ -57,6 +77,7 @@ class PublishService:
                 "rules_modified": 0,
                 "templates_added": 0,
             },
+            "embeddings_pending": embeddings_pending,
         }
 
     async def create_publish_job(
@@ -203,8 +224,8 @@ class PublishService:
             # Validate configuration consistency
             pass
         elif stage_name == "compile":
-            # Compute embeddings, validate references
-            pass
+            # Wait for queued embeddings, validate references
+            await self._wait_for_embeddings(job)
         elif stage_name == "write_bundles":
             # Serialize configuration
             pass
@@ -215,6 +236,36 @@ class PublishService:
             # Clear cached config
             pass
 
+    async def _wait_for_embeddings(self, job: PublishJob) -> None:
+        """Wait until the agent has no pending embedding jobs.
+
+        Publishing with pending jobs would ship rules and scenarios that
+        retrieval cannot match yet.
+
+        Args:
+            job: Parent job
+
+        Raises:
+            TimeoutError: If embeddings are still pending after the wait
+        """
+        if self._embedding_jobs is None:
+            return
+
+        deadline = time.monotonic() + self._embedding_wait_seconds
+        while True:
+            pending = await self._embedding_jobs.pending_count(job.tenant_id, job.agent_id)
+            if pending == 0:
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"{pending} embeddings still pending")
+            logger.debug(
+                "publish_waiting_for_embeddings",
+                job_id=str(job.id),
+                pending=pending,
+            )
+            await asyncio.sleep(min(self._embedding_poll_seconds, remaining))
+
     async def rollback_to_version(
         self,
         tenant_id: UUID,
@@ -0,0 +1,161 @@
+"""Startup warm-up for the API process.
+
+Dependencies are built lazily on first use, so without warm-up the first
+requests after a deploy pay for pool connects, model loads, template
+compilation and config loads. The app lifespan runs run_warmup() in the
+background; GET /ready reports ready only once it has finished.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from ruche.api.dependencies import (
+    get_alignment_engine,
+    get_audit_store,
+    get_config_store,
+    get_embedding_provider,
+    get_llm_response_cache,
+    get_memory_store,
+    get_redis_client,
+    get_session_store,
+)
+from ruche.config.settings import Settings
+from ruche.infrastructure.providers.embedding import EmbeddingProvider
+from ruche.observability.logging import get_logger
+from ruche.observability.metrics import STARTUP_WARMUP_DURATION
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class WarmupState:
+    """Progress of the startup warm-up, exposed by the readiness endpoint."""
+
+    ready: bool = False
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+    stages: dict[str, str] = field(default_factory=dict)
+
+
+_state = WarmupState()
+
+
+def get_warmup_state() -> WarmupState:
+    """Get the current warm-up state."""
+    return _state
+
+
+def reset_warmup_state() -> None:
+    """Reset warm-up state (used by tests)."""
+    global _state
+    _state = WarmupState()
+
+
+async def run_warmup(settings: Settings) -> WarmupState:
+    """Warm up shared dependencies, then mark the process ready.
+
+    Stage failures are recorded and logged but never fail startup: the
+    process still becomes ready and falls back to lazy initialization.
+    The same applies when warm-up exceeds its timeout.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Final warm-up state
+    """
+    state = _state
+    config = settings.api.warmup
+    state.started_at = datetime.now(UTC)
+
+    if not config.enabled:
+        state.stages["warmup"] = "disabled"
+    else:
+        try:
+            await asyncio.wait_for(
+                _run_stages(settings, state),
+                timeout=config.timeout_seconds,
+            )
+        except TimeoutError:
+            state.stages["warmup"] = "timed_out"
+            logger.warning("warmup_timed_out", timeout_seconds=config.timeout_seconds)
+
+    state.ready = True
+    state.completed_at = datetime.now(UTC)
+    logger.info(
+        "warmup_completed",
+        duration_ms=(state.completed_at - state.started_at).total_seconds() * 1000,
+        stages=state.stages,
+    )
+    return state
+
+
+async def _run_stages(settings: Settings, state: WarmupState) -> None:
+    config = settings.api.warmup
+
+    await _stage(state, "stores", _warm_stores())
+
+    embedding_provider = get_embedding_provider(settings)
+    if config.preload_models:
+        await _stage(state, "embeddings", embedding_provider.warm_up())
+
+    await _stage(state, "agents", _warm_agents(settings, embedding_provider))
+
+
+async def _stage(state: WarmupState, name: str, work: Awaitable[Any]) -> None:
+    """Run one warm-up stage, recording its outcome and duration."""
+    start = time.perf_counter()
+    try:
+        result = await work
+    except Exception as e:
+        state.stages[name] = f"failed: {e}"
+        logger.warning("warmup_stage_failed", stage=name, error=str(e))
+    else:
+        state.stages[name] = "ok" if result is None else f"ok ({result})"
+    finally:
+        STARTUP_WARMUP_DURATION.labels(stage=name).observe(time.perf_counter() - start)
+
+
+async def _warm_stores() -> None:
+    """Open the Postgres pool (to min_size) and a Redis connection."""
+    await get_config_store()
+    await get_audit_store()
+    await get_memory_store()
+    await get_session_store()
+    try:
+        redis_client = await get_redis_client()
+        await redis_client.ping()
+    except Exception as e:
+        logger.debug("warmup_redis_unavailable", error=str(e))
+
+
+async def _warm_agents(settings: Settings, embedding_provider: EmbeddingProvider) -> str:
+    """Build the engine and preload config for the most active agents."""
+    config = settings.api.warmup
+    config_store = await get_config_store()
+    session_store = await get_session_store()
+    audit_store = await get_audit_store()
+
+    engine = get_alignment_engine(
+        config_store=config_store,
+        session_store=session_store,
+        audit_store=audit_store,
+        embedding_provider=embedding_provider,
+        settings=settings,
+        response_cache=await get_llm_response_cache(settings),
+    )
+
+    agents: list[tuple[UUID, UUID]] = []
+    if config.top_agents > 0:
+        agents = await audit_store.list_active_agents(
+            since=datetime.now(UTC) - timedelta(hours=config.lookback_hours),
+            limit=config.top_agents,
+        )
+
+    warmed = await engine.warm_up(agents)
+    return f"{warmed} agents"
@@ -48,6 +48,27 @@ class AuditStore(ABC):
         """List turn records for a tenant with optional time filter."""
         pass
 
+    async def list_active_agents(
+        self,
+        *,
+        since: datetime,
+        limit: int = 20,
+    ) -> list[tuple[UUID, UUID]]:
+        """List (tenant_id, agent_id) pairs ranked by turn count since a time.
+
+        Used to pick agents worth preloading at startup. Stores that cannot
+        answer cheaply return an empty list.
+        """
+        return []
+
+    async def close(self) -> None:
+        """Write out anything buffered and release resources.
+
+        Called on shutdown. Stores that write synchronously need not
+        override this.
+        """
+        return None
+
     # Audit event operations
     @abstractmethod
     async def save_event(self, event: AuditEvent) -> UUID:
@@ -0,0 +1,413 @@
+"""Batched writer for turn records and audit events.
+
+Audit writes are the highest-volume Postgres traffic, and one INSERT per
+record costs a round trip and a WAL record each. AuditBatchWriter buffers
+records in memory and writes them with COPY, one transaction per flush,
+when the batch fills up or the flush interval elapses.
+
+The buffer is bounded. Records that do not fit are appended to a JSONL
+spill file (if a spill directory is configured) and replayed after the
+next successful flush; otherwise they are dropped and counted. Spill
+lines that cannot be parsed are set aside in a ``.bad`` file next to it
+instead of blocking the rest of the replay. close() flushes what is
+left, spilling it if the database is unreachable.
+
+turn_records and audit_events are range-partitioned by month on
+created_at (migration 022), so retention is a partition drop.
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections.abc import Iterable
+from contextlib import suppress
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from ruche.audit.models import AuditEvent, TurnRecord
+from ruche.config.models.storage import AuditWriterConfig
+from ruche.infrastructure.db.pool import PostgresPool
+from ruche.observability.logging import get_logger
+from ruche.observability.metrics import AUDIT_FLUSH_DURATION, AUDIT_RECORDS
+
+logger = get_logger(__name__)
+
+TURN_COLUMNS = [
+    "id",
+    "tenant_id",
+    "session_id",
+    "turn_number",
+    "user_message",
+    "assistant_response",
+    "context_extracted",
+    "rules_matched",
+    "scenario_state",
+    "tools_executed",
+    "token_usage",
+    "latency_ms",
+    "created_at",
+]
+
+EVENT_COLUMNS = [
+    "id",
+    "tenant_id",
+    "session_id",
+    "turn_id",
+    "event_type",
+    "event_data",
+    "created_at",
+]
+
+AUDIT_TABLES = ("turn_records", "audit_events")
+
+# Partition maintenance runs at most this often from the flush loop
+_PARTITION_CHECK_INTERVAL_SECONDS = 3600
+
+
+def turn_to_row(turn: TurnRecord) -> tuple[Any, ...]:
+    """Convert a TurnRecord to a turn_records row (TURN_COLUMNS order)."""
+    return (
+        turn.turn_id,
+        turn.tenant_id,
+        turn.session_id,
+        turn.turn_number,
+        turn.user_message,
+        turn.agent_response,
+        None,  # context_extracted - not in model
+        json.dumps([str(rid) for rid in turn.matched_rule_ids]),
+        json.dumps(
+            {
+                "scenario_id": str(turn.scenario_id) if turn.scenario_id else None,
+                "step_id": str(turn.step_id) if turn.step_id else None,
+            }
+        ),
+        json.dumps([tc.model_dump(mode="json") for tc in turn.tool_calls]),
+        json.dumps({"total": turn.tokens_used}),
+        turn.latency_ms,
+        turn.timestamp,
+    )
+
+
+def event_to_row(event: AuditEvent) -> tuple[Any, ...]:
+    """Convert an AuditEvent to an audit_events row (EVENT_COLUMNS order)."""
+    return (
+        event.id,
+        event.tenant_id,
+        event.session_id,
+        event.turn_id,
+        event.event_type,
+        json.dumps(event.event_data),
+        event.timestamp,
+    )
+
+
+def insert_sql(table: str, columns: list[str]) -> str:
+    """INSERT statement that skips rows already written."""
+    placeholders = ", ".join(f"${i}" for i in range(1, len(columns) + 1))
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) "
+        "ON CONFLICT (id, created_at) DO NOTHING"
+    )
+
+
+async def ensure_monthly_partitions(pool: PostgresPool, months_ahead: int) -> None:
+    """Create this month's audit partitions and the next months_ahead.
+
+    Rows outside every monthly partition land in the DEFAULT partition,
+    which retention cannot drop, so this runs at startup and hourly
+    from the batch writer.
+    """
+    now = datetime.now(UTC)
+    async with pool.acquire() as conn:
+        for offset in range(months_ahead + 1):
+            year, month = divmod(now.month - 1 + offset, 12)
+            month_start = datetime(now.year + year, month + 1, 1, tzinfo=UTC)
+            for table in AUDIT_TABLES:
+                await conn.execute(
+                    "SELECT create_monthly_partition($1::regclass, $2)",
+                    table,
+                    month_start,
+                )
+
+
+class AuditBatchWriter:
+    """Buffer audit records and write them to Postgres in batches.
+
+    add_turn()/add_event() never wait on the database. The flush loop
+    starts on first use and runs until close().
+    """
+
+    def __init__(
+        self,
+        pool: PostgresPool,
+        config: AuditWriterConfig | None = None,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            pool: PostgreSQL connection pool
+            config: Batching, buffer and spill settings
+        """
+        self._pool = pool
+        self._config = config or AuditWriterConfig()
+        self._turns: dict[UUID, TurnRecord] = {}
+        self._events: dict[UUID, AuditEvent] = {}
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+        self._partitions_checked_at: float | None = None
+        self._spill_dir = Path(self._config.spill_dir) if self._config.spill_dir else None
+
+    @property
+    def pending(self) -> int:
+        """Number of records waiting to be written."""
+        return len(self._turns) + len(self._events)
+
+    def add_turn(self, turn: TurnRecord) -> None:
+        """Queue a turn record for writing."""
+        if self._admit("turn", turn):
+            self._turns[turn.turn_id] = turn
+            self._after_add()
+
+    def add_event(self, event: AuditEvent) -> None:
+        """Queue an audit event for writing."""
+        if self._admit("event", event):
+            self._events[event.id] = event
+            self._after_add()
+
+    def get_pending_turn(self, turn_id: UUID) -> TurnRecord | None:
+        """Get a turn record that is buffered but not yet written."""
+        return self._turns.get(turn_id)
+
+    def get_pending_event(self, event_id: UUID) -> AuditEvent | None:
+        """Get an audit event that is buffered but not yet written."""
+        return self._events.get(event_id)
+
+    async def flush(self) -> int:
+        """Write all buffered records.
+
+        Records stay buffered if the write fails and are retried on the
+        next flush.
+
+        Returns:
+            Number of records written
+        """
+        async with self._flush_lock:
+            turns = list(self._turns.values())
+            events = list(self._events.values())
+            if not turns and not events:
+                return 0
+
+            try:
+                await self._write(turns, events)
+            except Exception as e:
+                logger.error(
+                    "audit_flush_failed",
+                    turns=len(turns),
+                    events=len(events),
+                    error=str(e),
+                )
+                return 0
+
+            # Records added while the write was in flight stay buffered
+            for turn in turns:
+                self._turns.pop(turn.turn_id, None)
+            for event in events:
+                self._events.pop(event.id, None)
+            AUDIT_RECORDS.labels(kind="turn", outcome="written").inc(len(turns))
+            AUDIT_RECORDS.labels(kind="event", outcome="written").inc(len(events))
+
+            self._replay_spill()
+            return len(turns) + len(events)
+
+    async def close(self) -> None:
+        """Stop the flush loop and write what is left.
+
+        Anything that still cannot be written is spilled to disk.
+        """
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        await self.flush()
+        if self.pending:
+            self._spill([("turn", t) for t in self._turns.values()])
+            self._spill([("event", e) for e in self._events.values()])
+            self._turns.clear()
+            self._events.clear()
+
+    async def ensure_partitions(self) -> None:
+        """Create monthly partitions for this month and the months ahead."""
+        await ensure_monthly_partitions(self._pool, self._config.partition_months_ahead)
+        self._partitions_checked_at = time.monotonic()
+
+    # Internals
+
+    def _admit(self, kind: str, record: TurnRecord | AuditEvent) -> bool:
+        if self.pending < self._config.max_buffer_size:
+            return True
+        self._spill([(kind, record)])
+        return False
+
+    def _after_add(self) -> None:
+        if (self._task is None or self._task.done()) and not self._closed:
+            self._task = asyncio.create_task(self._run())
+        if self.pending >= self._config.max_batch_size:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        interval = self._config.flush_interval_ms / 1000
+        while True:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=interval)
+            self._wakeup.clear()
+
+            if (
+                self._partitions_checked_at is None
+                or time.monotonic() - self._partitions_checked_at
+                > _PARTITION_CHECK_INTERVAL_SECONDS
+            ):
+                try:
+                    await self.ensure_partitions()
+                except Exception as e:
+                    self._partitions_checked_at = time.monotonic()
+                    logger.warning("audit_partition_check_failed", error=str(e))
+
+            # The loop must outlive any single failure, or the buffer
+            # only ever grows and everything spills
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error("audit_flush_loop_error", error=str(e))
+
+    async def _write(self, turns: list[TurnRecord], events: list[AuditEvent]) -> None:
+        """Write one batch with COPY, falling back to idempotent INSERTs.
+
+        COPY fails the whole batch on a duplicate key (e.g. a spilled
+        record that was in fact written), so the fallback skips conflicts.
+        """
+        turn_rows = [turn_to_row(t) for t in turns]
+        event_rows = [event_to_row(e) for e in events]
+
+        start = time.perf_counter()
+        try:
+            async with self._pool.acquire() as conn, conn.transaction():
+                if turn_rows:
+                    await conn.copy_records_to_table(
+                        "turn_records", records=turn_rows, columns=TURN_COLUMNS
+                    )
+                if event_rows:
+                    await conn.copy_records_to_table(
+                        "audit_events", records=event_rows, columns=EVENT_COLUMNS
+                    )
+            AUDIT_FLUSH_DURATION.labels(method="copy").observe(time.perf_counter() - start)
+            return
+        except Exception as e:
+            logger.warning("audit_copy_failed", error=str(e))
+
+        start = time.perf_counter()
+        async with self._pool.acquire() as conn, conn.transaction():
+            if turn_rows:
+                await conn.executemany(insert_sql("turn_records", TURN_COLUMNS), turn_rows)
+            if event_rows:
+                await conn.executemany(insert_sql("audit_events", EVENT_COLUMNS), event_rows)
+        AUDIT_FLUSH_DURATION.labels(method="insert").observe(time.perf_counter() - start)
+
+    def _spill(self, records: Iterable[tuple[str, TurnRecord | AuditEvent]]) -> None:
+        records = list(records)
+        if not records:
+            return
+        kind_counts: dict[str, int] = {}
+        for kind, _ in records:
+            kind_counts[kind] = kind_counts.get(kind, 0) + 1
+
+        if self._spill_dir is None:
+            for kind, count in kind_counts.items():
+                AUDIT_RECORDS.labels(kind=kind, outcome="dropped").inc(count)
+            logger.warning("audit_records_dropped", count=len(records))
+            return
+
+        try:
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+            with self._spill_path().open("a", encoding="utf-8") as f:
+                for kind, record in records:
+                    f.write(json.dumps({"kind": kind, "record": record.model_dump(mode="json")}))
+                    f.write("\n")
+        except OSError as e:
+            for kind, count in kind_counts.items():
+                AUDIT_RECORDS.labels(kind=kind, outcome="dropped").inc(count)
+            logger.error("audit_spill_failed", count=len(records), error=str(e))
+            return
+
+        for kind, count in kind_counts.items():
+            AUDIT_RECORDS.labels(kind=kind, outcome="spilled").inc(count)
+
+    def _spill_path(self) -> Path:
+        assert self._spill_dir is not None
+        return self._spill_dir / f"audit-{os.getpid()}.jsonl"
+
+    def _replay_spill(self) -> None:
+        """Move spilled records (from any process) back into the buffer.
+
+        A file is deleted only once all its lines are parsed; lines that
+        fail to parse, or whole files that cannot be read, are moved to a
+        ``.bad`` file for inspection.
+        """
+        if self._spill_dir is None or not self._spill_dir.is_dir():
+            return
+
+        for path in sorted(self._spill_dir.glob("audit-*.jsonl")):
+            # Renaming claims the file; another process may get there first
+            claimed = path.with_suffix(".replaying")
+            try:
+                path.rename(claimed)
+            except OSError:
+                continue
+
+            try:
+                lines = claimed.read_text(encoding="utf-8").splitlines()
+            except (OSError, UnicodeDecodeError) as e:
+                logger.error("audit_spill_unreadable", path=str(path), error=str(e))
+                with suppress(OSError):
+                    claimed.rename(path.with_suffix(".bad"))
+                continue
+
+            records: list[tuple[str, TurnRecord | AuditEvent]] = []
+            bad_lines: list[str] = []
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    if entry["kind"] == "turn":
+                        records.append(("turn", TurnRecord.model_validate(entry["record"])))
+                    else:
+                        records.append(("event", AuditEvent.model_validate(entry["record"])))
+                except Exception:
+                    bad_lines.append(line)
+
+            try:
+                if bad_lines:
+                    with path.with_suffix(".bad").open("a", encoding="utf-8") as f:
+                        f.write("\n".join(bad_lines) + "\n")
+                claimed.unlink()
+            except OSError as e:
+                # Leave the claimed file in place rather than lose records
+                logger.error("audit_spill_cleanup_failed", path=str(path), error=str(e))
+                continue
+
+            for kind, record in records:
+                if kind == "turn":
+                    self.add_turn(record)  # type: ignore[arg-type]
+                else:
+                    self.add_event(record)  # type: ignore[arg-type]
+            if bad_lines:
+                logger.warning("audit_spill_bad_lines", path=str(path), lines=len(bad_lines))
+            logger.info("audit_spill_replayed", path=str(path), records=len(records))
@@ -1,5 +1,6 @@
 """In-memory implementation of AuditStore."""
 
+from collections import Counter
 from datetime import datetime
 from uuid import UUID
 
@@ -67,6 +68,20 @@ class InMemoryAuditStore(AuditStore):
         results.sort(key=lambda x: x.timestamp, reverse=True)
         return results[:limit]
 
+    async def list_active_agents(
+        self,
+        *,
+        since: datetime,
+        limit: int = 20,
+    ) -> list[tuple[UUID, UUID]]:
+        """List (tenant_id, agent_id) pairs ranked by turn count since a time."""
+        counts = Counter(
+            (turn.tenant_id, turn.agent_id)
+            for turn in self._turns.values()
+            if turn.timestamp >= since
+        )
+        return [key for key, _ in counts.most_common(limit)]
+
     # Audit event operations
     async def save_event(self, event: AuditEvent) -> UUID:
         """Save an audit event."""
@@ -4,11 +4,22 @@ Uses asyncpg for async database access.
 """
 
 import json
-from datetime import datetime
+import re
+from datetime import UTC, datetime
 from uuid import UUID
 
 from ruche.audit.models import AuditEvent, TurnRecord
 from ruche.audit.store import AuditStore
+from ruche.audit.stores.batch_writer import (
+    AUDIT_TABLES,
+    EVENT_COLUMNS,
+    TURN_COLUMNS,
+    AuditBatchWriter,
+    ensure_monthly_partitions,
+    event_to_row,
+    insert_sql,
+    turn_to_row,
+)
 from ruche.infrastructure.db.errors import ConnectionError
 from ruche.infrastructure.db.pool import PostgresPool
 from ruche.observability.logging import get_logger
@@ -21,47 +32,40 @@ class PostgresAuditStore(AuditStore):
 
     Uses asyncpg connection pool for efficient database access.
     All records are immutable once written.
+
+    With a batch writer, save_turn/save_event buffer the record and
+    return immediately; list queries see it after the next flush.
     """
 
-    def __init__(self, pool: PostgresPool) -> None:
+    def __init__(
+        self,
+        pool: PostgresPool,
+        writer: AuditBatchWriter | None = None,
+    ) -> None:
         """Initialize with connection pool.
 
         Args:
             pool: PostgreSQL connection pool
+            writer: Batch writer for saves (None writes each record inline)
         """
         self._pool = pool
+        self._writer = writer
+
+    async def close(self) -> None:
+        """Flush buffered records."""
+        if self._writer is not None:
+            await self._writer.close()
 
     # Turn record operations
     async def save_turn(self, turn: TurnRecord) -> UUID:
         """Save a turn record."""
+        if self._writer is not None:
+            self._writer.add_turn(turn)
+            return turn.turn_id
+
         try:
             async with self._pool.acquire() as conn:
-                await conn.execute(
-                    """
-                    INSERT INTO turn_records (
-                        id, tenant_id, session_id, turn_number,
-                        user_message, assistant_response, context_extracted,
-                        rules_matched, scenario_state, tools_executed,
-                        token_usage, latency_ms, created_at
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)
-                    """,
-                    turn.turn_id,
-                    turn.tenant_id,
-                    turn.session_id,
-                    turn.turn_number,
-                    turn.user_message,
-                    turn.agent_response,
-                    None,  # context_extracted - not in model
-                    json.dumps([str(rid) for rid in turn.matched_rule_ids]),
-                    json.dumps({
-                        "scenario_id": str(turn.scenario_id) if turn.scenario_id else None,
-                        "step_id": str(turn.step_id) if turn.step_id else None,
-                    }),
-                    json.dumps([tc.model_dump(mode="json") for tc in turn.tool_calls]),
-                    json.dumps({"total": turn.tokens_used}),
-                    turn.latency_ms,
-                    turn.timestamp,
-                )
+                await conn.execute(insert_sql("turn_records", TURN_COLUMNS), *turn_to_row(turn))
                 logger.debug("turn_record_saved", turn_id=str(turn.turn_id))
                 return turn.turn_id
         except Exception as e:
@@ -72,6 +76,9 @@ class PostgresAuditStore(AuditStore):
 
     async def get_turn(self, turn_id: UUID) -> TurnRecord | None:
         """Get a turn record by ID."""
+        if self._writer is not None and (turn := self._writer.get_pending_turn(turn_id)):
+            return turn
+
         try:
             async with self._pool.acquire() as conn:
                 row = await conn.fetchrow(
@@ -170,26 +177,47 @@ class PostgresAuditStore(AuditStore):
             )
             raise ConnectionError(f"Failed to list turn records: {e}", cause=e) from e
 
-    # Audit event operations
-    async def save_event(self, event: AuditEvent) -> UUID:
-        """Save an audit event."""
+    async def list_active_agents(
+        self,
+        *,
+        since: datetime,
+        limit: int = 20,
+    ) -> list[tuple[UUID, UUID]]:
+        """List (tenant_id, agent_id) pairs ranked by turn count since a time.
+
+        turn_records has no agent column, so agents are resolved through
+        the sessions table.
+        """
         try:
             async with self._pool.acquire() as conn:
-                await conn.execute(
+                rows = await conn.fetch(
                     """
-                    INSERT INTO audit_events (
-                        id, tenant_id, session_id, turn_id,
-                        event_type, event_data, created_at
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7)
+                    SELECT s.tenant_id, s.agent_id, COUNT(*) AS turns
+                    FROM turn_records t
+                    JOIN sessions s ON s.session_id = t.session_id
+                    WHERE t.created_at >= $1
+                    GROUP BY s.tenant_id, s.agent_id
+                    ORDER BY turns DESC
+                    LIMIT $2
                     """,
-                    event.id,
-                    event.tenant_id,
-                    event.session_id,
-                    event.turn_id,
-                    event.event_type,
-                    json.dumps(event.event_data),
-                    event.timestamp,
+                    since,
+                    limit,
                 )
+                return [(row["tenant_id"], row["agent_id"]) for row in rows]
+        except Exception as e:
+            logger.error("postgres_list_active_agents_error", error=str(e))
+            raise ConnectionError(f"Failed to list active agents: {e}", cause=e) from e
+
+    # Audit event operations
+    async def save_event(self, event: AuditEvent) -> UUID:
+        """Save an audit event."""
+        if self._writer is not None:
+            self._writer.add_event(event)
+            return event.id
+
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.execute(insert_sql("audit_events", EVENT_COLUMNS), *event_to_row(event))
                 logger.debug("audit_event_saved", event_id=str(event.id))
                 return event.id
         except Exception as e:
@@ -200,6 +228,9 @@ class PostgresAuditStore(AuditStore):
 
     async def get_event(self, event_id: UUID) -> AuditEvent | None:
         """Get an audit event by ID."""
+        if self._writer is not None and (event := self._writer.get_pending_event(event_id)):
+            return event
+
         try:
             async with self._pool.acquire() as conn:
                 row = await conn.fetchrow(
@@ -255,6 +286,56 @@ class PostgresAuditStore(AuditStore):
             )
             raise ConnectionError(f"Failed to list audit events: {e}", cause=e) from e
 
+    # Partition maintenance
+    async def ensure_partitions(self, months_ahead: int = 2) -> None:
+        """Create monthly partitions for this month and the months ahead."""
+        try:
+            await ensure_monthly_partitions(self._pool, months_ahead)
+        except Exception as e:
+            logger.error("postgres_ensure_partitions_error", error=str(e))
+            raise ConnectionError(f"Failed to create audit partitions: {e}", cause=e) from e
+
+    async def drop_partitions_before(self, cutoff: datetime) -> list[str]:
+        """Drop monthly audit partitions that end on or before cutoff.
+
+        Retention for turn_records and audit_events: dropping a partition
+        is instant and leaves no dead tuples behind, unlike DELETE.
+
+        Args:
+            cutoff: Partitions whose whole month is before this are dropped
+
+        Returns:
+            Names of the dropped partitions
+        """
+        dropped: list[str] = []
+        try:
+            async with self._pool.acquire() as conn:
+                rows = await conn.fetch(
+                    """
+                    SELECT parent.relname AS parent, child.relname AS partition
+                    FROM pg_inherits
+                    JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                    WHERE parent.relname = ANY($1::text[])
+                    """,
+                    list(AUDIT_TABLES),
+                )
+                for row in rows:
+                    match = re.fullmatch(rf"{row['parent']}_(\d{{4}})(\d{{2}})", row["partition"])
+                    if not match:
+                        continue
+                    year, month = int(match.group(1)), int(match.group(2))
+                    month_end = datetime(year + month // 12, month % 12 + 1, 1, tzinfo=UTC)
+                    if month_end <= cutoff:
+                        await conn.execute(f'DROP TABLE IF EXISTS "{row["partition"]}"')
+                        dropped.append(row["partition"])
+            if dropped:
+                logger.info("audit_partitions_dropped", partitions=dropped)
+            return dropped
+        except Exception as e:
+            logger.error("postgres_drop_partitions_error", error=str(e))
+            raise ConnectionError(f"Failed to drop audit partitions: {e}", cause=e) from e
+
     # Helper methods
     def _row_to_turn_record(self, row) -> TurnRecord:
         """Convert database row to TurnRecord model."""
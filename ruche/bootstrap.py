@@ -28,11 +28,12 @@ from uuid import UUID, uuid4
 
 from ruche.brains.focal.pipeline import FocalCognitivePipeline as AlignmentEngine
 from ruche.brains.focal.stores.inmemory import InMemoryAgentConfigStore
+from ruche.config import get_settings
 from ruche.config.models.pipeline import OpenRouterProviderConfig, PipelineConfig
 from ruche.conversation.models import Channel, Session, SessionStatus
 from ruche.conversation.stores.inmemory import InMemorySessionStore
 from ruche.interlocutor_data.stores.inmemory import InMemoryInterlocutorDataStore
-from ruche.observability.logging import get_logger, setup_logging
+from ruche.observability.logging import get_logger, setup_logging_from_config
 from ruche.infrastructure.providers.embedding.jina import JinaEmbeddingProvider
 from ruche.infrastructure.providers.llm import create_executor, create_executors_from_pipeline_config
 from ruche.infrastructure.providers.rerank.jina import JinaRerankProvider
@@ -102,8 +103,9 @@ def bootstrap(
             agent_id=ctx.agent_id,
         )
     """
-    # Setup logging
-    setup_logging(level=log_level)
+    # Setup logging (log_level overrides the configured level)
+    logging_config = get_settings().observability.logging
+    setup_logging_from_config(logging_config.model_copy(update={"level": log_level}))
 
     # Generate IDs
     _tenant_id = tenant_id or uuid4()
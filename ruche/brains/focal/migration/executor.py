@@ -305,17 +305,18 @@ class MigrationExecutor:
         still_missing: list[str] = []
         filled_results = []
 
-        for field in required_fields:
-            # Check session first (fast path)
-            if field in session.variables:
-                continue
-
-            # Try gap fill service
-            result = await self._missing_field_resolver.fill_gap(
-                field_name=field,
+        # Check session first (fast path), then fill the rest in one batch
+        fields_to_fill = [f for f in required_fields if f not in session.variables]
+        fill_results = (
+            await self._missing_field_resolver.fill_multiple(
+                field_names=fields_to_fill,
                 session=session,
             )
+            if fields_to_fill
+            else {}
+        )
 
+        for field, result in fill_results.items():
             if result.filled:
                 # Add to session variables for this turn
                 session.variables[field] = result.value
@@ -5,6 +5,9 @@ Attempts to resolve missing data without asking the customer:
 2. Check session variables (current conversation)
 3. Extract from conversation history (LLM-based)
 
+fill_multiple() resolves profile and session hits in one pass, then extracts
+every still-missing field with a single batched LLM call.
+
 Enhanced with:
 - Schema validation via InterlocutorDataFieldValidator
 - Lineage tracking for extracted values
@@ -60,6 +63,51 @@ Description: {field_description}
 Respond with JSON only, no other text."""
 
 
+BATCH_EXTRACTION_PROMPT = """You are extracting structured data from a conversation.
+
+## Instructions
+- Look for every requested field in the conversation history
+- Return a value only if it is explicitly stated or clearly implied
+- If a value is uncertain or ambiguous, indicate lower confidence
+- If a value is not found, set found to false
+- Each value must match the JSON schema declared for its field
+
+## Fields to extract (JSON schema per field)
+{field_schemas}
+
+## Conversation History
+{conversation_history}
+
+## Response Format (JSON only)
+An object with one entry per requested field name:
+{{
+    "<field_name>": {{
+        "found": true/false,
+        "value": <extracted value matching the field schema, or null>,
+        "confidence": 0.0-1.0,
+        "source_quote": "<exact quote where you found this, or null>"
+    }}
+}}
+
+Respond with JSON only, no other text."""
+
+# Field value_type -> JSON schema fragment used in batched extraction
+_JSON_SCHEMA_TYPES: dict[str, dict[str, Any]] = {
+    "string": {"type": "string"},
+    "email": {"type": "string", "format": "email"},
+    "phone": {"type": "string"},
+    "date": {"type": "string", "format": "date"},
+    "datetime": {"type": "string", "format": "date-time"},
+    "number": {"type": "number"},
+    "integer": {"type": "integer"},
+    "boolean": {"type": "boolean"},
+    "json": {"type": "object"},
+}
+
+# Output token budget per field in a batched extraction call
+BATCH_TOKENS_PER_FIELD = 150
+
+
 class MissingFieldResolver:
     """Service for filling missing fields without user interaction.
 
@@ -330,41 +378,64 @@ class MissingFieldResolver:
             )
 
         try:
-            # Look up the profile field using InterlocutorDataStoreInterface interface
-            interlocutor_id = getattr(session, "interlocutor_id", None)
-            if interlocutor_id is None:
-                return FieldResolutionResult(
-                    field_name=field_name,
-                    filled=False,
-                    source=ResolutionSource.NOT_FOUND,
-                )
-
-            profile = await self._profile_store.get_by_interlocutor_id(
-                tenant_id=session.tenant_id,
-                interlocutor_id=interlocutor_id,
-            )
-
-            if profile and field_name in profile.fields:
-                field = profile.fields[field_name]
-                # Check if field is active (not expired, orphaned, or superseded)
-                from ruche.interlocutor_data.enums import ItemStatus
-                if field.status == ItemStatus.ACTIVE:
-                    return FieldResolutionResult(
-                        field_name=field_name,
-                        filled=True,
-                        value=field.value,
-                        source=ResolutionSource.PROFILE,
-                        confidence=field.confidence,
-                        needs_confirmation=field.requires_confirmation,
-                        source_item_id=field.id,
-                        source_item_type=SourceType.PROFILE_FIELD.value,
-                    )
+            profile = await self._load_profile(session)
         except Exception as e:
             logger.warning(
                 "gap_fill_profile_lookup_failed",
                 field_name=field_name,
                 error=str(e),
             )
+            profile = None
+
+        return self._resolve_from_profile(field_name, profile)
+
+    async def _load_profile(self, session: "Session") -> Any:
+        """Load the interlocutor profile for the session, if any.
+
+        Args:
+            session: Current session
+
+        Returns:
+            Profile or None when no store/interlocutor is available
+        """
+        interlocutor_id = getattr(session, "interlocutor_id", None)
+        if not self._profile_store or interlocutor_id is None:
+            return None
+
+        return await self._profile_store.get_by_interlocutor_id(
+            tenant_id=session.tenant_id,
+            interlocutor_id=interlocutor_id,
+        )
+
+    def _resolve_from_profile(
+        self,
+        field_name: str,
+        profile: Any,
+    ) -> FieldResolutionResult:
+        """Resolve a field from an already-loaded profile.
+
+        Args:
+            field_name: Field to look up
+            profile: Loaded profile (or None)
+
+        Returns:
+            FieldResolutionResult from profile or not found
+        """
+        if profile and field_name in profile.fields:
+            field = profile.fields[field_name]
+            # Check if field is active (not expired, orphaned, or superseded)
+            from ruche.interlocutor_data.enums import ItemStatus
+            if field.status == ItemStatus.ACTIVE:
+                return FieldResolutionResult(
+                    field_name=field_name,
+                    filled=True,
+                    value=field.value,
+                    source=ResolutionSource.PROFILE,
+                    confidence=field.confidence,
+                    needs_confirmation=field.requires_confirmation,
+                    source_item_id=field.id,
+                    source_item_type=SourceType.PROFILE_FIELD.value,
+                )
 
         return FieldResolutionResult(
             field_name=field_name,
@@ -477,6 +548,107 @@ class MissingFieldResolver:
                 source=ResolutionSource.NOT_FOUND,
             )
 
+    async def try_batch_conversation_extraction(
+        self,
+        fields: dict[str, tuple[str, str | None]],
+        session: "Session",
+        max_turns: int = 20,
+    ) -> dict[str, FieldResolutionResult]:
+        """Extract several fields from conversation history in one LLM call.
+
+        Each field is described to the LLM by its own JSON schema and the
+        response carries one verdict per field.
+
+        Args:
+            fields: Field name -> (field_type, field_description)
+            session: Current session
+            max_turns: Maximum turns to include
+
+        Returns:
+            Dict mapping every requested field name to its result
+        """
+        not_found = {
+            name: FieldResolutionResult(
+                field_name=name,
+                filled=False,
+                source=ResolutionSource.NOT_FOUND,
+            )
+            for name in fields
+        }
+        if not fields or not self._llm_executor:
+            return not_found
+
+        conversation_history = self._build_conversation_history(session, max_turns)
+        if not conversation_history.strip():
+            return not_found
+
+        field_schemas = {
+            name: self._build_field_schema(name, field_type, description)
+            for name, (field_type, description) in fields.items()
+        }
+        prompt = BATCH_EXTRACTION_PROMPT.format(
+            field_schemas=json.dumps(field_schemas, indent=2),
+            conversation_history=conversation_history,
+        )
+
+        try:
+            messages = [
+                LLMMessage(role="system", content="You extract structured data from conversations."),
+                LLMMessage(role="user", content=prompt),
+            ]
+            response = await self._llm_executor.generate(
+                messages=messages,
+                max_tokens=BATCH_TOKENS_PER_FIELD * len(fields),
+            )
+            data = json.loads(response.content.strip())
+            if not isinstance(data, dict):
+                raise TypeError(f"Expected JSON object, got {type(data).__name__}")
+
+        except Exception as e:
+            logger.warning(
+                "gap_fill_batch_extraction_failed",
+                session_id=str(session.session_id),
+                field_names=list(fields),
+                error=str(e),
+            )
+            return not_found
+
+        results = dict(not_found)
+        for name in fields:
+            field_data = data.get(name)
+            if not isinstance(field_data, dict):
+                continue
+            try:
+                results[name] = self._parse_extraction_data(name, field_data)
+            except (ValueError, TypeError) as e:
+                logger.warning(
+                    "gap_fill_parse_failed",
+                    field_name=name,
+                    error=str(e),
+                )
+
+        return results
+
+    def _build_field_schema(
+        self,
+        field_name: str,
+        field_type: str,
+        field_description: str | None,
+    ) -> dict[str, Any]:
+        """Build the JSON schema fragment describing one field's value.
+
+        Args:
+            field_name: Field name
+            field_type: Field value_type (string, email, date, number, ...)
+            field_description: Human description or collection prompt
+
+        Returns:
+            JSON schema dict for the field value
+        """
+        schema = dict(_JSON_SCHEMA_TYPES.get(field_type, _JSON_SCHEMA_TYPES["string"]))
+        schema["description"] = field_description or f"The {field_name} value"
+        return schema
+
     def _build_conversation_history(
         self,
         session: "Session",
@@ -526,47 +698,62 @@ class MissingFieldResolver:
         try:
             # Try to parse as JSON
             data = json.loads(response.strip())
+            return self._parse_extraction_data(field_name, data)
 
-            found = data.get("found", False)
-            if not found:
-                return FieldResolutionResult(
-                    field_name=field_name,
-                    filled=False,
-                    source=ResolutionSource.NOT_FOUND,
-                )
+        except (json.JSONDecodeError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(
+                "gap_fill_parse_failed",
+                field_name=field_name,
+                error=str(e),
+            )
+            return FieldResolutionResult(
+                field_name=field_name,
+                filled=False,
+                source=ResolutionSource.NOT_FOUND,
+            )
 
-            confidence = float(data.get("confidence", 0.0))
+    def _parse_extraction_data(
+        self,
+        field_name: str,
+        data: dict[str, Any],
+    ) -> FieldResolutionResult:
+        """Turn one field's extraction payload into a result.
 
-            # Check against threshold
-            if confidence < USE_THRESHOLD:
-                return FieldResolutionResult(
-                    field_name=field_name,
-                    filled=False,
-                    source=ResolutionSource.NOT_FOUND,
-                )
+        Args:
+            field_name: Field being extracted
+            data: Parsed payload with found/value/confidence/source_quote
 
+        Returns:
+            FieldResolutionResult, filled only above USE_THRESHOLD
+        """
+        found = data.get("found", False)
+        if not found:
             return FieldResolutionResult(
                 field_name=field_name,
-                filled=True,
-                value=data.get("value"),
-                source=ResolutionSource.EXTRACTION,
-                confidence=confidence,
-                needs_confirmation=confidence < NO_CONFIRM_THRESHOLD,
-                extraction_quote=data.get("source_quote"),
+                filled=False,
+                source=ResolutionSource.NOT_FOUND,
             )
 
-        except (json.JSONDecodeError, ValueError, TypeError) as e:
-            logger.warning(
-                "gap_fill_parse_failed",
-                field_name=field_name,
-                error=str(e),
-            )
+        confidence = float(data.get("confidence", 0.0))
+
+        # Check against threshold
+        if confidence < USE_THRESHOLD:
             return FieldResolutionResult(
                 field_name=field_name,
                 filled=False,
                 source=ResolutionSource.NOT_FOUND,
             )
 
+        return FieldResolutionResult(
+            field_name=field_name,
+            filled=True,
+            value=data.get("value"),
+            source=ResolutionSource.EXTRACTION,
+            confidence=confidence,
+            needs_confirmation=confidence < NO_CONFIRM_THRESHOLD,
+            extraction_quote=data.get("source_quote"),
+        )
+
     async def persist_extracted_values(
         self,
         session: "Session",
@@ -576,6 +763,8 @@ class MissingFieldResolver:
         """Persist extracted values to profile for future use.
 
         Enhanced with lineage tracking (T150) and validation checks (T151).
+        The profile is loaded once and all values are written with a single
+        update_fields() call.
 
         Args:
             session: Current session
@@ -588,8 +777,7 @@ class MissingFieldResolver:
         if not self._profile_store:
             return 0
 
-        persisted = 0
-
+        to_persist: list[FieldResolutionResult] = []
         for result in results:
             if not result.filled:
                 continue
@@ -608,24 +796,23 @@ class MissingFieldResolver:
                 )
                 continue
 
-            try:
-                # Get profile to update
-                interlocutor_id = getattr(session, "interlocutor_id", None)
-                if interlocutor_id is None:
-                    continue
-
-                profile = await self._profile_store.get_by_interlocutor_id(
-                    tenant_id=session.tenant_id,
-                    interlocutor_id=interlocutor_id,
-                )
-                if profile is None:
-                    continue
+            to_persist.append(result)
 
-                # Create VariableEntry with lineage tracking (T150)
-                from ruche.interlocutor_data.enums import VariableSource
-                from ruche.interlocutor_data.models import VariableEntry
+        if not to_persist:
+            return 0
+
+        try:
+            # Get profile to update
+            profile = await self._load_profile(session)
+            if profile is None:
+                return 0
+
+            # Create VariableEntry with lineage tracking (T150)
+            from ruche.interlocutor_data.enums import VariableSource
+            from ruche.interlocutor_data.models import VariableEntry
 
-                field = VariableEntry(
+            fields = [
+                VariableEntry(
                     name=result.field_name,
                     value=result.value,
                     value_type="string",  # Default, could be enhanced
@@ -634,37 +821,38 @@ class MissingFieldResolver:
                     confidence=result.confidence,
                     requires_confirmation=result.needs_confirmation,
                     source_item_type=SourceType(result.source_item_type) if result.source_item_type else None,
+                    field_definition_id=result.field_definition_id,
                     source_metadata={
                         "extraction_quote": result.extraction_quote,
                         "session_id": str(session.session_id),
                     },
                 )
+                for result in to_persist
+            ]
 
-                await self._profile_store.update_field(
-                    tenant_id=session.tenant_id,
-                    profile_id=profile.id,
-                    field=field,
-                    supersede_existing=True,
-                )
-                persisted += 1
-
-                logger.info(
-                    "gap_fill_persisted",
-                    session_id=str(session.session_id),
-                    field_name=result.field_name,
-                    source_item_type=result.source_item_type,
-                    confidence=result.confidence,
-                )
+            await self._profile_store.update_fields(
+                tenant_id=session.tenant_id,
+                profile_id=profile.id,
+                fields=fields,
+                supersede_existing=True,
+            )
 
-            except Exception as e:
-                logger.warning(
-                    "gap_fill_persist_failed",
-                    session_id=str(session.session_id),
-                    field_name=result.field_name,
-                    error=str(e),
-                )
+        except Exception as e:
+            logger.warning(
+                "gap_fill_persist_failed",
+                session_id=str(session.session_id),
+                field_names=[r.field_name for r in to_persist],
+                error=str(e),
+            )
+            return 0
 
-        return persisted
+        logger.info(
+            "gap_fill_persisted",
+            session_id=str(session.session_id),
+            field_names=[r.field_name for r in to_persist],
+            count=len(to_persist),
+        )
+        return len(to_persist)
 
     async def fill_multiple(
         self,
@@ -673,10 +861,14 @@ class MissingFieldResolver:
         field_definitions: dict[str, dict[str, Any]] | None = None,
         tenant_id: UUID | None = None,
         agent_id: UUID | None = None,
+        batch_extraction: bool = True,
     ) -> dict[str, FieldResolutionResult]:
         """Fill multiple fields at once.
 
-        Enhanced to use schema lookups (T148, T149).
+        Enhanced to use schema lookups (T148, T149). In batch mode the
+        profile is loaded once, profile and session hits are resolved in a
+        single pass, and all remaining fields are extracted with one LLM
+        call instead of one call per field.
 
         Args:
             field_names: Fields to fill
@@ -684,25 +876,110 @@ class MissingFieldResolver:
             field_definitions: Optional field type/description info (overrides schema)
             tenant_id: Tenant ID for schema lookup
             agent_id: Agent ID for schema lookup
+            batch_extraction: Use a single LLM call for all missing fields.
+                If False, falls back to per-field fill_gap().
 
         Returns:
             Dict mapping field name to result
         """
-        results = {}
+        results: dict[str, FieldResolutionResult] = {}
+
+        if not batch_extraction:
+            for field_name in field_names:
+                field_def = (field_definitions or {}).get(field_name, {})
+                result = await self.fill_gap(
+                    field_name=field_name,
+                    session=session,
+                    field_type=field_def.get("type", "string"),
+                    field_description=field_def.get("description"),
+                    tenant_id=tenant_id,
+                    agent_id=agent_id,
+                )
+                results[field_name] = result
+            return results
+
+        _tenant_id = tenant_id or getattr(session, "tenant_id", None)
+        _agent_id = agent_id or getattr(session, "agent_id", None)
+
+        profile = None
+        if self._profile_store:
+            try:
+                profile = await self._load_profile(session)
+            except Exception as e:
+                logger.warning(
+                    "gap_fill_profile_lookup_failed",
+                    field_names=field_names,
+                    error=str(e),
+                )
 
+        definitions: dict[str, InterlocutorDataField | None] = {}
+        to_extract: dict[str, tuple[str, str | None]] = {}
+
+        # Tiers 1 and 2: profile and session, resolved in one pass
         for field_name in field_names:
-            field_def = (field_definitions or {}).get(field_name, {})
-            result = await self.fill_gap(
+            field_definition = await self._get_field_definition(
                 field_name=field_name,
+                tenant_id=_tenant_id,
+                agent_id=_agent_id,
+            )
+            definitions[field_name] = field_definition
+
+            result = self._resolve_from_profile(field_name, profile)
+            if not result.filled:
+                result = self.try_session_fill(field_name=field_name, session=session)
+                if result.filled:
+                    # Track lineage from session (T150)
+                    result.source_item_type = SourceType.SESSION.value
+
+            if result.filled:
+                if field_definition:
+                    result.field_definition_id = field_definition.id
+                results[field_name] = result
+                continue
+
+            field_def = (field_definitions or {}).get(field_name, {})
+            effective_type = field_def.get("type", "string")
+            effective_description = field_def.get("description")
+            if field_definition:
+                effective_type = field_definition.value_type or effective_type
+                effective_description = (
+                    field_definition.extraction_prompt_hint
+                    or field_definition.collection_prompt
+                    or effective_description
+                )
+            to_extract[field_name] = (effective_type, effective_description)
+
+        # Tier 3: every still-missing field in a single extraction call
+        if to_extract:
+            extracted = await self.try_batch_conversation_extraction(
+                fields=to_extract,
                 session=session,
-                field_type=field_def.get("type", "string"),
-                field_description=field_def.get("description"),
-                tenant_id=tenant_id,
-                agent_id=agent_id,
             )
-            results[field_name] = result
+            for field_name, result in extracted.items():
+                field_definition = definitions.get(field_name)
+                if field_definition:
+                    result.field_definition_id = field_definition.id
+                if result.filled:
+                    # Track lineage for extracted values (T150)
+                    result.source_item_type = SourceType.TOOL.value  # LLM extraction is a tool
+                    if field_definition:
+                        # Validate extracted value against schema (T151)
+                        result.validation_errors = await self._validate_result(
+                            result=result,
+                            field_definition=field_definition,
+                        )
+                results[field_name] = result
 
-        return results
+        logger.info(
+            "gap_fill_batch_complete",
+            session_id=str(session.session_id),
+            total=len(field_names),
+            filled=sum(1 for r in results.values() if r.filled),
+            extraction_candidates=len(to_extract),
+        )
+
+        # Preserve the caller's field order
+        return {name: results[name] for name in field_names}
 
     async def fill_scenario_requirements(
         self,
@@ -0,0 +1,256 @@
+"""Dependency-declared phase scheduler for the FOCAL turn pipeline.
+
+Phases declare which other phases they read from. The scheduler starts each
+phase as soon as all of its inputs are available, so phases without a data
+dependency overlap instead of running back to back.
+
+A phase may also declare a speculative variant that starts earlier, with a
+smaller set of inputs. Once the full inputs are ready the speculative result
+is checked; if an upstream output invalidated it (e.g. the situation sensor
+changed the retrieval query) it is discarded and the phase runs normally.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from ruche.observability.logging import get_logger
+from ruche.observability.metrics import PHASE_OVERLAP_SAVINGS, PHASE_SPECULATION
+
+logger = get_logger(__name__)
+
+PhaseResults = dict[str, Any]
+PhaseFn = Callable[[PhaseResults], Awaitable[Any]]
+
+
+@dataclass
+class Phase:
+    """A unit of pipeline work with declared inputs.
+
+    Attributes:
+        name: Unique phase name; its output is stored under this key
+        run: Coroutine computing the output from upstream results
+        depends_on: Phases whose outputs `run` reads
+        speculate: Optional coroutine started once `speculate_after` is ready
+        speculate_after: Inputs the speculative variant needs (may be empty)
+        is_valid: Decides whether a speculative output can be kept once all
+            of `depends_on` is available
+        adopt: Optional hook turning an accepted speculative output into the
+            phase output (e.g. to apply it to the final upstream state)
+    """
+
+    name: str
+    run: PhaseFn
+    depends_on: tuple[str, ...] = ()
+    speculate: PhaseFn | None = None
+    speculate_after: tuple[str, ...] = ()
+    is_valid: Callable[[PhaseResults, Any], bool] | None = None
+    adopt: Callable[[PhaseResults, Any], Awaitable[Any]] | None = None
+
+
+@dataclass
+class PhaseRun:
+    """Timing record for one executed phase (or discarded speculation)."""
+
+    name: str
+    started_at: datetime
+    ended_at: datetime
+    duration_ms: float
+    speculative: bool = False
+    discarded: bool = False
+
+
+@dataclass
+class ScheduleReport:
+    """Outcome of a scheduler run."""
+
+    results: PhaseResults
+    runs: list[PhaseRun] = field(default_factory=list)
+    wall_time_ms: float = 0.0
+
+    @property
+    def sequential_time_ms(self) -> float:
+        """Sum of phase durations, i.e. the latency without overlap."""
+        return sum(r.duration_ms for r in self.runs if not r.discarded)
+
+    @property
+    def discarded(self) -> list[PhaseRun]:
+        """Speculative runs whose output was thrown away."""
+        return [r for r in self.runs if r.discarded]
+
+
+class PhaseScheduler:
+    """Runs a DAG of phases, starting each as soon as its inputs are ready.
+
+    With concurrent=False, phases run one after another in declaration order
+    and speculation is disabled, which reproduces the strictly sequential
+    pipeline.
+    """
+
+    def __init__(self, phases: list[Phase], *, concurrent: bool = True) -> None:
+        """Initialize and validate the phase graph.
+
+        Args:
+            phases: Phases in a valid topological (declaration) order
+            concurrent: Overlap independent phases and run speculation
+
+        Raises:
+            ValueError: On duplicate names, unknown or forward dependencies
+        """
+        seen: set[str] = set()
+        for phase in phases:
+            if phase.name in seen:
+                raise ValueError(f"Duplicate phase name: {phase.name}")
+            for dep in (*phase.depends_on, *phase.speculate_after):
+                if dep not in seen:
+                    raise ValueError(
+                        f"Phase {phase.name!r} depends on {dep!r}, "
+                        "which is unknown or declared later"
+                    )
+            if phase.speculate and not set(phase.speculate_after) <= set(phase.depends_on):
+                raise ValueError(
+                    f"Phase {phase.name!r}: speculate_after must be a subset of depends_on"
+                )
+            seen.add(phase.name)
+
+        self._phases = phases
+        self._concurrent = concurrent
+
+    async def run(self, initial: PhaseResults | None = None) -> ScheduleReport:
+        """Execute all phases.
+
+        Args:
+            initial: Pre-computed values available to every phase
+
+        Returns:
+            ScheduleReport with outputs keyed by phase name and timings
+
+        Raises:
+            Exception: The first exception raised by a (non-speculative) phase
+        """
+        report = ScheduleReport(results=dict(initial or {}))
+        start = time.perf_counter()
+
+        if self._concurrent:
+            await self._run_concurrent(report)
+        else:
+            for phase in self._phases:
+                report.results[phase.name] = await self._timed(
+                    report, phase.name, phase.run(report.results)
+                )
+
+        report.wall_time_ms = (time.perf_counter() - start) * 1000
+        saved_ms = max(0.0, report.sequential_time_ms - report.wall_time_ms)
+        PHASE_OVERLAP_SAVINGS.observe(saved_ms / 1000)
+
+        logger.debug(
+            "phase_schedule_complete",
+            phases=len(self._phases),
+            wall_time_ms=round(report.wall_time_ms, 2),
+            sequential_time_ms=round(report.sequential_time_ms, 2),
+            discarded=[r.name for r in report.discarded],
+        )
+        return report
+
+    async def _run_concurrent(self, report: ScheduleReport) -> None:
+        results = report.results
+        done: set[str] = set(results)
+        ready_events = {p.name: asyncio.Event() for p in self._phases}
+        speculative: dict[str, asyncio.Task[Any]] = {}
+
+        async def wait_for(deps: tuple[str, ...]) -> None:
+            for dep in deps:
+                if dep not in done:
+                    await ready_events[dep].wait()
+
+        async def run_speculative(phase: Phase) -> Any:
+            await wait_for(phase.speculate_after)
+            assert phase.speculate is not None
+            return await self._timed(
+                report, phase.name, phase.speculate(results), speculative=True
+            )
+
+        async def run_phase(phase: Phase) -> None:
+            await wait_for(phase.depends_on)
+            value = await self._resolve(report, phase, speculative.get(phase.name))
+            results[phase.name] = value
+            done.add(phase.name)
+            ready_events[phase.name].set()
+
+        for phase in self._phases:
+            if phase.speculate is not None:
+                speculative[phase.name] = asyncio.create_task(run_speculative(phase))
+
+        tasks = [asyncio.create_task(run_phase(p)) for p in self._phases]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in (*tasks, *speculative.values()):
+                if not task.done():
+                    task.cancel()
+            # Let cancelled tasks unwind before returning
+            await asyncio.gather(*tasks, *speculative.values(), return_exceptions=True)
+
+    async def _resolve(
+        self,
+        report: ScheduleReport,
+        phase: Phase,
+        spec_task: "asyncio.Task[Any] | None",
+    ) -> Any:
+        """Use the speculative output if still valid, else run the phase."""
+        if spec_task is not None:
+            try:
+                spec_value = await spec_task
+            except Exception as e:
+                logger.warning(
+                    "phase_speculation_failed",
+                    phase=phase.name,
+                    error=str(e),
+                )
+                PHASE_SPECULATION.labels(phase=phase.name, outcome="error").inc()
+                self._mark_discarded(report, phase.name)
+            else:
+                if phase.is_valid is None or phase.is_valid(report.results, spec_value):
+                    PHASE_SPECULATION.labels(phase=phase.name, outcome="hit").inc()
+                    if phase.adopt is not None:
+                        return await phase.adopt(report.results, spec_value)
+                    return spec_value
+
+                PHASE_SPECULATION.labels(phase=phase.name, outcome="discarded").inc()
+                self._mark_discarded(report, phase.name)
+                logger.info("phase_speculation_discarded", phase=phase.name)
+
+        return await self._timed(report, phase.name, phase.run(report.results))
+
+    async def _timed(
+        self,
+        report: ScheduleReport,
+        name: str,
+        coro: Awaitable[Any],
+        *,
+        speculative: bool = False,
+    ) -> Any:
+        started_at = datetime.utcnow()
+        start = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            report.runs.append(
+                PhaseRun(
+                    name=name,
+                    started_at=started_at,
+                    ended_at=datetime.utcnow(),
+                    duration_ms=(time.perf_counter() - start) * 1000,
+                    speculative=speculative,
+                )
+            )
+
+    @staticmethod
+    def _mark_discarded(report: ScheduleReport, name: str) -> None:
+        for run in reversed(report.runs):
+            if run.name == name and run.speculative:
+                run.discarded = True
+                return
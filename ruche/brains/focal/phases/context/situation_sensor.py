@@ -64,6 +64,14 @@ class SituationSensor:
         templates_dir = Path(__file__).parent / "prompts"
         self._template_loader = TemplateLoader(templates_dir)
 
+    def precompile_templates(self) -> int:
+        """Compile sensor prompt templates ahead of the first turn.
+
+        Returns:
+            Number of templates compiled
+        """
+        return self._template_loader.precompile()
+
     async def sense(
         self,
         message: str,
@@ -29,6 +29,17 @@ class TemplateLoader:
             lstrip_blocks=True,
         )
 
+    def precompile(self) -> int:
+        """Compile every template in the directory into the environment cache.
+
+        Returns:
+            Number of templates compiled
+        """
+        names = self.env.list_templates(extensions=["jinja2"])
+        for name in names:
+            self.env.get_template(name)
+        return len(names)
+
     def render(self, template_name: str, **context) -> str:
         """Render a template with context variables.
 
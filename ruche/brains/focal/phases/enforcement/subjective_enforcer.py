@@ -1,5 +1,8 @@
 """LLM-as-Judge enforcement for subjective rules."""
 
+import asyncio
+import json
+
 from ruche.brains.focal.models import Rule
 from ruche.config.models.pipeline import EnforcementConfig
 from ruche.infrastructure.providers.llm import LLMExecutor, LLMMessage
@@ -30,6 +33,21 @@ Response to evaluate:
 
 Does this response comply with the rule?"""
 
+    BATCH_SYSTEM_PROMPT = """You are a compliance judge. Your job is to determine if a response complies with each of the given rules.
+
+Return JSON only:
+{"verdicts": [{"rule_id": "<rule id>", "verdict": "PASS" or "FAIL", "reason": "<why it fails, empty for PASS>"}]}
+
+Give exactly one verdict per rule. Be strict but fair."""
+
+    BATCH_USER_PROMPT_TEMPLATE = """Rules:
+{rules}
+
+Response to evaluate:
+"{response}"
+
+Does this response comply with each rule?"""
+
     def __init__(
         self,
         llm_executor: LLMExecutor,
@@ -128,3 +146,129 @@ Does this response comply with the rule?"""
             )
             # On error, pass by default (fail-open for reliability)
             return (True, "")
+
+    async def evaluate_batch(
+        self,
+        response: str,
+        rules: list[Rule],
+    ) -> list[tuple[bool, str]]:
+        """Evaluate response against several subjective rules.
+
+        Rules are judged in one call per chunk of
+        llm_judge_max_rules_per_call rules, chunks concurrently. A single
+        rule uses evaluate(). Rules missing from a parsable verdict list
+        are judged one by one.
+
+        Args:
+            response: Generated response to evaluate
+            rules: Rules to check compliance against
+
+        Returns:
+            (passed, explanation) per rule, in the order of rules
+        """
+        if len(rules) == 1:
+            return [await self.evaluate(response, rules[0])]
+        if not rules:
+            return []
+        if not self._config.llm_judge_models:
+            logger.warning(
+                "enforcement_llm_judge_no_models_configured",
+                rule_count=len(rules),
+            )
+            return [(True, "")] * len(rules)
+
+        size = self._config.llm_judge_max_rules_per_call
+        chunks = [rules[i : i + size] for i in range(0, len(rules), size)]
+        results = await asyncio.gather(*(self._evaluate_chunk(response, c) for c in chunks))
+
+        logger.debug(
+            "enforcement_llm_judge_batch",
+            rule_count=len(rules),
+            chunk_count=len(chunks),
+        )
+        return [verdict for chunk_result in results for verdict in chunk_result]
+
+    async def _evaluate_chunk(
+        self,
+        response: str,
+        rules: list[Rule],
+    ) -> list[tuple[bool, str]]:
+        """Judge one chunk of rules in a single LLM call."""
+        user_prompt = self.BATCH_USER_PROMPT_TEMPLATE.format(
+            rules="\n".join(f"- [{rule.id}] {rule.action_text}" for rule in rules),
+            response=response,
+        )
+        messages = [
+            LLMMessage(role="system", content=self.BATCH_SYSTEM_PROMPT),
+            LLMMessage(role="user", content=user_prompt),
+        ]
+
+        try:
+            result = await self._llm.generate(
+                messages=messages,
+                temperature=0.0,
+                max_tokens=50 + 60 * len(rules),
+            )
+        except Exception as e:  # noqa: BLE001
+            logger.error(
+                "enforcement_llm_judge_error",
+                rule_count=len(rules),
+                error=str(e),
+            )
+            # On error, pass by default (fail-open for reliability)
+            return [(True, "")] * len(rules)
+
+        verdicts = self._parse_verdicts(result.content)
+        missing = [rule for rule in rules if str(rule.id) not in verdicts]
+        if missing:
+            logger.warning(
+                "enforcement_llm_judge_missing_verdicts",
+                rule_count=len(rules),
+                missing_count=len(missing),
+            )
+            judged = await asyncio.gather(*(self.evaluate(response, rule) for rule in missing))
+            verdicts.update({str(rule.id): v for rule, v in zip(missing, judged, strict=True)})
+
+        for rule in rules:
+            passed, reason = verdicts[str(rule.id)]
+            if not passed:
+                logger.info(
+                    "enforcement_llm_judge_fail",
+                    rule_id=str(rule.id),
+                    rule_name=rule.name,
+                    reason=reason,
+                )
+        return [verdicts[str(rule.id)] for rule in rules]
+
+    def _parse_verdicts(self, content: str) -> dict[str, tuple[bool, str]]:
+        """Parse a batch judgment into (passed, reason) by rule ID.
+
+        Verdicts other than PASS/FAIL are left out, so their rules are
+        judged again individually.
+        """
+        content = content.strip()
+
+        # Handle markdown code blocks
+        if "```" in content:
+            start = content.find("```json") + 7 if "```json" in content else content.find("```") + 3
+            end = content.find("```", start)
+            if end > start:
+                content = content[start:end].strip()
+
+        try:
+            data = json.loads(content)
+            entries = data.get("verdicts", [])
+        except (json.JSONDecodeError, AttributeError):
+            return {}
+
+        verdicts: dict[str, tuple[bool, str]] = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            verdict = str(entry.get("verdict", "")).upper()
+            if verdict == "PASS":
+                verdicts[str(entry.get("rule_id", ""))] = (True, "")
+            elif verdict == "FAIL":
+                reason = str(entry.get("reason") or "Rule violation detected")
+                verdicts[str(entry.get("rule_id", ""))] = (False, reason)
+        return verdicts
@@ -2,8 +2,12 @@
 
 Lane 1: Deterministic - Rules with enforcement_expression use simpleeval
 Lane 2: Subjective - Rules without expression use LLM-as-Judge
+
+Lane 2 judges all subjective rules in batched LLM calls that are in
+flight while lane 1 is evaluated in a worker thread.
 """
 
+import asyncio
 import time
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
@@ -39,8 +43,15 @@ class EnforcementValidator:
     CRITICAL: This validator ALWAYS enforces GLOBAL hard constraints,
     even if they weren't matched during retrieval. This prevents
     safety gaps where global guardrails are bypassed.
+
+    GLOBAL hard constraints are cached per agent, keyed by the agent's
+    live current_version and kept at most global_rules_cache_ttl_seconds,
+    so rule edits are picked up on publish or within the TTL at the latest.
     """
 
+    # Agents whose GLOBAL hard constraints are kept in memory
+    GLOBAL_RULES_CACHE_SIZE = 1000
+
     def __init__(
         self,
         response_generator: ResponseGenerator,
@@ -68,6 +79,9 @@ class EnforcementValidator:
         )
         self._variable_extractor = VariableExtractor()
 
+        # (tenant_id, agent_id) -> (current_version, fetched_at, GLOBAL hard constraints)
+        self._global_rules_cache: dict[tuple[UUID, UUID], tuple[int, float, list[Rule]]] = {}
+
     async def validate(
         self,
         response: str,
@@ -276,21 +290,17 @@ class EnforcementValidator:
         # 2. CRITICAL: Add ALL GLOBAL hard constraints (always enforce)
         if self._config.always_enforce_global:
             try:
-                global_rules = await self._agent_config_store.get_rules(
+                global_hard_rules = await self._get_global_hard_rules(
                     tenant_id=tenant_id,
                     agent_id=agent_id,
-                    scope=Scope.GLOBAL,
-                    enabled_only=True,
                 )
 
-                # Filter to hard constraints only and avoid duplicates
-                global_hard_count = 0
-                for rule in global_rules:
-                    if rule.is_hard_constraint:
-                        global_hard_count += 1
-                        if rule.id not in matched_ids:
-                            rules.append(rule)
-                            matched_ids.add(rule.id)
+                # Avoid duplicates with matched rules
+                global_hard_count = len(global_hard_rules)
+                for rule in global_hard_rules:
+                    if rule.id not in matched_ids:
+                        rules.append(rule)
+                        matched_ids.add(rule.id)
 
                 logger.info(
                     "enforcement_global_constraints_added",
@@ -312,6 +322,62 @@ class EnforcementValidator:
 
         return rules
 
+    async def _get_global_hard_rules(
+        self,
+        tenant_id: UUID,
+        agent_id: UUID,
+    ) -> list[Rule]:
+        """Get GLOBAL hard constraints, cached per agent version.
+
+        A cached entry is used only while the agent's current_version is
+        unchanged and the entry is younger than global_rules_cache_ttl_seconds.
+        If the version cannot be read, the rules are fetched uncached.
+
+        Args:
+            tenant_id: Tenant ID
+            agent_id: Agent ID
+
+        Returns:
+            Enabled GLOBAL rules that are hard constraints
+        """
+        key = (tenant_id, agent_id)
+        ttl = self._config.global_rules_cache_ttl_seconds
+        version: int | None = None
+        if ttl > 0:
+            try:
+                agent = await self._agent_config_store.get_agent(tenant_id, agent_id)
+                version = agent.current_version if agent else None
+            except Exception as e:  # noqa: BLE001
+                logger.warning(
+                    "enforcement_agent_version_unavailable",
+                    tenant_id=str(tenant_id),
+                    agent_id=str(agent_id),
+                    error=str(e),
+                )
+
+        now = time.monotonic()
+        if version is not None:
+            cached = self._global_rules_cache.get(key)
+            if cached is not None and cached[0] == version and now - cached[1] < ttl:
+                return cached[2]
+
+        global_rules = await self._agent_config_store.get_rules(
+            tenant_id=tenant_id,
+            agent_id=agent_id,
+            scope=Scope.GLOBAL,
+            enabled_only=True,
+        )
+        hard_rules = [rule for rule in global_rules if rule.is_hard_constraint]
+
+        if version is not None:
+            self._global_rules_cache.pop(key, None)
+            if len(self._global_rules_cache) >= self.GLOBAL_RULES_CACHE_SIZE:
+                # Evict the least recently stored agent
+                del self._global_rules_cache[next(iter(self._global_rules_cache))]
+            self._global_rules_cache[key] = (version, now, hard_rules)
+
+        return hard_rules
+
     def _extract_variables(
         self,
         response: str,
@@ -361,7 +427,8 @@ class EnforcementValidator:
         """Execute two-lane enforcement.
 
         Lane 1: Deterministic enforcement using simpleeval
-        Lane 2: Subjective enforcement using LLM-as-Judge
+        Lane 2: Subjective enforcement using LLM-as-Judge, started first so
+        its judge calls are in flight while lane 1 runs in a worker thread
 
         Args:
             response: Response to validate
@@ -374,7 +441,61 @@ class EnforcementValidator:
         """
         violations: list[ConstraintViolation] = []
 
-        # Lane 1: Deterministic enforcement
+        if not (self._config.llm_judge_enabled and lane2_rules):
+            return self._enforce_lane1(lane1_rules, variables)
+
+        # Lane 2 waits on the LLM while lane 1 (CPU only) runs in a thread,
+        # so the event loop is free to send the judge calls meanwhile
+        lane2_task = asyncio.create_task(
+            self._subjective_enforcer.evaluate_batch(response=response, rules=lane2_rules)
+        )
+        try:
+            if self._config.deterministic_enabled and lane1_rules:
+                violations.extend(
+                    await asyncio.to_thread(self._enforce_lane1, lane1_rules, variables)
+                )
+
+            # Lane 2: Subjective enforcement (LLM-as-Judge)
+            verdicts = await lane2_task
+        finally:
+            if not lane2_task.done():
+                lane2_task.cancel()
+
+        for rule, (passed, reason) in zip(lane2_rules, verdicts, strict=True):
+            if not passed:
+                violations.append(
+                    ConstraintViolation(
+                        rule_id=rule.id,
+                        rule_name=rule.name,
+                        violation_type="llm_judge_failed",
+                        details=reason or f"LLM judge found violation of rule '{rule.name}'",
+                        severity="hard",
+                    )
+                )
+                logger.info(
+                    "enforcement_lane2_violation",
+                    rule_id=str(rule.id),
+                    rule_name=rule.name,
+                    reason=reason,
+                )
+
+        return violations
+
+    def _enforce_lane1(
+        self,
+        lane1_rules: list[Rule],
+        variables: dict[str, Any],
+    ) -> list[ConstraintViolation]:
+        """Evaluate deterministic rules (Lane 1).
+
+        Args:
+            lane1_rules: Rules with enforcement_expression
+            variables: Variables for expression evaluation
+
+        Returns:
+            List of constraint violations
+        """
+        violations: list[ConstraintViolation] = []
         if self._config.deterministic_enabled and lane1_rules:
             for rule in lane1_rules:
                 passed, error_msg = self._deterministic_enforcer.evaluate(
@@ -399,30 +520,6 @@ class EnforcementValidator:
                         error=error_msg,
                     )
 
-        # Lane 2: Subjective enforcement (LLM-as-Judge)
-        if self._config.llm_judge_enabled and lane2_rules:
-            for rule in lane2_rules:
-                passed, reason = await self._subjective_enforcer.evaluate(
-                    response=response,
-                    rule=rule,
-                )
-                if not passed:
-                    violations.append(
-                        ConstraintViolation(
-                            rule_id=rule.id,
-                            rule_name=rule.name,
-                            violation_type="llm_judge_failed",
-                            details=reason or f"LLM judge found violation of rule '{rule.name}'",
-                            severity="hard",
-                        )
-                    )
-                    logger.info(
-                        "enforcement_lane2_violation",
-                        rule_id=str(rule.id),
-                        rule_name=rule.name,
-                        reason=reason,
-                    )
-
         return violations
 
     async def _regenerate(
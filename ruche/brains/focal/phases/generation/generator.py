@@ -95,8 +95,8 @@ class ResponseGenerator:
                 generation_time_ms=(time.perf_counter() - start_time) * 1000,
             )
 
-        # Build prompt
-        system_prompt = self._prompt_builder.build_system_prompt(
+        # Build prompt (stable prefix first, per-turn content last)
+        layout = self._prompt_builder.build_prompt_layout(
             matched_rules=matched_rules,
             snapshot=snapshot,
             tool_results=tool_results,
@@ -105,21 +105,29 @@ class ResponseGenerator:
             glossary_items=glossary_items,
         )
 
-        # Add suggested templates to prompt
+        # Add suggested templates next to the rules that attach them
         if templates:
             suggested = [t for t in templates if self._get_template_mode(t) == TemplateResponseMode.SUGGEST]
             if suggested:
-                system_prompt = self._add_template_suggestions(system_prompt, suggested)
+                layout.append("knowledge", self._build_template_suggestions(suggested))
+        system_prompt = layout.text
 
         # Build messages
         messages = self._prompt_builder.build_messages(
-            system_prompt=system_prompt,
+            system_prompt=layout,
             user_message=snapshot.message,
             history=history,
         )
 
         # Convert to LLMMessage format
-        llm_messages = [LLMMessage(role=m["role"], content=m["content"]) for m in messages]
+        llm_messages = [
+            LLMMessage(
+                role=m["role"],
+                content=m["content"],
+                cache_breakpoint=m.get("cache_breakpoint", False),
+            )
+            for m in messages
+        ]
 
         # Generate response
         llm_response = await self._llm_executor.generate(
@@ -228,17 +236,9 @@ class ResponseGenerator:
 
         return content
 
-    def _add_template_suggestions(
-        self,
-        system_prompt: str,
-        templates: list[Template],
-    ) -> str:
-        """Add template suggestions to the prompt."""
-        if not templates:
-            return system_prompt
-
+    def _build_template_suggestions(self, templates: list[Template]) -> str:
+        """Build the template suggestions prompt section."""
         suggestions = [
-            "",
             "## Suggested Response Templates",
             "You may use or adapt these templates:",
         ]
@@ -246,4 +246,4 @@ class ResponseGenerator:
         for template in templates:
             suggestions.append(f"- {template.name}: {template.content[:200]}...")
 
-        return system_prompt + "\n".join(suggestions)
+        return "\n".join(suggestions)
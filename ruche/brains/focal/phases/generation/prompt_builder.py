@@ -2,9 +2,21 @@
 
 Assembles context, rules, memory, and tool results into prompts
 for response generation.
+
+Prompts are laid out from most to least stable so providers with prefix
+caching can reuse the leading part across turns:
+
+1. instructions - system template (identical for every turn)
+2. knowledge    - glossary, matched rules, template suggestions
+3. turn         - situation context, memory, tool results, response plan
+
+Segments 1 and 2 end with a cache breakpoint.
 """
 
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 from ruche.brains.focal.phases.context.models import Turn
 from ruche.brains.focal.phases.context.situation_snapshot import SituationSnapshot
@@ -14,6 +26,49 @@ from ruche.brains.focal.phases.planning.models import ResponsePlan
 
 _SYSTEM_PROMPT_PATH = Path(__file__).parent / "prompts" / "system_prompt.txt"
 
+_SECTION_PLACEHOLDERS = {
+    "rules_section": "",
+    "context_section": "",
+    "memory_section": "",
+    "tool_results_section": "",
+}
+_EXTRA_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+@dataclass
+class PromptSegment:
+    """A contiguous part of the system prompt.
+
+    Attributes:
+        name: Segment name (instructions, knowledge, turn)
+        text: Segment content
+        cache_breakpoint: Whether the prompt prefix ending here is cacheable
+    """
+
+    name: str
+    text: str
+    cache_breakpoint: bool = False
+
+
+@dataclass
+class PromptLayout:
+    """System prompt split into ordered stable-prefix/volatile-suffix segments."""
+
+    segments: list[PromptSegment] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        """Full system prompt as a single string."""
+        return "\n\n".join(s.text for s in self.segments if s.text)
+
+    def append(self, name: str, text: str) -> None:
+        """Append text to the named segment."""
+        for segment in self.segments:
+            if segment.name == name:
+                segment.text = f"{segment.text}\n\n{text}" if segment.text else text
+                return
+        raise KeyError(name)
+
 
 class PromptBuilder:
     """Build prompts for response generation.
@@ -48,10 +103,6 @@ class PromptBuilder:
     def _default_template(self) -> str:
         """Return a minimal default template."""
         return """You are a helpful AI assistant.
-{rules_section}
-{context_section}
-{memory_section}
-{tool_results_section}
 Respond helpfully to the user."""
 
     def build_system_prompt(
@@ -76,47 +127,93 @@ Respond helpfully to the user."""
         Returns:
             Complete system prompt string
         """
-        rules_section = self._build_rules_section(matched_rules)
-        context_section = self._build_context_section(snapshot)
-        memory_section = self._build_memory_section(memory_context)
-        tool_results_section = self._build_tool_results_section(tool_results)
-        glossary_section = self._build_glossary_section(glossary_items)
-        response_plan_section = self._build_response_plan_section(response_plan)
-
-        prompt = self._system_template.format(
-            rules_section=rules_section,
-            context_section=context_section,
-            memory_section=memory_section,
-            tool_results_section=tool_results_section,
-        )
+        return self.build_prompt_layout(
+            matched_rules=matched_rules,
+            snapshot=snapshot,
+            tool_results=tool_results,
+            memory_context=memory_context,
+            response_plan=response_plan,
+            glossary_items=glossary_items,
+        ).text
+
+    def build_prompt_layout(
+        self,
+        matched_rules: list[MatchedRule],
+        snapshot: SituationSnapshot,
+        tool_results: list[ToolResult] | None = None,
+        memory_context: str | None = None,
+        response_plan: ResponsePlan | None = None,
+        glossary_items: list | None = None,
+    ) -> PromptLayout:
+        """Build the system prompt as ordered, cache-friendly segments.
 
-        # Append glossary section if present
-        if glossary_section:
-            prompt += "\n\n" + glossary_section
+        Section placeholders in the system template ({rules_section}, etc.)
+        are rendered empty; the sections themselves are placed in the
+        knowledge and turn segments so per-turn content never precedes
+        stable content.
 
-        # Append response plan section if present
-        if response_plan_section:
-            prompt += "\n\n" + response_plan_section
+        Args:
+            matched_rules: Rules that apply to this turn
+            snapshot: Situation snapshot
+            tool_results: Results from tool execution
+            memory_context: Retrieved memory/episode context
+            response_plan: Phase 8 response plan (optional)
+            glossary_items: Domain-specific terminology (optional)
 
-        return prompt
+        Returns:
+            PromptLayout with instructions, knowledge and turn segments
+        """
+        instructions = self._render_instructions()
+        knowledge = self._join_sections(
+            self._build_glossary_section(glossary_items),
+            self._build_rules_section(matched_rules),
+        )
+        turn = self._join_sections(
+            self._build_context_section(snapshot),
+            self._build_memory_section(memory_context),
+            self._build_tool_results_section(tool_results),
+            self._build_response_plan_section(response_plan),
+        )
+
+        return PromptLayout(
+            segments=[
+                PromptSegment("instructions", instructions, cache_breakpoint=True),
+                PromptSegment("knowledge", knowledge, cache_breakpoint=True),
+                PromptSegment("turn", turn),
+            ]
+        )
 
     def build_messages(
         self,
-        system_prompt: str,
+        system_prompt: str | PromptLayout,
         user_message: str,
         history: list[Turn] | None = None,
-    ) -> list[dict[str, str]]:
+    ) -> list[dict[str, Any]]:
         """Build the message list for the LLM.
 
+        A PromptLayout produces one system message per non-empty segment,
+        carrying its cache_breakpoint flag.
+
         Args:
-            system_prompt: System prompt to use
+            system_prompt: System prompt string or layout
             user_message: Current user message
             history: Conversation history
 
         Returns:
             List of message dicts with role and content
         """
-        messages = [{"role": "system", "content": system_prompt}]
+        if isinstance(system_prompt, PromptLayout):
+            messages: list[dict[str, Any]] = [
+                {
+                    "role": "system",
+                    "content": segment.text,
+                    "cache_breakpoint": segment.cache_breakpoint,
+                }
+                for segment in system_prompt.segments
+                if segment.text
+            ]
+        else:
+            messages = [{"role": "system", "content": system_prompt}]
 
         # Add history
         if history:
@@ -128,6 +225,15 @@ Respond helpfully to the user."""
 
         return messages
 
+    def _render_instructions(self) -> str:
+        """Render the system template without per-turn sections."""
+        rendered = self._system_template.format(**_SECTION_PLACEHOLDERS)
+        return _EXTRA_BLANK_LINES.sub("\n\n", rendered).strip()
+
+    @staticmethod
+    def _join_sections(*sections: str) -> str:
+        return "\n\n".join(s for s in sections if s)
+
     def _build_rules_section(self, matched_rules: list[MatchedRule]) -> str:
         """Build the rules section of the prompt."""
         if not matched_rules:
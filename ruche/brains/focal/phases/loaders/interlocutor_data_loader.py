@@ -11,6 +11,7 @@ from ruche.domain.interlocutor import (
 )
 from ruche.interlocutor_data.enums import ItemStatus
 from ruche.infrastructure.stores.interlocutor.interface import InterlocutorDataStore as InterlocutorDataStoreInterface
+from ruche.infrastructure.stores.interlocutor.turn_memo import get_profile
 from ruche.observability.logging import get_logger
 
 logger = get_logger(__name__)
@@ -45,8 +46,10 @@ class InterlocutorDataLoader:
         Returns:
             InterlocutorDataStore with current field values
         """
-        # Get InterlocutorDataStore from InterlocutorDataStoreInterface
-        profile = await self._profile_store.get_by_interlocutor_id(
+        # Get InterlocutorDataStore from InterlocutorDataStoreInterface,
+        # once per turn when called inside the pipeline
+        profile = await get_profile(
+            self._profile_store,
             tenant_id=tenant_id,
             interlocutor_id=interlocutor_id,
         )
@@ -24,6 +24,7 @@ for observability with timing metrics and structured logging.
 
 import asyncio
 import time
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
@@ -56,6 +57,7 @@ from ruche.brains.focal.migration.models import (
 )
 from ruche.brains.focal.models import Rule, Template, TurnContext
 from ruche.brains.focal.models.outcome import TurnOutcome
+from ruche.brains.focal.phase_scheduler import Phase, PhaseResults, PhaseScheduler
 from ruche.brains.focal.phases.planning import ResponsePlanner
 from ruche.brains.focal.phases.planning.models import ResponsePlan, ScenarioContributionPlan
 from ruche.brains.focal.result import AlignmentResult, PipelineStepTiming
@@ -67,6 +69,10 @@ from ruche.brains.focal.retrieval import (
     ScenarioRetriever,
     decide_canonical_intent,
 )
+from ruche.brains.focal.retrieval.embedding_backfill import (
+    backfill_intent_embeddings,
+    backfill_scenario_embeddings,
+)
 from ruche.brains.focal.retrieval.models import RetrievalResult, ScoredEpisode, ScoredScenario
 from ruche.brains.focal.stores import AgentConfigStore
 from ruche.brains.focal.templates_loader import load_templates_for_rules
@@ -79,6 +85,13 @@ from ruche.conversation.models.turn import ToolCall, Turn as ConversationTurn
 from ruche.conversation.store import SessionStore
 from ruche.domain.interlocutor.models import VariableEntry
 from ruche.infrastructure.stores.interlocutor.interface import InterlocutorDataStore as InterlocutorDataStoreInterface
+from ruche.infrastructure.stores.interlocutor.turn_memo import (
+    clear_profile_memo,
+    forget_profile,
+    get_profile,
+    remember_profile,
+    start_profile_memo,
+)
 from ruche.interlocutor_data.validation import InterlocutorDataFieldValidator
 from ruche.memory.retrieval import MemoryRetriever
 from ruche.memory.retrieval.reranker import MemoryReranker
@@ -88,6 +101,7 @@ from ruche.infrastructure.providers.embedding import EmbeddingProvider
 from ruche.infrastructure.providers.llm import (
     ExecutionContext,
     LLMExecutor,
+    LLMResponseCache,
     clear_execution_context,
     create_executor,
     create_executors_from_pipeline_config,
@@ -97,10 +111,33 @@ from ruche.infrastructure.providers.rerank import RerankProvider
 from ruche.brains.focal.pipeline_contribution_extractor import extract_scenario_contributions
 from ruche.memory.ingestion.ingestor import MemoryIngestor
 from ruche.memory.ingestion.queue import InMemoryTaskQueue
+from ruche.vector.embedding_manager import EmbeddingManager
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class _SpeculativeRetrieval:
+    """Retrieval computed on the raw message before sensing completed."""
+
+    query: SituationSnapshot
+    result: RetrievalResult
+    intent_candidates: list
+    timing: PipelineStepTiming
+
+    def is_valid_for(self, snapshot: SituationSnapshot) -> bool:
+        """Whether the sensed snapshot would have produced the same retrieval.
+
+        Retrieval reads the query text, its embedding and the language (the
+        full-text leg of memory search ranks under the language's regconfig).
+        """
+        return (
+            snapshot.message == self.query.message
+            and snapshot.language == self.query.language
+            and (snapshot.embedding is None or snapshot.embedding == self.query.embedding)
+        )
+
+
 class FocalCognitivePipeline:
     """FOCAL cognitive pipeline implementation.
 
@@ -141,6 +178,8 @@ class FocalCognitivePipeline:
         executors: dict[str, LLMExecutor] | None = None,
         profile_store: InterlocutorDataStoreInterface | None = None,
         enable_requirement_checking: bool = True,
+        response_cache: LLMResponseCache | None = None,
+        embedding_manager: EmbeddingManager | None = None,
     ) -> None:
         """Initialize the alignment engine.
 
@@ -159,18 +198,30 @@ class FocalCognitivePipeline:
             executors: Optional pre-configured executors (for testing)
             profile_store: Store for customer profiles (enables field requirement checking)
             enable_requirement_checking: Whether to check field requirements on scenario entry
+            response_cache: Shared LLM response cache (e.g. with a Redis tier).
+                If omitted and pipeline_config.response_cache is enabled, an
+                in-process cache is created.
+            embedding_manager: Syncs backfilled scenario embeddings to the
+                vector store (optional)
         """
         self._config_store = config_store
         self._embedding_provider = embedding_provider
+        self._embedding_manager = embedding_manager
         self._session_store = session_store
         self._audit_store = audit_store
         self._config = pipeline_config or PipelineConfig()
 
+        if response_cache is None and self._config.response_cache.enabled:
+            response_cache = LLMResponseCache(self._config.response_cache)
+        self._response_cache = response_cache
+
         # Use provided executors or create from pipeline config
         if executors:
             self._executors = executors
         else:
-            self._executors = create_executors_from_pipeline_config(self._config)
+            self._executors = create_executors_from_pipeline_config(
+                self._config, response_cache=response_cache
+            )
 
         # Create per-object-type rerankers if configured
         rule_reranker = None
@@ -213,6 +264,7 @@ class FocalCognitivePipeline:
             embedding_provider=embedding_provider,
             selection_config=self._config.retrieval.scenario_selection,
             reranker=scenario_reranker,
+            embedding_manager=embedding_manager,
         )
         self._intent_retriever = IntentRetriever(
             config_store=config_store,
@@ -432,9 +484,13 @@ class FocalCognitivePipeline:
                 agent_id=agent_id,
                 session_id=session_id,
                 turn_id=turn_id,
+                config_version=await self._get_config_version(tenant_id, agent_id),
             )
         )
 
+        # Load each profile once for all phases of this turn
+        profile_memo = start_profile_memo()
+
         try:
             return await self._process_turn_impl(
                 message=message,
@@ -452,8 +508,69 @@ class FocalCognitivePipeline:
                 interlocutor_id=interlocutor_id,
             )
         finally:
+            clear_profile_memo(profile_memo)
             clear_execution_context()
 
+    async def _get_config_version(self, tenant_id: UUID, agent_id: UUID) -> int | None:
+        """Get the agent's published config version for response cache keys.
+
+        Only looked up when response caching is active; returns None otherwise
+        or if the agent can't be loaded.
+        """
+        if self._response_cache is None:
+            return None
+        try:
+            agent = await self._config_store.get_agent(tenant_id, agent_id)
+        except Exception as e:
+            logger.warning("config_version_lookup_failed", agent_id=str(agent_id), error=str(e))
+            return None
+        return agent.current_version if agent else None
+
+    async def warm_up(self, agents: list[tuple[UUID, UUID]]) -> int:
+        """Pay one-time costs before the first turn.
+
+        Compiles prompt templates and loads each agent's static config
+        (agent, glossary, data schema, rules, scenarios, intents) so that
+        connections, prepared statements and store caches are hot. Missing
+        scenario and intent embeddings are computed and saved here rather
+        than on the first turn.
+
+        Args:
+            agents: (tenant_id, agent_id) pairs to preload
+
+        Returns:
+            Number of agents preloaded
+        """
+        self._situation_sensor.precompile_templates()
+
+        warmed = 0
+        for tenant_id, agent_id in agents:
+            try:
+                agent = await self._config_store.get_agent(tenant_id, agent_id)
+                if agent is None:
+                    continue
+                await self._static_config_loader.load_glossary(tenant_id, agent_id)
+                await self._static_config_loader.load_customer_data_schema(
+                    tenant_id, agent_id
+                )
+                await self._config_store.get_rules(tenant_id, agent_id)
+                await backfill_scenario_embeddings(
+                    await self._config_store.get_scenarios(tenant_id, agent_id),
+                    config_store=self._config_store,
+                    embedding_provider=self._embedding_provider,
+                    embedding_manager=self._embedding_manager,
+                )
+                await backfill_intent_embeddings(
+                    await self._config_store.get_intents(tenant_id, agent_id),
+                    config_store=self._config_store,
+                    embedding_provider=self._embedding_provider,
+                )
+                warmed += 1
+            except Exception as e:
+                logger.warning("agent_warm_up_failed", agent_id=str(agent_id), error=str(e))
+
+        return warmed
+
     async def _process_turn_impl(
         self,
         message: str,
@@ -587,176 +704,49 @@ class FocalCognitivePipeline:
             else None
         )
 
-        # Step 1: Situational Sensing
-        snapshot = await self._sense_situation(
+        # Steps 1-8: run the turn phases through the dependency-declared
+        # scheduler. Independent phases overlap; retrieval may start on the
+        # raw message while the situation sensor is still running.
+        phases = self._build_turn_phases(
             message=message,
             history=history,
+            session=session,
             timings=timings,
             tenant_id=tenant_id,
             agent_id=agent_id,
             interlocutor_id=resolved_interlocutor_id,
-            previous_intent_label=None,  # TODO: Track from session
+            active_scenario_id=active_scenario_id,
+            current_step_id=current_step_id,
+            visited_steps=visited_steps,
         )
+        schedule = await PhaseScheduler(
+            phases,
+            concurrent=self._config.scheduling.enabled,
+        ).run()
 
-        # Phase 3: Customer Data Update
-        persistent_customer_updates = []
-        if (
-            self._config.customer_data_update.enabled
-            and self._customer_data_updater
-            and snapshot.candidate_variables
-        ):
-            step_start_p3 = datetime.utcnow()
-            start_time_p3 = time.perf_counter()
-
-            try:
-                # Get customer data store from snapshot
-                customer_data_store = getattr(snapshot, "customer_data_store", None)
-                if customer_data_store:
-                    # Load field definitions
-                    customer_data_fields = []
-                    if self._static_config_loader:
-                        customer_data_fields_dict = await self._static_config_loader.load_customer_data_schema(
-                            tenant_id=tenant_id,
-                            agent_id=agent_id,
-                        )
-                        customer_data_fields = list(customer_data_fields_dict.values())
-
-                    # Execute Phase 3 update
-                    customer_data_store, persistent_customer_updates = await self._customer_data_updater.update(
-                        customer_data_store=customer_data_store,
-                        candidate_variables=snapshot.candidate_variables,
-                        field_definitions=customer_data_fields,
-                    )
-
-                    logger.info(
-                        "customer_data_update_completed",
-                        tenant_id=str(tenant_id),
-                        updates_count=len(persistent_customer_updates),
-                    )
-
-                elapsed_ms_p3 = (time.perf_counter() - start_time_p3) * 1000
-                timings.append(
-                    PipelineStepTiming(
-                        step="customer_data_update",
-                        started_at=step_start_p3,
-                        ended_at=datetime.utcnow(),
-                        duration_ms=elapsed_ms_p3,
-                    )
-                )
-            except Exception as e:
-                logger.warning(
-                    "customer_data_update_failed",
-                    error=str(e),
-                    tenant_id=str(tenant_id),
-                    agent_id=str(agent_id),
-                )
-                elapsed_ms_p3 = (time.perf_counter() - start_time_p3) * 1000
-                timings.append(
-                    PipelineStepTiming(
-                        step="customer_data_update",
-                        started_at=step_start_p3,
-                        ended_at=datetime.utcnow(),
-                        duration_ms=elapsed_ms_p3,
-                        skipped=True,
-                        skip_reason=f"Error: {str(e)}",
-                    )
+        for run in schedule.discarded:
+            timings.append(
+                PipelineStepTiming(
+                    step=f"{run.name}_speculative",
+                    started_at=run.started_at,
+                    ended_at=run.ended_at,
+                    duration_ms=run.duration_ms,
+                    skipped=True,
+                    skip_reason="Speculative result discarded",
                 )
+            )
 
-        # Step 2: Retrieval (get candidate rules)
-        retrieval_result = await self._retrieve_rules(
-            tenant_id,
-            agent_id,
-            snapshot,
-            timings,
-        )
-
-        # Step 3: Rule Filtering (P5.1 scope pre-filter + P5.2 LLM filter)
-        matched_rules = await self._filter_rules(
-            snapshot,
-            [scored.rule for scored in retrieval_result.rules],
-            session,
-            active_scenario_id,
-            current_step_id,
-            timings,
-        )
-
-        # Step 3.5: Relationship Expansion (P5.3)
-        matched_rules = await self._expand_relationships(
-            tenant_id,
-            agent_id,
-            matched_rules,
-            timings,
-        )
-
-        # Step 4: Scenario Filtering
-        scenario_result = await self._filter_scenarios(
-            tenant_id,
-            snapshot,
-            retrieval_result.scenarios,
-            active_scenario_id,
-            current_step_id,
-            visited_steps,
-            timings,
-        )
-
-        # Step 4b: Check Scenario Field Requirements
-        missing_requirements, scenario_blocked = await self._check_scenario_requirements(
-            session=session,
-            scenario_result=scenario_result,
-            tenant_id=tenant_id,
-            agent_id=agent_id,
-            timings=timings,
-        )
-
-        # Step 5: Tool Execution
-        tool_results = await self._execute_tools(
-            matched_rules=matched_rules,
-            snapshot=snapshot,
-            timings=timings,
-            session=session,
-            contribution_plan=None,  # TODO: Pass contribution_plan when Phase 6 is integrated
-        )
-
-        # Step 6: Response Planning (Phase 8)
-        response_plan = await self._build_response_plan(
-            scenario_result,
-            matched_rules,
-            tool_results,
-            snapshot,
-            tenant_id,
-            timings,
-        )
-
-        memory_context = self._build_memory_context(retrieval_result.memory_episodes)
-        templates = await load_templates_for_rules(
-            self._config_store,
-            tenant_id,
-            matched_rules,
-        )
-
-        # Step 7: Generation
-        generation_result = await self._generate_response(
-            response_plan,
-            snapshot,
-            matched_rules,
-            history,
-            timings,
-            tool_results,
-            memory_context,
-            templates,
-        )
-
-        # Step 8: Enforcement
-        enforcement_result = await self._enforce_response(
-            generation_result.response,
-            snapshot,
-            matched_rules,
-            templates,
-            timings,
-            tenant_id,
-            agent_id,
-            session,
-        )
+        phase_results = schedule.results
+        snapshot: SituationSnapshot = phase_results["situation_sensor"]
+        persistent_customer_updates = phase_results["customer_data_update"]
+        retrieval_result: RetrievalResult = phase_results["retrieval"]
+        matched_rules: list[MatchedRule] = phase_results["relationship_expansion"]
+        scenario_result = phase_results["scenario_filtering"]
+        missing_requirements, scenario_blocked = phase_results["requirement_check"]
+        tool_results: list[ToolResult] = phase_results["tool_execution"]
+        response_plan = phase_results["response_planning"]
+        generation_result: GenerationResult = phase_results["generation"]
+        enforcement_result: EnforcementResult = phase_results["enforcement"]
 
         # Calculate total time
         total_time_ms = (time.perf_counter() - start_time) * 1000
@@ -877,6 +867,308 @@ class FocalCognitivePipeline:
 
         return result
 
+    def _build_turn_phases(
+        self,
+        message: str,
+        history: list[Turn],
+        session: Session | None,
+        timings: list[PipelineStepTiming],
+        tenant_id: UUID,
+        agent_id: UUID,
+        interlocutor_id: UUID,
+        active_scenario_id: UUID | None,
+        current_step_id: UUID | None,
+        visited_steps: dict[UUID, int] | None,
+    ) -> list[Phase]:
+        """Declare the turn phases and their data dependencies.
+
+        Phases are listed in the order the sequential pipeline runs them,
+        which is also a valid topological order for the scheduler.
+        """
+
+        async def sense(_: PhaseResults) -> SituationSnapshot:
+            return await self._sense_situation(
+                message=message,
+                history=history,
+                timings=timings,
+                tenant_id=tenant_id,
+                agent_id=agent_id,
+                interlocutor_id=interlocutor_id,
+                previous_intent_label=None,  # TODO: Track from session
+            )
+
+        async def update_customer_data(r: PhaseResults) -> list:
+            return await self._update_customer_data(
+                r["situation_sensor"], tenant_id, agent_id, timings
+            )
+
+        async def retrieve(r: PhaseResults) -> RetrievalResult:
+            return await self._retrieve_rules(
+                tenant_id, agent_id, r["situation_sensor"], timings
+            )
+
+        async def speculate_retrieval(_: PhaseResults) -> "_SpeculativeRetrieval":
+            return await self._speculative_retrieval(tenant_id, agent_id, message)
+
+        def speculation_valid(r: PhaseResults, spec: "_SpeculativeRetrieval") -> bool:
+            return spec.is_valid_for(r["situation_sensor"])
+
+        async def adopt_retrieval(
+            r: PhaseResults, spec: "_SpeculativeRetrieval"
+        ) -> RetrievalResult:
+            self._finalize_retrieval(
+                r["situation_sensor"], spec.result, spec.intent_candidates
+            )
+            timings.append(spec.timing)
+            return spec.result
+
+        async def filter_rules(r: PhaseResults) -> list[MatchedRule]:
+            return await self._filter_rules(
+                r["situation_sensor"],
+                [scored.rule for scored in r["retrieval"].rules],
+                session,
+                active_scenario_id,
+                current_step_id,
+                timings,
+            )
+
+        async def expand_relationships(r: PhaseResults) -> list[MatchedRule]:
+            return await self._expand_relationships(
+                tenant_id, agent_id, r["rule_filtering"], timings
+            )
+
+        async def filter_scenarios(r: PhaseResults) -> ScenarioFilterResult | None:
+            return await self._filter_scenarios(
+                tenant_id,
+                r["situation_sensor"],
+                r["retrieval"].scenarios,
+                active_scenario_id,
+                current_step_id,
+                visited_steps,
+                timings,
+            )
+
+        async def check_requirements(
+            r: PhaseResults,
+        ) -> tuple[dict[str, FieldResolutionResult], bool]:
+            return await self._check_scenario_requirements(
+                session=session,
+                scenario_result=r["scenario_filtering"],
+                tenant_id=tenant_id,
+                agent_id=agent_id,
+                timings=timings,
+            )
+
+        async def execute_tools(r: PhaseResults) -> list[ToolResult]:
+            return await self._execute_tools(
+                matched_rules=r["relationship_expansion"],
+                snapshot=r["situation_sensor"],
+                timings=timings,
+                session=session,
+                contribution_plan=None,  # TODO: Pass contribution_plan when Phase 6 is integrated
+            )
+
+        async def load_templates(r: PhaseResults) -> list[Template]:
+            return await load_templates_for_rules(
+                self._config_store, tenant_id, r["relationship_expansion"]
+            )
+
+        async def plan_response(r: PhaseResults) -> ResponsePlan | None:
+            return await self._build_response_plan(
+                r["scenario_filtering"],
+                r["relationship_expansion"],
+                r["tool_execution"],
+                r["situation_sensor"],
+                tenant_id,
+                timings,
+            )
+
+        async def generate(r: PhaseResults) -> GenerationResult:
+            return await self._generate_response(
+                r["response_planning"],
+                r["situation_sensor"],
+                r["relationship_expansion"],
+                history,
+                timings,
+                r["tool_execution"],
+                self._build_memory_context(r["retrieval"].memory_episodes),
+                r["templates"],
+            )
+
+        async def enforce(r: PhaseResults) -> EnforcementResult:
+            return await self._enforce_response(
+                r["generation"].response,
+                r["situation_sensor"],
+                r["relationship_expansion"],
+                r["templates"],
+                timings,
+                tenant_id,
+                agent_id,
+                session,
+            )
+
+        speculative = (
+            self._config.scheduling.speculative_retrieval
+            and self._config.retrieval.enabled
+        )
+
+        return [
+            Phase("situation_sensor", sense),
+            Phase(
+                "customer_data_update",
+                update_customer_data,
+                depends_on=("situation_sensor",),
+            ),
+            Phase(
+                "retrieval",
+                retrieve,
+                depends_on=("situation_sensor",),
+                speculate=speculate_retrieval if speculative else None,
+                is_valid=speculation_valid,
+                adopt=adopt_retrieval,
+            ),
+            # Filters also wait for the in-memory customer data update so
+            # they observe the same state as the sequential pipeline
+            Phase(
+                "rule_filtering",
+                filter_rules,
+                depends_on=("situation_sensor", "customer_data_update", "retrieval"),
+            ),
+            Phase(
+                "relationship_expansion",
+                expand_relationships,
+                depends_on=("rule_filtering",),
+            ),
+            Phase(
+                "scenario_filtering",
+                filter_scenarios,
+                depends_on=("situation_sensor", "customer_data_update", "retrieval"),
+            ),
+            Phase(
+                "requirement_check",
+                check_requirements,
+                depends_on=("scenario_filtering",),
+            ),
+            # Tools may write session variables that the requirement check reads
+            Phase(
+                "tool_execution",
+                execute_tools,
+                depends_on=("situation_sensor", "relationship_expansion", "requirement_check"),
+            ),
+            Phase("templates", load_templates, depends_on=("relationship_expansion",)),
+            Phase(
+                "response_planning",
+                plan_response,
+                depends_on=(
+                    "situation_sensor",
+                    "scenario_filtering",
+                    "relationship_expansion",
+                    "tool_execution",
+                ),
+            ),
+            Phase(
+                "generation",
+                generate,
+                depends_on=(
+                    "situation_sensor",
+                    "retrieval",
+                    "relationship_expansion",
+                    "tool_execution",
+                    "templates",
+                    "response_planning",
+                ),
+            ),
+            Phase(
+                "enforcement",
+                enforce,
+                depends_on=(
+                    "situation_sensor",
+                    "relationship_expansion",
+                    "templates",
+                    "generation",
+                ),
+            ),
+        ]
+
+    async def _update_customer_data(
+        self,
+        snapshot: SituationSnapshot,
+        tenant_id: UUID,
+        agent_id: UUID,
+        timings: list[PipelineStepTiming],
+    ) -> list:
+        """Phase 3: apply candidate variables to the in-memory customer data.
+
+        Returns:
+            Updates to persist at the end of the turn
+        """
+        persistent_customer_updates = []
+        if not (
+            self._config.customer_data_update.enabled
+            and self._customer_data_updater
+            and snapshot.candidate_variables
+        ):
+            return persistent_customer_updates
+
+        step_start_p3 = datetime.utcnow()
+        start_time_p3 = time.perf_counter()
+
+        try:
+            # Get customer data store from snapshot
+            customer_data_store = getattr(snapshot, "customer_data_store", None)
+            if customer_data_store:
+                # Load field definitions
+                customer_data_fields = []
+                if self._static_config_loader:
+                    customer_data_fields_dict = await self._static_config_loader.load_customer_data_schema(
+                        tenant_id=tenant_id,
+                        agent_id=agent_id,
+                    )
+                    customer_data_fields = list(customer_data_fields_dict.values())
+
+                # Execute Phase 3 update
+                customer_data_store, persistent_customer_updates = await self._customer_data_updater.update(
+                    customer_data_store=customer_data_store,
+                    candidate_variables=snapshot.candidate_variables,
+                    field_definitions=customer_data_fields,
+                )
+
+                logger.info(
+                    "customer_data_update_completed",
+                    tenant_id=str(tenant_id),
+                    updates_count=len(persistent_customer_updates),
+                )
+
+            elapsed_ms_p3 = (time.perf_counter() - start_time_p3) * 1000
+            timings.append(
+                PipelineStepTiming(
+                    step="customer_data_update",
+                    started_at=step_start_p3,
+                    ended_at=datetime.utcnow(),
+                    duration_ms=elapsed_ms_p3,
+                )
+            )
+        except Exception as e:
+            logger.warning(
+                "customer_data_update_failed",
+                error=str(e),
+                tenant_id=str(tenant_id),
+                agent_id=str(agent_id),
+            )
+            elapsed_ms_p3 = (time.perf_counter() - start_time_p3) * 1000
+            timings.append(
+                PipelineStepTiming(
+                    step="customer_data_update",
+                    started_at=step_start_p3,
+                    ended_at=datetime.utcnow(),
+                    duration_ms=elapsed_ms_p3,
+                    skipped=True,
+                    skip_reason=f"Error: {str(e)}",
+                )
+            )
+
+        return persistent_customer_updates
+
     async def _load_history(
         self,
         session_id: UUID,
@@ -1429,6 +1721,80 @@ class FocalCognitivePipeline:
             )
             return RetrievalResult()
 
+        retrieval_result, intent_candidates = await self._gather_retrieval(
+            tenant_id, agent_id, snapshot
+        )
+        self._finalize_retrieval(snapshot, retrieval_result, intent_candidates)
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        timings.append(
+            PipelineStepTiming(
+                step="retrieval",
+                started_at=step_start,
+                ended_at=datetime.utcnow(),
+                duration_ms=elapsed_ms,
+            )
+        )
+
+        logger.debug(
+            "rules_retrieved",
+            count=len(retrieval_result.rules),
+            elapsed_ms=elapsed_ms,
+        )
+
+        return retrieval_result
+
+    async def _speculative_retrieval(
+        self,
+        tenant_id: UUID,
+        agent_id: UUID,
+        message: str,
+    ) -> "_SpeculativeRetrieval":
+        """Retrieve on the raw message before the situation sensor finishes.
+
+        The message is embedded once and the embedding is shared by all
+        retrievers. The canonical intent is not decided here because it
+        needs the sensor output; see _finalize_retrieval(). The query uses
+        the default language, so the speculation is discarded when the
+        sensor detects another one.
+        """
+        step_start = datetime.utcnow()
+        start_time = time.perf_counter()
+
+        query = SituationSnapshot(
+            message=message,
+            embedding=await self._embedding_provider.embed_single(message),
+            intent_changed=False,
+            topic_changed=False,
+            tone="neutral",
+        )
+        retrieval_result, intent_candidates = await self._gather_retrieval(
+            tenant_id, agent_id, query
+        )
+
+        return _SpeculativeRetrieval(
+            query=query,
+            result=retrieval_result,
+            intent_candidates=intent_candidates,
+            timing=PipelineStepTiming(
+                step="retrieval",
+                started_at=step_start,
+                ended_at=datetime.utcnow(),
+                duration_ms=(time.perf_counter() - start_time) * 1000,
+            ),
+        )
+
+    async def _gather_retrieval(
+        self,
+        tenant_id: UUID,
+        agent_id: UUID,
+        snapshot: SituationSnapshot,
+    ) -> tuple[RetrievalResult, list]:
+        """Run rule, scenario, intent and memory retrieval in parallel.
+
+        Returns:
+            (RetrievalResult with rules/scenarios/memory, intent candidates)
+        """
         # Build parallel retrieval tasks
         rule_task = self._rule_retriever.retrieve(
             tenant_id=tenant_id,
@@ -1481,17 +1847,6 @@ class FocalCognitivePipeline:
                     agent_id=str(agent_id),
                 )
 
-        # P4.3: Decide canonical intent (merge LLM sensor intent with hybrid retrieval)
-        sensor_intent = snapshot.new_intent_label  # From Phase 2 Situational Sensor
-        sensor_confidence = None  # Phase 2 would set this, but not yet implemented
-        canonical_intent, intent_score = decide_canonical_intent(
-            sensor_intent=sensor_intent,
-            sensor_confidence=sensor_confidence,
-            hybrid_candidates=intent_candidates,
-        )
-        snapshot.canonical_intent_label = canonical_intent
-        snapshot.canonical_intent_score = intent_score
-
         # Merge results into RetrievalResult
         retrieval_result.scenarios = scenarios
         retrieval_result.memory_episodes = memories
@@ -1512,23 +1867,25 @@ class FocalCognitivePipeline:
                 "min_k": self._config.retrieval.memory_selection.min_k,
             }
 
-        elapsed_ms = (time.perf_counter() - start_time) * 1000
-        timings.append(
-            PipelineStepTiming(
-                step="retrieval",
-                started_at=step_start,
-                ended_at=datetime.utcnow(),
-                duration_ms=elapsed_ms,
-            )
-        )
+        return retrieval_result, intent_candidates
 
-        logger.debug(
-            "rules_retrieved",
-            count=len(retrieval_result.rules),
-            elapsed_ms=elapsed_ms,
+    def _finalize_retrieval(
+        self,
+        snapshot: SituationSnapshot,
+        retrieval_result: RetrievalResult,  # noqa: ARG002
+        intent_candidates: list,
+    ) -> None:
+        """Apply sensor-dependent retrieval outputs to the snapshot."""
+        # P4.3: Decide canonical intent (merge LLM sensor intent with hybrid retrieval)
+        sensor_intent = snapshot.new_intent_label  # From Phase 2 Situational Sensor
+        sensor_confidence = None  # Phase 2 would set this, but not yet implemented
+        canonical_intent, intent_score = decide_canonical_intent(
+            sensor_intent=sensor_intent,
+            sensor_confidence=sensor_confidence,
+            hybrid_candidates=intent_candidates,
         )
-
-        return retrieval_result
+        snapshot.canonical_intent_label = canonical_intent
+        snapshot.canonical_intent_score = intent_score
 
     async def _filter_rules(
         self,
@@ -1982,7 +2339,8 @@ class FocalCognitivePipeline:
             return
 
         # Get or create customer profile
-        profile = await self._profile_store.get_by_interlocutor_id(
+        profile = await get_profile(
+            self._profile_store,
             tenant_id=session.tenant_id,
             interlocutor_id=session.interlocutor_id,
         )
@@ -2022,6 +2380,7 @@ class FocalCognitivePipeline:
                     error=str(e),
                 )
                 PERSISTENCE_OPERATIONS.labels(operation="customer_data", status="failure").inc()
+        forget_profile(session.tenant_id, session.interlocutor_id)
 
         logger.info(
             "customer_data_persisted",
@@ -2389,6 +2748,7 @@ class FocalCognitivePipeline:
         )
 
         if profile:
+            remember_profile(profile)
             logger.info(
                 "customer_resolved",
                 tenant_id=str(tenant_id),
@@ -2403,6 +2763,7 @@ class FocalCognitivePipeline:
             channel=channel_enum,
             channel_user_id=channel_user_id,
         )
+        remember_profile(profile)
 
         logger.info(
             "customer_created",
@@ -25,6 +25,7 @@ from ruche.brains.focal.retrieval.selection import (
     EntropySelectionStrategy,
     FixedKSelectionStrategy,
     ScoredItem,
+    ScoreSelection,
     SelectionResult,
     SelectionStrategy,
     create_selection_strategy,
@@ -34,6 +35,7 @@ __all__ = [
     # Selection strategies
     "SelectionStrategy",
     "ScoredItem",
+    "ScoreSelection",
     "SelectionResult",
     "FixedKSelectionStrategy",
     "ElbowSelectionStrategy",
@@ -0,0 +1,168 @@
+"""Backfill of missing scenario and intent embeddings.
+
+Retrieval scores scenarios and intents against vectors stored on the
+entities. Entities saved without one (e.g. created through the API while
+the embedding provider was down) are embedded here when the agent's
+config is loaded: all missing texts go to the provider in one batched
+embed() call, and the vectors are written back to the config store (and
+the vector store, when an EmbeddingManager is given). The retrieval hot
+path then only ever reads precomputed vectors.
+"""
+
+from ruche.brains.focal.models import Intent, Scenario
+from ruche.brains.focal.stores import AgentConfigStore
+from ruche.infrastructure.providers.embedding import EmbeddingProvider
+from ruche.observability.logging import get_logger
+from ruche.vector.embedding_manager import EmbeddingManager
+
+logger = get_logger(__name__)
+
+
+def scenarios_missing_embeddings(scenarios: list[Scenario]) -> list[Scenario]:
+    """Scenarios with entry condition text but no entry embedding."""
+    return [s for s in scenarios if s.entry_condition_embedding is None and s.entry_condition_text]
+
+
+def intents_missing_embeddings(intents: list[Intent]) -> list[Intent]:
+    """Intents with example phrases or a description but no embedding."""
+    return [i for i in intents if i.embedding is None and intent_texts(i)]
+
+
+async def backfill_scenario_embeddings(
+    scenarios: list[Scenario],
+    *,
+    config_store: AgentConfigStore,
+    embedding_provider: EmbeddingProvider,
+    embedding_manager: EmbeddingManager | None = None,
+    batch_size: int = 100,
+) -> int:
+    """Embed scenarios missing an entry embedding and persist the vectors.
+
+    Scenarios are updated in place, so callers can score the list they
+    passed in without reloading it.
+
+    Args:
+        scenarios: Scenarios of one agent, as loaded from the config store
+        config_store: Store the embedded scenarios are saved back to
+        embedding_provider: Provider for the batched embed() calls
+        embedding_manager: Optional manager syncing vectors to the vector store
+        batch_size: Maximum texts per embed() call
+
+    Returns:
+        Number of scenarios embedded and saved
+    """
+    missing = scenarios_missing_embeddings(scenarios)
+    if not missing:
+        return 0
+
+    try:
+        vectors, _ = await embed_texts(
+            embedding_provider, [s.entry_condition_text for s in missing], batch_size
+        )
+    except Exception as e:
+        logger.warning("scenario_embedding_backfill_failed", count=len(missing), error=str(e))
+        return 0
+
+    saved = 0
+    for scenario, vector in zip(missing, vectors, strict=True):
+        scenario.entry_condition_embedding = vector
+        try:
+            await config_store.save_scenario(scenario)
+            if embedding_manager is not None:
+                await embedding_manager.sync_scenario(scenario, generate_embedding=False)
+            saved += 1
+        except Exception as e:
+            logger.warning(
+                "scenario_embedding_save_failed",
+                scenario_id=str(scenario.id),
+                error=str(e),
+            )
+
+    logger.info("scenario_embeddings_backfilled", count=saved, missing=len(missing))
+    return saved
+
+
+async def backfill_intent_embeddings(
+    intents: list[Intent],
+    *,
+    config_store: AgentConfigStore,
+    embedding_provider: EmbeddingProvider,
+    batch_size: int = 100,
+) -> int:
+    """Embed intents missing an embedding and persist the vectors.
+
+    An intent's embedding is the mean of its example phrase embeddings
+    (its description when it has no phrases). Intents are updated in place.
+
+    Args:
+        intents: Intents of one agent, as loaded from the config store
+        config_store: Store the embedded intents are saved back to
+        embedding_provider: Provider for the batched embed() calls
+        batch_size: Maximum texts per embed() call
+
+    Returns:
+        Number of intents embedded and saved
+    """
+    missing = intents_missing_embeddings(intents)
+    if not missing:
+        return 0
+
+    texts_per_intent = [intent_texts(intent) for intent in missing]
+    try:
+        vectors, model = await embed_texts(
+            embedding_provider,
+            [text for texts in texts_per_intent for text in texts],
+            batch_size,
+        )
+    except Exception as e:
+        logger.warning("intent_embedding_backfill_failed", count=len(missing), error=str(e))
+        return 0
+
+    saved = 0
+    offset = 0
+    for intent, texts in zip(missing, texts_per_intent, strict=True):
+        phrase_vectors = vectors[offset : offset + len(texts)]
+        offset += len(texts)
+        intent.embedding = mean_embedding(phrase_vectors)
+        intent.embedding_model = model
+        try:
+            await config_store.save_intent(intent)
+            saved += 1
+        except Exception as e:
+            logger.warning("intent_embedding_save_failed", intent_id=str(intent.id), error=str(e))
+
+    logger.info("intent_embeddings_backfilled", count=saved, missing=len(missing))
+    return saved
+
+
+async def embed_texts(
+    embedding_provider: EmbeddingProvider,
+    texts: list[str],
+    batch_size: int,
+) -> tuple[list[list[float]], str | None]:
+    """Embed texts as passages in embed() calls of at most batch_size texts.
+
+    Returns:
+        Vectors in input order, and the model that produced them
+    """
+    vectors: list[list[float]] = []
+    model = None
+    for start in range(0, len(texts), batch_size):
+        response = await embedding_provider.embed(
+            texts[start : start + batch_size], task="retrieval.passage"
+        )
+        vectors.extend(response.embeddings)
+        model = response.model
+    return vectors, model
+
+
+def intent_texts(intent: Intent) -> list[str]:
+    """Texts an intent embedding is averaged over."""
+    if intent.example_phrases:
+        return intent.example_phrases
+    return [intent.description] if intent.description else []
+
+
+def mean_embedding(vectors: list[list[float]]) -> list[float]:
+    """Component-wise mean of equally sized vectors."""
+    return [sum(column) / len(vectors) for column in zip(*vectors, strict=True)]
@@ -6,14 +6,20 @@ intent example phrases using both vector similarity and (future) BM25.
 
 from uuid import UUID
 
+import numpy as np
+
 from ruche.brains.focal.phases.context.situation_snapshot import SituationSnapshot
-from ruche.brains.focal.models import Intent, IntentCandidate, ScoredIntent
-from ruche.brains.focal.retrieval.selection import ScoredItem, create_selection_strategy
+from ruche.brains.focal.models import Intent, IntentCandidate
+from ruche.brains.focal.retrieval.embedding_backfill import (
+    backfill_intent_embeddings,
+    intents_missing_embeddings,
+)
+from ruche.brains.focal.retrieval.selection import create_selection_strategy
 from ruche.brains.focal.stores import AgentConfigStore
 from ruche.config.models.selection import SelectionConfig
 from ruche.observability.logging import get_logger
 from ruche.infrastructure.providers.embedding import EmbeddingProvider
-from ruche.utils.vector import cosine_similarity
+from ruche.utils.vector import cosine_similarities
 
 logger = get_logger(__name__)
 
@@ -138,43 +144,37 @@ class IntentRetriever:
             )
             return []
 
+        if intents_missing_embeddings(intents):
+            await backfill_intent_embeddings(
+                intents,
+                config_store=self._config_store,
+                embedding_provider=self._embedding_provider,
+            )
+
         # Compute query embedding
         query_embedding = snapshot.embedding
         if query_embedding is None:
             query_embedding = await self._embedding_provider.embed_single(snapshot.message)
 
-        # Score each intent against query
-        scored: list[ScoredIntent] = []
-        for intent in intents:
-            score = self._score_intent(intent, query_embedding, snapshot.message)
-            scored.append(
-                ScoredIntent(
-                    intent_id=intent.id,
-                    intent_name=intent.name,
-                    score=score,
-                )
-            )
-
-        # Sort by score descending
-        scored.sort(key=lambda ic: ic.score, reverse=True)
+        # Score all intents against the query at once
+        scores = self._score_intents(intents, query_embedding, snapshot.message)
 
         # Apply selection strategy
-        scored_items = [ScoredItem(item=s, score=s.score) for s in scored]
-        selected = self._selection_strategy.select(
-            scored_items,
+        selected = self._selection_strategy.select_scores(
+            scores,
             max_k=self._selection_config.max_k,
             min_k=self._selection_config.min_k,
         )
 
-        # Convert to IntentCandidates
+        # Convert the selected intents to IntentCandidates
         candidates = [
             IntentCandidate(
-                intent_id=item.item.intent_id,
-                intent_name=item.item.intent_name,
-                score=item.item.score,
+                intent_id=intents[i].id,
+                intent_name=intents[i].name,
+                score=float(scores[i]),
                 source="hybrid",
             )
-            for item in selected.selected
+            for i in selected.indices
         ]
 
         logger.debug(
@@ -189,24 +189,22 @@ class IntentRetriever:
 
         return candidates
 
-    def _score_intent(
+    def _score_intents(
         self,
-        intent: Intent,
+        intents: list[Intent],
         query_embedding: list[float],
         query_text: str,
-    ) -> float:
-        """Score intent using vector similarity.
+    ) -> np.ndarray:
+        """Score intents using vector similarity.
 
         Future: Add BM25 lexical matching here for hybrid scoring.
 
         Args:
-            intent: Intent to score
+            intents: Intents to score
             query_embedding: Query message embedding
             query_text: Raw query text (for future BM25)
 
         Returns:
-            Similarity score (0-1)
+            Similarity scores (float32, parallel to intents)
         """
-        if intent.embedding:
-            return cosine_similarity(query_embedding, intent.embedding)
-        return 0.0
+        return cosine_similarities(query_embedding, [intent.embedding for intent in intents])
@@ -3,20 +3,21 @@
 import time
 from uuid import UUID
 
+import numpy as np
 from rank_bm25 import BM25Okapi
 
 from ruche.brains.focal.phases.context.situation_snapshot import SituationSnapshot
 from ruche.brains.focal.models import Rule, Scope
 from ruche.brains.focal.retrieval.models import RetrievalResult, RuleSource, ScoredRule
 from ruche.brains.focal.retrieval.reranker import RuleReranker
-from ruche.brains.focal.retrieval.selection import ScoredItem, create_selection_strategy
+from ruche.brains.focal.retrieval.selection import ScoreSelection, create_selection_strategy
 from ruche.brains.focal.stores import AgentConfigStore
 from ruche.config.models.pipeline import HybridRetrievalConfig
 from ruche.config.models.selection import SelectionConfig
 from ruche.observability.logging import get_logger
 from ruche.infrastructure.providers.embedding import EmbeddingProvider
 from ruche.utils.hybrid import HybridScorer
-from ruche.utils.vector import cosine_similarity
+from ruche.utils.vector import cosine_similarities
 
 logger = get_logger(__name__)
 
@@ -105,59 +106,51 @@ class RuleRetriever:
 
         query_text = snapshot.message
 
-        candidates: list[ScoredRule] = []
-        candidates.extend(
-            await self._retrieve_scope(
+        scopes = [(Scope.GLOBAL, None, RuleSource.GLOBAL)]
+        if active_scenario_id:
+            scopes.append((Scope.SCENARIO, active_scenario_id, RuleSource.SCENARIO))
+        if active_step_id:
+            scopes.append((Scope.STEP, active_step_id, RuleSource.STEP))
+
+        # Candidates are kept columnar: rules and sources parallel to one
+        # score array, and ScoredRule objects are only built for the rules
+        # selection keeps
+        rules: list[Rule] = []
+        sources: list[RuleSource] = []
+        score_parts: list[np.ndarray] = []
+        for scope, scope_id, source in scopes:
+            scope_rules, scope_scores = await self._retrieve_scope(
                 tenant_id,
                 agent_id,
-                scope=Scope.GLOBAL,
-                scope_id=None,
-                source=RuleSource.GLOBAL,
+                scope=scope,
+                scope_id=scope_id,
                 embedding=embedding,
                 query_text=query_text,
                 fired_rule_counts=fired_rule_counts,
                 last_fired_turns=last_fired_turns,
                 current_turn=current_turn,
             )
-        )
-
-        if active_scenario_id:
-            candidates.extend(
-                await self._retrieve_scope(
-                    tenant_id,
-                    agent_id,
-                    scope=Scope.SCENARIO,
-                    scope_id=active_scenario_id,
-                    source=RuleSource.SCENARIO,
-                    embedding=embedding,
-                    query_text=query_text,
-                    fired_rule_counts=fired_rule_counts,
-                    last_fired_turns=last_fired_turns,
-                    current_turn=current_turn,
-                )
-            )
-
-        if active_step_id:
-            candidates.extend(
-                await self._retrieve_scope(
-                    tenant_id,
-                    agent_id,
-                    scope=Scope.STEP,
-                    scope_id=active_step_id,
-                    source=RuleSource.STEP,
-                    embedding=embedding,
-                    query_text=query_text,
-                    fired_rule_counts=fired_rule_counts,
-                    last_fired_turns=last_fired_turns,
-                    current_turn=current_turn,
-                )
-            )
-
-        # Optional reranking
-        if self._reranker and candidates:
+            rules.extend(scope_rules)
+            sources.extend([source] * len(scope_rules))
+            score_parts.append(scope_scores)
+        scores = np.concatenate(score_parts)
+
+        if self._reranker and rules:
+            # The reranker rescores ScoredRule objects, so every candidate
+            # needs one on this path
+            order = np.argsort(-scores, kind="stable")
+            candidates = [
+                ScoredRule(rule=rules[i], score=float(scores[i]), source=sources[i])
+                for i in order
+            ]
             candidates = await self._reranker.rerank(snapshot.message, candidates)
-
-        selected_rules = self._apply_selection(candidates)
+            selected_rules = self._apply_selection(candidates)
+        else:
+            selection = self._select(scores)
+            selected_rules = [
+                ScoredRule(rule=rules[i], score=float(scores[i]), source=sources[i])
+                for i in selection.indices
+            ]
 
         elapsed_ms = (time.perf_counter() - start_time) * 1000
         selection_metadata = {
@@ -169,7 +162,7 @@ class RuleRetriever:
 
         logger.debug(
             "rules_retrieved",
-            total_candidates=len(candidates),
+            total_candidates=len(rules),
             selected=len(selected_rules),
             elapsed_ms=elapsed_ms,
         )
@@ -187,14 +180,18 @@ class RuleRetriever:
         *,
         scope: Scope,
         scope_id: UUID | None,
-        source: RuleSource,
         embedding: list[float],
         query_text: str,
         fired_rule_counts: dict[UUID, int],
         last_fired_turns: dict[UUID, int],
         current_turn: int,
-    ) -> list[ScoredRule]:
-        """Retrieve and score rules for a specific scope."""
+    ) -> tuple[list[Rule], np.ndarray]:
+        """Retrieve and score rules for a specific scope.
+
+        Returns:
+            Rules passing the business filters and their scores (float32,
+            parallel to the rules)
+        """
         rules = await self._config_store.get_rules(
             tenant_id,
             agent_id,
@@ -216,46 +213,33 @@ class RuleRetriever:
         ]
 
         if not filtered_rules:
-            return []
+            return [], np.empty(0, dtype=np.float32)
 
         # Use hybrid scoring if configured, else vector-only
         if self._hybrid_scorer:
-            scored = self._hybrid_retrieval(filtered_rules, embedding, query_text, source)
+            scores = self._hybrid_retrieval(filtered_rules, embedding, query_text)
         else:
-            scored = self._vector_only_retrieval(filtered_rules, embedding, source)
+            scores = self._vector_only_retrieval(filtered_rules, embedding)
 
-        # Sort by score descending for selection
-        scored.sort(key=lambda r: r.score, reverse=True)
-        return scored
+        return filtered_rules, scores
 
     def _vector_only_retrieval(
         self,
         rules: list[Rule],
         query_embedding: list[float],
-        source: RuleSource,
-    ) -> list[ScoredRule]:
+    ) -> np.ndarray:
         """Vector-only retrieval using cosine similarity."""
-        scored: list[ScoredRule] = []
-        for rule in rules:
-            score = self._compute_score(rule, query_embedding)
-            scored.append(ScoredRule(rule=rule, score=score, source=source))
-        return scored
+        return cosine_similarities(query_embedding, [rule.embedding for rule in rules])
 
     def _hybrid_retrieval(
         self,
         rules: list[Rule],
         query_embedding: list[float],
         query_text: str,
-        source: RuleSource,
-    ) -> list[ScoredRule]:
+    ) -> np.ndarray:
         """Hybrid retrieval combining vector and BM25 scores."""
         # Compute vector scores
-        vector_scores = [
-            cosine_similarity(query_embedding, rule.embedding)
-            if rule.embedding
-            else 0.0
-            for rule in rules
-        ]
+        vector_scores = cosine_similarities(query_embedding, [rule.embedding for rule in rules])
 
         # Compute BM25 scores
         corpus = [rule.condition_text.split() for rule in rules]
@@ -263,24 +247,7 @@ class RuleRetriever:
         bm25_scores = bm25.get_scores(query_text.split())
 
         # Combine scores
-        combined_scores = self._hybrid_scorer.combine_scores(vector_scores, list(bm25_scores))
-
-        # Build scored rules
-        scored = [
-            ScoredRule(rule=rule, score=score, source=source)
-            for rule, score in zip(rules, combined_scores)
-        ]
-
-        return scored
-
-    def _compute_score(self, rule: Rule, query_embedding: list[float]) -> float:
-        """Compute similarity score for a rule."""
-        if rule.embedding is None:
-            return 0.0
-        try:
-            return cosine_similarity(query_embedding, rule.embedding)
-        except ValueError:
-            return 0.0
+        return self._hybrid_scorer.combine_arrays(vector_scores, bm25_scores)
 
     def _passes_business_filters(
         self,
@@ -307,26 +274,20 @@ class RuleRetriever:
         return True
 
     def _apply_selection(self, scored_rules: list[ScoredRule]) -> list[ScoredRule]:
-        """Apply selection strategy and min_score filtering."""
+        """Apply selection strategy and min_score filtering to reranked rules."""
         if not scored_rules:
             return []
 
-        scored_rules = sorted(scored_rules, key=lambda r: r.score, reverse=True)
-
-        # Filter by min_score but keep ability to satisfy min_k
-        above_threshold = [
-            rule for rule in scored_rules if rule.score >= self._selection_config.min_score
-        ]
-        pool = (
-            above_threshold
-            if len(above_threshold) >= self._selection_config.min_k
-            else scored_rules
+        scores = np.fromiter(
+            (rule.score for rule in scored_rules), dtype=np.float32, count=len(scored_rules)
         )
+        return [scored_rules[i] for i in self._select(scores).indices]
 
-        items = [ScoredItem(item=rule, score=rule.score) for rule in pool]
-        selection = self._selection_strategy.select(
-            items,
+    def _select(self, scores: np.ndarray) -> ScoreSelection:
+        """Select candidates by score, keeping min_score unless min_k needs more."""
+        return self._selection_strategy.select_scores(
+            scores,
             max_k=self._selection_config.max_k,
             min_k=self._selection_config.min_k,
+            min_score=self._selection_config.min_score,
         )
-        return [item.item for item in selection.selected]
@@ -2,19 +2,26 @@
 
 from uuid import UUID
 
+import numpy as np
 from rank_bm25 import BM25Okapi
 
+from ruche.brains.focal.models import Scenario
 from ruche.brains.focal.phases.context.situation_snapshot import SituationSnapshot
+from ruche.brains.focal.retrieval.embedding_backfill import (
+    backfill_scenario_embeddings,
+    scenarios_missing_embeddings,
+)
 from ruche.brains.focal.retrieval.models import ScoredScenario
 from ruche.brains.focal.retrieval.reranker import ScenarioReranker
-from ruche.brains.focal.retrieval.selection import ScoredItem, create_selection_strategy
+from ruche.brains.focal.retrieval.selection import ScoreSelection, create_selection_strategy
 from ruche.brains.focal.stores import AgentConfigStore
 from ruche.config.models.pipeline import HybridRetrievalConfig
 from ruche.config.models.selection import SelectionConfig
 from ruche.observability.logging import get_logger
 from ruche.infrastructure.providers.embedding import EmbeddingProvider
 from ruche.utils.hybrid import HybridScorer
-from ruche.utils.vector import cosine_similarity
+from ruche.utils.vector import cosine_similarities
+from ruche.vector.embedding_manager import EmbeddingManager
 
 logger = get_logger(__name__)
 
@@ -34,6 +41,7 @@ class ScenarioRetriever:
         selection_config: SelectionConfig | None = None,
         reranker: ScenarioReranker | None = None,
         hybrid_config: HybridRetrievalConfig | None = None,
+        embedding_manager: EmbeddingManager | None = None,
     ) -> None:
         """Initialize the scenario retriever.
 
@@ -43,6 +51,8 @@ class ScenarioRetriever:
             selection_config: Configuration for selection strategy
             reranker: Optional reranker for result refinement
             hybrid_config: Optional hybrid retrieval configuration
+            embedding_manager: Optional manager syncing backfilled entry
+                embeddings to the vector store
         """
         self._config_store = config_store
         self._embedding_provider = embedding_provider
@@ -52,6 +62,7 @@ class ScenarioRetriever:
             **self._selection_config.params,
         )
         self._reranker = reranker
+        self._embedding_manager = embedding_manager
         self._hybrid_config = hybrid_config
         self._hybrid_scorer = (
             HybridScorer(
@@ -93,87 +104,75 @@ class ScenarioRetriever:
         if not scenarios:
             return []
 
+        # Only scenarios saved without a vector get here; once backfilled
+        # they are read precomputed like the rest
+        if scenarios_missing_embeddings(scenarios):
+            await backfill_scenario_embeddings(
+                scenarios,
+                config_store=self._config_store,
+                embedding_provider=self._embedding_provider,
+                embedding_manager=self._embedding_manager,
+            )
+
         query_embedding = snapshot.embedding or await self._embedding_provider.embed_single(
             snapshot.message
         )
 
         # Use hybrid scoring if configured, else vector-only
         if self._hybrid_scorer:
-            scored = await self._hybrid_retrieval(scenarios, query_embedding, snapshot.message)
+            scores = self._hybrid_retrieval(scenarios, query_embedding, snapshot.message)
         else:
-            scored = await self._vector_only_retrieval(scenarios, query_embedding)
+            scores = self._vector_only_retrieval(scenarios, query_embedding)
 
-        scored.sort(key=lambda s: s.score, reverse=True)
-
-        # Optional reranking
-        if self._reranker and scored:
+        if self._reranker:
+            # The reranker rescores ScoredScenario objects, so every candidate
+            # needs one on this path
+            order = np.argsort(-scores, kind="stable")
+            scored = [self._scored(scenarios[i], scores[i]) for i in order]
             scored = await self._reranker.rerank(snapshot.message, scored)
+            scores = np.fromiter((s.score for s in scored), dtype=np.float32, count=len(scored))
+            return [scored[i] for i in self._select(scores).indices]
 
-        # Filter by min_score but ensure min_k is honored
-        above_min = [s for s in scored if s.score >= self._selection_config.min_score]
-        pool = above_min if len(above_min) >= self._selection_config.min_k else scored
+        # Only the selected scenarios get a ScoredScenario
+        return [self._scored(scenarios[i], scores[i]) for i in self._select(scores).indices]
 
-        items = [ScoredItem(item=s, score=s.score) for s in pool]
-        selection = self._selection_strategy.select(
-            items,
+    def _select(self, scores: np.ndarray) -> ScoreSelection:
+        """Select candidates by score, keeping min_score unless min_k needs more."""
+        return self._selection_strategy.select_scores(
+            scores,
             max_k=self._selection_config.max_k,
             min_k=self._selection_config.min_k,
+            min_score=self._selection_config.min_score,
         )
 
-        return [item.item for item in selection.selected]
+    @staticmethod
+    def _scored(scenario: Scenario, score: float) -> ScoredScenario:
+        """Build the result object of a scored scenario."""
+        return ScoredScenario(
+            scenario_id=scenario.id,
+            scenario_name=scenario.name,
+            score=float(score),
+        )
 
-    async def _vector_only_retrieval(
+    def _vector_only_retrieval(
         self,
-        scenarios,
+        scenarios: list[Scenario],
         context_embedding: list[float],
-    ) -> list[ScoredScenario]:
+    ) -> np.ndarray:
         """Vector-only retrieval using cosine similarity."""
-        scored: list[ScoredScenario] = []
-        for scenario in scenarios:
-            entry_embedding = scenario.entry_condition_embedding
-            if entry_embedding is None and scenario.entry_condition_text:
-                try:
-                    entry_embedding = await self._embedding_provider.embed_single(
-                        scenario.entry_condition_text
-                    )
-                except Exception:
-                    entry_embedding = None
-
-            score = self._score_scenario(entry_embedding, context_embedding)
-            scored.append(
-                ScoredScenario(
-                    scenario_id=scenario.id,
-                    scenario_name=scenario.name,
-                    score=score,
-                )
-            )
-        return scored
+        return cosine_similarities(
+            context_embedding, [scenario.entry_condition_embedding for scenario in scenarios]
+        )
 
-    async def _hybrid_retrieval(
+    def _hybrid_retrieval(
         self,
-        scenarios,
+        scenarios: list[Scenario],
         context_embedding: list[float],
         query_text: str,
-    ) -> list[ScoredScenario]:
+    ) -> np.ndarray:
         """Hybrid retrieval combining vector and BM25 scores."""
-        # Ensure all scenarios have embeddings
-        entry_embeddings = []
-        for scenario in scenarios:
-            entry_embedding = scenario.entry_condition_embedding
-            if entry_embedding is None and scenario.entry_condition_text:
-                try:
-                    entry_embedding = await self._embedding_provider.embed_single(
-                        scenario.entry_condition_text
-                    )
-                except Exception:
-                    entry_embedding = None
-            entry_embeddings.append(entry_embedding)
-
         # Compute vector scores
-        vector_scores = [
-            cosine_similarity(context_embedding, emb) if emb else 0.0
-            for emb in entry_embeddings
-        ]
+        vector_scores = self._vector_only_retrieval(scenarios, context_embedding)
 
         # Compute BM25 scores
         corpus = [
@@ -184,29 +183,4 @@ class ScenarioRetriever:
         bm25_scores = bm25.get_scores(query_text.split())
 
         # Combine scores
-        combined_scores = self._hybrid_scorer.combine_scores(vector_scores, list(bm25_scores))
-
-        # Build scored scenarios
-        scored = [
-            ScoredScenario(
-                scenario_id=scenario.id,
-                scenario_name=scenario.name,
-                score=score,
-            )
-            for scenario, score in zip(scenarios, combined_scores)
-        ]
-
-        return scored
-
-    def _score_scenario(
-        self,
-        entry_embedding: list[float] | None,
-        query_embedding: list[float],
-    ) -> float:
-        """Compute similarity score for a scenario entry condition."""
-        if entry_embedding is None:
-            return 0.0
-        try:
-            return cosine_similarity(query_embedding, entry_embedding)
-        except ValueError:
-            return 0.0
+        return self._hybrid_scorer.combine_arrays(vector_scores, bm25_scores)
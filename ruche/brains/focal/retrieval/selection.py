@@ -2,18 +2,24 @@
 
 Selection strategies analyze score distributions to dynamically determine
 the optimal number of results to keep, rather than using a fixed top-k.
+
+Strategies work on score arrays: retrievers pass the scores of all their
+candidates as one array (parallel to their candidate list) and get back the
+positions of the selected candidates, so result objects are only built for
+what is kept. select() wraps the same logic for lists of ScoredItem.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any, Generic, TypeVar
 
 import numpy as np
-from scipy import stats
-from sklearn.cluster import DBSCAN
 
 T = TypeVar("T")
 
+_NO_INDICES = np.empty(0, dtype=np.intp)
+
 
 @dataclass
 class ScoredItem(Generic[T]):
@@ -49,6 +55,38 @@ class SelectionResult(Generic[T]):
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class ScoreSelection:
+    """Result of selection over a score array.
+
+    Attributes:
+        indices: Positions of the selected scores in the input array,
+            ordered by score descending
+        cutoff_score: Score threshold used for cutoff
+        method: Name of the strategy used
+        metadata: Strategy-specific metadata for logging/debugging
+    """
+
+    indices: np.ndarray
+    cutoff_score: float
+    method: str
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+def _count_at_least(scores: np.ndarray, threshold: float) -> int:
+    """Number of descending-sorted scores >= threshold (a prefix length).
+
+    The threshold is cast to the array's dtype so float32 scores compare
+    against the same rounding of the threshold they were stored with.
+    """
+    return int(np.count_nonzero(scores >= scores.dtype.type(threshold)))
+
+
+def _prefix(count: int) -> np.ndarray:
+    """Positions of the first count scores."""
+    return np.arange(count, dtype=np.intp)
+
+
 class SelectionStrategy(ABC):
     """Interface for dynamic k-selection after similarity search.
 
@@ -70,6 +108,24 @@ class SelectionStrategy(ABC):
         pass
 
     @abstractmethod
+    def _select_sorted(
+        self,
+        scores: np.ndarray,
+        max_k: int,
+        min_k: int,
+    ) -> tuple[np.ndarray, dict[str, Any]]:
+        """Select from scores sorted descending.
+
+        Args:
+            scores: Scores sorted descending
+            max_k: Maximum items to return (hard cap)
+            min_k: Minimum items to return (even if scores are low)
+
+        Returns:
+            (positions into scores in result order, strategy metadata)
+        """
+        pass
+
     def select(
         self,
         items: list[ScoredItem[T]],
@@ -90,21 +146,75 @@ class SelectionStrategy(ABC):
             ValueError: If items is not sorted by score descending
             ValueError: If min_k > max_k
         """
-        pass
+        scores = np.fromiter((item.score for item in items), dtype=np.float64, count=len(items))
+        self._validate_inputs(max_k, min_k)
+        if np.any(scores[:-1] < scores[1:]):
+            raise ValueError("Items must be sorted by score descending")
 
-    def _validate_inputs(
+        positions, metadata = self._select_sorted(scores, max_k, min_k)
+        selected = [items[i] for i in positions]
+
+        return SelectionResult(
+            selected=selected,
+            cutoff_score=selected[-1].score if selected else 0.0,
+            method=self.name,
+            metadata=metadata,
+        )
+
+    def select_scores(
         self,
-        items: list[ScoredItem[T]],
-        max_k: int,
-        min_k: int,
-    ) -> None:
+        scores: np.ndarray | Sequence[float],
+        max_k: int = 20,
+        min_k: int = 1,
+        *,
+        min_score: float | None = None,
+    ) -> ScoreSelection:
+        """Select from an unsorted score array.
+
+        Args:
+            scores: Candidate scores (float32 on the retrieval path), in the
+                order of the caller's candidate list
+            max_k: Maximum items to return (hard cap)
+            min_k: Minimum items to return (even if scores are low)
+            min_score: If set, only scores >= min_score are considered,
+                unless fewer than min_k pass
+
+        Returns:
+            ScoreSelection with positions into scores
+
+        Raises:
+            ValueError: If min_k > max_k
+        """
+        scores = np.asarray(scores)
+        if scores.dtype.kind != "f":
+            scores = scores.astype(np.float32)
+        self._validate_inputs(max_k, min_k)
+
+        pool = None
+        if min_score is not None:
+            above = np.flatnonzero(scores >= scores.dtype.type(min_score))
+            if len(above) >= min_k and len(above) < len(scores):
+                pool = above
+        candidates = scores if pool is None else scores[pool]
+
+        # Stable, so tied scores keep the caller's order
+        order = np.argsort(-candidates, kind="stable")
+        positions, metadata = self._select_sorted(candidates[order], max_k, min_k)
+        indices = order[positions]
+        if pool is not None:
+            indices = pool[indices]
+
+        return ScoreSelection(
+            indices=indices,
+            cutoff_score=float(scores[indices[-1]]) if len(indices) else 0.0,
+            method=self.name,
+            metadata=metadata,
+        )
+
+    def _validate_inputs(self, max_k: int, min_k: int) -> None:
         """Validate common inputs for all strategies."""
         if min_k > max_k:
             raise ValueError(f"min_k ({min_k}) cannot be greater than max_k ({max_k})")
-        if len(items) > 1:
-            for i in range(len(items) - 1):
-                if items[i].score < items[i + 1].score:
-                    raise ValueError("Items must be sorted by score descending")
 
 
 class FixedKSelectionStrategy(SelectionStrategy):
@@ -128,41 +238,23 @@ class FixedKSelectionStrategy(SelectionStrategy):
     def name(self) -> str:
         return "fixed_k"
 
-    def select(
+    def _select_sorted(
         self,
-        items: list[ScoredItem[T]],
-        max_k: int = 20,
-        min_k: int = 1,
-    ) -> SelectionResult[T]:
-        self._validate_inputs(items, max_k, min_k)
-
-        if not items:
-            return SelectionResult(
-                selected=[],
-                cutoff_score=0.0,
-                method=self.name,
-                metadata={"k": self._k},
-            )
-
-        # Apply k limit and max_k constraint
-        effective_k = min(self._k, max_k)
+        scores: np.ndarray,
+        max_k: int,
+        min_k: int,
+    ) -> tuple[np.ndarray, dict[str, Any]]:
+        if len(scores) == 0:
+            return _NO_INDICES, {"k": self._k}
 
-        # Filter by min_score and take top k
-        filtered = [item for item in items if item.score >= self._min_score]
-        selected = filtered[:effective_k]
+        # Filter by min_score and take top k, capped by max_k
+        count = min(_count_at_least(scores, self._min_score), self._k, max_k)
 
         # Ensure min_k is satisfied (even if below min_score)
-        if len(selected) < min_k and len(items) >= min_k:
-            selected = items[:min_k]
+        if count < min_k and len(scores) >= min_k:
+            count = min_k
 
-        cutoff = selected[-1].score if selected else 0.0
-
-        return SelectionResult(
-            selected=selected,
-            cutoff_score=cutoff,
-            method=self.name,
-            metadata={"k": self._k, "min_score": self._min_score},
-        )
+        return _prefix(count), {"k": self._k, "min_score": self._min_score}
 
 
 class ElbowSelectionStrategy(SelectionStrategy):
@@ -191,57 +283,36 @@ class ElbowSelectionStrategy(SelectionStrategy):
     def name(self) -> str:
         return "elbow"
 
-    def select(
+    def _select_sorted(
         self,
-        items: list[ScoredItem[T]],
-        max_k: int = 20,
-        min_k: int = 1,
-    ) -> SelectionResult[T]:
-        self._validate_inputs(items, max_k, min_k)
-
-        if not items:
-            return SelectionResult(
-                selected=[],
-                cutoff_score=0.0,
-                method=self.name,
-                metadata={"drop_threshold": self._drop_threshold},
-            )
-
-        # Find elbow point by detecting relative score drop
-        elbow_idx = len(items)
-        for i in range(1, len(items)):
-            if items[i - 1].score > 0:
-                relative_drop = (items[i - 1].score - items[i].score) / items[i - 1].score
-                if relative_drop > self._drop_threshold:
-                    elbow_idx = i
-                    break
-
-        # Apply min_score filter
-        score_cutoff_idx = len(items)
-        for i, item in enumerate(items):
-            if item.score < self._min_score:
-                score_cutoff_idx = i
-                break
-
-        # Use the more restrictive cutoff
-        cutoff_idx = min(elbow_idx, score_cutoff_idx, max_k)
+        scores: np.ndarray,
+        max_k: int,
+        min_k: int,
+    ) -> tuple[np.ndarray, dict[str, Any]]:
+        n = len(scores)
+        if n == 0:
+            return _NO_INDICES, {"drop_threshold": self._drop_threshold}
+
+        # Find elbow point: first relative drop above the threshold
+        previous = scores[:-1]
+        positive = previous > 0
+        drops = np.divide(
+            previous - scores[1:], previous, out=np.zeros_like(previous), where=positive
+        )
+        elbows = np.flatnonzero(positive & (drops > self._drop_threshold))
+        elbow_idx = int(elbows[0]) + 1 if len(elbows) else n
 
-        # Ensure min_k constraint
-        cutoff_idx = max(cutoff_idx, min(min_k, len(items)))
+        # Use the more restrictive of elbow, min_score and max_k
+        cutoff_idx = min(elbow_idx, _count_at_least(scores, self._min_score), max_k)
 
-        selected = items[:cutoff_idx]
-        cutoff = selected[-1].score if selected else 0.0
+        # Ensure min_k constraint
+        cutoff_idx = max(cutoff_idx, min(min_k, n))
 
-        return SelectionResult(
-            selected=selected,
-            cutoff_score=cutoff,
-            method=self.name,
-            metadata={
-                "drop_threshold": self._drop_threshold,
-                "min_score": self._min_score,
-                "elbow_idx": elbow_idx,
-            },
-        )
+        return _prefix(cutoff_idx), {
+            "drop_threshold": self._drop_threshold,
+            "min_score": self._min_score,
+            "elbow_idx": elbow_idx,
+        }
 
 
 class AdaptiveKSelectionStrategy(SelectionStrategy):
@@ -269,77 +340,43 @@ class AdaptiveKSelectionStrategy(SelectionStrategy):
     def name(self) -> str:
         return "adaptive_k"
 
-    def select(
+    def _select_sorted(
         self,
-        items: list[ScoredItem[T]],
-        max_k: int = 20,
-        min_k: int = 1,
-    ) -> SelectionResult[T]:
-        self._validate_inputs(items, max_k, min_k)
+        scores: np.ndarray,
+        max_k: int,
+        min_k: int,
+    ) -> tuple[np.ndarray, dict[str, Any]]:
+        n = len(scores)
+        if n == 0:
+            return _NO_INDICES, {"alpha": self._alpha}
 
-        if not items:
-            return SelectionResult(
-                selected=[],
-                cutoff_score=0.0,
-                method=self.name,
-                metadata={"alpha": self._alpha},
-            )
+        score_cutoff_idx = _count_at_least(scores, self._min_score)
 
-        if len(items) <= 2:
+        if n <= 2:
             # Not enough points for curvature analysis
-            selected = [item for item in items if item.score >= self._min_score]
-            if len(selected) < min_k:
-                selected = items[:min_k]
-            return SelectionResult(
-                selected=selected[:max_k],
-                cutoff_score=selected[-1].score if selected else 0.0,
-                method=self.name,
-                metadata={"alpha": self._alpha, "reason": "insufficient_points"},
-            )
-
-        scores = np.array([item.score for item in items])
-
-        # Compute first and second derivatives
-        first_deriv = np.diff(scores)
-        second_deriv = np.diff(first_deriv) if len(first_deriv) > 1 else np.array([0])
-
-        # Find point of maximum curvature (most negative second derivative)
-        if len(second_deriv) > 0:
-            # Normalize by standard deviation to make alpha scale-independent
-            std = np.std(second_deriv) if np.std(second_deriv) > 0 else 1.0
-            threshold = -self._alpha * std
-            curvature_idx = len(items)
-            for i, d2 in enumerate(second_deriv):
-                if d2 < threshold:
-                    curvature_idx = i + 2  # +2 because of double diff
-                    break
-        else:
-            curvature_idx = len(items)
+            count = score_cutoff_idx if score_cutoff_idx >= min_k else min(min_k, n)
+            return _prefix(min(count, max_k)), {
+                "alpha": self._alpha,
+                "reason": "insufficient_points",
+            }
 
-        # Apply min_score filter
-        score_cutoff_idx = len(items)
-        for i, item in enumerate(items):
-            if item.score < self._min_score:
-                score_cutoff_idx = i
-                break
+        # Point of maximum curvature: first second derivative below
+        # -alpha * std (std keeps alpha scale-independent)
+        second_deriv = np.diff(scores, n=2)
+        std = float(np.std(second_deriv))
+        threshold = -self._alpha * (std if std > 0 else 1.0)
+        bends = np.flatnonzero(second_deriv < threshold)
+        curvature_idx = int(bends[0]) + 2 if len(bends) else n  # +2 because of double diff
 
         # Use more restrictive cutoff
         cutoff_idx = min(curvature_idx, score_cutoff_idx, max_k)
-        cutoff_idx = max(cutoff_idx, min(min_k, len(items)))
+        cutoff_idx = max(cutoff_idx, min(min_k, n))
 
-        selected = items[:cutoff_idx]
-        cutoff = selected[-1].score if selected else 0.0
-
-        return SelectionResult(
-            selected=selected,
-            cutoff_score=cutoff,
-            method=self.name,
-            metadata={
-                "alpha": self._alpha,
-                "min_score": self._min_score,
-                "curvature_idx": curvature_idx,
-            },
-        )
+        return _prefix(cutoff_idx), {
+            "alpha": self._alpha,
+            "min_score": self._min_score,
+            "curvature_idx": curvature_idx,
+        }
 
 
 class EntropySelectionStrategy(SelectionStrategy):
@@ -374,35 +411,25 @@ class EntropySelectionStrategy(SelectionStrategy):
     def name(self) -> str:
         return "entropy"
 
-    def select(
+    def _select_sorted(
         self,
-        items: list[ScoredItem[T]],
-        max_k: int = 20,
-        min_k: int = 1,
-    ) -> SelectionResult[T]:
-        self._validate_inputs(items, max_k, min_k)
-
-        if not items:
-            return SelectionResult(
-                selected=[],
-                cutoff_score=0.0,
-                method=self.name,
-                metadata={"entropy": 0.0},
-            )
-
-        scores = np.array([item.score for item in items])
-
-        # Normalize scores to probabilities
-        score_sum = np.sum(scores)
+        scores: np.ndarray,
+        max_k: int,
+        min_k: int,
+    ) -> tuple[np.ndarray, dict[str, Any]]:
+        n = len(scores)
+        if n == 0:
+            return _NO_INDICES, {"entropy": 0.0}
+
+        # Shannon entropy of the scores as a probability distribution,
+        # normalized by the maximum possible entropy
+        normalized_entropy = 0.0
+        score_sum = float(np.sum(scores))
         if score_sum > 0:
-            probs = scores / score_sum
-            # Calculate Shannon entropy
-            entropy = float(stats.entropy(probs))
-            # Normalize entropy by max possible entropy
-            max_entropy = np.log(len(scores)) if len(scores) > 1 else 1.0
+            probs = scores[scores > 0] / score_sum
+            entropy = float(-np.sum(probs * np.log(probs)))
+            max_entropy = float(np.log(n)) if n > 1 else 1.0
             normalized_entropy = entropy / max_entropy if max_entropy > 0 else 0.0
-        else:
-            normalized_entropy = 0.0
 
         # Choose k based on entropy
         if normalized_entropy < self._entropy_threshold:
@@ -415,25 +442,17 @@ class EntropySelectionStrategy(SelectionStrategy):
         target_k = max(target_k, min_k)
 
         # Filter by min_score and select
-        filtered = [item for item in items if item.score >= self._min_score]
-        selected = filtered[:target_k]
+        count = min(_count_at_least(scores, self._min_score), target_k)
 
         # Ensure min_k
-        if len(selected) < min_k and len(items) >= min_k:
-            selected = items[:min_k]
+        if count < min_k and n >= min_k:
+            count = min_k
 
-        cutoff = selected[-1].score if selected else 0.0
-
-        return SelectionResult(
-            selected=selected,
-            cutoff_score=cutoff,
-            method=self.name,
-            metadata={
-                "entropy": normalized_entropy,
-                "threshold": self._entropy_threshold,
-                "target_k": target_k,
-            },
-        )
+        return _prefix(count), {
+            "entropy": normalized_entropy,
+            "threshold": self._entropy_threshold,
+            "target_k": target_k,
+        }
 
 
 class ClusterSelectionStrategy(SelectionStrategy):
@@ -467,92 +486,68 @@ class ClusterSelectionStrategy(SelectionStrategy):
     def name(self) -> str:
         return "clustering"
 
-    def select(
+    def _select_sorted(
         self,
-        items: list[ScoredItem[T]],
-        max_k: int = 20,
-        min_k: int = 1,
-    ) -> SelectionResult[T]:
-        self._validate_inputs(items, max_k, min_k)
-
-        if not items:
-            return SelectionResult(
-                selected=[],
-                cutoff_score=0.0,
-                method=self.name,
-                metadata={"n_clusters": 0},
-            )
+        scores: np.ndarray,
+        max_k: int,
+        min_k: int,
+    ) -> tuple[np.ndarray, dict[str, Any]]:
+        n = len(scores)
+        if n == 0:
+            return _NO_INDICES, {"n_clusters": 0}
 
         # Filter by min_score first
-        filtered = [(i, item) for i, item in enumerate(items) if item.score >= self._min_score]
+        passing = _count_at_least(scores, self._min_score)
 
-        if not filtered:
+        if passing == 0:
             # Fall back to min_k items if nothing passes threshold
-            selected = items[: min(min_k, len(items))]
-            return SelectionResult(
-                selected=selected,
-                cutoff_score=selected[-1].score if selected else 0.0,
-                method=self.name,
-                metadata={"n_clusters": 0, "reason": "below_threshold"},
-            )
-
-        if len(filtered) <= self._top_per_cluster:
-            # Not enough items for meaningful clustering
-            selected = [item for _, item in filtered]
-            if len(selected) < min_k:
-                selected = items[:min_k]
-            return SelectionResult(
-                selected=selected[:max_k],
-                cutoff_score=selected[-1].score if selected else 0.0,
-                method=self.name,
-                metadata={"n_clusters": 1, "reason": "insufficient_items"},
-            )
-
-        # Cluster by scores
-        scores = np.array([[item.score] for _, item in filtered])
-        clustering = DBSCAN(eps=self._eps, min_samples=self._min_samples).fit(scores)
-        labels = clustering.labels_
-
-        # Group items by cluster
-        clusters: dict[int, list[tuple[int, ScoredItem[T]]]] = {}
-        for (orig_idx, item), label in zip(filtered, labels):
-            if label not in clusters:
-                clusters[label] = []
-            clusters[label].append((orig_idx, item))
-
-        # Select top items from each cluster (sorted by original index to maintain score order)
-        selected = []
-        for label in sorted(clusters.keys()):
-            cluster_items = clusters[label]
-            # Items are already sorted by score (original order), take top_per_cluster
-            for _, item in cluster_items[: self._top_per_cluster]:
-                if len(selected) < max_k:
-                    selected.append(item)
-
-        # Sort by score descending
-        selected.sort(key=lambda x: x.score, reverse=True)
+            return _prefix(min(min_k, n)), {"n_clusters": 0, "reason": "below_threshold"}
 
-        # Ensure min_k
-        if len(selected) < min_k and len(items) >= min_k:
-            # Add more items from original list
-            existing_items = {id(s.item) for s in selected}
-            for item in items:
-                if id(item.item) not in existing_items and len(selected) < min_k:
-                    selected.append(item)
-            selected.sort(key=lambda x: x.score, reverse=True)
-
-        cutoff = selected[-1].score if selected else 0.0
-
-        return SelectionResult(
-            selected=selected,
-            cutoff_score=cutoff,
-            method=self.name,
-            metadata={
-                "n_clusters": len(set(labels)) - (1 if -1 in labels else 0),
-                "eps": self._eps,
-                "top_per_cluster": self._top_per_cluster,
-            },
-        )
+        if passing <= self._top_per_cluster:
+            # Not enough items for meaningful clustering
+            count = passing if passing >= min_k else min(min_k, n)
+            return _prefix(min(count, max_k)), {
+                "n_clusters": 1,
+                "reason": "insufficient_items",
+            }
+
+        labels = self._cluster_labels(scores[:passing])
+
+        # Rank of each item within its cluster, walking clusters in label
+        # order and items in score order
+        by_cluster = np.lexsort((np.arange(passing), labels))
+        cluster_labels = labels[by_cluster]
+        starts = np.flatnonzero(np.r_[True, cluster_labels[1:] != cluster_labels[:-1]])
+        rank = np.arange(passing) - np.repeat(starts, np.diff(np.r_[starts, passing]))
+
+        # Top items of each cluster, capped by max_k, sorted by score descending
+        selected = by_cluster[rank < self._top_per_cluster][:max_k]
+        selected = selected[np.argsort(-scores[selected], kind="stable")]
+
+        # Ensure min_k by adding the best items not selected yet
+        if len(selected) < min_k and n >= min_k:
+            rest = np.setdiff1d(np.arange(n), selected, assume_unique=True)
+            selected = np.concatenate((selected, rest[: min_k - len(selected)]))
+            selected = selected[np.argsort(-scores[selected], kind="stable")]
+
+        return selected, {
+            "n_clusters": int(len(np.unique(labels[labels >= 0]))),
+            "eps": self._eps,
+            "top_per_cluster": self._top_per_cluster,
+        }
+
+    def _cluster_labels(self, scores: np.ndarray) -> np.ndarray:
+        """DBSCAN cluster labels of scores sorted descending."""
+        if self._min_samples <= 1:
+            # Every point is a core point, so in one dimension the clusters
+            # are the runs of sorted scores whose consecutive gaps are <= eps
+            gaps = scores[:-1] - scores[1:]
+            return np.concatenate(([0], np.cumsum(gaps > self._eps)))
+
+        from sklearn.cluster import DBSCAN  # deferred: sklearn is slow to import
+
+        clustering = DBSCAN(eps=self._eps, min_samples=self._min_samples)
+        return clustering.fit(scores.reshape(-1, 1)).labels_
 
 
 def create_selection_strategy(
@@ -13,9 +13,11 @@ from ruche.brains.focal.models import (
     Scenario,
     Scope,
     Template,
+    TemplateResponseMode,
     ToolActivation,
     Variable,
 )
+from ruche.brains.focal.stores.listing import ListPage, SortOrder
 from ruche.interlocutor_data import InterlocutorDataField
 
 
@@ -45,6 +47,47 @@ class AgentConfigStore(ABC):
         """Get rules for an agent with optional filtering."""
         pass
 
+    @abstractmethod
+    async def list_rules(
+        self,
+        tenant_id: UUID,
+        agent_id: UUID,
+        *,
+        scope: Scope | None = None,
+        enabled: bool | None = None,
+        priority_min: int | None = None,
+        priority_max: int | None = None,
+        sort_by: str = "priority",
+        sort_order: SortOrder = "desc",
+        limit: int = 20,
+        cursor: str | None = None,
+        offset: int = 0,
+        include_total: bool = False,
+    ) -> ListPage[Rule]:
+        """List one page of an agent's rules for the admin API.
+
+        Rules are returned without their embedding vectors; the page's
+        embedded_ids tells which ones have one.
+
+        Args:
+            tenant_id: Tenant identifier
+            agent_id: Agent identifier
+            scope: Only rules of this scope
+            enabled: Only enabled (True) or disabled (False) rules
+            priority_min: Minimum priority
+            priority_max: Maximum priority
+            sort_by: name, priority, created_at or updated_at
+            sort_order: Sort direction
+            limit: Maximum rules in the page
+            cursor: Resume after a previous page's next_cursor
+            offset: Rules to skip when no cursor is given
+            include_total: Whether to count matching rules (capped)
+
+        Raises:
+            ValueError: If the cursor is invalid for this sort
+        """
+        pass
+
     @abstractmethod
     async def save_rule(self, rule: Rule) -> UUID:
         """Save a rule, returning its ID."""
@@ -114,6 +157,42 @@ class AgentConfigStore(ABC):
         """Get scenarios for an agent."""
         pass
 
+    @abstractmethod
+    async def list_scenarios(
+        self,
+        tenant_id: UUID,
+        agent_id: UUID,
+        *,
+        enabled: bool | None = None,
+        tag: str | None = None,
+        sort_by: str = "created_at",
+        sort_order: SortOrder = "desc",
+        limit: int = 20,
+        cursor: str | None = None,
+        offset: int = 0,
+        include_total: bool = False,
+    ) -> ListPage[Scenario]:
+        """List one page of an agent's scenarios for the admin API.
+
+        Scenarios are returned without their entry embeddings.
+
+        Args:
+            tenant_id: Tenant identifier
+            agent_id: Agent identifier
+            enabled: Only enabled (True) or disabled (False) scenarios
+            tag: Only scenarios with this tag
+            sort_by: name, created_at or updated_at
+            sort_order: Sort direction
+            limit: Maximum scenarios in the page
+            cursor: Resume after a previous page's next_cursor
+            offset: Scenarios to skip when no cursor is given
+            include_total: Whether to count matching scenarios (capped)
+
+        Raises:
+            ValueError: If the cursor is invalid for this sort
+        """
+        pass
+
     @abstractmethod
     async def save_scenario(self, scenario: Scenario) -> UUID:
         """Save a scenario, returning its ID."""
@@ -142,6 +221,40 @@ class AgentConfigStore(ABC):
         """Get templates for an agent with optional filtering."""
         pass
 
+    @abstractmethod
+    async def list_templates(
+        self,
+        tenant_id: UUID,
+        agent_id: UUID,
+        *,
+        scope: Scope | None = None,
+        mode: TemplateResponseMode | None = None,
+        sort_by: str = "created_at",
+        sort_order: SortOrder = "desc",
+        limit: int = 20,
+        cursor: str | None = None,
+        offset: int = 0,
+        include_total: bool = False,
+    ) -> ListPage[Template]:
+        """List one page of an agent's templates for the admin API.
+
+        Args:
+            tenant_id: Tenant identifier
+            agent_id: Agent identifier
+            scope: Only templates of this scope
+            mode: Only templates of this mode
+            sort_by: name, created_at or updated_at
+            sort_order: Sort direction
+            limit: Maximum templates in the page
+            cursor: Resume after a previous page's next_cursor
+            offset: Templates to skip when no cursor is given
+            include_total: Whether to count matching templates (capped)
+
+        Raises:
+            ValueError: If the cursor is invalid for this sort
+        """
+        pass
+
     @abstractmethod
     async def save_template(self, template: Template) -> UUID:
         """Save a template, returning its ID."""
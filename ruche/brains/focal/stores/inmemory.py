@@ -13,10 +13,12 @@ from ruche.brains.focal.models import (
     Scenario,
     Scope,
     Template,
+    TemplateResponseMode,
     ToolActivation,
     Variable,
 )
 from ruche.brains.focal.stores.agent_config_store import AgentConfigStore
+from ruche.brains.focal.stores.listing import ListPage, SortOrder, paginate
 from ruche.interlocutor_data import InterlocutorDataField
 from ruche.utils.vector import cosine_similarity
 
@@ -78,6 +80,44 @@ class InMemoryAgentConfigStore(AgentConfigStore):
             results.append(rule)
         return results
 
+    async def list_rules(
+        self,
+        tenant_id: UUID,
+        agent_id: UUID,
+        *,
+        scope: Scope | None = None,
+        enabled: bool | None = None,
+        priority_min: int | None = None,
+        priority_max: int | None = None,
+        sort_by: str = "priority",
+        sort_order: SortOrder = "desc",
+        limit: int = 20,
+        cursor: str | None = None,
+        offset: int = 0,
+        include_total: bool = False,
+    ) -> ListPage[Rule]:
+        """List one page of an agent's rules."""
+        rules = await self.get_rules(tenant_id, agent_id, scope=scope, enabled_only=False)
+        if enabled is not None:
+            rules = [r for r in rules if r.enabled == enabled]
+        if priority_min is not None:
+            rules = [r for r in rules if r.priority >= priority_min]
+        if priority_max is not None:
+            rules = [r for r in rules if r.priority <= priority_max]
+
+        page = paginate(
+            rules,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            include_total=include_total,
+        )
+        page.embedded_ids = {r.id for r in page.items if r.embedding is not None}
+        page.items = [r.model_copy(update={"embedding": None}) for r in page.items]
+        return page
+
     async def save_rule(self, rule: Rule) -> UUID:
         """Save a rule, returning its ID."""
         self._rules[rule.id] = rule
@@ -197,6 +237,41 @@ class InMemoryAgentConfigStore(AgentConfigStore):
             results.append(scenario)
         return results
 
+    async def list_scenarios(
+        self,
+        tenant_id: UUID,
+        agent_id: UUID,
+        *,
+        enabled: bool | None = None,
+        tag: str | None = None,
+        sort_by: str = "created_at",
+        sort_order: SortOrder = "desc",
+        limit: int = 20,
+        cursor: str | None = None,
+        offset: int = 0,
+        include_total: bool = False,
+    ) -> ListPage[Scenario]:
+        """List one page of an agent's scenarios."""
+        scenarios = await self.get_scenarios(tenant_id, agent_id, enabled_only=False)
+        if enabled is not None:
+            scenarios = [s for s in scenarios if s.enabled == enabled]
+        if tag is not None:
+            scenarios = [s for s in scenarios if tag in s.tags]
+
+        page = paginate(
+            scenarios,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            include_total=include_total,
+        )
+        page.items = [
+            s.model_copy(update={"entry_condition_embedding": None}) for s in page.items
+        ]
+        return page
+
     async def save_scenario(self, scenario: Scenario) -> UUID:
         """Save a scenario, returning its ID."""
         self._scenarios[scenario.id] = scenario
@@ -242,6 +317,35 @@ class InMemoryAgentConfigStore(AgentConfigStore):
             results.append(template)
         return results
 
+    async def list_templates(
+        self,
+        tenant_id: UUID,
+        agent_id: UUID,
+        *,
+        scope: Scope | None = None,
+        mode: TemplateResponseMode | None = None,
+        sort_by: str = "created_at",
+        sort_order: SortOrder = "desc",
+        limit: int = 20,
+        cursor: str | None = None,
+        offset: int = 0,
+        include_total: bool = False,
+    ) -> ListPage[Template]:
+        """List one page of an agent's templates."""
+        templates = await self.get_templates(tenant_id, agent_id, scope=scope)
+        if mode is not None:
+            templates = [t for t in templates if t.mode == mode]
+
+        return paginate(
+            templates,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            include_total=include_total,
+        )
+
     async def save_template(self, template: Template) -> UUID:
         """Save a template, returning its ID."""
         self._templates[template.id] = template
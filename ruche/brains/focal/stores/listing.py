@@ -0,0 +1,152 @@
+"""Keyset-paginated listing of agent configuration entities.
+
+Admin list endpoints page through rules, scenarios and templates sorted by
+one column. Pages are addressed by an opaque cursor holding the sort value
+and ID of the last item returned: the next page starts strictly after that
+(value, id) pair, so deep pages cost the same as the first one and stay
+stable while items are added or removed.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any, Generic, Literal, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+SortOrder = Literal["asc", "desc"]
+
+# Sort keys with a timestamp value; "priority" is an int, "name" a string
+_TIMESTAMP_SORTS = {"created_at", "updated_at"}
+
+DEFAULT_COUNT_CAP = 10_000
+
+
+class ListPage(BaseModel, Generic[T]):
+    """One page of a keyset-paginated listing."""
+
+    items: list[T] = Field(default_factory=list, description="Items of this page")
+    next_cursor: str | None = Field(
+        default=None, description="Cursor of the next page (None on the last page)"
+    )
+    total: int | None = Field(default=None, description="Matching items, if requested")
+    total_is_estimate: bool = Field(
+        default=False, description="Whether total was capped and is a lower bound"
+    )
+    embedded_ids: set[UUID] = Field(
+        default_factory=set,
+        description="Listed items that have an embedding (vectors are not loaded)",
+    )
+
+
+def encode_cursor(sort_by: str, sort_order: SortOrder, value: Any, item_id: UUID) -> str:
+    """Encode the position after an item as an opaque cursor.
+
+    Args:
+        sort_by: Sort key the listing uses
+        sort_order: Sort direction the listing uses
+        value: The item's sort value
+        item_id: The item's ID (tie-breaker)
+
+    Returns:
+        URL-safe cursor string
+    """
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps({"k": sort_by, "o": sort_order, "v": value, "id": str(item_id)})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, sort_order: SortOrder) -> tuple[Any, UUID]:
+    """Decode a cursor produced by encode_cursor() for the same sort.
+
+    Args:
+        cursor: Cursor from a previous page
+        sort_by: Sort key of the current request
+        sort_order: Sort direction of the current request
+
+    Returns:
+        (sort value, item ID) to resume after
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["k"] != sort_by or payload["o"] != sort_order:
+            raise ValueError("Cursor was issued for a different sort")
+        value = payload["v"]
+        if sort_by in _TIMESTAMP_SORTS:
+            value = datetime.fromisoformat(value)
+        elif sort_by == "priority":
+            value = int(value)
+        else:
+            value = str(value)
+        return value, UUID(payload["id"])
+    except (binascii.Error, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+
+
+def sort_value(item: Any, sort_by: str) -> Any:
+    """Sort value of an item; names sort case-insensitively."""
+    value = getattr(item, sort_by)
+    return value.lower() if sort_by == "name" else value
+
+
+def paginate(
+    items: list[T],
+    *,
+    sort_by: str,
+    sort_order: SortOrder,
+    limit: int,
+    cursor: str | None = None,
+    offset: int = 0,
+    include_total: bool = False,
+    key: Callable[[T, str], Any] = sort_value,
+) -> ListPage[T]:
+    """Sort and page a fully loaded list the way the SQL listings do.
+
+    Used by stores without database-side pagination.
+
+    Args:
+        items: Filtered items
+        sort_by: Attribute to sort by
+        sort_order: Sort direction
+        limit: Maximum items in the page
+        cursor: Resume after this cursor (takes precedence over offset)
+        offset: Items to skip when no cursor is given
+        include_total: Whether to report the number of matching items
+        key: Sort value of an item
+
+    Returns:
+        The requested page
+    """
+    descending = sort_order == "desc"
+    ordered = sorted(items, key=lambda i: (key(i, sort_by), i.id), reverse=descending)
+
+    if cursor is not None:
+        after = decode_cursor(cursor, sort_by, sort_order)
+        if descending:
+            remaining = [i for i in ordered if (key(i, sort_by), i.id) < after]
+        else:
+            remaining = [i for i in ordered if (key(i, sort_by), i.id) > after]
+    else:
+        remaining = ordered[offset:]
+
+    page = remaining[:limit]
+    next_cursor = None
+    if len(remaining) > limit:
+        last = page[-1]
+        next_cursor = encode_cursor(sort_by, sort_order, key(last, sort_by), last.id)
+
+    return ListPage[T](
+        items=page,
+        next_cursor=next_cursor,
+        total=len(items) if include_total else None,
+    )
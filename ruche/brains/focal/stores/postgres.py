@@ -16,16 +16,54 @@ from ruche.brains.focal.models import (
     Scenario,
     Scope,
     Template,
+    TemplateResponseMode,
     ToolActivation,
     Variable,
 )
 from ruche.brains.focal.stores.agent_config_store import AgentConfigStore
+from ruche.brains.focal.stores.listing import (
+    DEFAULT_COUNT_CAP,
+    ListPage,
+    SortOrder,
+    decode_cursor,
+    encode_cursor,
+)
+from ruche.config.models.storage import AnnSearchConfig
+from ruche.infrastructure.db.ann import ann_search, build_ann_query, tenant_index_sql
 from ruche.infrastructure.db.errors import ConnectionError
 from ruche.infrastructure.db.pool import PostgresPool
 from ruche.observability.logging import get_logger
 
 logger = get_logger(__name__)
 
+_RULE_SEARCH_SQL = build_ann_query(
+    table="rules",
+    columns="""id, tenant_id, agent_id, name, description,
+       condition_text, condition_embedding, embedding_model,
+       action_type, action_config, scope, scope_id,
+       priority, enabled, created_at, updated_at, deleted_at""",
+    embedding_column="condition_embedding",
+    filters=["tenant_id = $2", "agent_id = $3", "deleted_at IS NULL", "enabled = true"],
+)
+
+# Admin listings: sort expressions (served by the migration 025 indexes)
+# and projections without embedding vectors
+_NAME_SORTS = {"name": "lower(name)", "created_at": "created_at", "updated_at": "updated_at"}
+_RULE_SORTS = {**_NAME_SORTS, "priority": "priority"}
+
+_RULE_LIST_COLUMNS = """id, tenant_id, agent_id, name, description, condition_text,
+       NULL::bytea AS condition_embedding,
+       condition_embedding IS NOT NULL AS has_embedding, embedding_model,
+       action_type, action_config, scope, scope_id,
+       priority, enabled, created_at, updated_at, deleted_at"""
+
+_SCENARIO_LIST_COLUMNS = """id, tenant_id, agent_id, name, description, version,
+       entry_condition, NULL::bytea AS entry_embedding, steps, enabled,
+       created_at, updated_at, deleted_at"""
+
+_TEMPLATE_LIST_COLUMNS = """id, tenant_id, agent_id, name, content, mode,
+       scope, scope_id, created_at, updated_at, deleted_at"""
+
 
 class PostgresAgentConfigStore(AgentConfigStore):
     """PostgreSQL implementation of AgentConfigStore.
@@ -34,13 +72,19 @@ class PostgresAgentConfigStore(AgentConfigStore):
     and pgvector for vector similarity search.
     """
 
-    def __init__(self, pool: PostgresPool) -> None:
+    def __init__(
+        self,
+        pool: PostgresPool,
+        ann_config: AnnSearchConfig | None = None,
+    ) -> None:
         """Initialize with connection pool.
 
         Args:
             pool: PostgreSQL connection pool
+            ann_config: Vector search tuning (defaults if not provided)
         """
         self._pool = pool
+        self._ann_config = ann_config or AnnSearchConfig()
 
     # Rule operations
     async def get_rule(self, tenant_id: UUID, rule_id: UUID) -> Rule | None:
@@ -107,6 +151,59 @@ class PostgresAgentConfigStore(AgentConfigStore):
             logger.error("postgres_get_rules_error", agent_id=str(agent_id), error=str(e))
             raise ConnectionError(f"Failed to get rules: {e}", cause=e) from e
 
+    async def list_rules(
+        self,
+        tenant_id: UUID,
+        agent_id: UUID,
+        *,
+        scope: Scope | None = None,
+        enabled: bool | None = None,
+        priority_min: int | None = None,
+        priority_max: int | None = None,
+        sort_by: str = "priority",
+        sort_order: SortOrder = "desc",
+        limit: int = 20,
+        cursor: str | None = None,
+        offset: int = 0,
+        include_total: bool = False,
+    ) -> ListPage[Rule]:
+        """List one page of an agent's rules with a keyset query."""
+        filters = ["tenant_id = $1", "agent_id = $2", "deleted_at IS NULL"]
+        params: list = [tenant_id, agent_id]
+        if scope is not None:
+            params.append(scope.value)
+            filters.append(f"scope = ${len(params)}")
+        if enabled is not None:
+            params.append(enabled)
+            filters.append(f"enabled = ${len(params)}")
+        if priority_min is not None:
+            params.append(priority_min)
+            filters.append(f"priority >= ${len(params)}")
+        if priority_max is not None:
+            params.append(priority_max)
+            filters.append(f"priority <= ${len(params)}")
+
+        rows, page = await self._list_page(
+            table="rules",
+            columns=_RULE_LIST_COLUMNS,
+            sorts=_RULE_SORTS,
+            filters=filters,
+            params=params,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            include_total=include_total,
+        )
+        return ListPage[Rule](
+            items=[self._row_to_rule(row) for row in rows],
+            next_cursor=page.next_cursor,
+            total=page.total,
+            total_is_estimate=page.total_is_estimate,
+            embedded_ids={row["id"] for row in rows if row["has_embedding"]},
+        )
+
     async def save_rule(self, rule: Rule) -> UUID:
         """Save a rule, returning its ID."""
         try:
@@ -198,31 +295,18 @@ class PostgresAgentConfigStore(AgentConfigStore):
         """Search rules by vector similarity using pgvector."""
         try:
             async with self._pool.acquire() as conn:
-                # Convert embedding to pgvector format
-                embedding_str = f"[{','.join(map(str, query_embedding))}]"
-
-                rows = await conn.fetch(
-                    """
-                    SELECT id, tenant_id, agent_id, name, description,
-                           condition_text, condition_embedding, embedding_model,
-                           action_type, action_config, scope, scope_id,
-                           priority, enabled, created_at, updated_at, deleted_at,
-                           1 - (condition_embedding <=> $1::vector) AS score
-                    FROM rules
-                    WHERE tenant_id = $2 AND agent_id = $3
-                      AND deleted_at IS NULL AND enabled = true
-                      AND condition_embedding IS NOT NULL
-                      AND 1 - (condition_embedding <=> $1::vector) >= $4
-                    ORDER BY score DESC
-                    LIMIT $5
-                    """,
-                    embedding_str,
+                results = await ann_search(
+                    conn,
+                    _RULE_SEARCH_SQL,
+                    query_embedding,
                     tenant_id,
                     agent_id,
-                    min_score,
-                    limit,
+                    limit=limit,
+                    min_score=min_score,
+                    config=self._ann_config,
+                    table="rules",
                 )
-                return [(self._row_to_rule(row), row["score"]) for row in rows]
+                return [(self._row_to_rule(row), score) for row, score in results]
         except Exception as e:
             logger.error(
                 "postgres_vector_search_rules_error",
@@ -231,6 +315,33 @@ class PostgresAgentConfigStore(AgentConfigStore):
             )
             raise ConnectionError(f"Failed to search rules: {e}", cause=e) from e
 
+    async def create_tenant_vector_index(self, tenant_id: UUID) -> None:
+        """Build a dedicated rule vector index for a large tenant.
+
+        Runs CREATE INDEX CONCURRENTLY, so it can take a while but does not
+        block writes. Safe to call again once the index exists.
+
+        Args:
+            tenant_id: Tenant identifier
+        """
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.execute(
+                    tenant_index_sql(
+                        "rules",
+                        "condition_embedding",
+                        "tenant_id",
+                        str(tenant_id),
+                        where="deleted_at IS NULL",
+                    )
+                )
+                logger.info("rule_tenant_index_created", tenant_id=str(tenant_id))
+        except Exception as e:
+            logger.error(
+                "postgres_create_tenant_index_error", tenant_id=str(tenant_id), error=str(e)
+            )
+            raise ConnectionError(f"Failed to create tenant index: {e}", cause=e) from e
+
     # Scenario operations
     async def get_scenario(self, tenant_id: UUID, scenario_id: UUID) -> Scenario | None:
         """Get a scenario by ID."""
@@ -285,6 +396,50 @@ class PostgresAgentConfigStore(AgentConfigStore):
             )
             raise ConnectionError(f"Failed to get scenarios: {e}", cause=e) from e
 
+    async def list_scenarios(
+        self,
+        tenant_id: UUID,
+        agent_id: UUID,
+        *,
+        enabled: bool | None = None,
+        tag: str | None = None,
+        sort_by: str = "created_at",
+        sort_order: SortOrder = "desc",
+        limit: int = 20,
+        cursor: str | None = None,
+        offset: int = 0,
+        include_total: bool = False,
+    ) -> ListPage[Scenario]:
+        """List one page of an agent's scenarios with a keyset query."""
+        filters = ["tenant_id = $1", "agent_id = $2", "deleted_at IS NULL"]
+        params: list = [tenant_id, agent_id]
+        if enabled is not None:
+            params.append(enabled)
+            filters.append(f"enabled = ${len(params)}")
+        if tag is not None:
+            # Tags are not persisted in the scenarios table, so none match
+            filters.append("FALSE")
+
+        rows, page = await self._list_page(
+            table="scenarios",
+            columns=_SCENARIO_LIST_COLUMNS,
+            sorts=_NAME_SORTS,
+            filters=filters,
+            params=params,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            include_total=include_total,
+        )
+        return ListPage[Scenario](
+            items=[self._row_to_scenario(row) for row in rows],
+            next_cursor=page.next_cursor,
+            total=page.total,
+            total_is_estimate=page.total_is_estimate,
+        )
+
     async def save_scenario(self, scenario: Scenario) -> UUID:
         """Save a scenario, returning its ID."""
         try:
@@ -414,6 +569,50 @@ class PostgresAgentConfigStore(AgentConfigStore):
             )
             raise ConnectionError(f"Failed to get templates: {e}", cause=e) from e
 
+    async def list_templates(
+        self,
+        tenant_id: UUID,
+        agent_id: UUID,
+        *,
+        scope: Scope | None = None,
+        mode: TemplateResponseMode | None = None,
+        sort_by: str = "created_at",
+        sort_order: SortOrder = "desc",
+        limit: int = 20,
+        cursor: str | None = None,
+        offset: int = 0,
+        include_total: bool = False,
+    ) -> ListPage[Template]:
+        """List one page of an agent's templates with a keyset query."""
+        filters = ["tenant_id = $1", "agent_id = $2", "deleted_at IS NULL"]
+        params: list = [tenant_id, agent_id]
+        if scope is not None:
+            params.append(scope.value)
+            filters.append(f"scope = ${len(params)}")
+        if mode is not None:
+            params.append(mode.value)
+            filters.append(f"mode = ${len(params)}")
+
+        rows, page = await self._list_page(
+            table="templates",
+            columns=_TEMPLATE_LIST_COLUMNS,
+            sorts=_NAME_SORTS,
+            filters=filters,
+            params=params,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            include_total=include_total,
+        )
+        return ListPage[Template](
+            items=[self._row_to_template(row) for row in rows],
+            next_cursor=page.next_cursor,
+            total=page.total,
+            total_is_estimate=page.total_is_estimate,
+        )
+
     async def save_template(self, template: Template) -> UUID:
         """Save a template, returning its ID."""
         try:
@@ -1140,6 +1339,87 @@ class PostgresAgentConfigStore(AgentConfigStore):
             raise ConnectionError(f"Failed to get archived scenario: {e}", cause=e) from e
 
     # Helper methods for row conversion
+    async def _list_page(
+        self,
+        *,
+        table: str,
+        columns: str,
+        sorts: dict[str, str],
+        filters: list[str],
+        params: list,
+        sort_by: str,
+        sort_order: SortOrder,
+        limit: int,
+        cursor: str | None,
+        offset: int,
+        include_total: bool,
+    ) -> tuple[list, ListPage]:
+        """Fetch one page of an admin listing.
+
+        Pages are ordered by (sort expression, id) and resume strictly after
+        the cursor's pair, so each page is an index range scan. One extra row
+        is fetched to tell whether a next page exists. The optional total is
+        counted up to DEFAULT_COUNT_CAP rows and flagged as an estimate
+        beyond that.
+
+        Returns:
+            Rows of the page, and a ListPage carrying cursor and total
+        """
+        if sort_by not in sorts:
+            raise ValueError(f"Cannot sort {table} by {sort_by}")
+        sort_expr = sorts[sort_by]
+        direction = "DESC" if sort_order == "desc" else "ASC"
+
+        where = list(filters)
+        page_params = list(params)
+        if cursor is not None:
+            after_value, after_id = decode_cursor(cursor, sort_by, sort_order)
+            page_params += [after_value, after_id]
+            op = "<" if sort_order == "desc" else ">"
+            where.append(
+                f"({sort_expr}, id) {op} (${len(page_params) - 1}, ${len(page_params)})"
+            )
+        page_params.append(limit + 1)
+        query = f"""
+            SELECT {columns}, {sort_expr} AS sort_key
+            FROM {table}
+            WHERE {" AND ".join(where)}
+            ORDER BY {sort_expr} {direction}, id {direction}
+            LIMIT ${len(page_params)}
+        """
+        if cursor is None and offset:
+            page_params.append(offset)
+            query += f" OFFSET ${len(page_params)}"
+
+        try:
+            async with self._pool.acquire() as conn:
+                rows = await conn.fetch(query, *page_params)
+                count = None
+                if include_total:
+                    count = await conn.fetchval(
+                        f"""
+                        SELECT count(*) FROM (
+                            SELECT 1 FROM {table}
+                            WHERE {" AND ".join(filters)}
+                            LIMIT {DEFAULT_COUNT_CAP + 1}
+                        ) capped
+                        """,
+                        *params,
+                    )
+        except Exception as e:
+            logger.error("postgres_list_error", table=table, error=str(e))
+            raise ConnectionError(f"Failed to list {table}: {e}", cause=e) from e
+
+        page: ListPage = ListPage()
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            page.next_cursor = encode_cursor(sort_by, sort_order, last["sort_key"], last["id"])
+        if count is not None:
+            page.total = min(count, DEFAULT_COUNT_CAP)
+            page.total_is_estimate = count > DEFAULT_COUNT_CAP
+        return rows, page
+
     def _row_to_rule(self, row) -> Rule:
         """Convert database row to Rule model."""
         from uuid import UUID as UUIDType
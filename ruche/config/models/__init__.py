@@ -5,9 +5,15 @@ This module exports all configuration models for easy access:
     from ruche.config.models import APIConfig, StorageConfig
 """
 
+from ruche.config.models.acf import (
+    ACFConfig,
+    SessionAffinityConfig,
+    TurnHandoffConfig,
+    TypingCadenceConfig,
+)
 from ruche.config.models.agent import AgentConfig
-from ruche.config.models.jobs import HatchetConfig, JobsConfig
-from ruche.config.models.api import APIConfig, RateLimitConfig
+from ruche.config.models.jobs import EmbeddingJobsConfig, HatchetConfig, JobsConfig
+from ruche.config.models.api import APIConfig, RateLimitConfig, WarmupConfig
 from ruche.config.models.migration import (
     CheckpointConfig,
     DeploymentConfig,
@@ -43,20 +49,31 @@ from ruche.config.models.selection import (
     SelectionStrategiesConfig,
 )
 from ruche.config.models.storage import (
+    AnnSearchConfig,
+    AuditWriterConfig,
+    SessionPersistenceConfig,
     StorageConfig,
     StoreBackendConfig,
+    TextSearchConfig,
     VectorStoreConfig,
 )
 
 __all__ = [
+    # ACF
+    "ACFConfig",
+    "TypingCadenceConfig",
+    "TurnHandoffConfig",
+    "SessionAffinityConfig",
     # Agent
     "AgentConfig",
     # Jobs
+    "EmbeddingJobsConfig",
     "HatchetConfig",
     "JobsConfig",
     # API
     "APIConfig",
     "RateLimitConfig",
+    "WarmupConfig",
     # Migration
     "CheckpointConfig",
     "DeploymentConfig",
@@ -87,7 +104,11 @@ __all__ = [
     "SelectionConfig",
     "SelectionStrategiesConfig",
     # Storage
+    "AnnSearchConfig",
+    "AuditWriterConfig",
+    "SessionPersistenceConfig",
     "StorageConfig",
     "StoreBackendConfig",
+    "TextSearchConfig",
     "VectorStoreConfig",
 ]
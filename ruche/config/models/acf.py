@@ -0,0 +1,86 @@
+"""Agent Conversation Fabric configuration models."""
+
+from pydantic import BaseModel, Field
+
+
+class TypingCadenceConfig(BaseModel):
+    """Learned per-user typing cadence for accumulation windows.
+
+    Inter-message gaps are kept per tenant, interlocutor and channel in a
+    small quantile sketch in Redis and fed to TurnManager.suggest_wait_ms.
+    """
+
+    enabled: bool = Field(default=True, description="Learn and use typing cadence")
+    ttl_seconds: int = Field(
+        default=30 * 86400,
+        gt=0,
+        description="Sketch expiry, refreshed on every message",
+    )
+    max_gap_ms: int = Field(
+        default=3000,
+        gt=0,
+        description="Longer gaps are not typing; keep near the max accumulation window",
+    )
+    half_life_samples: int = Field(
+        default=50,
+        gt=0,
+        description="Samples after which an old gap weighs half as much",
+    )
+
+
+class TurnHandoffConfig(BaseModel):
+    """Hand-off of bulky step state between workflow steps.
+
+    The LogicalTurn and the response are kept in Redis under a
+    turn-scoped key; Hatchet step outputs carry only a reference.
+    """
+
+    enabled: bool = Field(default=True, description="Hand off step state through Redis")
+    ttl_seconds: int = Field(
+        default=900,
+        gt=0,
+        description="Expiry of a turn's state; must outlive the longest turn",
+    )
+
+
+class SessionAffinityConfig(BaseModel):
+    """Session-affine worker routing.
+
+    Sessions hash onto shards that live workers own by rendezvous hashing;
+    an owning worker keeps session state hot and locks sessions locally
+    before taking the Redis mutex.
+    """
+
+    enabled: bool = Field(default=False, description="Route sessions to owning workers")
+    num_shards: int = Field(
+        default=256,
+        gt=0,
+        description="Shards session keys hash onto; changing it moves every session",
+    )
+    member_ttl_seconds: float = Field(
+        default=15.0,
+        gt=0,
+        description="How long a heartbeat keeps a worker in the ring",
+    )
+    refresh_interval_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        description="Seconds between heartbeats and membership reloads",
+    )
+
+
+class ACFConfig(BaseModel):
+    """Top-level Agent Conversation Fabric configuration."""
+
+    cadence: TypingCadenceConfig = Field(
+        default_factory=TypingCadenceConfig,
+        description="Per-user typing cadence",
+    )
+    handoff: TurnHandoffConfig = Field(
+        default_factory=TurnHandoffConfig,
+        description="Step state hand-off",
+    )
+    affinity: SessionAffinityConfig = Field(
+        default_factory=SessionAffinityConfig,
+        description="Session-affine worker routing",
+    )
@@ -19,6 +19,31 @@ class RateLimitConfig(BaseModel):
     )
 
 
+class WarmupConfig(BaseModel):
+    """Startup warm-up configuration (API lifespan and ACF worker)."""
+
+    enabled: bool = Field(default=True, description="Run warm-up before reporting ready")
+    top_agents: int = Field(
+        default=20,
+        ge=0,
+        description="Number of most active agents to preload",
+    )
+    lookback_hours: int = Field(
+        default=24,
+        gt=0,
+        description="Window of recent turns used to rank active agents",
+    )
+    preload_models: bool = Field(
+        default=True,
+        description="Load local embedding models before the first request",
+    )
+    timeout_seconds: float = Field(
+        default=120.0,
+        gt=0,
+        description="Give up on warm-up (and report ready) after this long",
+    )
+
+
 class APIConfig(BaseModel):
     """Configuration for the HTTP API server."""
 
@@ -37,6 +62,10 @@ class APIConfig(BaseModel):
         default_factory=RateLimitConfig,
         description="Rate limiting settings",
     )
+    warmup: WarmupConfig = Field(
+        default_factory=WarmupConfig,
+        description="Startup warm-up settings",
+    )
 
     @field_validator("cors_origins", mode="before")
     @classmethod
@@ -52,6 +52,57 @@ class HatchetConfig(BaseModel):
     )
 
 
+class EmbeddingJobsConfig(BaseModel):
+    """Background embedding of rules, scenarios and intents.
+
+    Admin API writes enqueue one job per entity; the worker claims the jobs
+    of one agent at a time and embeds them in batched provider calls.
+    """
+
+    enabled: bool = Field(default=True, description="Run the embedding job worker")
+    coalesce_ms: int = Field(
+        default=500,
+        ge=0,
+        description="Delay before a new job is claimable, so writes arriving "
+        "together are embedded in one batch",
+    )
+    max_jobs_per_claim: int = Field(
+        default=1000,
+        gt=0,
+        description="Jobs of one agent claimed per worker iteration",
+    )
+    provider_batch_size: int = Field(
+        default=256,
+        gt=0,
+        description="Texts per embedding provider call",
+    )
+    lease_seconds: int = Field(
+        default=300,
+        gt=0,
+        description="Claim lease; unfinished jobs are claimed again after it",
+    )
+    poll_interval_ms: int = Field(
+        default=1000,
+        gt=0,
+        description="Idle sleep between claims",
+    )
+    max_attempts: int = Field(
+        default=5,
+        ge=1,
+        description="Attempts before a failing job is dropped",
+    )
+    retry_backoff_seconds: int = Field(
+        default=30,
+        ge=0,
+        description="Delay before a failed job is retried",
+    )
+    publish_wait_seconds: float = Field(
+        default=120.0,
+        ge=0,
+        description="How long publish waits for an agent's pending embeddings",
+    )
+
+
 class JobsConfig(BaseModel):
     """Top-level jobs configuration."""
 
@@ -59,3 +110,7 @@ class JobsConfig(BaseModel):
         default_factory=HatchetConfig,
         description="Hatchet configuration",
     )
+    embeddings: EmbeddingJobsConfig = Field(
+        default_factory=EmbeddingJobsConfig,
+        description="Embedding job queue and worker",
+    )
@@ -6,6 +6,7 @@ from pydantic import BaseModel, Field
 
 LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 LogFormat = Literal["json", "console"]
+LogOverflowPolicy = Literal["drop", "block"]
 
 
 class LoggingConfig(BaseModel):
@@ -25,6 +26,23 @@ class LoggingConfig(BaseModel):
         default_factory=list,
         description="Additional regex patterns to redact",
     )
+    async_writer: bool = Field(
+        default=True,
+        description="Write log lines from a background thread instead of the caller",
+    )
+    queue_size: int = Field(
+        default=10000,
+        ge=1,
+        description="Maximum log lines buffered for the background writer",
+    )
+    overflow_policy: LogOverflowPolicy = Field(
+        default="drop",
+        description="When the writer queue is full: drop the line or block the caller",
+    )
+    sample_rates: dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-event keep probability (0.0-1.0) for high-volume events",
+    )
 
 
 class TracingConfig(BaseModel):
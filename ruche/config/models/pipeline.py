@@ -377,6 +377,62 @@ class ScenarioOrchestrationConfig(BaseModel):
     )
 
 
+class PhaseSchedulingConfig(BaseModel):
+    """Turn phase scheduling configuration.
+
+    When enabled, phases without a data dependency (e.g. rule and scenario
+    filtering) run concurrently instead of strictly in sequence.
+    """
+
+    enabled: bool = Field(
+        default=True, description="Overlap independent pipeline phases"
+    )
+    speculative_retrieval: bool = Field(
+        default=True,
+        description="Start retrieval on the raw message while the situation sensor runs",
+    )
+
+
+class LLMResponseCacheConfig(BaseModel):
+    """Exact-match LLM response cache configuration.
+
+    Only deterministic calls (temperature at or below max_temperature) from
+    the listed steps are cached. Keys combine model, step, prompt hash and
+    agent config version, so a config publish never serves stale answers.
+    """
+
+    enabled: bool = Field(default=False, description="Enable response caching")
+    steps: list[str] = Field(
+        default_factory=lambda: ["situation_sensor", "rule_filtering", "scenario_filtering"],
+        description="Pipeline steps whose LLM calls may be cached",
+    )
+    max_temperature: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Calls with a higher temperature bypass the cache",
+    )
+    ttl_seconds: int = Field(
+        default=3600, gt=0, description="Entry lifetime in both tiers"
+    )
+    l1_max_entries: int = Field(
+        default=2048, ge=0, description="In-process LRU size (0 disables L1)"
+    )
+    l2_enabled: bool = Field(
+        default=True, description="Use Redis as a shared second tier when available"
+    )
+    l2_max_value_bytes: int = Field(
+        default=65536,
+        gt=0,
+        description="Responses larger than this (after compression) are not stored in Redis",
+    )
+    compression_min_bytes: int = Field(
+        default=512,
+        ge=0,
+        description="Values at least this large are zlib-compressed",
+    )
+    key_prefix: str = Field(default="llmcache", description="Redis key prefix")
+
+
 class InterlocutorDataUpdateConfig(BaseModel):
     """Customer data update step configuration (Phase 3)."""
 
@@ -527,12 +583,23 @@ class EnforcementConfig(BaseModel):
         default_factory=lambda: ["openrouter/anthropic/claude-3-haiku-20240307"],
         description="Models for LLM-as-Judge subjective enforcement",
     )
+    llm_judge_max_rules_per_call: int = Field(
+        default=10,
+        ge=1,
+        le=50,
+        description="Subjective rules judged per LLM call; larger sets run as concurrent chunks",
+    )
 
     # Always-enforce GLOBAL constraints
     always_enforce_global: bool = Field(
         default=True,
         description="Always fetch and enforce GLOBAL hard constraints, even if not matched",
     )
+    global_rules_cache_ttl_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        description="Max age of cached GLOBAL constraints per agent version (0 disables cache)",
+    )
 
     # Legacy field for backwards compatibility
     self_critique_enabled: bool = Field(
@@ -742,6 +809,14 @@ class PipelineConfig(BaseModel):
         default_factory=MemoryIngestionConfig,
         description="Memory ingestion configuration",
     )
+    scheduling: PhaseSchedulingConfig = Field(
+        default_factory=PhaseSchedulingConfig,
+        description="Concurrent/speculative phase scheduling",
+    )
+    response_cache: LLMResponseCacheConfig = Field(
+        default_factory=LLMResponseCacheConfig,
+        description="Exact-match cache for deterministic LLM calls",
+    )
 
     # Backwards compatibility alias
     @property
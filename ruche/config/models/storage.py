@@ -149,6 +149,136 @@ class VectorStoreConfig(BaseModel):
     )
 
 
+class AnnSearchConfig(BaseModel):
+    """Approximate nearest-neighbour search tuning for pgvector queries.
+
+    Applies to the embedding searches run directly against Postgres
+    (episodes, rules). Search width is set per query with SET LOCAL, and
+    widened when a selective filter leaves too few candidates.
+    """
+
+    ivfflat_probes: int = Field(
+        default=10,
+        gt=0,
+        description="ivfflat.probes for the first search round",
+    )
+    hnsw_ef_search: int = Field(
+        default=40,
+        gt=0,
+        le=1000,
+        description="hnsw.ef_search for the first search round",
+    )
+    hnsw_iterative_scan: Literal["off", "relaxed_order", "strict_order"] = Field(
+        default="off",
+        description="hnsw.iterative_scan mode (requires pgvector >= 0.8)",
+    )
+    candidate_multiplier: int = Field(
+        default=2,
+        ge=1,
+        description="Candidates fetched per requested result in the first round",
+    )
+    expansion_factor: int = Field(
+        default=4,
+        ge=2,
+        description="Growth of candidates and search width per extra round",
+    )
+    max_rounds: int = Field(
+        default=3,
+        ge=1,
+        description="Maximum search rounds before returning what was found",
+    )
+    max_candidates: int = Field(
+        default=1000,
+        gt=0,
+        description="Upper bound on candidates fetched in one round",
+    )
+    force_custom_plan: bool = Field(
+        default=True,
+        description="Plan with bound parameters so per-tenant partial indexes apply",
+    )
+
+
+class TextSearchConfig(BaseModel):
+    """Postgres full-text search settings for episode search."""
+
+    default_language: str = Field(
+        default="en",
+        description="Language (ISO 639-1) for episodes and queries that have none",
+    )
+    fuzzy_fallback: bool = Field(
+        default=False,
+        description="Fill short full-text results with trigram matches (needs pg_trgm)",
+    )
+    fuzzy_threshold: float = Field(
+        default=0.4,
+        ge=0.0,
+        le=1.0,
+        description="Minimum trigram word similarity for fuzzy matches",
+    )
+
+
+class AuditWriterConfig(BaseModel):
+    """Batched writes for the Postgres audit store.
+
+    Turn records and audit events are buffered in memory and written in
+    batches with COPY instead of one INSERT per record.
+    """
+
+    enabled: bool = Field(
+        default=True,
+        description="Buffer audit writes (False writes each record inline)",
+    )
+    max_batch_size: int = Field(
+        default=500,
+        gt=0,
+        description="Flush as soon as this many records are buffered",
+    )
+    flush_interval_ms: int = Field(
+        default=250,
+        gt=0,
+        description="Flush buffered records at least this often",
+    )
+    max_buffer_size: int = Field(
+        default=20000,
+        gt=0,
+        description="Records held in memory before spilling to disk",
+    )
+    spill_dir: str | None = Field(
+        default=None,
+        description="Directory for records that do not fit in memory (None drops them)",
+    )
+    partition_months_ahead: int = Field(
+        default=2,
+        ge=0,
+        description="Monthly partitions created ahead of time",
+    )
+
+
+class SessionPersistenceConfig(BaseModel):
+    """Delta-encoded session persistence.
+
+    Each save writes only what changed since the session was loaded (new
+    step visits, changed variables and rule fires, changed scalar fields)
+    instead of the whole session. A full snapshot is written every
+    ``compaction_interval`` deltas.
+    """
+
+    delta_encoding: bool = Field(
+        default=True,
+        description="Append per-save deltas (False writes a full snapshot every save)",
+    )
+    compaction_interval: int = Field(
+        default=20,
+        gt=0,
+        description="Deltas written before the next full snapshot",
+    )
+    max_step_history: int = Field(
+        default=50,
+        gt=0,
+        description="Step visits kept on the session; older visits are archived on compaction",
+    )
+
+
 class StorageConfig(BaseModel):
     """Configuration for all storage backends."""
 
@@ -176,3 +306,19 @@ class StorageConfig(BaseModel):
         default_factory=VectorStoreConfig,
         description="VectorStore backend for embeddings",
     )
+    ann: AnnSearchConfig = Field(
+        default_factory=AnnSearchConfig,
+        description="pgvector ANN search tuning for Postgres stores",
+    )
+    text_search: TextSearchConfig = Field(
+        default_factory=TextSearchConfig,
+        description="Full-text search for Postgres memory store",
+    )
+    audit_writer: AuditWriterConfig = Field(
+        default_factory=AuditWriterConfig,
+        description="Batched writes for Postgres audit store",
+    )
+    session_persistence: SessionPersistenceConfig = Field(
+        default_factory=SessionPersistenceConfig,
+        description="Delta encoding and compaction for session stores",
+    )
@@ -9,6 +9,7 @@ from pydantic_settings import (
     SettingsConfigDict,
 )
 
+from ruche.config.models.acf import ACFConfig
 from ruche.config.models.api import APIConfig
 from ruche.config.models.jobs import JobsConfig
 from ruche.config.models.migration import ScenarioMigrationConfig
@@ -97,6 +98,10 @@ class Settings(BaseSettings):
         default_factory=JobsConfig,
         description="Background jobs configuration",
     )
+    acf: ACFConfig = Field(
+        default_factory=ACFConfig,
+        description="Agent Conversation Fabric configuration",
+    )
 
     @classmethod
     def settings_customise_sources(
@@ -4,7 +4,7 @@ from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from ruche.conversation.models.enums import Channel, SessionStatus
 
@@ -155,3 +155,7 @@ class Session(BaseModel):
     last_activity_at: datetime = Field(
         default_factory=utc_now, description="Last activity"
     )
+
+    # What the store last persisted, for delta encoding (see
+    # ruche.conversation.stores.delta); not part of the session data
+    _persisted: Any = PrivateAttr(default=None)
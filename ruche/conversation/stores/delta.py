@@ -0,0 +1,171 @@
+"""Delta encoding for session persistence.
+
+Sessions grow with the conversation (step history, variables, rule-fire
+counters), so rewriting the whole session on every save makes payload size
+and serialization time linear in conversation length. Instead, a store
+remembers what it persisted (mark_persisted()) and the next save writes
+only what changed since (compute_delta()):
+
+- step visits appended after the last persisted one
+- set or removed keys of variables, variable_updated_at, rule_fires and
+  rule_last_fire_turn
+- changed scalar fields (status, active step, turn_count, ...)
+
+Readers rebuild the session from the last full snapshot plus its deltas
+(apply_delta()). Stores write a fresh snapshot every
+``compaction_interval`` deltas, capping step history at the same time
+(cap_step_history()); the visits that no longer fit are archived.
+
+Step history is treated as append-only: visits edited in place after
+they were persisted are only picked up by the next snapshot.
+"""
+
+import copy
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from ruche.conversation.models import Session, StepVisit
+
+# Map fields diffed key by key; everything else is compared whole
+MAP_FIELDS = ("variables", "variable_updated_at", "rule_fires", "rule_last_fire_turn")
+
+_TRACKED_FIELDS = {"step_history", *MAP_FIELDS}
+
+
+class MapDelta(BaseModel):
+    """Changes to one dict field of a session."""
+
+    set: dict[str, Any] = Field(default_factory=dict, description="Added or changed keys")
+    unset: list[str] = Field(default_factory=list, description="Removed keys")
+
+
+class SessionDelta(BaseModel):
+    """Changes to a session since it was last persisted."""
+
+    step_visits: list[StepVisit] = Field(
+        default_factory=list, description="Step visits appended since"
+    )
+    maps: dict[str, MapDelta] = Field(
+        default_factory=dict, description="Changes to variables and rule counters"
+    )
+    fields: dict[str, Any] = Field(
+        default_factory=dict, description="Changed scalar fields (JSON values)"
+    )
+
+
+@dataclass
+class _PersistedState:
+    """What a store last wrote for a session."""
+
+    last_visit: StepVisit | None
+    maps: dict[str, dict[str, Any]]
+    fields: dict[str, Any]
+    deltas: int
+
+
+def mark_persisted(session: Session, *, deltas: int = 0) -> None:
+    """Record the session's current state as persisted.
+
+    Args:
+        session: Session just loaded or saved
+        deltas: Deltas stored on top of the last full snapshot
+    """
+    session._persisted = _PersistedState(
+        last_visit=session.step_history[-1] if session.step_history else None,
+        maps={
+            # Variables may hold mutable values changed in place
+            "variables": copy.deepcopy(session.variables),
+            "variable_updated_at": dict(session.variable_updated_at),
+            "rule_fires": dict(session.rule_fires),
+            "rule_last_fire_turn": dict(session.rule_last_fire_turn),
+        },
+        fields=_scalar_fields(session),
+        deltas=deltas,
+    )
+
+
+def pending_deltas(session: Session) -> int:
+    """Number of deltas stored on top of the session's last snapshot."""
+    state = session._persisted
+    return state.deltas if isinstance(state, _PersistedState) else 0
+
+
+def compute_delta(session: Session) -> SessionDelta | None:
+    """Diff a session against what was last persisted.
+
+    Returns:
+        The delta, or None if a full snapshot is needed (the session was
+        never persisted, or its step history was rewritten)
+    """
+    state = session._persisted
+    if not isinstance(state, _PersistedState):
+        return None
+
+    history = session.step_history
+    if state.last_visit is None:
+        new_visits = list(history)
+    else:
+        for index in range(len(history) - 1, -1, -1):
+            if history[index] is state.last_visit:
+                new_visits = history[index + 1 :]
+                break
+        else:
+            return None
+
+    maps: dict[str, MapDelta] = {}
+    for name in MAP_FIELDS:
+        before = state.maps[name]
+        after: dict[str, Any] = getattr(session, name)
+        changed = {k: v for k, v in after.items() if k not in before or before[k] != v}
+        removed = [k for k in before if k not in after]
+        if changed or removed:
+            maps[name] = MapDelta(set=changed, unset=removed)
+
+    current = _scalar_fields(session)
+    fields = {k: v for k, v in current.items() if state.fields.get(k) != v}
+
+    return SessionDelta(step_visits=new_visits, maps=maps, fields=fields)
+
+
+def apply_delta(session: Session, delta: SessionDelta) -> None:
+    """Replay a delta onto a session loaded from a snapshot."""
+    if delta.step_visits:
+        session.step_history = [*session.step_history, *delta.step_visits]
+    for name, change in delta.maps.items():
+        values = {**getattr(session, name), **change.set}
+        for key in change.unset:
+            values.pop(key, None)
+        setattr(session, name, values)
+    for name, value in delta.fields.items():
+        setattr(session, name, value)
+
+
+def cap_step_history(session: Session, max_steps: int) -> list[StepVisit]:
+    """Trim step history to the most recent visits.
+
+    The latest checkpoint visit is kept even when it is older, since
+    migrations use it to avoid re-entering steps upstream of it.
+
+    Returns:
+        Visits removed from the session, oldest first, for archiving
+    """
+    history = session.step_history
+    if len(history) <= max_steps:
+        return []
+
+    kept = history[-max_steps:]
+    archived = history[:-max_steps]
+    if not any(visit.is_checkpoint for visit in kept):
+        checkpoint = next((v for v in reversed(archived) if v.is_checkpoint), None)
+        if checkpoint is not None:
+            archived = [v for v in archived if v is not checkpoint]
+            kept = [checkpoint, *kept]
+
+    session.step_history = kept
+    return archived
+
+
+def _scalar_fields(session: Session) -> dict[str, Any]:
+    return session.model_dump(mode="json", exclude=_TRACKED_FIELDS)
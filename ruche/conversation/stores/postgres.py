@@ -3,7 +3,9 @@
 Provides persistent storage for sessions with full query support.
 """
 
+import json
 from datetime import UTC, datetime
+from enum import Enum
 from typing import Any
 from uuid import UUID
 
@@ -11,8 +13,16 @@ import asyncpg
 from pydantic import BaseModel
 
 from ruche.brains.focal.migration.models import ScopeFilter
-from ruche.conversation.models import Channel, Session, SessionStatus
+from ruche.config.models.storage import SessionPersistenceConfig
+from ruche.conversation.models import Channel, Session, SessionStatus, StepVisit
 from ruche.conversation.store import SessionStore
+from ruche.conversation.stores.delta import (
+    SessionDelta,
+    cap_step_history,
+    compute_delta,
+    mark_persisted,
+    pending_deltas,
+)
 from ruche.infrastructure.db.errors import ConnectionError, NotFoundError
 from ruche.observability.logging import get_logger
 
@@ -32,20 +42,103 @@ def _serialize_json(obj: Any) -> Any:
     return obj
 
 
+# Scalar columns a delta may update (other session fields are not stored)
+_DELTA_COLUMNS = {
+    "customer_profile_id",
+    "config_version",
+    "active_scenario_id",
+    "active_step_id",
+    "active_scenario_version",
+    "relocalization_count",
+    "turn_count",
+    "status",
+    "scenario_checksum",
+    "last_activity_at",
+}
+_DELTA_JSONB_COLUMNS = {"active_scenarios", "pending_migration"}
+
+STEP_ARCHIVE_SQL = """
+    INSERT INTO session_step_archive (session_id, tenant_id, visits)
+    VALUES ($1, $2, $3::jsonb)
+"""
+
+# session_step_archive has no FK to sessions; delete it with the session
+STEP_ARCHIVE_DELETE_SQL = "DELETE FROM session_step_archive WHERE session_id = $1"
+
+
+def delta_update_query(session: Session, delta: SessionDelta) -> tuple[str, list[Any]]:
+    """Build an UPDATE that applies a session delta in place.
+
+    Step visits are appended and map fields merged with jsonb operators, so
+    only the changes travel to the server.
+
+    Returns:
+        SQL and its arguments ($1 is the session ID)
+    """
+    args: list[Any] = [session.session_id]
+    assignments = ["delta_count = delta_count + 1"]
+
+    if delta.step_visits:
+        args.append(json.dumps([v.model_dump(mode="json") for v in delta.step_visits]))
+        assignments.append(
+            f"step_history = COALESCE(step_history, '[]'::jsonb) || ${len(args)}::jsonb"
+        )
+
+    for name, change in delta.maps.items():
+        args.append(change.unset)
+        args.append(json.dumps(change.model_dump(mode="json")["set"]))
+        assignments.append(
+            f"{name} = (COALESCE({name}, '{{}}'::jsonb) - ${len(args) - 1}::text[])"
+            f" || ${len(args)}::jsonb"
+        )
+
+    for name, value in delta.fields.items():
+        if name in _DELTA_JSONB_COLUMNS:
+            args.append(json.dumps(value))
+            assignments.append(f"{name} = ${len(args)}::jsonb")
+        elif name in _DELTA_COLUMNS:
+            current = getattr(session, name)
+            args.append(current.value if isinstance(current, Enum) else current)
+            assignments.append(f"{name} = ${len(args)}")
+
+    sql = f"UPDATE sessions SET {', '.join(assignments)} WHERE session_id = $1"
+    return sql, args
+
+
+def archive_visits_args(session: Session, visits: list[StepVisit]) -> tuple[Any, ...]:
+    """Arguments for STEP_ARCHIVE_SQL."""
+    return (
+        session.session_id,
+        session.tenant_id,
+        json.dumps([v.model_dump(mode="json") for v in visits]),
+    )
+
+
 class PostgresSessionStore(SessionStore):
     """PostgreSQL implementation of SessionStore.
 
     Stores sessions in PostgreSQL for long-term persistence.
     Used as fallback/persistent tier for Redis cache.
+
+    Saves of a loaded session update only what changed (see
+    ruche.conversation.stores.delta); every ``compaction_interval`` saves
+    the full row is rewritten and old step visits are moved to
+    session_step_archive.
     """
 
-    def __init__(self, pool: asyncpg.Pool) -> None:
+    def __init__(
+        self,
+        pool: asyncpg.Pool,
+        persistence: SessionPersistenceConfig | None = None,
+    ) -> None:
         """Initialize PostgreSQL session store.
 
         Args:
             pool: asyncpg connection pool
+            persistence: Delta encoding settings (uses defaults if not provided)
         """
         self._pool = pool
+        self._persistence = persistence or SessionPersistenceConfig()
 
     def _session_to_dict(self, session: Session) -> dict[str, Any]:
         """Convert Session to dict for database storage."""
@@ -60,7 +153,10 @@ class PostgresSessionStore(SessionStore):
         # Convert channel and status back to enums
         row["channel"] = Channel(row["channel"])
         row["status"] = SessionStatus(row["status"])
-        return Session.model_validate(row)
+        deltas = row.pop("delta_count", 0) or 0
+        session = Session.model_validate(row)
+        mark_persisted(session, deltas=deltas)
+        return session
 
     async def get(self, session_id: UUID) -> Session | None:
         """Get a session by ID."""
@@ -100,13 +196,32 @@ class PostgresSessionStore(SessionStore):
     async def save(self, session: Session) -> UUID:
         """Save a session to PostgreSQL.
 
-        Updates last_activity_at and upserts the session.
+        Updates last_activity_at, then applies a delta to the stored row or,
+        when compaction is due, upserts the whole session.
         """
         try:
             session.last_activity_at = datetime.now(UTC)
+            delta = compute_delta(session) if self._persistence.delta_encoding else None
+            deltas = pending_deltas(session)
+
+            if delta is not None and deltas < self._persistence.compaction_interval:
+                sql, args = delta_update_query(session, delta)
+                async with self._pool.acquire() as conn:
+                    result = await conn.execute(sql, *args)
+                # The row may have been deleted since the session was loaded
+                if result != "UPDATE 0":
+                    mark_persisted(session, deltas=deltas + 1)
+                    logger.debug(
+                        "session_delta_saved",
+                        session_id=str(session.session_id),
+                        deltas=deltas + 1,
+                    )
+                    return session.session_id
+
+            archived = cap_step_history(session, self._persistence.max_step_history)
             data = self._session_to_dict(session)
 
-            async with self._pool.acquire() as conn:
+            async with self._pool.acquire() as conn, conn.transaction():
                 await conn.execute(
                     """
                     INSERT INTO sessions (
@@ -137,7 +252,8 @@ class PostgresSessionStore(SessionStore):
                         status = EXCLUDED.status,
                         pending_migration = EXCLUDED.pending_migration,
                         scenario_checksum = EXCLUDED.scenario_checksum,
-                        last_activity_at = EXCLUDED.last_activity_at
+                        last_activity_at = EXCLUDED.last_activity_at,
+                        delta_count = 0
                     """,
                     data["session_id"],
                     data["tenant_id"],
@@ -163,15 +279,19 @@ class PostgresSessionStore(SessionStore):
                     data["created_at"],
                     data["last_activity_at"],
                 )
+                if archived:
+                    await conn.execute(STEP_ARCHIVE_SQL, *archive_visits_args(session, archived))
 
-                logger.info(
-                    "session_saved",
-                    session_id=str(session.session_id),
-                    tenant_id=str(session.tenant_id),
-                    agent_id=str(session.agent_id),
-                )
+            mark_persisted(session)
+            logger.info(
+                "session_saved",
+                session_id=str(session.session_id),
+                tenant_id=str(session.tenant_id),
+                agent_id=str(session.agent_id),
+                archived_visits=len(archived),
+            )
 
-                return session.session_id
+            return session.session_id
 
         except asyncpg.PostgresError as e:
             logger.error(
@@ -182,9 +302,9 @@ class PostgresSessionStore(SessionStore):
             raise ConnectionError(f"Failed to save session: {e}", cause=e) from e
 
     async def delete(self, session_id: UUID) -> bool:
-        """Delete a session from PostgreSQL."""
+        """Delete a session and its archived step visits from PostgreSQL."""
         try:
-            async with self._pool.acquire() as conn:
+            async with self._pool.acquire() as conn, conn.transaction():
                 result = await conn.execute(
                     """
                     DELETE FROM sessions
@@ -192,6 +312,7 @@ class PostgresSessionStore(SessionStore):
                     """,
                     session_id,
                 )
+                await conn.execute(STEP_ARCHIVE_DELETE_SQL, session_id)
 
                 deleted = result.split()[-1] == "1"
                 logger.info(
@@ -4,6 +4,7 @@ Implements hot cache (30 min TTL) in Redis with PostgreSQL as
 persistent storage fallback. Write-through to both tiers.
 """
 
+import contextlib
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
@@ -13,11 +14,26 @@ import redis.asyncio as redis
 from pydantic import BaseModel
 
 from ruche.brains.focal.migration.models import ScopeFilter
-from ruche.config.models.storage import RedisSessionConfig
-from ruche.conversation.models import Channel, Session, SessionStatus
+from ruche.config.models.storage import RedisSessionConfig, SessionPersistenceConfig
+from ruche.conversation.models import Channel, Session, SessionStatus, StepVisit
 from ruche.conversation.store import SessionStore
+from ruche.conversation.stores.delta import (
+    SessionDelta,
+    apply_delta,
+    cap_step_history,
+    compute_delta,
+    mark_persisted,
+    pending_deltas,
+)
+from ruche.conversation.stores.postgres import (
+    STEP_ARCHIVE_DELETE_SQL,
+    STEP_ARCHIVE_SQL,
+    archive_visits_args,
+    delta_update_query,
+)
 from ruche.infrastructure.db.errors import ConnectionError
 from ruche.observability.logging import get_logger
+from ruche.observability.metrics import SESSION_PERSIST_BYTES
 
 logger = get_logger(__name__)
 
@@ -42,8 +58,15 @@ class RedisSessionStore(SessionStore):
     storage. Write-through to both on save. Read from Redis first, then
     PostgreSQL on cache miss.
 
+    Saves of a loaded session append a delta (see
+    ruche.conversation.stores.delta) instead of rewriting the snapshot;
+    every ``compaction_interval`` deltas a fresh snapshot replaces them and
+    old step visits are archived.
+
     Key structure:
-    - session:hot:{session_id} - Hot cache (30 min TTL)
+    - session:hot:{session_id} - Hot cache (30 min TTL), last full snapshot
+    - session:delta:{session_id} - Deltas since the snapshot (same TTL)
+    - session:steps:{session_id} - Archived step visits (without PostgreSQL)
     - session:index:agent:{tenant_id}:{agent_id} - Session IDs by agent
     - session:index:customer:{tenant_id}:{profile_id} - Session IDs by customer
     - session:index:channel:{tenant_id}:{channel}:{user_id} - Session by channel
@@ -54,6 +77,7 @@ class RedisSessionStore(SessionStore):
         client: redis.Redis,
         pg_pool: asyncpg.Pool | None = None,
         config: RedisSessionConfig | None = None,
+        persistence: SessionPersistenceConfig | None = None,
     ) -> None:
         """Initialize Redis session store with PostgreSQL fallback.
 
@@ -61,16 +85,26 @@ class RedisSessionStore(SessionStore):
             client: Redis client instance
             pg_pool: PostgreSQL connection pool for persistent storage
             config: Redis session configuration (uses defaults if not provided)
+            persistence: Delta encoding settings (uses defaults if not provided)
         """
         self._client = client
         self._pg_pool = pg_pool
         self._config = config or RedisSessionConfig()
+        self._persistence = persistence or SessionPersistenceConfig()
         self._prefix = self._config.key_prefix
 
     def _hot_key(self, session_id: UUID) -> str:
         """Get hot cache key for session."""
         return f"{self._prefix}:hot:{session_id}"
 
+    def _delta_key(self, session_id: UUID) -> str:
+        """Get delta list key for session."""
+        return f"{self._prefix}:delta:{session_id}"
+
+    def _archive_key(self, session_id: UUID) -> str:
+        """Get archived step visits key for session."""
+        return f"{self._prefix}:steps:{session_id}"
+
     def _agent_index_key(self, tenant_id: UUID, agent_id: UUID) -> str:
         """Get agent index key."""
         return f"{self._prefix}:index:agent:{tenant_id}:{agent_id}"
@@ -101,15 +135,14 @@ class RedisSessionStore(SessionStore):
         """
         try:
             # Try Redis cache first
-            hot_key = self._hot_key(session_id)
-            data = await self._client.get(hot_key)
+            session = await self._get_from_redis(session_id)
 
-            if data:
+            if session:
                 logger.debug(
                     "session_retrieved_cache",
                     session_id=str(session_id),
                 )
-                return self._deserialize_session(data)
+                return session
 
             # Fall back to PostgreSQL if configured
             if self._pg_pool:
@@ -145,13 +178,17 @@ class RedisSessionStore(SessionStore):
         """
         try:
             session.last_activity_at = datetime.now(UTC)
-
-            # Write to PostgreSQL first (persistent storage)
-            if self._pg_pool:
-                await self._save_to_postgres(session)
-
-            # Then cache in Redis
-            await self._cache_to_redis(session)
+            delta = compute_delta(session) if self._persistence.delta_encoding else None
+            deltas = pending_deltas(session)
+
+            if (
+                delta is None
+                or deltas >= self._persistence.compaction_interval
+                or not await self._save_delta(session, delta)
+            ):
+                await self._save_snapshot(session)
+            else:
+                mark_persisted(session, deltas=deltas + 1)
 
             # Update indexes
             await self._update_indexes(session)
@@ -183,8 +220,11 @@ class RedisSessionStore(SessionStore):
             session = await self.get(session_id)
 
             # Delete from Redis cache
-            hot_key = self._hot_key(session_id)
-            await self._client.delete(hot_key)
+            await self._client.delete(
+                self._hot_key(session_id),
+                self._delta_key(session_id),
+                self._archive_key(session_id),
+            )
 
             # Delete from PostgreSQL if configured
             if self._pg_pool:
@@ -349,12 +389,13 @@ class RedisSessionStore(SessionStore):
             results = []
 
             async for key in self._client.scan_iter(match=pattern):
-                data = await self._client.get(key)
-                if not data:
+                # Clients without decode_responses yield bytes keys
+                if isinstance(key, bytes):
+                    key = key.decode()
+                session = await self._get_from_redis(UUID(key.rsplit(":", 1)[-1]))
+                if not session:
                     continue
 
-                session = self._deserialize_session(data)
-
                 # Filter conditions
                 if session.tenant_id != tenant_id:
                     continue
@@ -401,15 +442,99 @@ class RedisSessionStore(SessionStore):
                 f"Failed to find sessions by step hash: {e}", cause=e
             ) from e
 
-    async def _cache_to_redis(self, session: Session) -> None:
-        """Cache a session to Redis with TTL."""
-        data = self._serialize_session(session)
+    async def _get_from_redis(self, session_id: UUID) -> Session | None:
+        """Rebuild a session from its cached snapshot and deltas."""
+        pipe = self._client.pipeline(transaction=False)
+        pipe.get(self._hot_key(session_id))
+        pipe.lrange(self._delta_key(session_id), 0, -1)
+        data, deltas = await pipe.execute()
+        if not data:
+            return None
+
+        session = self._deserialize_session(data)
+        for raw in deltas:
+            apply_delta(session, SessionDelta.model_validate_json(raw))
+        mark_persisted(session, deltas=len(deltas))
+        return session
+
+    async def _save_delta(self, session: Session, delta: SessionDelta) -> bool:
+        """Append a delta to both tiers.
+
+        PostgreSQL is written first, so a failed write never leaves Redis
+        ahead of it. If Redis then fails, its cached copy is dropped and
+        reads fall back to PostgreSQL.
+
+        Returns:
+            False if either tier lacks the snapshot and a full save is needed
+        """
+        payload = delta.model_dump_json()
         hot_key = self._hot_key(session.session_id)
-        await self._client.setex(
-            hot_key,
+        delta_key = self._delta_key(session.session_id)
+
+        if self._pg_pool:
+            sql, args = delta_update_query(session, delta)
+            async with self._pg_pool.acquire() as conn:
+                result = await conn.execute(sql, *args)
+            if result == "UPDATE 0":
+                return False
+
+        try:
+            pipe = self._client.pipeline(transaction=True)
+            pipe.expire(hot_key, self._config.hot_ttl_seconds)
+            pipe.rpush(delta_key, payload)
+            pipe.expire(delta_key, self._config.hot_ttl_seconds)
+            snapshot_present, _, _ = await pipe.execute()
+        except redis.RedisError:
+            if self._pg_pool:
+                with contextlib.suppress(redis.RedisError):
+                    await self._client.delete(hot_key, delta_key)
+            raise
+        if not snapshot_present:
+            await self._client.delete(delta_key)
+            return False
+
+        SESSION_PERSIST_BYTES.labels(mode="delta").observe(len(payload))
+        return True
+
+    async def _save_snapshot(self, session: Session) -> None:
+        """Write a full snapshot, replacing deltas and archiving old visits."""
+        archived = cap_step_history(session, self._persistence.max_step_history)
+
+        # Write to PostgreSQL first (persistent storage)
+        if self._pg_pool:
+            await self._save_to_postgres(session, archived)
+        elif archived:
+            await self._archive_to_redis(session, archived)
+
+        # Then cache in Redis
+        size = await self._cache_to_redis(session)
+        mark_persisted(session)
+        SESSION_PERSIST_BYTES.labels(mode="snapshot").observe(size)
+
+    async def _archive_to_redis(self, session: Session, visits: list[StepVisit]) -> None:
+        """Append archived step visits to the session's Redis archive."""
+        archive_key = self._archive_key(session.session_id)
+        pipe = self._client.pipeline(transaction=True)
+        pipe.rpush(archive_key, *(v.model_dump_json() for v in visits))
+        pipe.expire(archive_key, self._config.persist_ttl_seconds)
+        await pipe.execute()
+
+    async def _cache_to_redis(self, session: Session) -> int:
+        """Cache a session snapshot to Redis with TTL, dropping stale deltas.
+
+        Returns:
+            Size of the serialized snapshot
+        """
+        data = self._serialize_session(session)
+        pipe = self._client.pipeline(transaction=True)
+        pipe.setex(
+            self._hot_key(session.session_id),
             self._config.hot_ttl_seconds,
             data,
         )
+        pipe.delete(self._delta_key(session.session_id))
+        await pipe.execute()
+        return len(data)
 
     async def _get_from_postgres(self, session_id: UUID) -> Session | None:
         """Get session from PostgreSQL."""
@@ -427,11 +552,13 @@ class RedisSessionStore(SessionStore):
 
             return self._dict_to_session(dict(row))
 
-    async def _save_to_postgres(self, session: Session) -> None:
+    async def _save_to_postgres(
+        self, session: Session, archived: list[StepVisit] | None = None
+    ) -> None:
         """Save session to PostgreSQL."""
         data = self._session_to_dict(session)
 
-        async with self._pg_pool.acquire() as conn:
+        async with self._pg_pool.acquire() as conn, conn.transaction():
             await conn.execute(
                 """
                 INSERT INTO sessions (
@@ -462,7 +589,8 @@ class RedisSessionStore(SessionStore):
                     status = EXCLUDED.status,
                     pending_migration = EXCLUDED.pending_migration,
                     scenario_checksum = EXCLUDED.scenario_checksum,
-                    last_activity_at = EXCLUDED.last_activity_at
+                    last_activity_at = EXCLUDED.last_activity_at,
+                    delta_count = 0
                 """,
                 data["session_id"],
                 data["tenant_id"],
@@ -488,10 +616,12 @@ class RedisSessionStore(SessionStore):
                 data["created_at"],
                 data["last_activity_at"],
             )
+            if archived:
+                await conn.execute(STEP_ARCHIVE_SQL, *archive_visits_args(session, archived))
 
     async def _delete_from_postgres(self, session_id: UUID) -> None:
-        """Delete session from PostgreSQL."""
-        async with self._pg_pool.acquire() as conn:
+        """Delete session and its archived step visits from PostgreSQL."""
+        async with self._pg_pool.acquire() as conn, conn.transaction():
             await conn.execute(
                 """
                 DELETE FROM sessions
@@ -499,6 +629,7 @@ class RedisSessionStore(SessionStore):
                 """,
                 session_id,
             )
+            await conn.execute(STEP_ARCHIVE_DELETE_SQL, session_id)
 
     async def _find_sessions_by_step_hash_postgres(
         self,
@@ -554,7 +685,11 @@ class RedisSessionStore(SessionStore):
         """Convert PostgreSQL row to Session model."""
         row["channel"] = Channel(row["channel"])
         row["status"] = SessionStatus(row["status"])
-        return Session.model_validate(row)
+        row.pop("delta_count", None)
+        session = Session.model_validate(row)
+        # Cached as a fresh snapshot, so no Redis deltas are pending
+        mark_persisted(session)
+        return session
 
     async def health_check(self) -> bool:
         """Check Redis connection health."""
@@ -107,6 +107,13 @@ class Task(BaseModel):
             return False
         return datetime.now(UTC) > self.expires_at
 
+    @property
+    def due_at(self) -> datetime:
+        """Earliest time the task may execute (scheduled_for/execute_after)."""
+        if self.execute_after and self.execute_after > self.scheduled_for:
+            return self.execute_after
+        return self.scheduled_for
+
     @property
     def can_retry(self) -> bool:
         """Check if task can be retried."""
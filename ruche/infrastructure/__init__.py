@@ -9,79 +9,72 @@ Consolidates all infrastructure concerns in one place:
 This layer provides the foundation for the alignment engine and API layer.
 """
 
-# Stores
-from ruche.infrastructure.stores import (
-    AuditStore,
-    InterlocutorDataStoreCacheLayer,
-    ConfigStore,
-    EntityType,
-    InMemoryAuditStore,
-    InMemoryConfigStore,
-    InMemoryInterlocutorDataStore,
-    InMemoryMemoryStore,
-    InMemorySessionStore,
-    InMemoryVectorStore,
-    InterlocutorDataStore,
-    MemoryStore,
-    PgVectorStore,
-    PostgresAuditStore,
-    PostgresConfigStore,
-    PostgresInterlocutorDataStore,
-    PostgresMemoryStore,
-    QdrantVectorStore,
-    RedisSessionStore,
-    SessionStore,
-    VectorDocument,
-    VectorMetadata,
-    VectorSearchResult,
-    VectorStore,
-)
+from typing import TYPE_CHECKING
 
-# Providers
-from ruche.infrastructure.providers import (
-    EmbeddingProvider,
-    JinaEmbeddingProvider,
-    JinaRerankProvider,
-    LLMExecutor,
-    MockEmbeddingProvider,
-    MockLLMProvider,
-    MockRerankProvider,
-    RerankProvider,
-)
+from ruche.utils.lazy import lazy_exports
 
-# Optional provider (requires sentence_transformers package)
-try:
+if TYPE_CHECKING:
+    from ruche.infrastructure.stores import (
+        AuditStore,
+        InterlocutorDataStoreCacheLayer,
+        ConfigStore,
+        EntityType,
+        InMemoryAuditStore,
+        InMemoryConfigStore,
+        InMemoryInterlocutorDataStore,
+        InMemoryMemoryStore,
+        InMemorySessionStore,
+        InMemoryVectorStore,
+        InterlocutorDataStore,
+        MemoryStore,
+        PgVectorStore,
+        PostgresAuditStore,
+        PostgresConfigStore,
+        PostgresInterlocutorDataStore,
+        PostgresMemoryStore,
+        QdrantVectorStore,
+        RedisSessionStore,
+        SessionStore,
+        VectorDocument,
+        VectorMetadata,
+        VectorSearchResult,
+        VectorStore,
+    )
+    from ruche.infrastructure.providers import (
+        EmbeddingProvider,
+        JinaEmbeddingProvider,
+        JinaRerankProvider,
+        LLMExecutor,
+        MockEmbeddingProvider,
+        MockLLMProvider,
+        MockRerankProvider,
+        RerankProvider,
+    )
     from ruche.infrastructure.providers import SentenceTransformerEmbeddingProvider
-except (ImportError, TypeError):
-    SentenceTransformerEmbeddingProvider = None  # type: ignore
-
-# Toolbox
-from ruche.infrastructure.toolbox import (
-    ComposioProvider,
-    HTTPProvider,
-    InternalProvider,
-    SideEffectPolicy,
-    ToolActivation,
-    ToolDefinition,
-    ToolGateway,
-    ToolMetadata,
-    ToolResult,
-    Toolbox,
-)
-
-# Channels
-from ruche.infrastructure.channels import (
-    AGUIWebchatAdapter,
-    ChannelBinding,
-    ChannelGateway,
-    ChannelPolicy,
-    ChannelType,
-    InboundMessage,
-    OutboundMessage,
-    SimpleWebchatAdapter,
-    SMTPEmailAdapter,
-    TwilioWhatsAppAdapter,
-)
+    from ruche.infrastructure.toolbox import (
+        ComposioProvider,
+        HTTPProvider,
+        InternalProvider,
+        SideEffectPolicy,
+        ToolActivation,
+        ToolDefinition,
+        ToolGateway,
+        ToolMetadata,
+        ToolResult,
+        Toolbox,
+    )
+    from ruche.infrastructure.channels import (
+        AGUIWebchatAdapter,
+        ChannelBinding,
+        ChannelGateway,
+        ChannelPolicy,
+        ChannelType,
+        InboundMessage,
+        OutboundMessage,
+        SimpleWebchatAdapter,
+        SMTPEmailAdapter,
+        TwilioWhatsAppAdapter,
+    )
 
 __all__ = [
     # Stores - Config
@@ -150,3 +143,64 @@ __all__ = [
     "TwilioWhatsAppAdapter",
     "SMTPEmailAdapter",
 ]
+
+# Resolved on first access (PEP 562) so importing this package stays cheap
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AuditStore": "ruche.infrastructure.stores",
+        "InterlocutorDataStoreCacheLayer": "ruche.infrastructure.stores",
+        "ConfigStore": "ruche.infrastructure.stores",
+        "EntityType": "ruche.infrastructure.stores",
+        "InMemoryAuditStore": "ruche.infrastructure.stores",
+        "InMemoryConfigStore": "ruche.infrastructure.stores",
+        "InMemoryInterlocutorDataStore": "ruche.infrastructure.stores",
+        "InMemoryMemoryStore": "ruche.infrastructure.stores",
+        "InMemorySessionStore": "ruche.infrastructure.stores",
+        "InMemoryVectorStore": "ruche.infrastructure.stores",
+        "InterlocutorDataStore": "ruche.infrastructure.stores",
+        "MemoryStore": "ruche.infrastructure.stores",
+        "PgVectorStore": "ruche.infrastructure.stores",
+        "PostgresAuditStore": "ruche.infrastructure.stores",
+        "PostgresConfigStore": "ruche.infrastructure.stores",
+        "PostgresInterlocutorDataStore": "ruche.infrastructure.stores",
+        "PostgresMemoryStore": "ruche.infrastructure.stores",
+        "QdrantVectorStore": "ruche.infrastructure.stores",
+        "RedisSessionStore": "ruche.infrastructure.stores",
+        "SessionStore": "ruche.infrastructure.stores",
+        "VectorDocument": "ruche.infrastructure.stores",
+        "VectorMetadata": "ruche.infrastructure.stores",
+        "VectorSearchResult": "ruche.infrastructure.stores",
+        "VectorStore": "ruche.infrastructure.stores",
+        "EmbeddingProvider": "ruche.infrastructure.providers",
+        "JinaEmbeddingProvider": "ruche.infrastructure.providers",
+        "JinaRerankProvider": "ruche.infrastructure.providers",
+        "LLMExecutor": "ruche.infrastructure.providers",
+        "MockEmbeddingProvider": "ruche.infrastructure.providers",
+        "MockLLMProvider": "ruche.infrastructure.providers",
+        "MockRerankProvider": "ruche.infrastructure.providers",
+        "RerankProvider": "ruche.infrastructure.providers",
+        "SentenceTransformerEmbeddingProvider": "ruche.infrastructure.providers",
+        "ComposioProvider": "ruche.infrastructure.toolbox",
+        "HTTPProvider": "ruche.infrastructure.toolbox",
+        "InternalProvider": "ruche.infrastructure.toolbox",
+        "SideEffectPolicy": "ruche.infrastructure.toolbox",
+        "ToolActivation": "ruche.infrastructure.toolbox",
+        "ToolDefinition": "ruche.infrastructure.toolbox",
+        "ToolGateway": "ruche.infrastructure.toolbox",
+        "ToolMetadata": "ruche.infrastructure.toolbox",
+        "ToolResult": "ruche.infrastructure.toolbox",
+        "Toolbox": "ruche.infrastructure.toolbox",
+        "AGUIWebchatAdapter": "ruche.infrastructure.channels",
+        "ChannelBinding": "ruche.infrastructure.channels",
+        "ChannelGateway": "ruche.infrastructure.channels",
+        "ChannelPolicy": "ruche.infrastructure.channels",
+        "ChannelType": "ruche.infrastructure.channels",
+        "InboundMessage": "ruche.infrastructure.channels",
+        "OutboundMessage": "ruche.infrastructure.channels",
+        "SimpleWebchatAdapter": "ruche.infrastructure.channels",
+        "SMTPEmailAdapter": "ruche.infrastructure.channels",
+        "TwilioWhatsAppAdapter": "ruche.infrastructure.channels",
+    },
+    optional=["SentenceTransformerEmbeddingProvider"],
+)
@@ -0,0 +1,208 @@
+"""Index-friendly pgvector nearest-neighbour queries.
+
+pgvector only uses an ivfflat/HNSW index when the query orders by the raw
+distance operator and has a LIMIT. Filtering on ``1 - distance >= x`` or
+sorting by a computed score alias forces a sequential scan, so queries
+built here order by ``column <=> $1`` and apply the score threshold to the
+returned rows instead.
+
+An index scan visits a fixed number of candidates (``ef_search`` for HNSW,
+``probes`` lists for ivfflat) and the WHERE clause is applied afterwards.
+With a selective filter (one session's episodes in a shared index) fewer
+than LIMIT rows survive, so ann_search() retries with a wider search until
+it has enough results or hits its bounds.
+
+Large tenants can get their own partial index (see tenant_index_sql()); with
+``force_custom_plan`` the planner sees the bound tenant value and picks it.
+"""
+
+import re
+from collections.abc import Sequence
+from typing import Any
+
+import asyncpg
+
+from ruche.config.models.storage import AnnSearchConfig
+from ruche.observability.metrics import ANN_SEARCH_ROUNDS
+
+# pgvector rejects hnsw.ef_search above this
+MAX_EF_SEARCH = 1000
+
+_PARAM = re.compile(r"\$(\d+)")
+
+
+def build_ann_query(
+    *,
+    table: str,
+    columns: str,
+    embedding_column: str,
+    filters: Sequence[str],
+) -> str:
+    """Build a nearest-neighbour query that can use a vector index.
+
+    Parameter $1 is the query embedding. Filters use $2.. in order, and the
+    candidate limit is the parameter after the last filter parameter.
+
+    Args:
+        table: Table to search
+        columns: Select list (without the distance column)
+        embedding_column: pgvector column compared with cosine distance
+        filters: SQL predicates ANDed together, e.g. ``"group_id = $2"``
+
+    Returns:
+        SQL returning the select list plus a ``distance`` column
+    """
+    limit_param = _count_params(filters) + 2
+    where = " AND ".join([*filters, f"{embedding_column} IS NOT NULL"])
+    return (
+        f"SELECT {columns}, {embedding_column} <=> $1::vector AS distance "
+        f"FROM {table} "
+        f"WHERE {where} "
+        f"ORDER BY {embedding_column} <=> $1::vector "
+        f"LIMIT ${limit_param}"
+    )
+
+
+async def ann_search(
+    conn: asyncpg.Connection,
+    query: str,
+    query_embedding: list[float],
+    *args: Any,
+    limit: int,
+    min_score: float,
+    config: AnnSearchConfig,
+    table: str,
+) -> list[tuple[asyncpg.Record, float]]:
+    """Run a query from build_ann_query() and score its rows.
+
+    Args:
+        conn: Connection to run on (a transaction is opened for SET LOCAL)
+        query: SQL from build_ann_query()
+        query_embedding: Query vector
+        *args: Filter parameter values, in order
+        limit: Maximum results to return
+        min_score: Minimum cosine similarity (1 - distance)
+        config: Search tuning
+        table: Table name, used as a metric label
+
+    Returns:
+        (row, score) pairs, best first, at most ``limit`` long
+    """
+    embedding_str = f"[{','.join(map(str, query_embedding))}]"
+    candidates = min(max(limit * config.candidate_multiplier, limit), config.max_candidates)
+    probes = config.ivfflat_probes
+    ef_search = max(config.hnsw_ef_search, min(candidates, MAX_EF_SEARCH))
+
+    results: list[tuple[asyncpg.Record, float]] = []
+    rounds = 0
+    async with conn.transaction():
+        if config.force_custom_plan:
+            await conn.execute("SET LOCAL plan_cache_mode = force_custom_plan")
+        if config.hnsw_iterative_scan != "off":
+            await conn.execute(f"SET LOCAL hnsw.iterative_scan = {config.hnsw_iterative_scan}")
+
+        while True:
+            rounds += 1
+            await conn.execute(f"SET LOCAL ivfflat.probes = {int(probes)}")
+            await conn.execute(f"SET LOCAL hnsw.ef_search = {int(ef_search)}")
+            rows = await conn.fetch(query, embedding_str, *args, candidates)
+
+            results = []
+            for row in rows:
+                score = 1 - row["distance"]
+                if score >= min_score:
+                    results.append((row, score))
+
+            if len(results) >= limit or rounds >= config.max_rounds:
+                break
+            # Rows come back nearest first: once one falls below the
+            # threshold, a wider search only finds worse matches. Otherwise
+            # the filter starved the index scan and widening can help.
+            if len(rows) > len(results):
+                break
+            if candidates >= config.max_candidates and ef_search >= MAX_EF_SEARCH:
+                break
+
+            candidates = min(candidates * config.expansion_factor, config.max_candidates)
+            probes *= config.expansion_factor
+            ef_search = min(max(ef_search * config.expansion_factor, candidates), MAX_EF_SEARCH)
+
+    ANN_SEARCH_ROUNDS.labels(table=table).observe(rounds)
+    return results[:limit]
+
+
+def hnsw_index_sql(
+    index_name: str,
+    table: str,
+    column: str,
+    *,
+    where: str | None = None,
+    m: int = 16,
+    ef_construction: int = 64,
+    concurrently: bool = False,
+) -> str:
+    """Build a CREATE INDEX statement for a cosine HNSW index.
+
+    Args:
+        index_name: Index name
+        table: Indexed table
+        column: pgvector column
+        where: Optional partial-index predicate
+        m: Max connections per graph layer
+        ef_construction: Candidate list size while building
+        concurrently: Build without blocking writes (not inside a transaction)
+
+    Returns:
+        SQL statement
+    """
+    sql = (
+        f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS {index_name} "
+        f"ON {table} USING hnsw ({column} vector_cosine_ops) "
+        f"WITH (m = {int(m)}, ef_construction = {int(ef_construction)})"
+    )
+    if where:
+        sql += f" WHERE {where}"
+    return sql
+
+
+def tenant_index_sql(
+    table: str,
+    column: str,
+    tenant_column: str,
+    tenant_id: str,
+    *,
+    where: str | None = None,
+) -> str:
+    """Build a per-tenant partial HNSW index, built concurrently.
+
+    A dedicated index keeps a large tenant's search inside its own graph
+    instead of filtering a shared one.
+
+    Args:
+        table: Indexed table
+        column: pgvector column
+        tenant_column: Column holding the tenant key
+        tenant_id: Tenant key value
+        where: Extra predicate, matching the search query's static filters
+
+    Returns:
+        SQL statement
+    """
+    literal = str(tenant_id).replace("'", "''")
+    predicate = f"{tenant_column} = '{literal}' AND {column} IS NOT NULL"
+    if where:
+        predicate += f" AND {where}"
+    suffix = "".join(c for c in str(tenant_id) if c.isalnum())[:24]
+    return hnsw_index_sql(
+        f"idx_{table}_{column}_t_{suffix}",
+        table,
+        column,
+        where=predicate,
+        concurrently=True,
+    )
+
+
+def _count_params(filters: Sequence[str]) -> int:
+    """Number of filter parameters ($2..$n) used in filters."""
+    numbers = [int(n) for predicate in filters for n in _PARAM.findall(predicate)]
+    return max(numbers, default=1) - 1
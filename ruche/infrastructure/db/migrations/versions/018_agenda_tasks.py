@@ -0,0 +1,91 @@
+"""Create agenda_tasks table for durable task scheduling.
+
+Revision ID: 018
+Revises: 016
+Create Date: 2026-10-18
+
+Tables: agenda_tasks
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+from alembic import op
+
+revision = "018"
+down_revision = "016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create agenda_tasks table.
+
+    due_at is max(scheduled_for, execute_after), precomputed so the claim
+    query can use a single partial index. locked_until holds the claim
+    lease of RUNNING tasks.
+    """
+    op.create_table(
+        "agenda_tasks",
+        sa.Column("id", UUID, primary_key=True),
+        sa.Column("tenant_id", UUID, nullable=False),
+        sa.Column("agent_id", UUID, nullable=False),
+        sa.Column("task_type", sa.String(50), nullable=False),
+        sa.Column("priority", sa.String(20), nullable=False, server_default="'normal'"),
+        sa.Column("interlocutor_id", UUID),
+        sa.Column("session_id", UUID),
+
+        # Scheduling
+        sa.Column("scheduled_for", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("execute_after", sa.TIMESTAMP(timezone=True)),
+        sa.Column("expires_at", sa.TIMESTAMP(timezone=True)),
+        sa.Column("due_at", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("locked_until", sa.TIMESTAMP(timezone=True)),
+
+        sa.Column("payload", JSONB, server_default="{}"),
+        sa.Column("status", sa.String(20), nullable=False, server_default="'scheduled'"),
+
+        # Execution tracking
+        sa.Column("attempts", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer, nullable=False, server_default="3"),
+        sa.Column("last_error", sa.Text),
+        sa.Column("metadata", JSONB, server_default="{}"),
+
+        # Timestamps
+        sa.Column("created_at", sa.TIMESTAMP(timezone=True), server_default=sa.text("NOW()"), nullable=False),
+        sa.Column("started_at", sa.TIMESTAMP(timezone=True)),
+        sa.Column("completed_at", sa.TIMESTAMP(timezone=True)),
+
+        sa.CheckConstraint(
+            "status IN ('scheduled', 'running', 'completed', 'failed', 'cancelled')",
+            name="chk_agenda_tasks_status",
+        ),
+    )
+
+    # Claim query: only scheduled tasks, ordered by due time
+    op.create_index(
+        "idx_agenda_tasks_due",
+        "agenda_tasks",
+        ["status", "due_at"],
+        postgresql_where=sa.text("status = 'scheduled'"),
+    )
+
+    # Lease recovery: running tasks whose claim expired
+    op.create_index(
+        "idx_agenda_tasks_lease",
+        "agenda_tasks",
+        ["locked_until"],
+        postgresql_where=sa.text("status = 'running'"),
+    )
+
+    op.create_index(
+        "idx_agenda_tasks_interlocutor",
+        "agenda_tasks",
+        ["tenant_id", "interlocutor_id"],
+        postgresql_where=sa.text("interlocutor_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop agenda_tasks table."""
+    op.drop_table("agenda_tasks")
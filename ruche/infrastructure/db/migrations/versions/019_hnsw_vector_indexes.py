@@ -0,0 +1,102 @@
+"""Replace IVFFlat vector indexes with HNSW and add episodes.tenant_key.
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-18
+
+IVFFlat lists are trained on the data present at build time (migration
+007 runs on near-empty tables), and a filtered search probes lists that
+mostly belong to other tenants. HNSW needs no training and, with the
+store queries ordering by raw distance, is used for filtered searches.
+
+episodes.tenant_key is the tenant part of group_id ("tenant_id:session_id")
+so large tenants can get their own partial index
+(PostgresMemoryStore.create_tenant_vector_index).
+"""
+
+from alembic import op
+
+revision = "019"
+down_revision = "018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Swap vector indexes to HNSW and add the tenant key column."""
+    op.execute("DROP INDEX IF EXISTS idx_rules_embedding")
+    op.execute(
+        """
+        CREATE INDEX idx_rules_embedding ON rules
+        USING hnsw (condition_embedding vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64)
+        WHERE condition_embedding IS NOT NULL AND deleted_at IS NULL
+        """
+    )
+
+    op.execute("DROP INDEX IF EXISTS idx_scenarios_entry_embedding")
+    op.execute(
+        """
+        CREATE INDEX idx_scenarios_entry_embedding ON scenarios
+        USING hnsw (entry_embedding vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64)
+        WHERE entry_embedding IS NOT NULL AND deleted_at IS NULL
+        """
+    )
+
+    op.execute(
+        """
+        ALTER TABLE episodes ADD COLUMN tenant_key VARCHAR(200)
+        GENERATED ALWAYS AS (split_part(group_id, ':', 1)) STORED
+        """
+    )
+    op.create_index("idx_episodes_tenant_key", "episodes", ["tenant_key"])
+
+    op.execute("DROP INDEX IF EXISTS idx_episodes_embedding")
+    op.execute(
+        """
+        CREATE INDEX idx_episodes_embedding ON episodes
+        USING hnsw (embedding vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64)
+        WHERE embedding IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    """Restore IVFFlat indexes and drop the tenant key column.
+
+    Per-tenant indexes built at runtime depend on tenant_key and are
+    dropped with it.
+    """
+    op.execute("DROP INDEX IF EXISTS idx_episodes_embedding")
+    op.drop_index("idx_episodes_tenant_key", table_name="episodes")
+    op.execute("ALTER TABLE episodes DROP COLUMN IF EXISTS tenant_key")
+    op.execute(
+        """
+        CREATE INDEX idx_episodes_embedding ON episodes
+        USING ivfflat (embedding vector_cosine_ops)
+        WITH (lists = 100)
+        WHERE embedding IS NOT NULL
+        """
+    )
+
+    op.execute("DROP INDEX IF EXISTS idx_scenarios_entry_embedding")
+    op.execute(
+        """
+        CREATE INDEX idx_scenarios_entry_embedding ON scenarios
+        USING ivfflat (entry_embedding vector_cosine_ops)
+        WITH (lists = 50)
+        WHERE entry_embedding IS NOT NULL AND deleted_at IS NULL
+        """
+    )
+
+    op.execute("DROP INDEX IF EXISTS idx_rules_embedding")
+    op.execute(
+        """
+        CREATE INDEX idx_rules_embedding ON rules
+        USING ivfflat (condition_embedding vector_cosine_ops)
+        WITH (lists = 100)
+        WHERE condition_embedding IS NOT NULL AND deleted_at IS NULL
+        """
+    )
@@ -0,0 +1,50 @@
+"""Add full-text and trigram search for episodes.
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-18
+
+PostgresMemoryStore.text_search_episodes previously ran content ILIKE '%q%', a scan
+of the whole group. content_tsv is a generated tsvector built with the
+episode's own text search configuration (set by the store from the
+episode language) and served by a GIN index. The pg_trgm index backs the
+optional fuzzy fallback.
+"""
+
+from alembic import op
+
+revision = "020"
+down_revision = "019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add text search columns and indexes to episodes."""
+    # Existing rows get the default language's configuration
+    op.execute(
+        """
+        ALTER TABLE episodes
+        ADD COLUMN text_search_config regconfig NOT NULL DEFAULT 'english'
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE episodes ADD COLUMN content_tsv tsvector
+        GENERATED ALWAYS AS (to_tsvector(text_search_config, content)) STORED
+        """
+    )
+    op.execute("CREATE INDEX idx_episodes_content_tsv ON episodes USING gin (content_tsv)")
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX idx_episodes_content_trgm ON episodes USING gin (content gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Drop text search columns and indexes."""
+    op.execute("DROP INDEX IF EXISTS idx_episodes_content_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_episodes_content_tsv")
+    op.execute("ALTER TABLE episodes DROP COLUMN IF EXISTS content_tsv")
+    op.execute("ALTER TABLE episodes DROP COLUMN IF EXISTS text_search_config")
@@ -0,0 +1,61 @@
+"""Create memory_group_counters for O(1) summarization triggers.
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-18
+
+Tables: memory_group_counters
+
+The summarizer used to load every episode of a group on each ingestion
+to count turns and summaries. PostgresMemoryStore now keeps these counts
+in one row per group, updated in the same transaction as the episode
+insert.
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "021"
+down_revision = "020"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create memory_group_counters and backfill it from episodes."""
+    op.create_table(
+        "memory_group_counters",
+        sa.Column("group_id", sa.String(200), primary_key=True),
+        sa.Column("total_turns", sa.BigInteger, nullable=False, server_default="0"),
+        sa.Column("unsummarized_turns", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("summaries_since_meta", sa.Integer, nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("NOW()"),
+            nullable=False,
+        ),
+    )
+
+    # The previous trigger summarized every turns_per_summary (default 20)
+    # turns and meta-summarized every summaries_per_meta (default 5)
+    # summaries, so the remainders are what is still pending.
+    op.execute(
+        """
+        INSERT INTO memory_group_counters (
+            group_id, total_turns, unsummarized_turns, summaries_since_meta
+        )
+        SELECT group_id,
+               COUNT(*) FILTER (WHERE content_type IN ('message', 'event')),
+               COUNT(*) FILTER (WHERE content_type IN ('message', 'event')) % 20,
+               COUNT(*) FILTER (WHERE content_type = 'summary') % 5
+        FROM episodes
+        GROUP BY group_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop memory_group_counters."""
+    op.drop_table("memory_group_counters")
@@ -0,0 +1,237 @@
+"""Range-partition turn_records and audit_events by month.
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-18
+
+The audit tables only grow, and retention by DELETE leaves bloat behind.
+Both become partitioned by month on created_at so old months are dropped
+with PostgresAuditStore.drop_partitions_before(). create_monthly_partition()
+is called at startup and by the audit batch writer to keep months ahead
+available; the DEFAULT partition catches anything outside them.
+
+Primary keys become (id, created_at), since a partitioned table's unique
+constraints must include the partition key. audit_events.turn_id no longer
+references turn_records: foreign keys to a partitioned table need the full
+key, and the batch writer does not order turn and event writes.
+"""
+
+from alembic import op
+
+revision = "022"
+down_revision = "021"
+branch_labels = None
+depends_on = None
+
+_TABLES = ("turn_records", "audit_events")
+
+# Columns copied between the old and new tables (created_at handled apart)
+_COLUMNS = {
+    "turn_records": (
+        "id, tenant_id, session_id, turn_number, user_message, assistant_response, "
+        "context_extracted, rules_matched, scenario_state, tools_executed, "
+        "token_usage, latency_ms"
+    ),
+    "audit_events": "id, tenant_id, session_id, turn_id, event_type, event_data",
+}
+
+_INDEXES = (
+    "idx_turn_records_session",
+    "idx_turn_records_tenant",
+    "idx_turn_records_created",
+    "idx_audit_events_tenant",
+    "idx_audit_events_session",
+    "idx_audit_events_type",
+    "idx_audit_events_created",
+)
+
+
+def upgrade() -> None:
+    """Rebuild the audit tables as monthly partitioned tables."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION create_monthly_partition(
+            parent regclass, month_start timestamptz
+        ) RETURNS text AS $$
+        DECLARE
+            lower_bound timestamptz := date_trunc('month', month_start AT TIME ZONE 'UTC')
+                AT TIME ZONE 'UTC';
+            upper_bound timestamptz := lower_bound + interval '1 month';
+            partition_name text := parent::text || '_'
+                || to_char(lower_bound AT TIME ZONE 'UTC', 'YYYYMM');
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF %s FOR VALUES FROM (%L) TO (%L)',
+                partition_name, parent, lower_bound, upper_bound
+            );
+            RETURN partition_name;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+    op.execute("ALTER TABLE audit_events DROP CONSTRAINT IF EXISTS audit_events_turn_id_fkey")
+    for table in _TABLES:
+        op.execute(f"DROP POLICY IF EXISTS tenant_isolation ON {table}")
+        op.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+    for index in _INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+
+    op.execute(
+        """
+        CREATE TABLE turn_records (
+            id UUID NOT NULL,
+            tenant_id UUID NOT NULL,
+            session_id UUID NOT NULL,
+            turn_number INTEGER NOT NULL,
+            user_message TEXT NOT NULL,
+            assistant_response TEXT,
+            context_extracted JSONB,
+            rules_matched JSONB DEFAULT '[]',
+            scenario_state JSONB,
+            tools_executed JSONB DEFAULT '[]',
+            token_usage JSONB,
+            latency_ms INTEGER,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute(
+        """
+        CREATE TABLE audit_events (
+            id UUID NOT NULL,
+            tenant_id UUID NOT NULL,
+            session_id UUID,
+            turn_id UUID,
+            event_type VARCHAR(50) NOT NULL,
+            event_data JSONB NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+
+    for table in _TABLES:
+        # Months covering existing rows, through two months ahead
+        op.execute(
+            f"""
+            SELECT create_monthly_partition('{table}'::regclass, month_start)
+            FROM generate_series(
+                date_trunc('month', COALESCE(
+                    (SELECT MIN(created_at) FROM {table}_legacy), NOW()
+                ) AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+                NOW() + interval '2 months',
+                interval '1 month'
+            ) AS month_start
+            """
+        )
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+        columns = _COLUMNS[table]
+        op.execute(
+            f"""
+            INSERT INTO {table} ({columns}, created_at)
+            SELECT {columns}, COALESCE(created_at, NOW()) FROM {table}_legacy
+            """
+        )
+
+    _create_indexes()
+    for table in _TABLES:
+        op.execute(f"DROP TABLE {table}_legacy")
+        _enable_rls(table)
+
+
+def downgrade() -> None:
+    """Restore unpartitioned audit tables, keeping their rows."""
+    for table in _TABLES:
+        op.execute(f"DROP POLICY IF EXISTS tenant_isolation ON {table}")
+        op.execute(f"ALTER TABLE {table} RENAME TO {table}_partitioned")
+    for index in _INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+
+    op.execute(
+        """
+        CREATE TABLE turn_records (
+            id UUID PRIMARY KEY,
+            tenant_id UUID NOT NULL,
+            session_id UUID NOT NULL,
+            turn_number INTEGER NOT NULL,
+            user_message TEXT NOT NULL,
+            assistant_response TEXT,
+            context_extracted JSONB,
+            rules_matched JSONB DEFAULT '[]',
+            scenario_state JSONB,
+            tools_executed JSONB DEFAULT '[]',
+            token_usage JSONB,
+            latency_ms INTEGER,
+            created_at TIMESTAMPTZ DEFAULT NOW()
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TABLE audit_events (
+            id UUID PRIMARY KEY,
+            tenant_id UUID NOT NULL,
+            session_id UUID,
+            turn_id UUID,
+            event_type VARCHAR(50) NOT NULL,
+            event_data JSONB NOT NULL,
+            created_at TIMESTAMPTZ DEFAULT NOW()
+        )
+        """
+    )
+    for table in _TABLES:
+        columns = _COLUMNS[table]
+        op.execute(
+            f"""
+            INSERT INTO {table} ({columns}, created_at)
+            SELECT DISTINCT ON (id) {columns}, created_at FROM {table}_partitioned
+            ORDER BY id, created_at
+            """
+        )
+        op.execute(f"DROP TABLE {table}_partitioned CASCADE")
+    # Events whose turn was never recorded cannot satisfy the old foreign key
+    op.execute(
+        """
+        UPDATE audit_events SET turn_id = NULL
+        WHERE turn_id IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM turn_records WHERE turn_records.id = audit_events.turn_id)
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE audit_events ADD CONSTRAINT audit_events_turn_id_fkey
+        FOREIGN KEY (turn_id) REFERENCES turn_records (id)
+        """
+    )
+
+    _create_indexes()
+    for table in _TABLES:
+        _enable_rls(table)
+    op.execute("DROP FUNCTION IF EXISTS create_monthly_partition(regclass, timestamptz)")
+
+
+def _create_indexes() -> None:
+    """Create the audit indexes from migration 004."""
+    op.execute("CREATE INDEX idx_turn_records_session ON turn_records (session_id)")
+    op.execute("CREATE INDEX idx_turn_records_tenant ON turn_records (tenant_id)")
+    op.execute("CREATE INDEX idx_turn_records_created ON turn_records (tenant_id, created_at DESC)")
+    op.execute("CREATE INDEX idx_audit_events_tenant ON audit_events (tenant_id)")
+    op.execute(
+        "CREATE INDEX idx_audit_events_session ON audit_events (session_id) "
+        "WHERE session_id IS NOT NULL"
+    )
+    op.execute("CREATE INDEX idx_audit_events_type ON audit_events (tenant_id, event_type)")
+    op.execute("CREATE INDEX idx_audit_events_created ON audit_events (tenant_id, created_at DESC)")
+
+
+def _enable_rls(table: str) -> None:
+    """Re-create the tenant_isolation policy from migration 016."""
+    op.execute(f"ALTER TABLE {table} ENABLE ROW LEVEL SECURITY")
+    op.execute(
+        f"""
+        CREATE POLICY tenant_isolation ON {table}
+        USING (tenant_id = current_setting('app.current_tenant')::uuid)
+        """
+    )
@@ -0,0 +1,54 @@
+"""Add session delta bookkeeping and the step visit archive.
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-18
+
+Session saves now update only what changed (appending to step_history and
+merging the JSONB maps). sessions.delta_count counts those updates since
+the last full rewrite, which resets it and moves step visits beyond the
+configured cap to session_step_archive.
+"""
+
+from alembic import op
+
+revision = "023"
+down_revision = "022"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add delta_count and create session_step_archive."""
+    op.execute("ALTER TABLE sessions ADD COLUMN delta_count INTEGER NOT NULL DEFAULT 0")
+
+    op.execute(
+        """
+        CREATE TABLE session_step_archive (
+            id BIGSERIAL PRIMARY KEY,
+            session_id UUID NOT NULL,
+            tenant_id UUID NOT NULL,
+            visits JSONB NOT NULL,
+            archived_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        )
+        """
+    )
+    op.create_index(
+        "idx_session_step_archive_session",
+        "session_step_archive",
+        ["session_id", "archived_at"],
+    )
+
+    op.execute("ALTER TABLE session_step_archive ENABLE ROW LEVEL SECURITY")
+    op.execute(
+        """
+        CREATE POLICY tenant_isolation ON session_step_archive
+            USING (tenant_id = current_setting('app.current_tenant')::uuid)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop session_step_archive and delta_count."""
+    op.execute("DROP TABLE IF EXISTS session_step_archive")
+    op.execute("ALTER TABLE sessions DROP COLUMN IF EXISTS delta_count")
@@ -0,0 +1,44 @@
+"""Create the embedding job queue.
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-10-18
+
+Admin API writes of rules, scenarios and intents enqueue one row per
+entity; re-enqueueing an entity replaces its row. The embedding worker
+claims the rows of one agent at a time with a lease (locked_until).
+Like agenda_tasks, the table is a cross-tenant queue and has no RLS.
+"""
+
+from alembic import op
+
+revision = "024"
+down_revision = "023"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create embedding_jobs."""
+    op.execute(
+        """
+        CREATE TABLE embedding_jobs (
+            tenant_id UUID NOT NULL,
+            agent_id UUID NOT NULL,
+            entity_type VARCHAR(20) NOT NULL,
+            entity_id UUID NOT NULL,
+            enqueued_at TIMESTAMPTZ NOT NULL,
+            ready_at TIMESTAMPTZ NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            locked_until TIMESTAMPTZ,
+            PRIMARY KEY (tenant_id, entity_type, entity_id)
+        )
+        """
+    )
+    op.create_index("idx_embedding_jobs_ready", "embedding_jobs", ["ready_at"])
+    op.create_index("idx_embedding_jobs_agent", "embedding_jobs", ["tenant_id", "agent_id"])
+
+
+def downgrade() -> None:
+    """Drop embedding_jobs."""
+    op.execute("DROP TABLE IF EXISTS embedding_jobs")
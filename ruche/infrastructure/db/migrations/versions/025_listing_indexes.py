@@ -0,0 +1,49 @@
+"""Add keyset indexes for admin listings of rules, scenarios and templates.
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-10-18
+
+Admin list endpoints page with ORDER BY <sort>, id and resume after the
+last (sort, id) pair of the previous page. One index per sortable column,
+scoped to (tenant_id, agent_id) and live rows, turns each page into a
+bounded index range scan in either direction.
+"""
+
+from alembic import op
+
+revision = "025"
+down_revision = "024"
+branch_labels = None
+depends_on = None
+
+_SORTS = {
+    "rules": {
+        "name": "lower(name)",
+        "priority": "priority",
+        "created": "created_at",
+        "updated": "updated_at",
+    },
+    "scenarios": {"name": "lower(name)", "created": "created_at", "updated": "updated_at"},
+    "templates": {"name": "lower(name)", "created": "created_at", "updated": "updated_at"},
+}
+
+
+def upgrade() -> None:
+    """Create the listing indexes."""
+    for table, sorts in _SORTS.items():
+        for suffix, expr in sorts.items():
+            op.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS idx_{table}_list_{suffix}
+                ON {table} (tenant_id, agent_id, {expr}, id)
+                WHERE deleted_at IS NULL
+                """
+            )
+
+
+def downgrade() -> None:
+    """Drop the listing indexes."""
+    for table, sorts in _SORTS.items():
+        for suffix in sorts:
+            op.execute(f"DROP INDEX IF EXISTS idx_{table}_list_{suffix}")
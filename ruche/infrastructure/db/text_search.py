@@ -0,0 +1,48 @@
+"""Postgres full-text search configuration helpers.
+
+Episodes store a ``tsvector`` built with the text search configuration of
+their language (stemming, stop words). Queries must use the same
+configuration to match, so both sides go through regconfig_for_language().
+"""
+
+# ISO 639-1 code -> built-in Postgres text search configuration
+LANGUAGE_REGCONFIGS: dict[str, str] = {
+    "ar": "arabic",
+    "da": "danish",
+    "de": "german",
+    "el": "greek",
+    "en": "english",
+    "es": "spanish",
+    "fi": "finnish",
+    "fr": "french",
+    "hu": "hungarian",
+    "id": "indonesian",
+    "it": "italian",
+    "lt": "lithuanian",
+    "nl": "dutch",
+    "no": "norwegian",
+    "pt": "portuguese",
+    "ro": "romanian",
+    "ru": "russian",
+    "sv": "swedish",
+    "tr": "turkish",
+}
+
+# No stemming or stop words; matches exact lexemes in any language
+FALLBACK_REGCONFIG = "simple"
+
+
+def regconfig_for_language(language: str | None, default: str | None = None) -> str:
+    """Map a language code to a Postgres text search configuration.
+
+    Args:
+        language: ISO 639-1 code (region suffixes like "en-US" are ignored)
+        default: Language code used when language is None
+
+    Returns:
+        Configuration name, "simple" for unsupported languages
+    """
+    code = language or default
+    if not code:
+        return FALLBACK_REGCONFIG
+    return LANGUAGE_REGCONFIGS.get(code.split("-")[0].lower(), FALLBACK_REGCONFIG)
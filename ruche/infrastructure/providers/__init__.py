@@ -6,22 +6,22 @@ This module consolidates all AI provider implementations:
 - Rerank: Re-ordering search results by relevance (Jina, Cohere, CrossEncoder)
 """
 
-from ruche.infrastructure.providers.embedding.base import EmbeddingProvider
-from ruche.infrastructure.providers.embedding.jina import JinaEmbeddingProvider
-from ruche.infrastructure.providers.embedding.mock import MockEmbeddingProvider
+from typing import TYPE_CHECKING
 
-# Optional: SentenceTransformer requires sentence_transformers package
-try:
+from ruche.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ruche.infrastructure.providers.embedding.base import EmbeddingProvider
+    from ruche.infrastructure.providers.embedding.jina import JinaEmbeddingProvider
+    from ruche.infrastructure.providers.embedding.mock import MockEmbeddingProvider
     from ruche.infrastructure.providers.embedding.sentence_transformers import (
-        SentenceTransformerEmbeddingProvider,
+        SentenceTransformersProvider as SentenceTransformerEmbeddingProvider,
     )
-except ImportError:
-    SentenceTransformerEmbeddingProvider = None  # type: ignore
-from ruche.infrastructure.providers.llm.executor import LLMExecutor
-from ruche.infrastructure.providers.llm.mock import MockLLMProvider
-from ruche.infrastructure.providers.rerank.base import RerankProvider
-from ruche.infrastructure.providers.rerank.jina import JinaRerankProvider
-from ruche.infrastructure.providers.rerank.mock import MockRerankProvider
+    from ruche.infrastructure.providers.llm.executor import LLMExecutor
+    from ruche.infrastructure.providers.llm.mock import MockLLMProvider
+    from ruche.infrastructure.providers.rerank.base import RerankProvider
+    from ruche.infrastructure.providers.rerank.jina import JinaRerankProvider
+    from ruche.infrastructure.providers.rerank.mock import MockRerankProvider
 
 __all__ = [
     # LLM
@@ -37,3 +37,23 @@ __all__ = [
     "JinaRerankProvider",
     "MockRerankProvider",
 ]
+
+# Resolved on first access (PEP 562) so importing this package stays cheap
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "EmbeddingProvider": "ruche.infrastructure.providers.embedding.base",
+        "JinaEmbeddingProvider": "ruche.infrastructure.providers.embedding.jina",
+        "MockEmbeddingProvider": "ruche.infrastructure.providers.embedding.mock",
+        "SentenceTransformerEmbeddingProvider": (
+            "ruche.infrastructure.providers.embedding.sentence_transformers"
+            ":SentenceTransformersProvider"
+        ),
+        "LLMExecutor": "ruche.infrastructure.providers.llm.executor",
+        "MockLLMProvider": "ruche.infrastructure.providers.llm.mock",
+        "RerankProvider": "ruche.infrastructure.providers.rerank.base",
+        "JinaRerankProvider": "ruche.infrastructure.providers.rerank.jina",
+        "MockRerankProvider": "ruche.infrastructure.providers.rerank.mock",
+    },
+    optional=["SentenceTransformerEmbeddingProvider"],
+)
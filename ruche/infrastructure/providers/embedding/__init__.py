@@ -1,10 +1,15 @@
 """Embedding providers for text vectorization."""
 
-from ruche.infrastructure.providers.embedding.base import EmbeddingProvider, EmbeddingResponse
-from ruche.infrastructure.providers.embedding.cohere import CohereEmbeddingProvider
-from ruche.infrastructure.providers.embedding.jina import JinaEmbeddingProvider
-from ruche.infrastructure.providers.embedding.mock import MockEmbeddingProvider
-from ruche.infrastructure.providers.embedding.openai import OpenAIEmbeddingProvider
+from typing import TYPE_CHECKING
+
+from ruche.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ruche.infrastructure.providers.embedding.base import EmbeddingProvider, EmbeddingResponse
+    from ruche.infrastructure.providers.embedding.cohere import CohereEmbeddingProvider
+    from ruche.infrastructure.providers.embedding.jina import JinaEmbeddingProvider
+    from ruche.infrastructure.providers.embedding.mock import MockEmbeddingProvider
+    from ruche.infrastructure.providers.embedding.openai import OpenAIEmbeddingProvider
 
 __all__ = [
     "CohereEmbeddingProvider",
@@ -14,3 +19,16 @@ __all__ = [
     "MockEmbeddingProvider",
     "OpenAIEmbeddingProvider",
 ]
+
+# Resolved on first access (PEP 562) so importing this package stays cheap
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "EmbeddingProvider": "ruche.infrastructure.providers.embedding.base",
+        "EmbeddingResponse": "ruche.infrastructure.providers.embedding.base",
+        "CohereEmbeddingProvider": "ruche.infrastructure.providers.embedding.cohere",
+        "JinaEmbeddingProvider": "ruche.infrastructure.providers.embedding.jina",
+        "MockEmbeddingProvider": "ruche.infrastructure.providers.embedding.mock",
+        "OpenAIEmbeddingProvider": "ruche.infrastructure.providers.embedding.openai",
+    },
+)
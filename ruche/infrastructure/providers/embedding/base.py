@@ -80,3 +80,11 @@ class EmbeddingProvider(ABC):
         """
         response = await self.embed([text], model=model, **kwargs)
         return response.embeddings[0]
+
+    async def warm_up(self) -> None:
+        """Load models or open clients ahead of the first request.
+
+        No-op by default; providers with expensive lazy initialization
+        (e.g. local models) override this.
+        """
+        return None
@@ -28,6 +28,14 @@ class SentenceTransformersProvider(EmbeddingProvider):
             self._model = SentenceTransformer(self._model_name)
         return self._model
 
+    async def warm_up(self) -> None:
+        """Load the model and run one encode so first requests don't pay for it."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None,
+            lambda: self._ensure_model_loaded().encode(["warm up"], show_progress_bar=False),
+        )
+
     @property
     def provider_name(self) -> str:
         """Return the provider name."""
@@ -26,6 +26,9 @@ from ruche.infrastructure.providers.llm.base import (
     TokenUsage,
 )
 
+# Response cache
+from ruche.infrastructure.providers.llm.cache import LLMResponseCache
+
 # Executor (primary interface)
 from ruche.infrastructure.providers.llm.executor import (
     ExecutionContext,
@@ -61,6 +64,8 @@ __all__ = [
     "create_executor",
     "create_executor_from_step_config",
     "create_executors_from_pipeline_config",
+    # Response cache
+    "LLMResponseCache",
     # Testing
     "MockLLMProvider",
 ]
@@ -17,6 +17,10 @@ class LLMMessage(BaseModel):
 
     role: str = Field(..., description="Role: system, user, or assistant")
     content: str = Field(..., description="Message content")
+    cache_breakpoint: bool = Field(
+        default=False,
+        description="Prompt prefix ending with this message is cacheable (provider prompt caching)",
+    )
 
 
 class TokenUsage(BaseModel):
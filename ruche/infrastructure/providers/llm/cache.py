@@ -0,0 +1,214 @@
+"""Exact-match response cache for deterministic LLM calls.
+
+Pipeline steps like the situation sensor and rule filter call the LLM at
+temperature 0 with prompts rendered from templates. Short repetitive
+messages ("yes", "thanks", greetings) render identical prompts, so their
+responses can be reused.
+
+Two tiers:
+- L1: in-process LRU with TTL (per worker)
+- L2: optional Redis, shared across workers, TTL-bounded and size-bounded
+
+Keys hash (model, step, prompt, generation params, agent config version).
+Values are JSON, zlib-compressed above a size threshold. Redis values are
+stored as text ("j:" raw JSON or "z:" base64 of compressed JSON) so the
+cache works with clients created with decode_responses=True.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import time
+import zlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from ruche.infrastructure.providers.llm.base import LLMMessage, LLMResponse
+from ruche.observability.logging import get_logger
+from ruche.observability.metrics import LLM_RESPONSE_CACHE
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+    from ruche.config.models.pipeline import LLMResponseCacheConfig
+
+logger = get_logger(__name__)
+
+_RAW_PREFIX = "j:"
+_COMPRESSED_PREFIX = "z:"
+
+
+class LLMResponseCache:
+    """Two-tier (in-process + Redis) exact-match LLM response cache.
+
+    Cache failures never fail a call: Redis errors are logged and treated
+    as misses.
+    """
+
+    def __init__(
+        self,
+        config: LLMResponseCacheConfig,
+        redis: Redis | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            config: Cache configuration
+            redis: Optional Redis client for the shared L2 tier
+        """
+        self._config = config
+        self._redis = redis if config.l2_enabled else None
+        self._steps = frozenset(config.steps)
+        self._l1: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    def is_cacheable(self, step: str | None, temperature: float) -> bool:
+        """Whether a call from this step with this temperature may be cached."""
+        return (
+            self._config.enabled
+            and step is not None
+            and step in self._steps
+            and temperature <= self._config.max_temperature
+        )
+
+    @staticmethod
+    def make_key(
+        *,
+        model: str,
+        step: str,
+        messages: list[LLMMessage],
+        max_tokens: int,
+        temperature: float,
+        config_version: int | str | None,
+    ) -> str:
+        """Build the cache key for a call.
+
+        The prompt and generation parameters are hashed; model, step and
+        config version stay readable so keys can be inspected or purged.
+        """
+        digest = hashlib.sha256()
+        for message in messages:
+            digest.update(message.role.encode())
+            digest.update(b"\x00")
+            digest.update(message.content.encode())
+            digest.update(b"\x01")
+        digest.update(f"{max_tokens}:{temperature}".encode())
+        version = config_version if config_version is not None else "-"
+        return f"{model}:{step}:v{version}:{digest.hexdigest()}"
+
+    async def get(self, step: str, key: str) -> LLMResponse | None:
+        """Look up a cached response, promoting L2 hits into L1.
+
+        Args:
+            step: Pipeline step (metrics label)
+            key: Key from make_key
+
+        Returns:
+            Cached LLMResponse or None
+        """
+        payload = self._l1_get(key)
+        if payload is not None:
+            LLM_RESPONSE_CACHE.labels(step=step, result="l1_hit").inc()
+            return self._decode(payload)
+
+        if self._redis is not None:
+            try:
+                stored = await self._redis.get(self._redis_key(key))
+            except Exception as e:
+                logger.warning("llm_cache_read_failed", step=step, error=str(e))
+                stored = None
+
+            if stored is not None:
+                try:
+                    payload = self._unpack(stored)
+                    response = self._decode(payload)
+                except Exception as e:
+                    logger.warning("llm_cache_corrupted_value", step=step, error=str(e))
+                else:
+                    self._l1_set(key, payload)
+                    LLM_RESPONSE_CACHE.labels(step=step, result="l2_hit").inc()
+                    return response
+
+        LLM_RESPONSE_CACHE.labels(step=step, result="miss").inc()
+        return None
+
+    async def set(self, step: str, key: str, response: LLMResponse) -> None:
+        """Store a response in both tiers.
+
+        Args:
+            step: Pipeline step (for logging)
+            key: Key from make_key
+            response: Response to cache
+        """
+        payload = response.model_dump_json(
+            include={"content", "model", "finish_reason", "usage"}
+        )
+        self._l1_set(key, payload)
+
+        if self._redis is None:
+            return
+
+        packed = self._pack(payload)
+        if len(packed) > self._config.l2_max_value_bytes:
+            logger.debug("llm_cache_value_too_large", step=step, size=len(packed))
+            return
+
+        try:
+            await self._redis.set(
+                self._redis_key(key), packed, ex=self._config.ttl_seconds
+            )
+        except Exception as e:
+            logger.warning("llm_cache_write_failed", step=step, error=str(e))
+
+    def clear(self) -> None:
+        """Drop all L1 entries (L2 entries expire via TTL)."""
+        self._l1.clear()
+
+    # ========================================================================
+    # Internal
+    # ========================================================================
+
+    def _l1_get(self, key: str) -> str | None:
+        entry = self._l1.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at < time.monotonic():
+            del self._l1[key]
+            return None
+        self._l1.move_to_end(key)
+        return payload
+
+    def _l1_set(self, key: str, payload: str) -> None:
+        if self._config.l1_max_entries == 0:
+            return
+        self._l1[key] = (time.monotonic() + self._config.ttl_seconds, payload)
+        self._l1.move_to_end(key)
+        while len(self._l1) > self._config.l1_max_entries:
+            self._l1.popitem(last=False)
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self._config.key_prefix}:{key}"
+
+    def _pack(self, payload: str) -> str:
+        raw = payload.encode()
+        if len(raw) < self._config.compression_min_bytes:
+            return _RAW_PREFIX + payload
+        compressed = base64.b64encode(zlib.compress(raw)).decode("ascii")
+        return _COMPRESSED_PREFIX + compressed
+
+    @staticmethod
+    def _unpack(stored: str | bytes) -> str:
+        value = stored.decode() if isinstance(stored, bytes) else stored
+        if value.startswith(_COMPRESSED_PREFIX):
+            return zlib.decompress(base64.b64decode(value[2:])).decode()
+        if value.startswith(_RAW_PREFIX):
+            return value[2:]
+        raise ValueError("Unknown cache value format")
+
+    @staticmethod
+    def _decode(payload: str) -> LLMResponse:
+        response = LLMResponse.model_validate(json.loads(payload))
+        response.metadata["cache_hit"] = True
+        return response
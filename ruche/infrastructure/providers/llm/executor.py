@@ -20,6 +20,7 @@ Uses Agno model classes internally:
 
 from __future__ import annotations
 
+import copy
 import json
 import time
 from collections.abc import AsyncIterator
@@ -31,6 +32,7 @@ from uuid import UUID
 from pydantic import BaseModel
 
 from ruche.observability.logging import get_logger
+from ruche.observability.metrics import LLM_PROMPT_TOKENS
 from ruche.infrastructure.providers.llm.base import (
     LLMMessage,
     LLMResponse,
@@ -43,6 +45,7 @@ if TYPE_CHECKING:
     from agno.agent import Agent
 
     from ruche.config.models.pipeline import OpenRouterProviderConfig, PipelineConfig
+    from ruche.infrastructure.providers.llm.cache import LLMResponseCache
 
 logger = get_logger(__name__)
 
@@ -67,6 +70,7 @@ class ExecutionContext:
     session_id: UUID
     turn_id: UUID | None = None
     step: str | None = None  # "context_extraction", "rule_filtering", etc.
+    config_version: int | None = None  # Agent config version (response cache key)
 
     # Optional: for billing/analytics
     interlocutor_id: str | None = None
@@ -110,6 +114,7 @@ class LLMExecutor:
     - Fallback chain on failure (Agno doesn't have this natively)
     - Observability (latency_ms, request metadata)
     - Tenant context from ExecutionContext (no param threading)
+    - Optional exact-match response cache for deterministic calls
 
     Model string format:
         openrouter/anthropic/claude-3-haiku -> OpenRouter(id="anthropic/claude-3-haiku")
@@ -137,6 +142,7 @@ class LLMExecutor:
         timeout: float = 60.0,
         step_name: str | None = None,
         openrouter_config: OpenRouterProviderConfig | None = None,
+        response_cache: LLMResponseCache | None = None,
     ) -> None:
         """Initialize the executor.
 
@@ -147,6 +153,7 @@ class LLMExecutor:
             timeout: Request timeout in seconds
             step_name: Pipeline step name for logging
             openrouter_config: OpenRouter-specific provider routing config
+            response_cache: Cache for deterministic calls (None disables caching)
         """
         self._model = model
         self._fallback_models = fallback_models or []
@@ -154,9 +161,11 @@ class LLMExecutor:
         self._timeout = timeout
         self._step_name = step_name
         self._openrouter_config = openrouter_config
+        self._response_cache = response_cache
 
-        # Cache for Agno agents (one per model string)
-        self._agents: dict[str, Agent] = {}
+        # Cache for Agno models (one per model string); agents are built per
+        # call because each call carries its own system prompt
+        self._models: dict[str, Any] = {}
 
     @property
     def model(self) -> str:
@@ -181,6 +190,8 @@ class LLMExecutor:
 
         Uses primary model, falls back to fallback_models on failure.
         Automatically includes tenant/session context from ExecutionContext.
+        Deterministic calls are served from the response cache when one is
+        configured for this step.
 
         Args:
             messages: Conversation messages
@@ -197,6 +208,23 @@ class LLMExecutor:
 
         ctx = get_execution_context()
 
+        cache_key: str | None = None
+        cache = self._response_cache
+        if cache is not None and cache.is_cacheable(self._step_name, temperature):
+            assert self._step_name is not None
+            cache_key = cache.make_key(
+                model=self._model,
+                step=self._step_name,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                config_version=ctx.config_version if ctx else None,
+            )
+            cached = await cache.get(self._step_name, cache_key)
+            if cached is not None:
+                self._add_context_metadata(cached, ctx)
+                return cached
+
         for model in models_to_try:
             try:
                 response = await self._generate_with_model(
@@ -207,13 +235,11 @@ class LLMExecutor:
                     **kwargs,
                 )
 
-                # Add context metadata to response
-                if ctx:
-                    response.metadata["tenant_id"] = str(ctx.tenant_id)
-                    response.metadata["agent_id"] = str(ctx.agent_id)
-                    response.metadata["session_id"] = str(ctx.session_id)
-                    response.metadata["step"] = self._step_name or ctx.step
+                if cache_key is not None:
+                    assert cache is not None and self._step_name is not None
+                    await cache.set(self._step_name, cache_key, response)
 
+                self._add_context_metadata(response, ctx)
                 return response
 
             except RateLimitError as e:
@@ -252,6 +278,16 @@ class LLMExecutor:
             f"Tried: {models_to_try}. Last error: {last_error}"
         )
 
+    def _add_context_metadata(
+        self, response: LLMResponse, ctx: ExecutionContext | None
+    ) -> None:
+        """Add tenant/session context metadata to a response."""
+        if ctx:
+            response.metadata["tenant_id"] = str(ctx.tenant_id)
+            response.metadata["agent_id"] = str(ctx.agent_id)
+            response.metadata["session_id"] = str(ctx.session_id)
+            response.metadata["step"] = self._step_name or ctx.step
+
     async def generate_structured(
         self,
         prompt: str,
@@ -337,28 +373,14 @@ class LLMExecutor:
     # Internal: Agno-based execution
     # ========================================================================
 
-    def _get_or_create_agent(self, model: str) -> Agent | None:
-        """Get cached Agno agent or create new one for model."""
-        if model in self._agents:
-            return self._agents[model]
-
-        provider_type, _ = self._parse_model(model)
-        if provider_type == "mock":
-            return None
-
-        agno_model = self._create_agno_model(model)
-        if agno_model is None:
-            return None
-
-        from agno.agent import Agent
+    def _get_or_create_model(self, model: str) -> Any:
+        """Get cached Agno model or create new one for model string.
 
-        agent = Agent(
-            model=agno_model,
-            num_history_messages=0,  # We manage history ourselves
-            markdown=False,
-        )
-        self._agents[model] = agent
-        return agent
+        Returns None for mock models.
+        """
+        if model not in self._models:
+            self._models[model] = self._create_agno_model(model)
+        return self._models[model]
 
     def _create_agno_model(self, model: str) -> Any:
         """Create Agno model class from model string.
@@ -437,12 +459,83 @@ class LLMExecutor:
                 parts.append(f"Assistant: {msg.content}")
         return "\n\n".join(parts)
 
-    def _get_system_prompt(self, messages: list[LLMMessage]) -> str | None:
-        """Extract system prompt from messages."""
+    def _get_system_blocks(self, messages: list[LLMMessage]) -> list[tuple[str, bool]]:
+        """Group system messages into (text, cacheable) blocks.
+
+        Each block ends at a cache breakpoint; content after the last
+        breakpoint forms a trailing uncached block.
+        """
+        blocks: list[tuple[str, bool]] = []
+        pending: list[str] = []
         for msg in messages:
-            if msg.role == "system":
-                return msg.content
-        return None
+            if msg.role != "system":
+                continue
+            pending.append(msg.content)
+            if msg.cache_breakpoint:
+                blocks.append(("\n\n".join(pending), True))
+                pending = []
+        if pending:
+            blocks.append(("\n\n".join(pending), False))
+        return blocks
+
+    def _build_agent(
+        self,
+        model: str,
+        provider_type: str,
+        messages: list[LLMMessage],
+    ) -> Agent | None:
+        """Build an Agno agent for one call, with that call's system prompt.
+
+        Calls on one executor run concurrently, so the system prompt is never
+        set on a shared agent; only the Agno model (and its HTTP client) is
+        cached. Anthropic takes explicit cache_control blocks, set on a copy
+        of the model. Other providers (OpenAI, OpenRouter, Groq) cache the
+        longest repeated prefix automatically, so the ordered stable-first
+        text is enough.
+
+        Returns None for mock models.
+        """
+        agno_model = self._get_or_create_model(model)
+        if agno_model is None:
+            return None
+
+        blocks = self._get_system_blocks(messages)
+        instructions = ["\n\n".join(text for text, _ in blocks)] if blocks else None
+
+        if provider_type == "anthropic" and any(cacheable for _, cacheable in blocks):
+            from agno.models.anthropic.claude import SystemPromptBlock
+
+            agno_model = copy.copy(agno_model)
+            agno_model.system_prompt_blocks = [
+                SystemPromptBlock(text=text, cache=cacheable) for text, cacheable in blocks
+            ]
+            instructions = None
+
+        from agno.agent import Agent
+
+        return Agent(
+            model=agno_model,
+            instructions=instructions,
+            num_history_messages=0,  # We manage history ourselves
+            markdown=False,
+        )
+
+    def _record_prompt_tokens(self, run_response: Any, metadata: dict[str, Any]) -> None:
+        """Record provider-reported prompt cache usage in metadata and metrics."""
+        run_metrics = getattr(run_response, "metrics", None)
+        if run_metrics is None:
+            return
+
+        step = self._step_name or "unknown"
+        for kind, attr in (
+            ("input", "input_tokens"),
+            ("cache_read", "cache_read_tokens"),
+            ("cache_write", "cache_write_tokens"),
+        ):
+            value = getattr(run_metrics, attr, 0) or 0
+            if isinstance(value, int) and value > 0:
+                LLM_PROMPT_TOKENS.labels(step=step, kind=kind).inc(value)
+                metadata[f"{kind}_tokens"] = value
 
     async def _generate_with_model(
         self,
@@ -463,17 +556,13 @@ class LLMExecutor:
         if provider_type == "mock":
             return self._mock_response(model, messages)
 
-        agent = self._get_or_create_agent(model)
+        # Agent for this call, with its system prompt (cache breakpoints where supported)
+        agent = self._build_agent(model, provider_type, messages)
         if agent is None:
             return self._mock_response(model, messages)
 
         # Format input for Agno
         input_text = self._format_messages_for_agno(messages)
-        system_prompt = self._get_system_prompt(messages)
-
-        # Update agent's system prompt if provided
-        if system_prompt:
-            agent.instructions = [system_prompt]
 
         start_time = time.perf_counter()
 
@@ -504,6 +593,7 @@ class LLMExecutor:
             metadata["backend_provider"] = backend_provider
         if provider_data:
             metadata["provider_data"] = provider_data
+        self._record_prompt_tokens(run_response, metadata)
 
         # Build response
         response = LLMResponse(
@@ -600,16 +690,12 @@ Output only the JSON, no other text."""
             yield f"Mock streaming response for {model}"
             return
 
-        agent = self._get_or_create_agent(model)
+        agent = self._build_agent(model, provider_type, messages)
         if agent is None:
             yield f"Mock streaming response for {model}"
             return
 
         input_text = self._format_messages_for_agno(messages)
-        system_prompt = self._get_system_prompt(messages)
-
-        if system_prompt:
-            agent.instructions = [system_prompt]
 
         try:
             # Use Agno's streaming - returns async iterator directly
@@ -690,12 +776,14 @@ def create_executor(
 def create_executor_from_step_config(
     step_config: Any,
     step_name: str,
+    response_cache: LLMResponseCache | None = None,
 ) -> LLMExecutor:
     """Create an LLMExecutor from pipeline step configuration.
 
     Args:
         step_config: Pipeline step config with model, fallback_models, and optional openrouter
         step_name: Name of the step
+        response_cache: Optional response cache shared across steps
 
     Returns:
         Configured LLMExecutor
@@ -706,16 +794,20 @@ def create_executor_from_step_config(
         timeout=getattr(step_config, "timeout", 60.0),
         step_name=step_name,
         openrouter_config=getattr(step_config, "openrouter", None),
+        response_cache=response_cache,
     )
 
 
 def create_executors_from_pipeline_config(
     config: PipelineConfig,
+    response_cache: LLMResponseCache | None = None,
 ) -> dict[str, LLMExecutor]:
     """Create all executors from pipeline configuration.
 
     Args:
         config: Full pipeline configuration
+        response_cache: Optional response cache; only steps listed in
+            config.response_cache.steps actually use it
 
     Returns:
         Dict mapping step name to executor
@@ -725,34 +817,34 @@ def create_executors_from_pipeline_config(
     # Legacy context extraction (deprecated - use situation_sensor instead)
     if config.context_extraction.enabled:
         executors["context_extraction"] = create_executor_from_step_config(
-            config.context_extraction, "context_extraction"
+            config.context_extraction, "context_extraction", response_cache
         )
 
     # Phase 2: Situational sensor (replaces context_extraction)
     if config.situation_sensor.enabled:
         executors["situation_sensor"] = create_executor_from_step_config(
-            config.situation_sensor, "situation_sensor"
+            config.situation_sensor, "situation_sensor", response_cache
         )
 
     if config.rule_filtering.enabled:
         executors["rule_filtering"] = create_executor_from_step_config(
-            config.rule_filtering, "rule_filtering"
+            config.rule_filtering, "rule_filtering", response_cache
         )
 
     if config.scenario_filtering.enabled:
         executors["scenario_filtering"] = create_executor_from_step_config(
-            config.scenario_filtering, "scenario_filtering"
+            config.scenario_filtering, "scenario_filtering", response_cache
         )
 
     if config.generation.enabled:
         executors["generation"] = create_executor_from_step_config(
-            config.generation, "generation"
+            config.generation, "generation", response_cache
         )
 
     # Memory ingestion executors
     if config.memory_ingestion.entity_extraction.enabled:
         executors["entity_extraction"] = create_executor_from_step_config(
-            config.memory_ingestion.entity_extraction, "entity_extraction"
+            config.memory_ingestion.entity_extraction, "entity_extraction", response_cache
         )
 
     return executors
@@ -1,9 +1,14 @@
 """Rerank providers for document reranking."""
 
-from ruche.infrastructure.providers.rerank.base import RerankProvider, RerankResponse, RerankResult
-from ruche.infrastructure.providers.rerank.cohere import CohereRerankProvider
-from ruche.infrastructure.providers.rerank.jina import JinaRerankProvider
-from ruche.infrastructure.providers.rerank.mock import MockRerankProvider
+from typing import TYPE_CHECKING
+
+from ruche.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ruche.infrastructure.providers.rerank.base import RerankProvider, RerankResponse, RerankResult
+    from ruche.infrastructure.providers.rerank.cohere import CohereRerankProvider
+    from ruche.infrastructure.providers.rerank.jina import JinaRerankProvider
+    from ruche.infrastructure.providers.rerank.mock import MockRerankProvider
 
 __all__ = [
     "RerankProvider",
@@ -13,3 +18,16 @@ __all__ = [
     "JinaRerankProvider",
     "MockRerankProvider",
 ]
+
+# Resolved on first access (PEP 562) so importing this package stays cheap
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "RerankProvider": "ruche.infrastructure.providers.rerank.base",
+        "RerankResponse": "ruche.infrastructure.providers.rerank.base",
+        "RerankResult": "ruche.infrastructure.providers.rerank.base",
+        "CohereRerankProvider": "ruche.infrastructure.providers.rerank.cohere",
+        "JinaRerankProvider": "ruche.infrastructure.providers.rerank.jina",
+        "MockRerankProvider": "ruche.infrastructure.providers.rerank.mock",
+    },
+)
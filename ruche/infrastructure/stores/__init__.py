@@ -16,53 +16,47 @@ Note: Some stores have canonical locations in top-level modules:
 - ruche/vector/ - VectorStore
 """
 
-# Config Store (canonical: infrastructure/stores/config/)
-from ruche.infrastructure.stores.config import (
-    ConfigStore,
-    InMemoryConfigStore,
-    PostgresConfigStore,
-)
-
-# Session Store (canonical: ruche/conversation/)
-from ruche.conversation.stores import (
-    InMemorySessionStore,
-    RedisSessionStore,
-    SessionStore,
-)
+from typing import TYPE_CHECKING
 
-# Interlocutor Data Store (canonical: infrastructure/stores/interlocutor/)
-from ruche.infrastructure.stores.interlocutor import (
-    InterlocutorDataStoreCacheLayer,
-    InMemoryInterlocutorDataStore,
-    InterlocutorDataStore,
-    PostgresInterlocutorDataStore,
-)
+from ruche.utils.lazy import lazy_exports
 
-# Memory Store (canonical: infrastructure/stores/memory/)
-from ruche.infrastructure.stores.memory import (
-    InMemoryMemoryStore,
-    MemoryStore,
-    PostgresMemoryStore,
-)
-
-# Audit Store (canonical: ruche/audit/)
-from ruche.audit.stores import (
-    AuditStore,
-    InMemoryAuditStore,
-    PostgresAuditStore,
-)
-
-# Vector Store (canonical: ruche/vector/)
-from ruche.vector import (
-    EntityType,
-    InMemoryVectorStore,
-    PgVectorStore,
-    QdrantVectorStore,
-    VectorDocument,
-    VectorMetadata,
-    VectorSearchResult,
-    VectorStore,
-)
+if TYPE_CHECKING:
+    from ruche.infrastructure.stores.config import (
+        ConfigStore,
+        InMemoryConfigStore,
+        PostgresConfigStore,
+    )
+    from ruche.conversation.stores import (
+        InMemorySessionStore,
+        RedisSessionStore,
+        SessionStore,
+    )
+    from ruche.infrastructure.stores.interlocutor import (
+        InterlocutorDataStoreCacheLayer,
+        InMemoryInterlocutorDataStore,
+        InterlocutorDataStore,
+        PostgresInterlocutorDataStore,
+    )
+    from ruche.infrastructure.stores.memory import (
+        InMemoryMemoryStore,
+        MemoryStore,
+        PostgresMemoryStore,
+    )
+    from ruche.audit.stores import (
+        AuditStore,
+        InMemoryAuditStore,
+        PostgresAuditStore,
+    )
+    from ruche.vector import (
+        EntityType,
+        InMemoryVectorStore,
+        PgVectorStore,
+        QdrantVectorStore,
+        VectorDocument,
+        VectorMetadata,
+        VectorSearchResult,
+        VectorStore,
+    )
 
 __all__ = [
     # Config Store
@@ -96,3 +90,34 @@ __all__ = [
     "PgVectorStore",
     "QdrantVectorStore",
 ]
+
+# Resolved on first access (PEP 562) so importing this package stays cheap
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ConfigStore": "ruche.infrastructure.stores.config",
+        "InMemoryConfigStore": "ruche.infrastructure.stores.config",
+        "PostgresConfigStore": "ruche.infrastructure.stores.config",
+        "InMemorySessionStore": "ruche.conversation.stores",
+        "RedisSessionStore": "ruche.conversation.stores",
+        "SessionStore": "ruche.conversation.stores",
+        "InterlocutorDataStoreCacheLayer": "ruche.infrastructure.stores.interlocutor",
+        "InMemoryInterlocutorDataStore": "ruche.infrastructure.stores.interlocutor",
+        "InterlocutorDataStore": "ruche.infrastructure.stores.interlocutor",
+        "PostgresInterlocutorDataStore": "ruche.infrastructure.stores.interlocutor",
+        "InMemoryMemoryStore": "ruche.infrastructure.stores.memory",
+        "MemoryStore": "ruche.infrastructure.stores.memory",
+        "PostgresMemoryStore": "ruche.infrastructure.stores.memory",
+        "AuditStore": "ruche.audit.stores",
+        "InMemoryAuditStore": "ruche.audit.stores",
+        "PostgresAuditStore": "ruche.audit.stores",
+        "EntityType": "ruche.vector",
+        "InMemoryVectorStore": "ruche.vector",
+        "PgVectorStore": "ruche.vector",
+        "QdrantVectorStore": "ruche.vector",
+        "VectorDocument": "ruche.vector",
+        "VectorMetadata": "ruche.vector",
+        "VectorSearchResult": "ruche.vector",
+        "VectorStore": "ruche.vector",
+    },
+)
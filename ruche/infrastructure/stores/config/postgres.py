@@ -20,12 +20,24 @@ from ruche.brains.focal.models import (
     Variable,
 )
 from ruche.infrastructure.stores.config.interface import ConfigStore
+from ruche.config.models.storage import AnnSearchConfig
+from ruche.infrastructure.db.ann import ann_search, build_ann_query, tenant_index_sql
 from ruche.infrastructure.db.errors import ConnectionError
 from ruche.infrastructure.db.pool import PostgresPool
 from ruche.observability.logging import get_logger
 
 logger = get_logger(__name__)
 
+_RULE_SEARCH_SQL = build_ann_query(
+    table="rules",
+    columns="""id, tenant_id, agent_id, name, description,
+       condition_text, condition_embedding, embedding_model,
+       action_type, action_config, scope, scope_id,
+       priority, enabled, created_at, updated_at, deleted_at""",
+    embedding_column="condition_embedding",
+    filters=["tenant_id = $2", "agent_id = $3", "deleted_at IS NULL", "enabled = true"],
+)
+
 
 class PostgresConfigStore(ConfigStore):
     """PostgreSQL implementation of ConfigStore.
@@ -34,13 +46,19 @@ class PostgresConfigStore(ConfigStore):
     and pgvector for vector similarity search.
     """
 
-    def __init__(self, pool: PostgresPool) -> None:
+    def __init__(
+        self,
+        pool: PostgresPool,
+        ann_config: AnnSearchConfig | None = None,
+    ) -> None:
         """Initialize with connection pool.
 
         Args:
             pool: PostgreSQL connection pool
+            ann_config: Vector search tuning (defaults if not provided)
         """
         self._pool = pool
+        self._ann_config = ann_config or AnnSearchConfig()
 
     # Rule operations
     async def get_rule(self, tenant_id: UUID, rule_id: UUID) -> Rule | None:
@@ -198,31 +216,18 @@ class PostgresConfigStore(ConfigStore):
         """Search rules by vector similarity using pgvector."""
         try:
             async with self._pool.acquire() as conn:
-                # Convert embedding to pgvector format
-                embedding_str = f"[{','.join(map(str, query_embedding))}]"
-
-                rows = await conn.fetch(
-                    """
-                    SELECT id, tenant_id, agent_id, name, description,
-                           condition_text, condition_embedding, embedding_model,
-                           action_type, action_config, scope, scope_id,
-                           priority, enabled, created_at, updated_at, deleted_at,
-                           1 - (condition_embedding <=> $1::vector) AS score
-                    FROM rules
-                    WHERE tenant_id = $2 AND agent_id = $3
-                      AND deleted_at IS NULL AND enabled = true
-                      AND condition_embedding IS NOT NULL
-                      AND 1 - (condition_embedding <=> $1::vector) >= $4
-                    ORDER BY score DESC
-                    LIMIT $5
-                    """,
-                    embedding_str,
+                results = await ann_search(
+                    conn,
+                    _RULE_SEARCH_SQL,
+                    query_embedding,
                     tenant_id,
                     agent_id,
-                    min_score,
-                    limit,
+                    limit=limit,
+                    min_score=min_score,
+                    config=self._ann_config,
+                    table="rules",
                 )
-                return [(self._row_to_rule(row), row["score"]) for row in rows]
+                return [(self._row_to_rule(row), score) for row, score in results]
         except Exception as e:
             logger.error(
                 "postgres_vector_search_rules_error",
@@ -231,6 +236,33 @@ class PostgresConfigStore(ConfigStore):
             )
             raise ConnectionError(f"Failed to search rules: {e}", cause=e) from e
 
+    async def create_tenant_vector_index(self, tenant_id: UUID) -> None:
+        """Build a dedicated rule vector index for a large tenant.
+
+        Runs CREATE INDEX CONCURRENTLY, so it can take a while but does not
+        block writes. Safe to call again once the index exists.
+
+        Args:
+            tenant_id: Tenant identifier
+        """
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.execute(
+                    tenant_index_sql(
+                        "rules",
+                        "condition_embedding",
+                        "tenant_id",
+                        str(tenant_id),
+                        where="deleted_at IS NULL",
+                    )
+                )
+                logger.info("rule_tenant_index_created", tenant_id=str(tenant_id))
+        except Exception as e:
+            logger.error(
+                "postgres_create_tenant_index_error", tenant_id=str(tenant_id), error=str(e)
+            )
+            raise ConnectionError(f"Failed to create tenant index: {e}", cause=e) from e
+
     # Scenario operations
     async def get_scenario(self, tenant_id: UUID, scenario_id: UUID) -> Scenario | None:
         """Get a scenario by ID."""
@@ -366,6 +366,22 @@ class InterlocutorDataStoreCacheLayer(InterlocutorDataStore):
         await self._invalidate([key], tenant_id, "update_field")
         return result
 
+    async def update_fields(
+        self,
+        tenant_id: UUID,
+        profile_id: UUID,
+        fields: list[VariableEntry],
+        *,
+        supersede_existing: bool = True,
+    ) -> list[UUID]:
+        """Update fields in bulk and invalidate profile cache once."""
+        result = await self._backend.update_fields(
+            tenant_id, profile_id, fields, supersede_existing=supersede_existing
+        )
+        key = self._profile_key(tenant_id, profile_id)
+        await self._invalidate([key], tenant_id, "update_fields")
+        return result
+
     async def get_field(
         self,
         tenant_id: UUID,
@@ -131,6 +131,36 @@ class InterlocutorDataStore(ABC):
         """
         pass
 
+    async def update_fields(
+        self,
+        tenant_id: UUID,
+        profile_id: UUID,
+        fields: list[VariableEntry],
+        *,
+        supersede_existing: bool = True,
+    ) -> list[UUID]:
+        """Update several profile fields in one call.
+
+        Default implementation applies update_field sequentially. Backends
+        that can batch writes (single transaction, single cache
+        invalidation) should override this.
+
+        Args:
+            tenant_id: Tenant identifier
+            profile_id: Profile to update
+            fields: New field values
+            supersede_existing: Whether to supersede existing fields
+
+        Returns:
+            IDs of the new fields, in input order
+        """
+        return [
+            await self.update_field(
+                tenant_id, profile_id, field, supersede_existing=supersede_existing
+            )
+            for field in fields
+        ]
+
     @abstractmethod
     async def get_field(
         self,
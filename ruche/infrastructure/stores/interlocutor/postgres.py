@@ -33,12 +33,49 @@ from ruche.interlocutor_data.models import (
     InterlocutorDataField,
     ScenarioFieldRequirement,
 )
-from ruche.infrastructure.stores.interlocutor.interface import InterlocutorDataStore
+from ruche.infrastructure.stores.interlocutor.interface import (
+    InterlocutorDataStore as InterlocutorDataStoreInterface,
+)
 
 logger = get_logger(__name__)
 
+# A profile with its channel identities, active fields and active assets in
+# one round trip. Related rows come back as JSON arrays; ``where`` filters
+# customer_profiles p with the tenant as $1.
+_FULL_PROFILE_SQL = """
+    SELECT p.id, p.tenant_id, p.external_id, p.created_at, p.updated_at,
+           ci.identities, pf.fields, pa.assets
+    FROM customer_profiles p
+    CROSS JOIN LATERAL (
+        SELECT COALESCE(
+            json_agg(
+                json_build_object(
+                    'channel', c.channel,
+                    'channel_user_id', c.channel_user_id,
+                    'verified', c.verified
+                )
+                ORDER BY c.created_at
+            ),
+            '[]'::json
+        ) AS identities
+        FROM channel_identities c
+        WHERE c.tenant_id = p.tenant_id AND c.profile_id = p.id
+    ) ci
+    CROSS JOIN LATERAL (
+        SELECT COALESCE(json_agg(to_jsonb(f) ORDER BY f.valid_from DESC), '[]'::json) AS fields
+        FROM profile_fields f
+        WHERE f.tenant_id = p.tenant_id AND f.profile_id = p.id AND f.status = 'active'
+    ) pf
+    CROSS JOIN LATERAL (
+        SELECT COALESCE(json_agg(to_jsonb(a)), '[]'::json) AS assets
+        FROM profile_assets a
+        WHERE a.tenant_id = p.tenant_id AND a.profile_id = p.id AND a.status = 'active'
+    ) pa
+    WHERE p.tenant_id = $1 AND {where} AND p.merged_into_id IS NULL
+"""
+
 
-class PostgresInterlocutorDataStore(InterlocutorDataStore):
+class PostgresInterlocutorDataStore(InterlocutorDataStoreInterface):
     """PostgreSQL implementation of InterlocutorDataStore.
 
     Enhanced with:
@@ -67,16 +104,12 @@ class PostgresInterlocutorDataStore(InterlocutorDataStore):
         try:
             async with self._pool.acquire() as conn:
                 row = await conn.fetchrow(
-                    """
-                    SELECT id, tenant_id, external_id, created_at, updated_at, merged_into_id
-                    FROM customer_profiles
-                    WHERE tenant_id = $1 AND id = $2 AND merged_into_id IS NULL
-                    """,
+                    _FULL_PROFILE_SQL.format(where="p.id = $2"),
                     tenant_id,
                     interlocutor_id,
                 )
                 if row:
-                    return await self._load_full_profile(conn, row, include_history)
+                    return self._row_to_profile(row)
                 return None
         except Exception as e:
             logger.error(
@@ -108,19 +141,18 @@ class PostgresInterlocutorDataStore(InterlocutorDataStore):
         try:
             async with self._pool.acquire() as conn:
                 row = await conn.fetchrow(
-                    """
-                    SELECT p.id, p.tenant_id, p.external_id, p.created_at, p.updated_at, p.merged_into_id
-                    FROM customer_profiles p
-                    JOIN channel_identities c ON p.id = c.profile_id
-                    WHERE p.tenant_id = $1 AND c.channel = $2 AND c.channel_user_id = $3
-                      AND p.merged_into_id IS NULL
-                    """,
+                    _FULL_PROFILE_SQL.format(
+                        where="""p.id = (
+                            SELECT profile_id FROM channel_identities
+                            WHERE tenant_id = $1 AND channel = $2 AND channel_user_id = $3
+                        )"""
+                    ),
                     tenant_id,
                     channel.value,
                     channel_user_id,
                 )
                 if row:
-                    return await self._load_full_profile(conn, row, include_history)
+                    return self._row_to_profile(row)
                 return None
         except Exception as e:
             logger.error(
@@ -236,60 +268,96 @@ class PostgresInterlocutorDataStore(InterlocutorDataStore):
         try:
             async with self._pool.acquire() as conn:
                 async with conn.transaction():
-                    # Mark existing active field as superseded
-                    if supersede_existing:
-                        await conn.execute(
-                            """
-                            UPDATE profile_fields
-                            SET status = 'superseded',
-                                superseded_by_id = $1,
-                                superseded_at = NOW()
-                            WHERE tenant_id = $2 AND profile_id = $3
-                              AND field_name = $4 AND status = 'active'
-                            """,
-                            field.id,
-                            tenant_id,
-                            profile_id,
-                            field.name,
-                        )
-
-                    # Insert new field
-                    source_str = field.source.value if hasattr(field.source, 'value') else str(field.source)
-                    source_item_type_str = field.source_item_type.value if field.source_item_type else None
-
-                    await conn.execute(
-                        """
-                        INSERT INTO profile_fields (
-                            id, tenant_id, profile_id, field_name, field_value,
-                            source, confidence, verified, valid_from, status,
-                            source_item_id, source_item_type, source_metadata,
-                            field_definition_id, expires_at
-                        ) VALUES (
-                            $1, $2, $3, $4, $5, $6, $7, $8, $9, 'active',
-                            $10, $11, $12, $13, $14
-                        )
-                        """,
-                        field.id,
-                        tenant_id,
-                        profile_id,
-                        field.name,
-                        json.dumps(field.value) if not isinstance(field.value, str) else field.value,
-                        source_str,
-                        field.confidence,
-                        field.verified,
-                        field.collected_at,
-                        field.source_item_id,
-                        source_item_type_str,
-                        json.dumps(field.source_metadata),
-                        field.field_definition_id,
-                        field.expires_at,
+                    await self._write_field(
+                        conn, tenant_id, profile_id, field, supersede_existing
                     )
-
                     return field.id
         except Exception as e:
             logger.error("postgres_update_field_error", error=str(e))
             raise ConnectionError(f"Failed to update field: {e}", cause=e) from e
 
+    async def update_fields(
+        self,
+        tenant_id: UUID,
+        profile_id: UUID,
+        fields: list[VariableEntry],
+        *,
+        supersede_existing: bool = True,
+    ) -> list[UUID]:
+        """Update several profile fields in a single transaction."""
+        if not fields:
+            return []
+
+        try:
+            async with self._pool.acquire() as conn:
+                async with conn.transaction():
+                    for field in fields:
+                        await self._write_field(
+                            conn, tenant_id, profile_id, field, supersede_existing
+                        )
+                    return [field.id for field in fields]
+        except Exception as e:
+            logger.error("postgres_update_fields_error", error=str(e), count=len(fields))
+            raise ConnectionError(f"Failed to update fields: {e}", cause=e) from e
+
+    async def _write_field(
+        self,
+        conn: Any,
+        tenant_id: UUID,
+        profile_id: UUID,
+        field: VariableEntry,
+        supersede_existing: bool,
+    ) -> None:
+        """Supersede the active field (optionally) and insert the new one."""
+        # Mark existing active field as superseded
+        if supersede_existing:
+            await conn.execute(
+                """
+                UPDATE profile_fields
+                SET status = 'superseded',
+                    superseded_by_id = $1,
+                    superseded_at = NOW()
+                WHERE tenant_id = $2 AND profile_id = $3
+                  AND field_name = $4 AND status = 'active'
+                """,
+                field.id,
+                tenant_id,
+                profile_id,
+                field.name,
+            )
+
+        # Insert new field
+        source_str = field.source.value if hasattr(field.source, 'value') else str(field.source)
+        source_item_type_str = field.source_item_type.value if field.source_item_type else None
+
+        await conn.execute(
+            """
+            INSERT INTO profile_fields (
+                id, tenant_id, profile_id, field_name, field_value,
+                source, confidence, verified, valid_from, status,
+                source_item_id, source_item_type, source_metadata,
+                field_definition_id, expires_at
+            ) VALUES (
+                $1, $2, $3, $4, $5, $6, $7, $8, $9, 'active',
+                $10, $11, $12, $13, $14
+            )
+            """,
+            field.id,
+            tenant_id,
+            profile_id,
+            field.name,
+            json.dumps(field.value) if not isinstance(field.value, str) else field.value,
+            source_str,
+            field.confidence,
+            field.verified,
+            field.collected_at,
+            field.source_item_id,
+            source_item_type_str,
+            json.dumps(field.source_metadata),
+            field.field_definition_id,
+            field.expires_at,
+        )
+
     async def get_field(
         self,
         tenant_id: UUID,
@@ -1352,72 +1420,39 @@ class PostgresInterlocutorDataStore(InterlocutorDataStore):
             updated_at=row.get("updated_at"),
         )
 
-    async def _load_full_profile(
-        self, conn, profile_row, include_history: bool = False
-    ) -> InterlocutorDataStore:
-        """Load full profile with all related data."""
-        profile_id = profile_row["id"]
-        tenant_id = profile_row["tenant_id"]
-
-        # Load channel identities
-        identity_rows = await conn.fetch(
-            """
-            SELECT channel, channel_user_id, verified, created_at
-            FROM channel_identities
-            WHERE tenant_id = $1 AND profile_id = $2
-            """,
-            tenant_id,
-            profile_id,
+    def _row_to_profile(self, row) -> InterlocutorDataStore:
+        """Convert a _FULL_PROFILE_SQL row to a profile."""
+        identities, field_rows, asset_rows = (
+            json.loads(row[column]) if isinstance(row[column], str) else row[column]
+            for column in ("identities", "fields", "assets")
         )
+
         channel_identities = [
             ChannelIdentity(
-                channel=Channel(row["channel"]),
-                channel_user_id=row["channel_user_id"],
-                verified=row["verified"],
-                primary=False,
+                channel=Channel(identity["channel"]),
+                channel_user_id=identity["channel_user_id"],
+                verified=identity["verified"] or False,
+                primary=index == 0,
             )
-            for row in identity_rows
+            for index, identity in enumerate(identities)
         ]
-        if channel_identities:
-            channel_identities[0].primary = True
-
-        # Load active profile fields
-        field_rows = await conn.fetch(
-            """
-            SELECT * FROM profile_fields
-            WHERE tenant_id = $1 AND profile_id = $2 AND status = 'active'
-            ORDER BY valid_from DESC
-            """,
-            tenant_id,
-            profile_id,
-        )
 
+        # Rows come newest first; keep the current value of each field
         fields = {}
-        for row in field_rows:
-            field_name = row["field_name"]
+        for field_row in field_rows:
+            field_name = field_row["field_name"]
             if field_name not in fields:
-                fields[field_name] = self._row_to_field(row)
-
-        # Load active assets
-        asset_rows = await conn.fetch(
-            """
-            SELECT * FROM profile_assets
-            WHERE tenant_id = $1 AND profile_id = $2 AND status = 'active'
-            """,
-            tenant_id,
-            profile_id,
-        )
-        assets = [self._row_to_asset(row) for row in asset_rows]
+                fields[field_name] = self._row_to_field(field_row)
 
         return InterlocutorDataStore(
-            id=profile_id,
-            tenant_id=tenant_id,
-            interlocutor_id=profile_id,
+            id=row["id"],
+            tenant_id=row["tenant_id"],
+            interlocutor_id=row["id"],
             channel_identities=channel_identities,
             fields=fields,
-            assets=assets,
+            assets=[self._row_to_asset(asset_row) for asset_row in asset_rows],
             verification_level=VerificationLevel.UNVERIFIED,
             consents=[],
-            created_at=profile_row["created_at"],
-            updated_at=profile_row["updated_at"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
         )
@@ -0,0 +1,93 @@
+"""Turn-scoped profile memo.
+
+Several phases of one turn read the same profile: customer resolution,
+situation sensing, turn context building and customer data persistence.
+Between start_profile_memo() and clear_profile_memo() the first read of a
+profile loads it and every later read in the turn reuses it. Phases
+running concurrently share the in-flight load.
+
+Outside a memo scope get_profile() reads the store directly.
+"""
+
+import asyncio
+from contextvars import ContextVar, Token
+from uuid import UUID
+
+from ruche.infrastructure.stores.interlocutor.interface import (
+    InterlocutorDataStore as InterlocutorDataStoreInterface,
+)
+from ruche.interlocutor_data.models import InterlocutorDataStore
+
+_ProfileMemo = dict[tuple[UUID, UUID], "asyncio.Future[InterlocutorDataStore | None]"]
+
+_profile_memo: ContextVar[_ProfileMemo | None] = ContextVar("profile_memo", default=None)
+
+
+def start_profile_memo() -> Token[_ProfileMemo | None]:
+    """Start memoizing profile reads for the current turn.
+
+    Returns:
+        Token for clear_profile_memo()
+    """
+    return _profile_memo.set({})
+
+
+def clear_profile_memo(token: Token[_ProfileMemo | None]) -> None:
+    """Stop memoizing and drop the turn's profiles."""
+    _profile_memo.reset(token)
+
+
+async def get_profile(
+    store: InterlocutorDataStoreInterface,
+    tenant_id: UUID,
+    interlocutor_id: UUID,
+) -> InterlocutorDataStore | None:
+    """Get a profile by interlocutor ID, at most one load per turn.
+
+    Args:
+        store: Profile store to load from on a miss
+        tenant_id: Tenant ID
+        interlocutor_id: Interlocutor ID
+
+    Returns:
+        The profile, or None if it does not exist
+    """
+    memo = _profile_memo.get()
+    if memo is None:
+        return await store.get_by_interlocutor_id(
+            tenant_id=tenant_id, interlocutor_id=interlocutor_id
+        )
+
+    key = (tenant_id, interlocutor_id)
+    future = memo.get(key)
+    if future is None:
+        future = asyncio.ensure_future(
+            store.get_by_interlocutor_id(tenant_id=tenant_id, interlocutor_id=interlocutor_id)
+        )
+        memo[key] = future
+    try:
+        return await asyncio.shield(future)
+    except Exception:
+        # Let the next phase retry instead of replaying the failure
+        if memo.get(key) is future:
+            del memo[key]
+        raise
+
+
+def remember_profile(profile: InterlocutorDataStore) -> None:
+    """Memoize a profile loaded some other way (e.g. by channel identity)."""
+    memo = _profile_memo.get()
+    if memo is None:
+        return
+    future: asyncio.Future[InterlocutorDataStore | None] = (
+        asyncio.get_running_loop().create_future()
+    )
+    future.set_result(profile)
+    memo[(profile.tenant_id, profile.interlocutor_id)] = future
+
+
+def forget_profile(tenant_id: UUID, interlocutor_id: UUID) -> None:
+    """Drop a memoized profile after writing to it."""
+    memo = _profile_memo.get()
+    if memo is not None:
+        memo.pop((tenant_id, interlocutor_id), None)
@@ -1,9 +1,16 @@
 """In-memory implementation of MemoryStore."""
 
 from collections import deque
+from collections.abc import Sequence
 from uuid import UUID
 
-from ruche.memory.models import Entity, Episode, Relationship
+from ruche.memory.models import (
+    TURN_CONTENT_TYPES,
+    Entity,
+    Episode,
+    Relationship,
+    SummaryCounters,
+)
 from ruche.infrastructure.stores.memory.interface import MemoryStore
 from ruche.utils.vector import cosine_similarity
 
@@ -21,11 +28,21 @@ class InMemoryMemoryStore(MemoryStore):
         self._episodes: dict[UUID, Episode] = {}
         self._entities: dict[UUID, Entity] = {}
         self._relationships: dict[UUID, Relationship] = {}
+        self._summary_counters: dict[str, SummaryCounters] = {}
 
     # Episode operations
     async def add_episode(self, episode: Episode) -> UUID:
         """Add an episode to the store."""
         self._episodes[episode.id] = episode
+
+        counters = self._summary_counters.setdefault(
+            episode.group_id, SummaryCounters(group_id=episode.group_id)
+        )
+        if episode.content_type in TURN_CONTENT_TYPES:
+            counters.total_turns += 1
+            counters.unsummarized_turns += 1
+        elif episode.content_type == "summary":
+            counters.summaries_since_meta += 1
         return episode.id
 
     async def get_episode(self, group_id: str, episode_id: UUID) -> Episode | None:
@@ -35,12 +52,24 @@ class InMemoryMemoryStore(MemoryStore):
             return episode
         return None
 
-    async def get_episodes(self, group_id: str, *, limit: int = 100) -> list[Episode]:
+    async def get_episodes(
+        self,
+        group_id: str,
+        *,
+        limit: int = 100,
+        offset: int = 0,
+        content_types: Sequence[str] | None = None,
+    ) -> list[Episode]:
         """Get episodes for a group."""
-        results = [ep for ep in self._episodes.values() if ep.group_id == group_id]
+        results = [
+            ep
+            for ep in self._episodes.values()
+            if ep.group_id == group_id
+            and (content_types is None or ep.content_type in content_types)
+        ]
         # Sort by occurred_at descending
         results.sort(key=lambda x: x.occurred_at, reverse=True)
-        return results[:limit]
+        return results[offset : offset + limit]
 
     async def vector_search_episodes(
         self,
@@ -72,6 +101,7 @@ class InMemoryMemoryStore(MemoryStore):
         group_id: str,
         *,
         limit: int = 10,
+        language: str | None = None,  # noqa: ARG002
     ) -> list[Episode]:
         """Search episodes by text content (substring match)."""
         query_lower = query.lower()
@@ -92,6 +122,31 @@ class InMemoryMemoryStore(MemoryStore):
             return True
         return False
 
+    # Summarization counters
+    async def get_summary_counters(self, group_id: str) -> SummaryCounters:
+        """Get a group's summary counters."""
+        counters = self._summary_counters.get(group_id)
+        if counters is None:
+            return SummaryCounters(group_id=group_id)
+        return counters.model_copy()
+
+    async def consume_summary_counters(
+        self,
+        group_id: str,
+        *,
+        turns: int = 0,
+        summaries: int = 0,
+    ) -> SummaryCounters | None:
+        """Claim pending turns and/or summaries if enough are pending."""
+        counters = self._summary_counters.setdefault(
+            group_id, SummaryCounters(group_id=group_id)
+        )
+        if counters.unsummarized_turns < turns or counters.summaries_since_meta < summaries:
+            return None
+        counters.unsummarized_turns -= turns
+        counters.summaries_since_meta -= summaries
+        return counters.model_copy()
+
     # Entity operations
     async def add_entity(self, entity: Entity) -> UUID:
         """Add an entity to the store."""
@@ -274,4 +329,7 @@ class InMemoryMemoryStore(MemoryStore):
             del self._relationships[rid]
             count += 1
 
+        # A recreated group starts counting from zero
+        self._summary_counters.pop(group_id, None)
+
         return count
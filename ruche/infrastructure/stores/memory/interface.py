@@ -1,9 +1,12 @@
 """MemoryStore abstract interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
-from ruche.memory.models import Entity, Episode, Relationship
+from rank_bm25 import BM25Okapi
+
+from ruche.memory.models import Entity, Episode, Relationship, SummaryCounters
 
 
 class MemoryStore(ABC):
@@ -16,7 +19,12 @@ class MemoryStore(ABC):
     # Episode operations
     @abstractmethod
     async def add_episode(self, episode: Episode) -> UUID:
-        """Add an episode to the store."""
+        """Add an episode to the store.
+
+        Also updates the group's summary counters: turn episodes
+        (message, event) count towards the next window summary, window
+        summaries towards the next meta-summary.
+        """
         pass
 
     @abstractmethod
@@ -25,8 +33,22 @@ class MemoryStore(ABC):
         pass
 
     @abstractmethod
-    async def get_episodes(self, group_id: str, *, limit: int = 100) -> list[Episode]:
-        """Get episodes for a group."""
+    async def get_episodes(
+        self,
+        group_id: str,
+        *,
+        limit: int = 100,
+        offset: int = 0,
+        content_types: Sequence[str] | None = None,
+    ) -> list[Episode]:
+        """Get episodes for a group, most recent first.
+
+        Args:
+            group_id: Group to read
+            limit: Maximum episodes
+            offset: Number of most recent matching episodes to skip
+            content_types: Only return these content types
+        """
         pass
 
     @abstractmethod
@@ -48,15 +70,86 @@ class MemoryStore(ABC):
         group_id: str,
         *,
         limit: int = 10,
+        language: str | None = None,
     ) -> list[Episode]:
-        """Search episodes by text content."""
+        """Search episodes by text content.
+
+        Args:
+            query: Search text
+            group_id: Group to search
+            limit: Maximum results
+            language: ISO 639-1 code of the query, for backends that stem
+        """
         pass
 
+    async def hybrid_search_episodes(
+        self,
+        query_embedding: list[float],
+        query_text: str,
+        group_id: str,
+        *,
+        limit: int = 10,
+        language: str | None = None,  # noqa: ARG002
+    ) -> list[tuple[Episode, float, float]]:
+        """Search episodes by vector similarity and lexical match together.
+
+        The default scores the top vector matches with BM25 in Python.
+        Backends with native text search override this to rank both
+        signals in the database.
+
+        Args:
+            query_embedding: Query vector
+            query_text: Query text
+            group_id: Group to search
+            limit: Maximum candidates per signal
+            language: ISO 639-1 code of the query
+
+        Returns:
+            (episode, vector_score, text_score) tuples, unordered
+        """
+        results = await self.vector_search_episodes(
+            query_embedding, group_id, limit=limit, min_score=0.0
+        )
+        if not results:
+            return []
+
+        corpus = [episode.content.split() for episode, _ in results]
+        text_scores = BM25Okapi(corpus).get_scores(query_text.split())
+        return [
+            (episode, score, float(text_score))
+            for (episode, score), text_score in zip(results, text_scores)
+        ]
+
     @abstractmethod
     async def delete_episode(self, group_id: str, episode_id: UUID) -> bool:
         """Delete an episode."""
         pass
 
+    # Summarization counters
+    @abstractmethod
+    async def get_summary_counters(self, group_id: str) -> SummaryCounters:
+        """Get a group's summary counters (all zero for an unknown group)."""
+        pass
+
+    @abstractmethod
+    async def consume_summary_counters(
+        self,
+        group_id: str,
+        *,
+        turns: int = 0,
+        summaries: int = 0,
+    ) -> SummaryCounters | None:
+        """Atomically claim pending turns and/or summaries.
+
+        Subtracts from unsummarized_turns and summaries_since_meta only if
+        both have at least the requested amount, so concurrent summarizers
+        never claim the same window. Negative amounts release a claim.
+
+        Returns:
+            Counters after the update, or None if not enough were pending
+        """
+        pass
+
     # Entity operations
     @abstractmethod
     async def add_entity(self, entity: Entity) -> UUID:
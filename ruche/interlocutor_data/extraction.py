@@ -97,6 +97,26 @@ Respond in JSON format:
 }}
 """
 
+FIELD_DEFINITIONS_BATCH_PROMPT = """Generate complete field definitions for the following profile fields:
+
+Fields: {field_names}
+Context: These fields are used in scenarios/rules for customer personalization.
+
+For each field provide:
+1. A collection prompt (how to ask the customer for this information)
+2. Validation regex (if applicable)
+3. Example values for extraction
+
+Respond in JSON format, with one entry per field name:
+{{
+  "field_name": {{
+    "collection_prompt": "polite question to ask customer",
+    "validation_regex": "optional regex pattern",
+    "examples": ["example1", "example2"]
+  }}
+}}
+"""
+
 
 class InterlocutorDataSchemaExtractor:
     """Extracts profile field requirements from scenarios and rules.
@@ -206,6 +226,8 @@ class InterlocutorDataSchemaExtractor:
     ) -> list[FieldDefinitionSuggestion]:
         """Generate field definition suggestions for extracted fields.
 
+        With an LLM configured, multiple fields are suggested in a single call.
+
         Args:
             field_names: List of field names to generate definitions for
             tenant_id: Tenant identifier
@@ -214,11 +236,10 @@ class InterlocutorDataSchemaExtractor:
         Returns:
             List of FieldDefinitionSuggestion objects
         """
-        suggestions = []
-
-        for name in field_names:
-            suggestion = await self._suggest_single_field(name)
-            suggestions.append(suggestion)
+        if self._llm is None or len(field_names) <= 1:
+            suggestions = [await self._suggest_single_field(name) for name in field_names]
+        else:
+            suggestions = await self._suggest_fields_batch(field_names)
 
         logger.info(
             "field_definitions_suggested",
@@ -227,6 +248,56 @@ class InterlocutorDataSchemaExtractor:
 
         return suggestions
 
+    async def _suggest_fields_batch(
+        self, field_names: list[str]
+    ) -> list[FieldDefinitionSuggestion]:
+        """Generate suggestions for several fields with a single LLM call."""
+        prompt = FIELD_DEFINITIONS_BATCH_PROMPT.format(field_names=", ".join(field_names))
+
+        try:
+            response = await self._llm.generate(prompt)
+            parsed = self._parse_field_definition_response(response)
+            if not isinstance(parsed, dict):
+                parsed = {}
+        except Exception as e:
+            logger.warning(
+                "field_definitions_batch_failed",
+                field_count=len(field_names),
+                error=str(e),
+            )
+            parsed = {}
+
+        suggestions = []
+        for name in field_names:
+            inferred_type = self._infer_type_from_name(name)
+            display_name = self._generate_display_name(name)
+            field_data = parsed.get(name)
+
+            if isinstance(field_data, dict):
+                suggestions.append(
+                    FieldDefinitionSuggestion(
+                        name=name,
+                        display_name=display_name,
+                        value_type=inferred_type,
+                        description=field_data.get("description"),
+                        validation_regex=field_data.get("validation_regex"),
+                        collection_prompt=field_data.get("collection_prompt"),
+                        confidence=0.9,
+                    )
+                )
+            else:
+                # Field missing from the batch response - basic suggestion
+                suggestions.append(
+                    FieldDefinitionSuggestion(
+                        name=name,
+                        display_name=display_name,
+                        value_type=inferred_type,
+                        confidence=0.5,
+                    )
+                )
+
+        return suggestions
+
     async def _suggest_single_field(self, field_name: str) -> FieldDefinitionSuggestion:
         """Generate suggestion for a single field."""
         # Infer type from field name patterns
@@ -293,10 +293,17 @@ class MemoryIngestor:
     async def _queue_summarization_check(self, group_id: str) -> None:
         """Queue async summarization threshold check.
 
+        When a summarizer is available the threshold is checked first
+        (an O(1) counter read) so no task is queued for most turns.
+
         Args:
             group_id: Tenant:session identifier
         """
         try:
+            if self._summarizer is not None and not await self._summarizer.is_summarization_due(
+                group_id
+            ):
+                return
             await self._task_queue.enqueue(
                 "check_summarization",
                 group_id=group_id,
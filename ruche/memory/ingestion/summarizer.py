@@ -5,6 +5,7 @@ from typing import Any
 from ruche.config.models.pipeline import SummarizationConfig
 from ruche.memory.ingestion.errors import SummarizationError
 from ruche.memory.models.episode import Episode
+from ruche.memory.models.summary_counters import TURN_CONTENT_TYPES
 from ruche.infrastructure.stores.memory.interface import MemoryStore
 from ruche.observability.logging import get_logger
 from ruche.infrastructure.providers.llm import LLMMessage
@@ -189,14 +190,27 @@ summaries into a high-level overview. Focus on major themes and outcomes.""",
                 cause=e,
             ) from e
 
+    async def is_summarization_due(self, group_id: str) -> bool:
+        """Check whether a window of unsummarized turns is pending.
+
+        Args:
+            group_id: Tenant:session to check
+
+        Returns:
+            True if check_and_summarize_if_needed() would summarize
+        """
+        counters = await self._memory_store.get_summary_counters(group_id)
+        return counters.unsummarized_turns >= self._config.window.turns_per_summary
+
     async def check_and_summarize_if_needed(
         self,
         group_id: str,
     ) -> Episode | None:
         """Check if summarization threshold reached and summarize if needed.
 
-        Queries MemoryStore to count episodes, compares against thresholds,
-        and triggers window or meta-summary generation.
+        Reads the group's summary counters, claims a window of turns when
+        enough are pending, and loads only that window. Claims are atomic
+        in the store, so concurrent checks never summarize the same turns.
 
         Args:
             group_id: Tenant:session to check
@@ -208,55 +222,66 @@ summaries into a high-level overview. Focus on major themes and outcomes.""",
         Raises:
             SummarizationError: If summary generation or storage fails
         """
-        try:
-            # Get all episodes
-            all_episodes = await self._memory_store.get_episodes(group_id)
+        window_size = self._config.window.turns_per_summary
+        summaries_per_meta = self._config.meta.summaries_per_meta
 
-            # Count message episodes (exclude summaries)
-            message_episodes = [
-                e for e in all_episodes if e.content_type in ("message", "event")
-            ]
-            turn_count = len(message_episodes)
-
-            # Check window summarization threshold
-            window_threshold = self._config.window.turns_per_summary
-
-            if turn_count % window_threshold != 0 or turn_count == 0:
+        try:
+            if not await self.is_summarization_due(group_id):
                 return None
 
-            # Get unsummarized episodes for this window
-            start_idx = max(0, turn_count - window_threshold)
-            window_episodes = message_episodes[start_idx:turn_count]
-
-            if len(window_episodes) < window_threshold:
+            claimed = await self._memory_store.consume_summary_counters(
+                group_id, turns=window_size
+            )
+            if claimed is None:
                 return None
 
-            # Generate window summary
-            summary = await self.summarize_window(window_episodes, group_id)
-
-            # Store summary
-            await self._memory_store.add_episode(summary)
+            try:
+                # Turns newer than the claimed window stay unsummarized
+                window_episodes = await self._memory_store.get_episodes(
+                    group_id,
+                    limit=window_size,
+                    offset=claimed.unsummarized_turns,
+                    content_types=TURN_CONTENT_TYPES,
+                )
+                window_episodes.reverse()
+
+                summary = await self.summarize_window(window_episodes, group_id)
+                await self._memory_store.add_episode(summary)
+            except Exception:
+                # Release the claim so the window is retried on the next check
+                await self._memory_store.consume_summary_counters(
+                    group_id, turns=-window_size
+                )
+                raise
 
             # Check if meta-summarization needed
-            if turn_count >= self._config.meta.enabled_at_turn_count:
-                # Get all window summaries
-                summaries = [
-                    e for e in all_episodes if e.content_type == "summary"
-                ]
-
-                if len(summaries) % self._config.meta.summaries_per_meta == 0:
-                    # Generate meta-summary
-                    meta_summaries_start = max(
-                        0, len(summaries) - self._config.meta.summaries_per_meta
-                    )
-                    meta_summaries = summaries[meta_summaries_start:]
-
-                    if len(meta_summaries) >= self._config.meta.summaries_per_meta:
-                        meta = await self.create_meta_summary(meta_summaries, group_id)
-                        await self._memory_store.add_episode(meta)
-                        return meta
-
-            return summary
+            if claimed.total_turns < self._config.meta.enabled_at_turn_count:
+                return summary
+
+            claimed_meta = await self._memory_store.consume_summary_counters(
+                group_id, summaries=summaries_per_meta
+            )
+            if claimed_meta is None:
+                return summary
+
+            try:
+                meta_summaries = await self._memory_store.get_episodes(
+                    group_id,
+                    limit=summaries_per_meta,
+                    offset=claimed_meta.summaries_since_meta,
+                    content_types=("summary",),
+                )
+                meta_summaries.reverse()
+
+                meta = await self.create_meta_summary(meta_summaries, group_id)
+                await self._memory_store.add_episode(meta)
+            except Exception:
+                await self._memory_store.consume_summary_counters(
+                    group_id, summaries=-summaries_per_meta
+                )
+                raise
+
+            return meta
 
         except Exception as e:
             logger.error(
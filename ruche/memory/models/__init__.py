@@ -4,14 +4,18 @@ Contains all Pydantic models for the memory system:
 - Episodes for atomic memory units
 - Entities for knowledge graph nodes
 - Relationships for knowledge graph edges
+- Summary counters for summarization triggers
 """
 
 from ruche.memory.models.entity import Entity
 from ruche.memory.models.episode import Episode
 from ruche.memory.models.relationship import Relationship
+from ruche.memory.models.summary_counters import TURN_CONTENT_TYPES, SummaryCounters
 
 __all__ = [
     "Episode",
     "Entity",
     "Relationship",
+    "SummaryCounters",
+    "TURN_CONTENT_TYPES",
 ]
@@ -0,0 +1,24 @@
+"""Per-group counters that drive summarization triggers."""
+
+from pydantic import BaseModel, Field
+
+# Episode content types that count as conversation turns
+TURN_CONTENT_TYPES = ("message", "event")
+
+
+class SummaryCounters(BaseModel):
+    """Summarization progress for one memory group.
+
+    Memory stores update these as episodes are added, so deciding whether
+    a window or meta-summary is due never requires loading the group's
+    episodes.
+    """
+
+    group_id: str = Field(..., description="Tenant:session the counters belong to")
+    total_turns: int = Field(default=0, description="Turn episodes ever added")
+    unsummarized_turns: int = Field(
+        default=0, description="Turn episodes not yet claimed by a window summary"
+    )
+    summaries_since_meta: int = Field(
+        default=0, description="Window summaries not yet claimed by a meta-summary"
+    )
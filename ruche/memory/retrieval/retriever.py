@@ -2,19 +2,19 @@
 
 from uuid import UUID
 
-from rank_bm25 import BM25Okapi
+import numpy as np
 
 from ruche.brains.focal.phases.context.situation_snapshot import SituationSnapshot
 from ruche.brains.focal.retrieval.models import ScoredEpisode
-from ruche.brains.focal.retrieval.selection import ScoredItem, create_selection_strategy
+from ruche.brains.focal.retrieval.selection import ScoreSelection, create_selection_strategy
 from ruche.config.models.pipeline import HybridRetrievalConfig
 from ruche.config.models.selection import SelectionConfig
+from ruche.memory.models import Episode
 from ruche.memory.retrieval.reranker import MemoryReranker
 from ruche.infrastructure.stores.memory.interface import MemoryStore
 from ruche.observability.logging import get_logger
 from ruche.infrastructure.providers.embedding import EmbeddingProvider
 from ruche.utils.hybrid import HybridScorer
-from ruche.utils.vector import cosine_similarity
 
 logger = get_logger(__name__)
 
@@ -68,35 +68,51 @@ class MemoryRetriever:
 
         # Use hybrid scoring if configured
         if self._hybrid_scorer:
-            scored = await self._hybrid_retrieval(
-                query_embedding, snapshot.message, group_id
+            episodes, scores = await self._hybrid_retrieval(
+                query_embedding, snapshot.message, group_id, snapshot.language
             )
         else:
-            scored = await self._vector_only_retrieval(query_embedding, group_id)
+            episodes, scores = await self._vector_only_retrieval(query_embedding, group_id)
 
-        scored.sort(key=lambda s: s.score, reverse=True)
+        if not episodes:
+            return []
 
-        # Optional reranking
-        if self._reranker and scored:
+        if self._reranker:
+            # The reranker rescores ScoredEpisode objects, so every candidate
+            # needs one on this path
+            order = np.argsort(-scores, kind="stable")
+            scored = [self._scored(episodes[i], scores[i]) for i in order]
             scored = await self._reranker.rerank(snapshot.message, scored)
+            scores = np.fromiter((s.score for s in scored), dtype=np.float32, count=len(scored))
+            return [scored[i] for i in self._select(scores).indices]
+
+        # Selection; only the selected episodes get a ScoredEpisode
+        return [self._scored(episodes[i], scores[i]) for i in self._select(scores).indices]
 
-        # Selection
-        above_min = [s for s in scored if s.score >= self._selection_config.min_score]
-        pool = above_min if len(above_min) >= self._selection_config.min_k else scored
-        items = [ScoredItem(item=s, score=s.score) for s in pool]
-        selection = self._selection_strategy.select(
-            items,
+    def _select(self, scores: np.ndarray) -> ScoreSelection:
+        """Select candidates by score, keeping min_score unless min_k needs more."""
+        return self._selection_strategy.select_scores(
+            scores,
             max_k=self._selection_config.max_k,
             min_k=self._selection_config.min_k,
+            min_score=self._selection_config.min_score,
         )
 
-        return [item.item for item in selection.selected]
+    @staticmethod
+    def _scored(episode: Episode, score: float) -> ScoredEpisode:
+        """Build the result object of a scored episode."""
+        return ScoredEpisode(
+            episode_id=episode.id,
+            content=episode.content,
+            score=float(score),
+            metadata={"occurred_at": str(episode.occurred_at)},
+        )
 
     async def _vector_only_retrieval(
         self,
         query_embedding: list[float],
         group_id: str,
-    ) -> list[ScoredEpisode]:
+    ) -> tuple[list[Episode], np.ndarray]:
         """Vector-only retrieval using cosine similarity."""
         raw_results = await self._memory_store.vector_search_episodes(
             query_embedding,
@@ -105,55 +121,44 @@ class MemoryRetriever:
             min_score=self._selection_config.min_score,
         )
 
-        scored = [
-            ScoredEpisode(
-                episode_id=episode.id,
-                content=episode.content,
-                score=score,
-                metadata={"occurred_at": str(episode.occurred_at)},
-            )
-            for episode, score in raw_results
-        ]
-        return scored
+        episodes = [episode for episode, _ in raw_results]
+        scores = np.fromiter(
+            (score for _, score in raw_results), dtype=np.float32, count=len(raw_results)
+        )
+        return episodes, scores
 
     async def _hybrid_retrieval(
         self,
         query_embedding: list[float],
         query_text: str,
         group_id: str,
-    ) -> list[ScoredEpisode]:
-        """Hybrid retrieval combining vector and BM25 scores."""
-        # Get all episodes for the group (no limit for hybrid scoring)
-        raw_results = await self._memory_store.vector_search_episodes(
+        language: str | None = None,
+    ) -> tuple[list[Episode], np.ndarray]:
+        """Hybrid retrieval combining vector and lexical scores."""
+        # The store ranks lexically (full-text search in Postgres, BM25
+        # otherwise) and returns both scores per candidate
+        raw_results = await self._memory_store.hybrid_search_episodes(
             query_embedding,
-            group_id=group_id,
-            limit=self._selection_config.max_k * 2,  # Get more for BM25 reranking
-            min_score=0.0,  # No threshold for hybrid
+            query_text,
+            group_id,
+            limit=self._selection_config.max_k * 2,
+            language=language,
         )
 
         if not raw_results:
-            return []
-
-        episodes = [episode for episode, _ in raw_results]
-        vector_scores = [score for _, score in raw_results]
+            return [], np.empty(0, dtype=np.float32)
 
-        # Compute BM25 scores
-        corpus = [episode.content.split() for episode in episodes]
-        bm25 = BM25Okapi(corpus)
-        bm25_scores = bm25.get_scores(query_text.split())
+        episodes = [episode for episode, _, _ in raw_results]
+        vector_scores = np.fromiter(
+            (vector_score for _, vector_score, _ in raw_results),
+            dtype=np.float32,
+            count=len(raw_results),
+        )
+        text_scores = np.fromiter(
+            (text_score for _, _, text_score in raw_results),
+            dtype=np.float32,
+            count=len(raw_results),
+        )
 
         # Combine scores
-        combined_scores = self._hybrid_scorer.combine_scores(vector_scores, list(bm25_scores))
-
-        # Build scored episodes
-        scored = [
-            ScoredEpisode(
-                episode_id=episode.id,
-                content=episode.content,
-                score=score,
-                metadata={"occurred_at": str(episode.occurred_at)},
-            )
-            for episode, score in zip(episodes, combined_scores)
-        ]
-
-        return scored
+        return episodes, self._hybrid_scorer.combine_arrays(vector_scores, text_scores)
@@ -5,16 +5,75 @@ vector similarity search.
 """
 
 import json
+from collections.abc import Sequence
 from uuid import UUID
 
+from ruche.config.models.storage import AnnSearchConfig, TextSearchConfig
+from ruche.infrastructure.db.ann import ann_search, build_ann_query, tenant_index_sql
 from ruche.infrastructure.db.errors import ConnectionError
 from ruche.infrastructure.db.pool import PostgresPool
-from ruche.memory.models import Entity, Episode, Relationship
+from ruche.infrastructure.db.text_search import regconfig_for_language
+from ruche.memory.models import (
+    TURN_CONTENT_TYPES,
+    Entity,
+    Episode,
+    Relationship,
+    SummaryCounters,
+)
 from ruche.infrastructure.stores.memory.interface import MemoryStore
 from ruche.observability.logging import get_logger
 
 logger = get_logger(__name__)
 
+_EPISODE_COLUMNS = """id, group_id, content, content_type, source,
+       source_metadata, occurred_at, recorded_at,
+       embedding, embedding_model, entity_ids"""
+
+# tenant_key (the tenant part of group_id) lets per-tenant partial
+# indexes match once the bound group_id is visible to the planner.
+_EPISODE_SEARCH_SQL = build_ann_query(
+    table="episodes",
+    columns=_EPISODE_COLUMNS,
+    embedding_column="embedding",
+    filters=["group_id = $2", "tenant_key = split_part($2, ':', 1)"],
+)
+
+# content_tsv is generated from content using the row's text_search_config
+_EPISODE_TEXT_SEARCH_SQL = f"""
+SELECT {_EPISODE_COLUMNS}
+FROM episodes, websearch_to_tsquery($2::regconfig, $3) AS query
+WHERE group_id = $1 AND content_tsv @@ query
+ORDER BY ts_rank_cd(content_tsv, query, 32) DESC, occurred_at DESC
+LIMIT $4
+"""
+
+# Word-similarity fallback served by the pg_trgm GIN index
+_EPISODE_FUZZY_SEARCH_SQL = f"""
+SELECT {_EPISODE_COLUMNS}
+FROM episodes
+WHERE group_id = $1 AND $2 <% content AND NOT (id = ANY($3::uuid[]))
+ORDER BY word_similarity($2, content) DESC
+LIMIT $4
+"""
+
+# Candidates are the nearest vectors (found with ann_search, passed as
+# $6) plus the best text matches; both scores are computed for every
+# candidate. ts_rank_cd normalization 32 maps the rank into [0, 1).
+_EPISODE_HYBRID_SEARCH_SQL = f"""
+WITH q AS (SELECT websearch_to_tsquery($3::regconfig, $4) AS query),
+lex AS (
+    SELECT id FROM episodes, q
+    WHERE group_id = $2 AND content_tsv @@ q.query
+    ORDER BY ts_rank_cd(content_tsv, q.query, 32) DESC
+    LIMIT $5
+)
+SELECT {_EPISODE_COLUMNS},
+       COALESCE(1 - (embedding <=> $1::vector), 0) AS vector_score,
+       ts_rank_cd(content_tsv, q.query, 32) AS text_score
+FROM episodes, q
+WHERE group_id = $2 AND (id = ANY($6::uuid[]) OR id IN (SELECT id FROM lex))
+"""
+
 
 class PostgresMemoryStore(MemoryStore):
     """PostgreSQL implementation of MemoryStore.
@@ -23,27 +82,37 @@ class PostgresMemoryStore(MemoryStore):
     and pgvector for vector similarity search.
     """
 
-    def __init__(self, pool: PostgresPool) -> None:
+    def __init__(
+        self,
+        pool: PostgresPool,
+        ann_config: AnnSearchConfig | None = None,
+        text_search_config: TextSearchConfig | None = None,
+    ) -> None:
         """Initialize with connection pool.
 
         Args:
             pool: PostgreSQL connection pool
+            ann_config: Vector search tuning (defaults if not provided)
+            text_search_config: Full-text search settings (defaults if not provided)
         """
         self._pool = pool
+        self._ann_config = ann_config or AnnSearchConfig()
+        self._text_search_config = text_search_config or TextSearchConfig()
 
     # Episode operations
     async def add_episode(self, episode: Episode) -> UUID:
         """Add an episode to the store."""
         try:
-            async with self._pool.acquire() as conn:
+            async with self._pool.acquire() as conn, conn.transaction():
                 embedding_str = self._embedding_to_pgvector(episode.embedding)
                 await conn.execute(
                     """
                     INSERT INTO episodes (
                         id, group_id, content, content_type, source,
                         source_metadata, occurred_at, recorded_at,
-                        embedding, embedding_model, entity_ids
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+                        embedding, embedding_model, entity_ids,
+                        text_search_config
+                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12::regconfig)
                     """,
                     episode.id,
                     episode.group_id,
@@ -56,7 +125,29 @@ class PostgresMemoryStore(MemoryStore):
                     embedding_str,
                     episode.embedding_model,
                     [str(eid) for eid in episode.entity_ids],
+                    self._regconfig(episode.source_metadata.get("language")),
                 )
+
+                # Counters are updated in the same transaction as the insert
+                turns = 1 if episode.content_type in TURN_CONTENT_TYPES else 0
+                summaries = 1 if episode.content_type == "summary" else 0
+                if turns or summaries:
+                    await conn.execute(
+                        """
+                        INSERT INTO memory_group_counters (
+                            group_id, total_turns, unsummarized_turns,
+                            summaries_since_meta
+                        ) VALUES ($1, $2, $2, $3)
+                        ON CONFLICT (group_id) DO UPDATE SET
+                            total_turns = memory_group_counters.total_turns + $2,
+                            unsummarized_turns = memory_group_counters.unsummarized_turns + $2,
+                            summaries_since_meta = memory_group_counters.summaries_since_meta + $3,
+                            updated_at = NOW()
+                        """,
+                        episode.group_id,
+                        turns,
+                        summaries,
+                    )
                 logger.debug("episode_added", episode_id=str(episode.id))
                 return episode.id
         except Exception as e:
@@ -89,7 +180,14 @@ class PostgresMemoryStore(MemoryStore):
             )
             raise ConnectionError(f"Failed to get episode: {e}", cause=e) from e
 
-    async def get_episodes(self, group_id: str, *, limit: int = 100) -> list[Episode]:
+    async def get_episodes(
+        self,
+        group_id: str,
+        *,
+        limit: int = 100,
+        offset: int = 0,
+        content_types: Sequence[str] | None = None,
+    ) -> list[Episode]:
         """Get episodes for a group."""
         try:
             async with self._pool.acquire() as conn:
@@ -100,11 +198,14 @@ class PostgresMemoryStore(MemoryStore):
                            embedding, embedding_model, entity_ids
                     FROM episodes
                     WHERE group_id = $1
+                      AND ($4::text[] IS NULL OR content_type = ANY($4::text[]))
                     ORDER BY occurred_at DESC
-                    LIMIT $2
+                    LIMIT $2 OFFSET $3
                     """,
                     group_id,
                     limit,
+                    offset,
+                    list(content_types) if content_types is not None else None,
                 )
                 return [self._row_to_episode(row) for row in rows]
         except Exception as e:
@@ -124,27 +225,17 @@ class PostgresMemoryStore(MemoryStore):
         """Search episodes by vector similarity using pgvector."""
         try:
             async with self._pool.acquire() as conn:
-                embedding_str = f"[{','.join(map(str, query_embedding))}]"
-
-                rows = await conn.fetch(
-                    """
-                    SELECT id, group_id, content, content_type, source,
-                           source_metadata, occurred_at, recorded_at,
-                           embedding, embedding_model, entity_ids,
-                           1 - (embedding <=> $1::vector) AS score
-                    FROM episodes
-                    WHERE group_id = $2
-                      AND embedding IS NOT NULL
-                      AND 1 - (embedding <=> $1::vector) >= $3
-                    ORDER BY score DESC
-                    LIMIT $4
-                    """,
-                    embedding_str,
+                results = await ann_search(
+                    conn,
+                    _EPISODE_SEARCH_SQL,
+                    query_embedding,
                     group_id,
-                    min_score,
-                    limit,
+                    limit=limit,
+                    min_score=min_score,
+                    config=self._ann_config,
+                    table="episodes",
                 )
-                return [(self._row_to_episode(row), row["score"]) for row in rows]
+                return [(self._row_to_episode(row), score) for row, score in results]
         except Exception as e:
             logger.error(
                 "postgres_vector_search_episodes_error",
@@ -153,31 +244,67 @@ class PostgresMemoryStore(MemoryStore):
             )
             raise ConnectionError(f"Failed to search episodes: {e}", cause=e) from e
 
+    async def create_tenant_vector_index(self, tenant_id: str) -> None:
+        """Build a dedicated episode vector index for a large tenant.
+
+        Runs CREATE INDEX CONCURRENTLY, so it can take a while but does not
+        block writes. Safe to call again once the index exists.
+
+        Args:
+            tenant_id: Tenant part of the episodes' group_id
+        """
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.execute(
+                    tenant_index_sql("episodes", "embedding", "tenant_key", tenant_id)
+                )
+                logger.info("episode_tenant_index_created", tenant_id=tenant_id)
+        except Exception as e:
+            logger.error(
+                "postgres_create_tenant_index_error", tenant_id=tenant_id, error=str(e)
+            )
+            raise ConnectionError(f"Failed to create tenant index: {e}", cause=e) from e
+
     async def text_search_episodes(
         self,
         query: str,
         group_id: str,
         *,
         limit: int = 10,
+        language: str | None = None,
     ) -> list[Episode]:
-        """Search episodes by text content using ILIKE."""
+        """Search episodes with full-text search, ranked by ts_rank_cd.
+
+        With fuzzy_fallback enabled, short results are filled with trigram
+        word-similarity matches (typos, partial words).
+        """
         try:
             async with self._pool.acquire() as conn:
                 rows = await conn.fetch(
-                    """
-                    SELECT id, group_id, content, content_type, source,
-                           source_metadata, occurred_at, recorded_at,
-                           embedding, embedding_model, entity_ids
-                    FROM episodes
-                    WHERE group_id = $1 AND content ILIKE $2
-                    ORDER BY occurred_at DESC
-                    LIMIT $3
-                    """,
+                    _EPISODE_TEXT_SEARCH_SQL,
                     group_id,
-                    f"%{query}%",
+                    self._regconfig(language),
+                    query,
                     limit,
                 )
-                return [self._row_to_episode(row) for row in rows]
+                episodes = [self._row_to_episode(row) for row in rows]
+
+                if self._text_search_config.fuzzy_fallback and len(episodes) < limit:
+                    async with conn.transaction():
+                        await conn.execute(
+                            "SET LOCAL pg_trgm.word_similarity_threshold = "
+                            f"{float(self._text_search_config.fuzzy_threshold)}"
+                        )
+                        fuzzy_rows = await conn.fetch(
+                            _EPISODE_FUZZY_SEARCH_SQL,
+                            group_id,
+                            query,
+                            [episode.id for episode in episodes],
+                            limit - len(episodes),
+                        )
+                    episodes.extend(self._row_to_episode(row) for row in fuzzy_rows)
+
+                return episodes
         except Exception as e:
             logger.error(
                 "postgres_text_search_episodes_error",
@@ -186,6 +313,54 @@ class PostgresMemoryStore(MemoryStore):
             )
             raise ConnectionError(f"Failed to search episodes: {e}", cause=e) from e
 
+    async def hybrid_search_episodes(
+        self,
+        query_embedding: list[float],
+        query_text: str,
+        group_id: str,
+        *,
+        limit: int = 10,
+        language: str | None = None,
+    ) -> list[tuple[Episode, float, float]]:
+        """Fuse vector and full-text candidates and score both legs.
+
+        The vector leg goes through ann_search, so it widens the index scan
+        when the group filter starves it; the text leg and the scoring of
+        every candidate run in one query.
+        """
+        try:
+            async with self._pool.acquire() as conn:
+                nearest = await ann_search(
+                    conn,
+                    _EPISODE_SEARCH_SQL,
+                    query_embedding,
+                    group_id,
+                    limit=limit,
+                    min_score=0.0,
+                    config=self._ann_config,
+                    table="episodes",
+                )
+                rows = await conn.fetch(
+                    _EPISODE_HYBRID_SEARCH_SQL,
+                    self._embedding_to_pgvector(query_embedding),
+                    group_id,
+                    self._regconfig(language),
+                    query_text,
+                    limit,
+                    [row["id"] for row, _score in nearest],
+                )
+                return [
+                    (self._row_to_episode(row), row["vector_score"], row["text_score"])
+                    for row in rows
+                ]
+        except Exception as e:
+            logger.error(
+                "postgres_hybrid_search_episodes_error",
+                group_id=group_id,
+                error=str(e),
+            )
+            raise ConnectionError(f"Failed to search episodes: {e}", cause=e) from e
+
     async def delete_episode(self, group_id: str, episode_id: UUID) -> bool:
         """Delete an episode."""
         try:
@@ -210,6 +385,63 @@ class PostgresMemoryStore(MemoryStore):
             )
             raise ConnectionError(f"Failed to delete episode: {e}", cause=e) from e
 
+    # Summarization counters
+    async def get_summary_counters(self, group_id: str) -> SummaryCounters:
+        """Get a group's summary counters."""
+        try:
+            async with self._pool.acquire() as conn:
+                row = await conn.fetchrow(
+                    """
+                    SELECT group_id, total_turns, unsummarized_turns, summaries_since_meta
+                    FROM memory_group_counters
+                    WHERE group_id = $1
+                    """,
+                    group_id,
+                )
+                if row is None:
+                    return SummaryCounters(group_id=group_id)
+                return SummaryCounters(**dict(row))
+        except Exception as e:
+            logger.error(
+                "postgres_get_summary_counters_error", group_id=group_id, error=str(e)
+            )
+            raise ConnectionError(f"Failed to get summary counters: {e}", cause=e) from e
+
+    async def consume_summary_counters(
+        self,
+        group_id: str,
+        *,
+        turns: int = 0,
+        summaries: int = 0,
+    ) -> SummaryCounters | None:
+        """Claim pending turns and/or summaries with a conditional update."""
+        try:
+            async with self._pool.acquire() as conn:
+                row = await conn.fetchrow(
+                    """
+                    UPDATE memory_group_counters
+                    SET unsummarized_turns = unsummarized_turns - $2,
+                        summaries_since_meta = summaries_since_meta - $3,
+                        updated_at = NOW()
+                    WHERE group_id = $1
+                      AND unsummarized_turns >= $2
+                      AND summaries_since_meta >= $3
+                    RETURNING group_id, total_turns, unsummarized_turns,
+                              summaries_since_meta
+                    """,
+                    group_id,
+                    turns,
+                    summaries,
+                )
+                return SummaryCounters(**dict(row)) if row else None
+        except Exception as e:
+            logger.error(
+                "postgres_consume_summary_counters_error", group_id=group_id, error=str(e)
+            )
+            raise ConnectionError(
+                f"Failed to consume summary counters: {e}", cause=e
+            ) from e
+
     # Entity operations
     async def add_entity(self, entity: Entity) -> UUID:
         """Add an entity to the store."""
@@ -579,9 +811,13 @@ class PostgresMemoryStore(MemoryStore):
 
     # Bulk operations
     async def delete_by_group(self, group_id: str) -> int:
-        """Delete all episodes, entities, and relationships for a group."""
+        """Delete all episodes, entities, and relationships for a group.
+
+        The group's summary counters go too, so a recreated group starts
+        counting from zero.
+        """
         try:
-            async with self._pool.acquire() as conn:
+            async with self._pool.acquire() as conn, conn.transaction():
                 total = 0
 
                 # Delete relationships first (FK constraint)
@@ -605,6 +841,11 @@ class PostgresMemoryStore(MemoryStore):
                 )
                 total += int(result.split()[-1])
 
+                await conn.execute(
+                    "DELETE FROM memory_group_counters WHERE group_id = $1",
+                    group_id,
+                )
+
                 logger.info("group_deleted", group_id=group_id, total_deleted=total)
                 return total
         except Exception as e:
@@ -614,6 +855,10 @@ class PostgresMemoryStore(MemoryStore):
             raise ConnectionError(f"Failed to delete by group: {e}", cause=e) from e
 
     # Helper methods
+    def _regconfig(self, language: str | None) -> str:
+        """Text search configuration for a language code."""
+        return regconfig_for_language(language, self._text_search_config.default_language)
+
     def _row_to_episode(self, row) -> Episode:
         """Convert database row to Episode model."""
         entity_ids = []
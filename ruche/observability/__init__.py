@@ -4,7 +4,13 @@ Provides standardized observability primitives using structlog for logging,
 OpenTelemetry for tracing, and Prometheus for metrics.
 """
 
-from ruche.observability.logging import PIIRedactor, get_logger, setup_logging
+from ruche.observability.logging import (
+    EventSampler,
+    PIIRedactor,
+    get_logger,
+    setup_logging,
+    setup_logging_from_config,
+)
 from ruche.observability.metrics import (
     ACTIVE_SESSIONS,
     ERRORS,
@@ -33,8 +39,10 @@ from ruche.observability.tracing import (
 __all__ = [
     # Logging
     "setup_logging",
+    "setup_logging_from_config",
     "get_logger",
     "PIIRedactor",
+    "EventSampler",
     # Metrics
     "setup_metrics",
     "REQUEST_COUNT",
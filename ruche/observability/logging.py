@@ -1,17 +1,34 @@
 """Structured logging configuration using structlog.
 
 Provides JSON logging for production and console logging for development,
-with automatic context binding and PII redaction.
+with automatic context binding and PII redaction. Lines can be written
+from a background thread so the event loop never blocks on stderr.
 """
 
+import atexit
+import contextlib
+import json
+import queue
+import random
 import re
 import sys
+import threading
 from collections.abc import MutableMapping
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, TextIO, cast
 
 import structlog
 from structlog.types import EventDict, WrappedLogger
 
+from ruche.observability.metrics import LOG_EVENTS_DROPPED
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from ruche.config.models.observability import LoggingConfig
+
 # Sensitive key names (O(1) lookup)
 SENSITIVE_KEYS: frozenset[str] = frozenset({
     "password",
@@ -44,15 +61,54 @@ EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
 PHONE_PATTERN = re.compile(r"\+?[\d\s\-\(\)]{10,}")
 SSN_PATTERN = re.compile(r"\d{3}-\d{2}-\d{4}")
 
+# Shortest string any built-in pattern can match (a@b.co); shorter values
+# are skipped unless custom patterns are configured
+_MIN_PII_LENGTH = 6
+
+_REDACTED = "[REDACTED]"
+
+
+def _build_pii_pattern(extra_patterns: list[str]) -> re.Pattern[str]:
+    """Combine all PII patterns into one alternation with named groups.
+
+    Alternatives are tried in the same order the individual substitutions
+    used to run (email, phone, SSN), so redaction output is unchanged.
+    """
+    parts = [
+        f"(?P<EMAIL>{EMAIL_PATTERN.pattern})",
+        f"(?P<PHONE>{PHONE_PATTERN.pattern})",
+        f"(?P<SSN>{SSN_PATTERN.pattern})",
+    ]
+    parts.extend(f"(?P<REDACTED_{i}>{pattern})" for i, pattern in enumerate(extra_patterns))
+    return re.compile("|".join(parts))
+
+
+def _replacement(match: re.Match[str]) -> str:
+    group = match.lastgroup or ""
+    return _REDACTED if group.startswith("REDACTED_") else f"[{group}]"
+
 
 class PIIRedactor:
     """Processor that redacts PII from log events.
 
     Uses two-tier approach:
     1. Key-name lookup via frozenset (O(1)) for known sensitive keys
-    2. Regex patterns on string values as fallback for accidental PII
+    2. One combined regex pass on string values as fallback for accidental PII
+
+    Containers are copied only when something inside them is redacted;
+    events without PII pass through without allocation.
     """
 
+    def __init__(self, extra_patterns: list[str] | None = None) -> None:
+        """Initialize the redactor.
+
+        Args:
+            extra_patterns: Additional regex patterns replaced with [REDACTED]
+        """
+        self._pattern = _build_pii_pattern(extra_patterns or [])
+        # Custom patterns may match strings shorter than any built-in one
+        self._min_length = 0 if extra_patterns else _MIN_PII_LENGTH
+
     def __call__(
         self,
         _logger: WrappedLogger,
@@ -62,49 +118,192 @@ class PIIRedactor:
         """Redact PII from event dictionary."""
         return cast(EventDict, self._redact_dict(event_dict))
 
-    def _redact_dict(self, data: MutableMapping[str, Any]) -> dict[str, Any]:
-        """Recursively redact PII from a dictionary."""
-        result: dict[str, Any] = {}
+    def _redact_dict(self, data: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
+        """Recursively redact PII from a dictionary (copy-on-write)."""
+        result: dict[str, Any] | None = None
         for key, value in data.items():
-            key_lower = key.lower()
-
-            # Check if key is sensitive
-            if key_lower in SENSITIVE_KEYS:
-                result[key] = "[REDACTED]"
-            elif isinstance(value, dict):
-                result[key] = self._redact_dict(value)
-            elif isinstance(value, str):
-                result[key] = self._redact_string(value)
-            elif isinstance(value, list):
-                result[key] = self._redact_list(value)
+            if key.lower() in SENSITIVE_KEYS:
+                redacted: Any = _REDACTED
             else:
-                result[key] = value
+                redacted = self._redact_value(value)
+            if redacted is not value:
+                if result is None:
+                    result = dict(data)
+                result[key] = redacted
 
-        return result
+        return data if result is None else result
 
-    def _redact_string(self, value: str) -> str:
-        """Redact PII patterns from a string."""
-        # Replace email patterns
-        value = EMAIL_PATTERN.sub("[EMAIL]", value)
-        # Replace phone patterns
-        value = PHONE_PATTERN.sub("[PHONE]", value)
-        # Replace SSN patterns
-        value = SSN_PATTERN.sub("[SSN]", value)
+    def _redact_value(self, value: Any) -> Any:
+        if isinstance(value, str):
+            return self._redact_string(value)
+        if isinstance(value, dict):
+            return self._redact_dict(value)
+        if isinstance(value, list):
+            return self._redact_list(value)
         return value
 
+    def _redact_string(self, value: str) -> str:
+        """Redact PII patterns from a string (returns the input if clean)."""
+        if len(value) < self._min_length or self._pattern.search(value) is None:
+            return value
+        return self._pattern.sub(_replacement, value)
+
     def _redact_list(self, items: list[Any]) -> list[Any]:
-        """Redact PII from list items."""
-        result: list[Any] = []
-        for item in items:
-            if isinstance(item, dict):
-                result.append(self._redact_dict(item))
-            elif isinstance(item, str):
-                result.append(self._redact_string(item))
-            elif isinstance(item, list):
-                result.append(self._redact_list(item))
+        """Redact PII from list items (copy-on-write)."""
+        result: list[Any] | None = None
+        for i, item in enumerate(items):
+            redacted = self._redact_value(item)
+            if redacted is not item:
+                if result is None:
+                    result = list(items)
+                result[i] = redacted
+        return items if result is None else result
+
+
+class EventSampler:
+    """Processor that keeps only a fraction of selected high-volume events.
+
+    Events not listed in rates are always kept. Should run first in the
+    processor chain so dropped events cost nothing further.
+    """
+
+    def __init__(self, rates: dict[str, float]) -> None:
+        """Initialize the sampler.
+
+        Args:
+            rates: Event name -> keep probability (0.0-1.0)
+        """
+        self._rates = dict(rates)
+
+    def __call__(
+        self,
+        _logger: WrappedLogger,
+        _method_name: str,
+        event_dict: EventDict,
+    ) -> EventDict:
+        """Drop the event with probability 1 - rate."""
+        rate = self._rates.get(event_dict.get("event", ""))
+        if rate is not None and random.random() >= rate:
+            LOG_EVENTS_DROPPED.labels(reason="sampled").inc()
+            raise structlog.DropEvent
+        return event_dict
+
+
+# =============================================================================
+# Serialization and output
+# =============================================================================
+
+
+def _json_dumps(obj: Any, default: Any = None, **_kwargs: Any) -> str:
+    """JSON serializer for JSONRenderer; uses orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=default or str,
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    return json.dumps(obj, default=default or str)
+
+
+class QueuedLogWriter:
+    """Writes rendered log lines to a stream from a background thread.
+
+    The calling thread only enqueues; formatting I/O happens off the event
+    loop. When the queue is full, the "drop" policy discards the line (and
+    counts it), while "block" makes the caller wait for space.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        max_queue_size: int = 10000,
+        overflow_policy: str = "drop",
+    ) -> None:
+        """Start the writer thread.
+
+        Args:
+            stream: Output stream
+            max_queue_size: Maximum buffered lines
+            overflow_policy: "drop" or "block"
+        """
+        self._stream = stream
+        self._queue: queue.Queue[str | None] = queue.Queue(maxsize=max_queue_size)
+        self._block = overflow_policy == "block"
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, line: str) -> None:
+        """Enqueue a line for writing."""
+        try:
+            if self._block:
+                self._queue.put(line)
             else:
-                result.append(item)
-        return result
+                self._queue.put_nowait(line)
+        except queue.Full:
+            LOG_EVENTS_DROPPED.labels(reason="queue_full").inc()
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Wait until all queued lines have been written."""
+        # Queue.join() without a timeout: wait on the condition it uses
+        done = self._queue.all_tasks_done
+        with done:
+            done.wait_for(lambda: not self._queue.unfinished_tasks, timeout=timeout)
+
+    def close(self) -> None:
+        """Flush and stop the writer thread."""
+        if not self._thread.is_alive():
+            return
+        # Late writes after shutdown must never block the caller
+        self._block = False
+        self._queue.put(None)
+        self._thread.join(timeout=5.0)
+
+    def _run(self) -> None:
+        while True:
+            line = self._queue.get()
+            try:
+                if line is None:
+                    return
+                self._stream.write(line + "\n")
+                if self._queue.empty():
+                    self._stream.flush()
+            except Exception as e:
+                # The logging pipeline itself is broken; report on the
+                # interpreter's original stderr rather than losing it silently
+                LOG_EVENTS_DROPPED.labels(reason="write_error").inc()
+                if sys.__stderr__ is not None:
+                    with contextlib.suppress(Exception):
+                        sys.__stderr__.write(f"log writer failed: {e!r}\n")
+            finally:
+                self._queue.task_done()
+
+
+class QueuedLogger:
+    """structlog logger that hands rendered lines to a QueuedLogWriter."""
+
+    def __init__(self, writer: QueuedLogWriter) -> None:
+        self._writer = writer
+
+    def msg(self, message: str) -> None:
+        """Enqueue a rendered message."""
+        self._writer.write(message)
+
+    log = debug = info = warn = warning = msg
+    fatal = failure = err = error = critical = exception = msg
+
+
+class QueuedLoggerFactory:
+    """Logger factory sharing one background writer across loggers."""
+
+    def __init__(self, writer: QueuedLogWriter) -> None:
+        self._logger = QueuedLogger(writer)
+
+    def __call__(self, *_args: Any) -> QueuedLogger:
+        return self._logger
+
+
+_writer: QueuedLogWriter | None = None
 
 
 def setup_logging(
@@ -112,6 +311,12 @@ def setup_logging(
     format: str = "json",
     redact_pii: bool = True,
     _include_trace_id: bool = True,  # Reserved for future trace ID injection
+    *,
+    redact_patterns: list[str] | None = None,
+    async_writer: bool = False,
+    queue_size: int = 10000,
+    overflow_policy: str = "drop",
+    sample_rates: dict[str, float] | None = None,
 ) -> None:
     """Configure structured logging.
 
@@ -120,21 +325,31 @@ def setup_logging(
         format: Output format - "json" for production, "console" for development
         redact_pii: Whether to redact PII from logs
         include_trace_id: Whether to include trace_id in logs
+        redact_patterns: Additional regex patterns to redact
+        async_writer: Write lines from a background thread
+        queue_size: Maximum lines buffered by the background writer
+        overflow_policy: "drop" or "block" when the writer queue is full
+        sample_rates: Per-event keep probability for high-volume events
     """
+    global _writer
+
     # Build processor chain
-    processors: list[Any] = [
+    processors: list[Any] = []
+    if sample_rates:
+        processors.append(EventSampler(sample_rates))
+    processors.extend([
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
-    ]
+    ])
 
     # Add PII redaction if enabled
     if redact_pii:
-        processors.append(PIIRedactor())
+        processors.append(PIIRedactor(redact_patterns))
 
     # Add final renderer based on format
     if format == "json":
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(structlog.processors.JSONRenderer(serializer=_json_dumps))
     else:
         # Console format for development
         processors.append(structlog.dev.ConsoleRenderer(colors=True))
@@ -149,15 +364,39 @@ def setup_logging(
     }
     level_num = level_map.get(level.upper(), 20)
 
+    logger_factory: Any
+    if async_writer:
+        # One writer per process: loggers cached before a reconfigure keep
+        # writing through it, so it is never replaced or closed early.
+        if _writer is None:
+            _writer = QueuedLogWriter(sys.stderr, queue_size, overflow_policy)
+        logger_factory = QueuedLoggerFactory(_writer)
+    else:
+        logger_factory = structlog.PrintLoggerFactory(sys.stderr)
+
     structlog.configure(
         processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(level_num),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(sys.stderr),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
 
+def setup_logging_from_config(config: "LoggingConfig") -> None:
+    """Configure structured logging from a LoggingConfig."""
+    setup_logging(
+        level=config.level,
+        format=config.format,
+        redact_pii=config.redact_pii,
+        redact_patterns=config.redact_patterns,
+        async_writer=config.async_writer,
+        queue_size=config.queue_size,
+        overflow_policy=config.overflow_policy,
+        sample_rates=config.sample_rates,
+    )
+
+
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """Get a logger instance bound to the given name.
 
@@ -337,6 +337,134 @@ PERSISTENCE_PARALLEL_SAVINGS = Histogram(
     buckets=(0.0, 0.01, 0.025, 0.05, 0.1, 0.15, 0.2, 0.3, 0.5),
 )
 
+# Turn pipeline phase scheduling metrics
+PHASE_SPECULATION = Counter(
+    "focal_phase_speculation_total",
+    "Speculative phase executions by outcome",
+    labelnames=["phase", "outcome"],  # hit, discarded, error
+)
+
+PHASE_OVERLAP_SAVINGS = Histogram(
+    "focal_phase_overlap_savings_seconds",
+    "Time saved per turn by overlapping independent pipeline phases",
+    buckets=(0.0, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+LLM_RESPONSE_CACHE = Counter(
+    "focal_llm_response_cache_total",
+    "LLM response cache lookups by step and result",
+    ["step", "result"],  # l1_hit, l2_hit, miss
+)
+
+LLM_PROMPT_TOKENS = Counter(
+    "focal_llm_prompt_tokens_total",
+    "Prompt tokens reported by providers, split by prompt cache usage",
+    ["step", "kind"],  # input, cache_read, cache_write
+)
+
+LOG_EVENTS_DROPPED = Counter(
+    "focal_log_events_dropped_total",
+    "Log events not written, by reason",
+    ["reason"],  # sampled, queue_full, write_error
+)
+
+STARTUP_WARMUP_DURATION = Histogram(
+    "focal_startup_warmup_seconds",
+    "Duration of startup warm-up stages",
+    ["stage"],  # stores, embeddings, agents
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+ANN_SEARCH_ROUNDS = Histogram(
+    "focal_ann_search_rounds",
+    "pgvector search rounds per query (more than 1 means the filter starved the index scan)",
+    ["table"],
+    buckets=(1, 2, 3, 4, 5),
+)
+
+AUDIT_RECORDS = Counter(
+    "focal_audit_records_total",
+    "Audit records handled by the batch writer",
+    ["kind", "outcome"],  # turn/event; written, spilled, dropped
+)
+
+AUDIT_FLUSH_DURATION = Histogram(
+    "focal_audit_flush_seconds",
+    "Duration of audit batch flushes",
+    ["method"],  # copy, insert
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+SESSION_PERSIST_BYTES = Histogram(
+    "focal_session_persist_bytes",
+    "Serialized size of a session save",
+    ["mode"],  # delta, snapshot
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576),
+)
+
+EMBEDDING_JOBS = Counter(
+    "focal_embedding_jobs_total",
+    "Embedding jobs handled by the embedding worker",
+    ["entity_type", "outcome"],  # embedded, stale, missing, retried, dropped
+)
+
+EMBEDDING_JOB_BATCH_SIZE = Histogram(
+    "focal_embedding_job_batch_size",
+    "Jobs embedded together per worker claim",
+    buckets=(1, 5, 10, 50, 100, 250, 500, 1000, 2500),
+)
+
+
+SESSION_MUTEX_WAIT = Histogram(
+    "focal_session_mutex_wait_seconds",
+    "Time to acquire the ACF session mutex",
+    ["outcome"],  # acquired, timeout
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+SESSION_MUTEX_WAKEUPS = Counter(
+    "focal_session_mutex_wakeups_total",
+    "Session mutex waiters woken by a release or by lease expiry",
+    ["reason"],  # released, expired
+)
+
+SESSION_MUTEX_LEASE_LOST = Counter(
+    "focal_session_mutex_lease_lost_total",
+    "Session mutex leases that expired or were taken over while held",
+)
+
+
+ACF_LISTENER_LAG = Histogram(
+    "focal_acf_listener_lag_seconds",
+    "Time ACF events wait in a listener queue before delivery",
+    ["listener"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+
+ACF_LISTENER_DROPPED = Counter(
+    "focal_acf_listener_dropped_total",
+    "ACF events dropped because a listener queue was full",
+    ["listener", "policy"],  # drop_oldest, drop_newest
+)
+
+ACF_LISTENER_QUEUE_DEPTH = Gauge(
+    "focal_acf_listener_queue_depth",
+    "ACF events waiting in a listener queue",
+    ["listener"],
+)
+
+ACF_HANDOFF_BYTES = Histogram(
+    "focal_acf_handoff_bytes",
+    "Encoded size of step state handed off through Redis",
+    ["step"],
+    buckets=[256, 1024, 4096, 16384, 65536, 262144, 1048576],
+)
+
+ACF_AFFINITY_SHARDS_OWNED = Gauge(
+    "focal_acf_affinity_shards_owned",
+    "Session shards owned by this worker",
+)
+
 
 def setup_metrics() -> None:
     """Initialize metrics configuration.
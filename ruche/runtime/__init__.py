@@ -36,77 +36,73 @@ Key Architectural Principles:
 - Toolbox owns TOOL EXECUTION (semantics, enforcement, audit)
 """
 
-# ACF exports
-from ruche.runtime.acf import (
-    ACFEvent,
-    ACFEventType,
-    AccumulationHint,
-    CommitPointTracker,
-    FabricTurnContext,
-    FabricTurnContextImpl,
-    LogicalTurn,
-    LogicalTurnStatus,
-    LogicalTurnWorkflow,
-    MessageShape,
-    PhaseArtifact,
-    ScenarioStepRef,
-    SessionMutex,
-    SideEffect,
-    SideEffectPolicy,
-    SupersedeAction,
-    SupersedeCoordinator,
-    SupersedeDecision,
-    TurnManager,
-    UserCadenceStats,
-    build_session_key,
-    build_tool_idempotency_key,
-)
-
-# Agent exports
-from ruche.runtime.agent import (
-    AgentCapabilities,
-    AgentContext,
-    AgentMetadata,
-    AgentRuntime,
-)
-
-# Agenda exports (models from domain layer)
-from ruche.domain.agenda import (
-    ScheduledTask,
-    Task,
-    TaskPriority,
-    TaskStatus,
-    TaskType,
-)
-from ruche.runtime.agenda import (
-    AgendaScheduler,
-    TaskWorkflow,
-)
+from typing import TYPE_CHECKING
 
-# Brain exports
-from ruche.runtime.brain import (
-    Brain,
-    SupersedeCapable,
-    SupersedeDecision as BrainSupersede,
-)
+from ruche.utils.lazy import lazy_exports
 
-# Toolbox exports
-from ruche.runtime.toolbox import (
-    IdempotencyCache,
-    PlannedToolExecution,
-    ResolvedTool,
-    SideEffectPolicy as ToolboxSideEffectPolicy,
-    SideEffectRecord,
-    ToolActivation,
-    ToolDefinition,
-    ToolExecutionContext,
-    ToolExecutionError,
-    ToolGateway,
-    ToolMetadata,
-    ToolProvider,
-    ToolResult,
-    Toolbox,
-)
+if TYPE_CHECKING:
+    from ruche.runtime.acf import (
+        ACFEvent,
+        ACFEventType,
+        AccumulationHint,
+        CommitPointTracker,
+        FabricTurnContext,
+        FabricTurnContextImpl,
+        LogicalTurn,
+        LogicalTurnStatus,
+        LogicalTurnWorkflow,
+        MessageShape,
+        PhaseArtifact,
+        ScenarioStepRef,
+        SessionMutex,
+        SideEffect,
+        SideEffectPolicy,
+        SupersedeAction,
+        SupersedeCoordinator,
+        SupersedeDecision,
+        TurnManager,
+        UserCadenceStats,
+        build_session_key,
+        build_tool_idempotency_key,
+    )
+    from ruche.runtime.agent import (
+        AgentCapabilities,
+        AgentContext,
+        AgentMetadata,
+        AgentRuntime,
+    )
+    from ruche.domain.agenda import (
+        ScheduledTask,
+        Task,
+        TaskPriority,
+        TaskStatus,
+        TaskType,
+    )
+    from ruche.runtime.agenda import (
+        AgendaScheduler,
+        TaskWorkflow,
+    )
+    from ruche.runtime.brain import (
+        Brain,
+        SupersedeCapable,
+        SupersedeDecision as BrainSupersede,
+    )
+    from ruche.runtime.toolbox import (
+        IdempotencyCache,
+        PlannedToolExecution,
+        ResolvedTool,
+        SideEffectPolicy as ToolboxSideEffectPolicy,
+        SideEffectRecord,
+        ToolActivation,
+        ToolDefinition,
+        ToolExecutionContext,
+        ToolExecutionError,
+        ToolGateway,
+        ToolMetadata,
+        ToolProvider,
+        ToolResult,
+        Toolbox,
+    )
 
 __all__ = [
     # ACF - Core models
@@ -169,3 +165,60 @@ __all__ = [
     "ToolExecutionError",
     "IdempotencyCache",
 ]
+
+# Resolved on first access (PEP 562) so importing this package stays cheap
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ACFEvent": "ruche.runtime.acf",
+        "ACFEventType": "ruche.runtime.acf",
+        "AccumulationHint": "ruche.runtime.acf",
+        "CommitPointTracker": "ruche.runtime.acf",
+        "FabricTurnContext": "ruche.runtime.acf",
+        "FabricTurnContextImpl": "ruche.runtime.acf",
+        "LogicalTurn": "ruche.runtime.acf",
+        "LogicalTurnStatus": "ruche.runtime.acf",
+        "LogicalTurnWorkflow": "ruche.runtime.acf",
+        "MessageShape": "ruche.runtime.acf",
+        "PhaseArtifact": "ruche.runtime.acf",
+        "ScenarioStepRef": "ruche.runtime.acf",
+        "SessionMutex": "ruche.runtime.acf",
+        "SideEffect": "ruche.runtime.acf",
+        "SideEffectPolicy": "ruche.runtime.acf",
+        "SupersedeAction": "ruche.runtime.acf",
+        "SupersedeCoordinator": "ruche.runtime.acf",
+        "SupersedeDecision": "ruche.runtime.acf",
+        "TurnManager": "ruche.runtime.acf",
+        "UserCadenceStats": "ruche.runtime.acf",
+        "build_session_key": "ruche.runtime.acf",
+        "build_tool_idempotency_key": "ruche.runtime.acf",
+        "AgentCapabilities": "ruche.runtime.agent",
+        "AgentContext": "ruche.runtime.agent",
+        "AgentMetadata": "ruche.runtime.agent",
+        "AgentRuntime": "ruche.runtime.agent",
+        "ScheduledTask": "ruche.domain.agenda",
+        "Task": "ruche.domain.agenda",
+        "TaskPriority": "ruche.domain.agenda",
+        "TaskStatus": "ruche.domain.agenda",
+        "TaskType": "ruche.domain.agenda",
+        "AgendaScheduler": "ruche.runtime.agenda",
+        "TaskWorkflow": "ruche.runtime.agenda",
+        "Brain": "ruche.runtime.brain",
+        "SupersedeCapable": "ruche.runtime.brain",
+        "BrainSupersede": "ruche.runtime.brain:SupersedeDecision",
+        "IdempotencyCache": "ruche.runtime.toolbox",
+        "PlannedToolExecution": "ruche.runtime.toolbox",
+        "ResolvedTool": "ruche.runtime.toolbox",
+        "ToolboxSideEffectPolicy": "ruche.runtime.toolbox:SideEffectPolicy",
+        "SideEffectRecord": "ruche.runtime.toolbox",
+        "ToolActivation": "ruche.runtime.toolbox",
+        "ToolDefinition": "ruche.runtime.toolbox",
+        "ToolExecutionContext": "ruche.runtime.toolbox",
+        "ToolExecutionError": "ruche.runtime.toolbox",
+        "ToolGateway": "ruche.runtime.toolbox",
+        "ToolMetadata": "ruche.runtime.toolbox",
+        "ToolProvider": "ruche.runtime.toolbox",
+        "ToolResult": "ruche.runtime.toolbox",
+        "Toolbox": "ruche.runtime.toolbox",
+    },
+)
@@ -15,8 +15,10 @@ Key Principle: ACF owns WHEN and HOW (timing, coordination, safety).
 CognitivePipeline owns WHAT (decisions, semantics, behavior).
 """
 
+from ruche.runtime.acf.affinity import SessionAffinity, ShardRing
+from ruche.runtime.acf.cadence import CadenceSketch, TypingCadenceStore
 from ruche.runtime.acf.commit_point import CommitPointTracker
-from ruche.runtime.acf.event_router import EventListener, EventRouter
+from ruche.runtime.acf.event_router import EventListener, EventRouter, OverflowPolicy
 from ruche.runtime.acf.events import ACFEvent, ACFEventType
 from ruche.runtime.acf.gateway import (
     ActiveTurnIndex,
@@ -25,6 +27,7 @@ from ruche.runtime.acf.gateway import (
     TurnDecision,
     TurnGateway,
 )
+from ruche.runtime.acf.handoff import TurnStateExpiredError, TurnStateStore
 from ruche.runtime.acf.models import (
     AccumulationHint,
     FabricTurnContext,
@@ -40,7 +43,7 @@ from ruche.runtime.acf.models import (
     SupersedeDecision,
 )
 from ruche.runtime.acf.turn_manager import UserCadenceStats
-from ruche.runtime.acf.mutex import SessionMutex, build_session_key
+from ruche.runtime.acf.mutex import MutexLease, SessionMutex, build_session_key
 from ruche.runtime.acf.supersede import (
     SupersedeCoordinator,
     build_tool_idempotency_key,
@@ -70,14 +73,22 @@ __all__ = [
     "ACFEventType",
     "EventListener",
     "EventRouter",
+    "OverflowPolicy",
     # Gateway models
     "TurnAction",
     "TurnDecision",
     # Components
     "SessionMutex",
+    "MutexLease",
     "TurnManager",
     "SupersedeCoordinator",
     "CommitPointTracker",
+    "TypingCadenceStore",
+    "CadenceSketch",
+    "TurnStateStore",
+    "TurnStateExpiredError",
+    "ShardRing",
+    "SessionAffinity",
     "LogicalTurnWorkflow",
     "TurnGateway",
     "ActiveTurnIndex",
@@ -0,0 +1,238 @@
+"""Session-affine worker routing.
+
+Pins every conversation to one worker so concurrent turns of a session
+meet on a local lock instead of contending on the Redis mutex across
+hosts.
+
+- Session keys hash onto a fixed number of shards, so a session never
+  changes shard.
+- Shards are assigned to the live workers by rendezvous (highest random
+  weight) hashing: when a worker joins or leaves, only the shards it gains
+  or loses move, and every process computes the same owner without
+  coordination.
+- Workers announce themselves in a Redis sorted set scored by heartbeat
+  expiry; a worker that stops refreshing drops out of the ring.
+- The gateway stamps each turn with its shard and owning worker, and the
+  dispatcher routes it to that worker's queue.
+- Owning workers serialize turns of a session with a local lock before
+  taking the Redis mutex (which still excludes other hosts).
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import time
+import weakref
+
+from redis.asyncio import Redis
+
+from ruche.observability.logging import get_logger
+from ruche.observability.metrics import ACF_AFFINITY_SHARDS_OWNED
+
+logger = get_logger(__name__)
+
+
+def _hash64(value: str) -> int:
+    """Stable 64-bit hash (independent of PYTHONHASHSEED)."""
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+def shard_for(session_key: str, num_shards: int) -> int:
+    """Shard of a session key."""
+    return _hash64(session_key) % num_shards
+
+
+def rendezvous_owner(shard: int, workers: "list[str] | tuple[str, ...]") -> str | None:
+    """Worker with the highest weight for a shard, or None without workers."""
+    if not workers:
+        return None
+    return max(workers, key=lambda worker: (_hash64(f"{worker}/{shard}"), worker))
+
+
+class ShardRing:
+    """Read-only view of worker membership and shard ownership.
+
+    Used by the gateway to route turns; SessionAffinity extends it for
+    the workers themselves.
+
+    Membership key format: {prefix} (sorted set, score = heartbeat expiry)
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        num_shards: int = 256,
+        refresh_interval_seconds: float = 5.0,
+        key_prefix: str = "acf:workers",
+    ) -> None:
+        """Initialize ring.
+
+        Args:
+            redis: Redis client instance
+            num_shards: Number of shards session keys hash onto
+            refresh_interval_seconds: Maximum age of the membership view
+            key_prefix: Redis key of the membership set
+        """
+        self._redis = redis
+        self._num_shards = num_shards
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._members_key = key_prefix
+        self._workers: tuple[str, ...] = ()
+        self._refreshed_at: float | None = None
+
+    @property
+    def num_shards(self) -> int:
+        """Number of shards."""
+        return self._num_shards
+
+    @property
+    def workers(self) -> tuple[str, ...]:
+        """Live workers as of the last refresh."""
+        return self._workers
+
+    def shard_for(self, session_key: str) -> int:
+        """Shard of a session key."""
+        return shard_for(session_key, self._num_shards)
+
+    def owner_of(self, shard: int) -> str | None:
+        """Worker owning a shard, or None if no worker is live."""
+        return rendezvous_owner(shard, self._workers)
+
+    async def refresh(self) -> tuple[str, ...]:
+        """Reload the live workers from Redis.
+
+        Returns:
+            Live worker IDs, sorted
+        """
+        members = await self._redis.zrangebyscore(self._members_key, time.time(), "+inf")
+        self._workers = tuple(sorted(m.decode() if isinstance(m, bytes) else m for m in members))
+        self._refreshed_at = time.monotonic()
+        return self._workers
+
+    async def route(self, session_key: str) -> tuple[int, str | None]:
+        """Shard and owning worker of a session.
+
+        Membership is reloaded when older than refresh_interval_seconds.
+
+        Returns:
+            (shard, worker ID or None if no worker is live)
+        """
+        if (
+            self._refreshed_at is None
+            or time.monotonic() - self._refreshed_at >= self._refresh_interval_seconds
+        ):
+            await self.refresh()
+        shard = self.shard_for(session_key)
+        return shard, self.owner_of(shard)
+
+
+class SessionAffinity(ShardRing):
+    """Worker-side membership, shard ownership and local locks."""
+
+    def __init__(
+        self,
+        redis: Redis,
+        worker_id: str,
+        num_shards: int = 256,
+        member_ttl_seconds: float = 15.0,
+        refresh_interval_seconds: float = 5.0,
+        key_prefix: str = "acf:workers",
+    ) -> None:
+        """Initialize affinity for this worker.
+
+        Args:
+            redis: Redis client instance
+            worker_id: Unique ID of this worker process
+            num_shards: Number of shards session keys hash onto
+            member_ttl_seconds: How long a heartbeat keeps the worker in the ring
+            refresh_interval_seconds: Seconds between heartbeats
+            key_prefix: Redis key of the membership set
+        """
+        super().__init__(
+            redis,
+            num_shards=num_shards,
+            refresh_interval_seconds=refresh_interval_seconds,
+            key_prefix=key_prefix,
+        )
+        self._worker_id = worker_id
+        self._member_ttl_seconds = member_ttl_seconds
+        self._owned: frozenset[int] = frozenset()
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def worker_id(self) -> str:
+        """ID of this worker."""
+        return self._worker_id
+
+    @property
+    def owned_shards(self) -> frozenset[int]:
+        """Shards this worker owned at the last refresh."""
+        return self._owned
+
+    def owns(self, shard: int) -> bool:
+        """Whether this worker owns a shard."""
+        return shard in self._owned
+
+    def local_lock(self, session_key: str) -> asyncio.Lock:
+        """In-process lock for a session (kept alive while referenced)."""
+        lock = self._locks.get(session_key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[session_key] = lock
+        return lock
+
+    async def refresh(self) -> tuple[str, ...]:
+        """Heartbeat, reload the ring and apply ownership changes.
+
+        Returns:
+            Live worker IDs, sorted
+        """
+        now = time.time()
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.zadd(self._members_key, {self._worker_id: now + self._member_ttl_seconds})
+        pipe.zremrangebyscore(self._members_key, "-inf", now)
+        await pipe.execute()
+
+        workers = await super().refresh()
+        owned = frozenset(
+            shard for shard in range(self._num_shards) if self.owner_of(shard) == self._worker_id
+        )
+        if owned != self._owned:
+            lost = self._owned - owned
+            logger.info(
+                "affinity_rebalanced",
+                worker_id=self._worker_id,
+                workers=len(workers),
+                owned_shards=len(owned),
+                gained_shards=len(owned - self._owned),
+                lost_shards=len(lost),
+            )
+            self._owned = owned
+            ACF_AFFINITY_SHARDS_OWNED.set(len(owned))
+        return workers
+
+    async def start(self) -> None:
+        """Join the ring and keep refreshing in the background."""
+        await self.refresh()
+
+        async def loop() -> None:
+            while True:
+                await asyncio.sleep(self._refresh_interval_seconds)
+                try:
+                    await self.refresh()
+                except Exception as e:
+                    logger.warning("affinity_refresh_failed", error=str(e))
+
+        self._task = asyncio.create_task(loop())
+
+    async def stop(self) -> None:
+        """Stop refreshing and leave the ring so shards move immediately."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self._redis.zrem(self._members_key, self._worker_id)
+        self._owned = frozenset()
+        ACF_AFFINITY_SHARDS_OWNED.set(0)
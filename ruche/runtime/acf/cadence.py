@@ -0,0 +1,206 @@
+"""Learned per-user typing cadence.
+
+Records the gaps between consecutive messages of an interlocutor on a
+channel and summarizes them as UserCadenceStats for
+TurnManager.suggest_wait_ms, so accumulation windows follow how a user
+actually types instead of the channel default. The gap before the first
+message of a turn counts too: a follow-up that just missed the window is
+what lets a slow typist's window grow. Only gaps of at most max_gap_ms
+are recorded, so pauses for the agent's reply and reading are not.
+
+Gaps are kept in a CadenceSketch: a log-bucketed histogram (DDSketch
+style, 5% relative accuracy) whose weights decay per sample, so a few
+dozen bytes of JSON hold recent quantiles for any gap from 10ms to
+minutes. Sketches live in Redis with a TTL refreshed on every message.
+"""
+
+import json
+import math
+from datetime import datetime
+
+from redis.asyncio import Redis
+
+from ruche.observability.logging import get_logger
+from ruche.runtime.acf.turn_manager import UserCadenceStats
+
+logger = get_logger(__name__)
+
+
+class CadenceSketch:
+    """Decayed quantile sketch of inter-message gaps.
+
+    Bucket i holds gaps in (GAMMA^(i-1), GAMMA^i] milliseconds, so any
+    quantile is returned within RELATIVE_ACCURACY of a true gap.
+    """
+
+    RELATIVE_ACCURACY = 0.05
+    GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+    MIN_GAP_MS = 10.0
+    # Buckets decayed below this weight are dropped to keep the sketch small
+    MIN_WEIGHT = 1e-3
+
+    def __init__(
+        self,
+        buckets: dict[int, float] | None = None,
+        count: int = 0,
+        last_at_ms: int | None = None,
+    ) -> None:
+        """Initialize sketch.
+
+        Args:
+            buckets: Bucket index -> decayed weight
+            count: Gaps recorded in total (not decayed)
+            last_at_ms: Epoch milliseconds of the latest message seen
+        """
+        self.buckets = buckets or {}
+        self.count = count
+        self.last_at_ms = last_at_ms
+
+    def add(self, gap_ms: float, decay: float = 1.0) -> None:
+        """Record a gap, first scaling existing weights by decay."""
+        if decay < 1.0:
+            self.buckets = {
+                index: weight * decay
+                for index, weight in self.buckets.items()
+                if weight * decay >= self.MIN_WEIGHT
+            }
+        index = math.ceil(math.log(max(gap_ms, self.MIN_GAP_MS)) / math.log(self.GAMMA))
+        self.buckets[index] = self.buckets.get(index, 0.0) + 1.0
+        self.count += 1
+
+    def quantile(self, q: float) -> float | None:
+        """Gap at quantile q (0-1) in milliseconds, or None when empty."""
+        total = sum(self.buckets.values())
+        if total == 0:
+            return None
+        rank = q * total
+        seen = 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                break
+        # Midpoint of the bucket in relative terms
+        return 2 * self.GAMMA**index / (self.GAMMA + 1)
+
+    def stats(self) -> UserCadenceStats | None:
+        """Summary for TurnManager, or None before the first gap."""
+        p50 = self.quantile(0.5)
+        p95 = self.quantile(0.95)
+        if p50 is None or p95 is None:
+            return None
+        return UserCadenceStats(
+            inter_message_p50_ms=round(p50),
+            inter_message_p95_ms=round(p95),
+            sample_count=self.count,
+        )
+
+    def to_json(self) -> str:
+        """Compact JSON encoding."""
+        return json.dumps(
+            {
+                "n": self.count,
+                "t": self.last_at_ms,
+                "b": [[index, round(weight, 4)] for index, weight in sorted(self.buckets.items())],
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> "CadenceSketch":
+        """Decode a sketch written by to_json."""
+        payload = json.loads(data)
+        return cls(
+            buckets={int(index): float(weight) for index, weight in payload.get("b", [])},
+            count=int(payload.get("n", 0)),
+            last_at_ms=payload.get("t"),
+        )
+
+
+class TypingCadenceStore:
+    """Redis-backed cadence sketches per tenant, interlocutor and channel.
+
+    Key format: {prefix}:{tenant_id}:{interlocutor_id}:{channel}
+
+    Updates are read-modify-write without a transaction; the session
+    mutex already serializes messages of one session, and a lost update
+    from another agent of the same user only drops one sample.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        ttl_seconds: int = 30 * 86400,
+        max_gap_ms: int = 3000,
+        half_life_samples: int = 50,
+        key_prefix: str = "cadence",
+    ) -> None:
+        """Initialize store.
+
+        Args:
+            redis: Redis client instance
+            ttl_seconds: Sketch expiry, refreshed on every message
+            max_gap_ms: Gaps above this are not recorded (about the longest
+                accumulation window; longer pauses are not typing)
+            half_life_samples: Samples after which a gap weighs half
+            key_prefix: Prefix for Redis keys
+        """
+        self._redis = redis
+        self._ttl_seconds = ttl_seconds
+        self._max_gap_ms = max_gap_ms
+        self._decay = 0.5 ** (1 / half_life_samples)
+        self._key_prefix = key_prefix
+
+    def key_for_session(self, session_key: str) -> str | None:
+        """Cadence key of a session key, or None if it is not composite.
+
+        Cadence belongs to the person on a channel, so the agent part of
+        the session key is dropped.
+        """
+        parts = session_key.split(":")
+        if len(parts) != 4:
+            return None
+        tenant_id, _agent_id, interlocutor_id, channel = parts
+        return f"{self._key_prefix}:{tenant_id}:{interlocutor_id}:{channel}"
+
+    async def get(self, key: str) -> UserCadenceStats | None:
+        """Current stats for a cadence key.
+
+        Args:
+            key: Key from key_for_session
+
+        Returns:
+            UserCadenceStats, or None if nothing was learned yet
+        """
+        data = await self._redis.get(key)
+        if data is None:
+            return None
+        return CadenceSketch.from_json(data).stats()
+
+    async def observe(self, key: str, at: datetime) -> UserCadenceStats | None:
+        """Record a message and return the updated stats.
+
+        The gap to the previous message is recorded when it is positive
+        and at most max_gap_ms, whether or not the message started a new
+        turn; the message time is remembered either way.
+
+        Args:
+            key: Key from key_for_session
+            at: When the message was sent
+
+        Returns:
+            UserCadenceStats, or None if nothing was learned yet
+        """
+        data = await self._redis.get(key)
+        sketch = CadenceSketch.from_json(data) if data is not None else CadenceSketch()
+
+        at_ms = int(at.timestamp() * 1000)
+        if sketch.last_at_ms is not None:
+            gap_ms = at_ms - sketch.last_at_ms
+            if 0 < gap_ms <= self._max_gap_ms:
+                sketch.add(gap_ms, self._decay)
+        sketch.last_at_ms = max(at_ms, sketch.last_at_ms or 0)
+
+        await self._redis.set(key, sketch.to_json(), ex=self._ttl_seconds)
+
+        logger.debug("typing_cadence_observed", key=key, sample_count=sketch.count)
+        return sketch.stats()
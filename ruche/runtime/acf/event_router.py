@@ -8,14 +8,31 @@ Architecture:
 - Routes to registered listeners based on event patterns
 - Stores side effects in LogicalTurn when infra.tool.* events arrive
 - Supports async listeners for external integrations
+
+Dispatch:
+- Patterns are resolved once per event type when listeners change; the
+  resulting dispatch table is replaced as a whole (copy-on-write), so
+  route() reads it without locking or pattern matching
+- Synchronous listeners are awaited by route() (e.g. side-effect recording)
+- Every other listener has a bounded queue drained by its own task, so a
+  slow listener (webhooks, live UIs) never stalls the turn that emitted
 """
 
 import asyncio
+import contextlib
 from collections import defaultdict
-from typing import Awaitable, Callable, Protocol
+from collections.abc import Sequence
+from dataclasses import dataclass
+from enum import Enum
+from typing import Protocol
 
 from ruche.observability.logging import get_logger
-from ruche.runtime.acf.events import ACFEvent
+from ruche.observability.metrics import (
+    ACF_LISTENER_DROPPED,
+    ACF_LISTENER_LAG,
+    ACF_LISTENER_QUEUE_DEPTH,
+)
+from ruche.runtime.acf.events import ACFEvent, ACFEventType
 from ruche.runtime.acf.models import LogicalTurn
 
 logger = get_logger(__name__)
@@ -41,12 +58,46 @@ class EventListener(Protocol):
         ...
 
 
+class OverflowPolicy(str, Enum):
+    """What a full listener queue does with a new event."""
+
+    DROP_OLDEST = "drop_oldest"  # Keep the freshest events (live UIs, metrics)
+    DROP_NEWEST = "drop_newest"  # Keep what is already queued
+    BLOCK = "block"  # Backpressure: route() waits for space
+
+
+@dataclass(eq=False)
+class _Subscription:
+    """A registered listener and its delivery state."""
+
+    pattern: str
+    listener: EventListener
+    name: str
+    synchronous: bool
+    overflow: OverflowPolicy
+    queue: asyncio.Queue | None = None
+    worker: asyncio.Task | None = None
+
+
+@dataclass(frozen=True)
+class _Route:
+    """Subscriptions matching one event type, in registration order."""
+
+    synchronous: tuple[_Subscription, ...] = ()
+    queued: tuple[_Subscription, ...] = ()
+    all: tuple[_Subscription, ...] = ()
+
+
+_NO_ROUTE = _Route()
+
+
 class EventRouter:
     """Routes ACFEvents to appropriate listeners.
 
     EventRouter is the central dispatch mechanism for ACF events. It:
     1. Maintains a registry of listeners per event pattern
-    2. Routes events to all matching listeners in parallel
+    2. Delivers events to synchronous listeners inline and to all others
+       through bounded per-listener queues
     3. Records side effects in LogicalTurn for infra.tool.* events
     4. Handles listener failures gracefully
 
@@ -55,23 +106,41 @@ class EventRouter:
     - "turn.*" matches all turn events
     - "tool.executed" matches exact event type
 
-    Thread-safety: This class uses internal locks for listener registration.
-    Event routing is async-safe via asyncio.
+    Thread-safety: registration is serialized by an internal lock and
+    publishes a new dispatch table; routing only reads the current table.
     """
 
-    def __init__(self) -> None:
-        """Initialize event router with empty listener registry."""
-        self._listeners: dict[str, list[EventListener]] = defaultdict(list)
+    def __init__(self, default_queue_size: int = 1000) -> None:
+        """Initialize event router with empty listener registry.
+
+        Args:
+            default_queue_size: Queue bound for asynchronous listeners
+        """
+        self._listeners: dict[str, list[_Subscription]] = defaultdict(list)
+        self._subscriptions: list[_Subscription] = []
+        self._table: dict[str, _Route] = {}
+        self._default_queue_size = default_queue_size
         self._lock = asyncio.Lock()
 
     async def register_listener(
-        self, pattern: str, listener: EventListener
+        self,
+        pattern: str,
+        listener: EventListener,
+        *,
+        synchronous: bool = False,
+        queue_size: int | None = None,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        name: str | None = None,
     ) -> None:
         """Register a listener for events matching a pattern.
 
         Args:
             pattern: Event pattern to match (e.g., "*", "turn.*", "tool.executed")
             listener: Async callable to handle matching events
+            synchronous: Deliver inline; route() waits for the listener
+            queue_size: Queue bound for asynchronous delivery
+            overflow: What a full queue does with a new event
+            name: Listener name for metrics (default: callable's qualified name)
 
         Examples:
             # Listen to all events
@@ -80,40 +149,65 @@ class EventRouter:
             # Listen to all turn events
             await router.register_listener("turn.*", metrics_handler)
 
-            # Listen to specific event type
-            await router.register_listener("tool.executed", tool_metrics_handler)
+            # Side effects must be recorded before the turn moves on
+            await router.register_listener(
+                "tool.executed", side_effect_recorder, synchronous=True
+            )
         """
+        subscription = _Subscription(
+            pattern=pattern,
+            listener=listener,
+            name=name or getattr(listener, "__qualname__", type(listener).__name__),
+            synchronous=synchronous,
+            overflow=overflow,
+        )
+        if not synchronous:
+            subscription.queue = asyncio.Queue(maxsize=queue_size or self._default_queue_size)
+            subscription.worker = asyncio.create_task(self._drain(subscription))
+
         async with self._lock:
-            self._listeners[pattern].append(listener)
+            self._listeners[pattern].append(subscription)
+            self._subscriptions.append(subscription)
+            self._rebuild_table()
             logger.debug(
                 "event_listener_registered",
                 pattern=pattern,
+                listener=subscription.name,
+                synchronous=synchronous,
                 total_listeners=len(self._listeners[pattern]),
             )
 
-    async def unregister_listener(
-        self, pattern: str, listener: EventListener
-    ) -> None:
+    async def unregister_listener(self, pattern: str, listener: EventListener) -> None:
         """Unregister a listener from a pattern.
 
+        Events still queued for the listener are discarded.
+
         Args:
             pattern: Event pattern the listener was registered for
             listener: The listener to remove
         """
         async with self._lock:
-            if pattern in self._listeners:
-                try:
-                    self._listeners[pattern].remove(listener)
-                    logger.debug(
-                        "event_listener_unregistered",
-                        pattern=pattern,
-                        remaining_listeners=len(self._listeners[pattern]),
-                    )
-                except ValueError:
-                    logger.warning(
-                        "event_listener_not_found",
-                        pattern=pattern,
-                    )
+            subscription = next(
+                (s for s in self._listeners.get(pattern, []) if s.listener == listener),
+                None,
+            )
+            if subscription is None:
+                logger.warning(
+                    "event_listener_not_found",
+                    pattern=pattern,
+                )
+                return
+
+            self._listeners[pattern].remove(subscription)
+            self._subscriptions.remove(subscription)
+            self._rebuild_table()
+            logger.debug(
+                "event_listener_unregistered",
+                pattern=pattern,
+                remaining_listeners=len(self._listeners[pattern]),
+            )
+
+        await self._stop(subscription)
 
     async def route(
         self,
@@ -123,53 +217,144 @@ class EventRouter:
         """Route event to all matching listeners.
 
         This is the main entry point for event routing. It:
-        1. Finds all listeners matching the event type
-        2. Dispatches to all matching listeners in parallel
-        3. Records side effects in LogicalTurn if needed
-        4. Logs routing errors but doesn't fail
+        1. Looks up the listeners for the event type in the dispatch table
+        2. Queues the event for asynchronous listeners
+        3. Awaits synchronous listeners in parallel
+        4. Records side effects in LogicalTurn if needed
+        5. Logs routing errors but doesn't fail
+
+        Only synchronous listeners, and asynchronous listeners with the
+        BLOCK policy and a full queue, make the caller wait.
 
         Args:
             event: The event to route
             logical_turn: Optional LogicalTurn to update with side effects
 
         Side Effects:
-            - Calls all matching listeners
+            - Calls synchronous listeners, queues for all others
             - Updates logical_turn.side_effects for infra.tool.* events
         """
-        # Find matching listeners
-        matching_listeners = await self._find_matching_listeners(event)
+        event_type = event.type.value
+        route = self._table.get(event_type)
+        if route is None:
+            route = self._build_route(event_type, self._subscriptions)
 
-        if not matching_listeners:
+        if not route.all:
             logger.debug(
                 "no_listeners_for_event",
-                event_type=event.type.value,
+                event_type=event_type,
                 logical_turn_id=event.logical_turn_id,
             )
-            return
+        else:
+            logger.debug(
+                "routing_event",
+                event_type=event_type,
+                listener_count=len(route.all),
+                logical_turn_id=event.logical_turn_id,
+                tenant_id=event.tenant_id,
+                agent_id=event.agent_id,
+            )
 
-        # Log routing
-        logger.debug(
-            "routing_event",
-            event_type=event.type.value,
-            listener_count=len(matching_listeners),
-            logical_turn_id=event.logical_turn_id,
-            tenant_id=event.tenant_id,
-            agent_id=event.agent_id,
-        )
+        for subscription in route.queued:
+            await self._enqueue(subscription, event)
 
-        # Dispatch to all matching listeners in parallel
-        tasks = [
-            self._dispatch_to_listener(listener, event) for listener in matching_listeners
-        ]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        if route.synchronous:
+            await asyncio.gather(
+                *(self._dispatch_to_listener(s.listener, event) for s in route.synchronous)
+            )
 
         # Record side effect in LogicalTurn if this is a tool event
         if logical_turn is not None:
             await self._record_side_effect(event, logical_turn)
 
-    async def _find_matching_listeners(
-        self, event: ACFEvent
-    ) -> list[EventListener]:
+    async def flush(self) -> None:
+        """Wait until every queued event has been delivered."""
+        await asyncio.gather(*(s.queue.join() for s in self._subscriptions if s.queue is not None))
+
+    async def close(self) -> None:
+        """Deliver queued events, then stop all listener tasks."""
+        await self.flush()
+        async with self._lock:
+            subscriptions = list(self._subscriptions)
+            self._subscriptions.clear()
+            self._listeners.clear()
+            self._rebuild_table()
+        for subscription in subscriptions:
+            await self._stop(subscription)
+
+    def _rebuild_table(self) -> None:
+        """Publish a new dispatch table for the current subscriptions.
+
+        Called with the registration lock held. The table is built aside
+        and swapped in one assignment, so route() sees either the old or
+        the new table, never a partial one.
+        """
+        subscriptions = tuple(self._subscriptions)
+        self._table = {
+            event_type.value: self._build_route(event_type.value, subscriptions)
+            for event_type in ACFEventType
+        }
+
+    def _build_route(
+        self, event_type: str, subscriptions: Sequence[_Subscription]
+    ) -> _Route:
+        """Resolve the subscriptions matching an event type."""
+        matching = tuple(s for s in subscriptions if self._matches_pattern(event_type, s.pattern))
+        if not matching:
+            return _NO_ROUTE
+        return _Route(
+            synchronous=tuple(s for s in matching if s.synchronous),
+            queued=tuple(s for s in matching if not s.synchronous),
+            all=matching,
+        )
+
+    async def _enqueue(self, subscription: _Subscription, event: ACFEvent) -> None:
+        """Queue an event for an asynchronous listener, applying its overflow policy."""
+        queue = subscription.queue
+        item = (event, asyncio.get_running_loop().time())
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            if subscription.overflow == OverflowPolicy.BLOCK:
+                await queue.put(item)
+            else:
+                if subscription.overflow == OverflowPolicy.DROP_OLDEST:
+                    queue.get_nowait()
+                    queue.task_done()
+                    queue.put_nowait(item)
+                ACF_LISTENER_DROPPED.labels(
+                    listener=subscription.name, policy=subscription.overflow.value
+                ).inc()
+                logger.debug(
+                    "event_dropped",
+                    listener=subscription.name,
+                    policy=subscription.overflow.value,
+                    event_type=event.type.value,
+                )
+        ACF_LISTENER_QUEUE_DEPTH.labels(listener=subscription.name).set(queue.qsize())
+
+    async def _drain(self, subscription: _Subscription) -> None:
+        """Deliver queued events to one listener, in order."""
+        queue = subscription.queue
+        loop = asyncio.get_running_loop()
+        while True:
+            event, enqueued_at = await queue.get()
+            ACF_LISTENER_LAG.labels(listener=subscription.name).observe(loop.time() - enqueued_at)
+            try:
+                await self._dispatch_to_listener(subscription.listener, event)
+            finally:
+                queue.task_done()
+                ACF_LISTENER_QUEUE_DEPTH.labels(listener=subscription.name).set(queue.qsize())
+
+    async def _stop(self, subscription: _Subscription) -> None:
+        """Cancel the delivery task of a subscription."""
+        if subscription.worker is None:
+            return
+        subscription.worker.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await subscription.worker
+
+    async def _find_matching_listeners(self, event: ACFEvent) -> list[EventListener]:
         """Find all listeners matching the event.
 
         Args:
@@ -178,15 +363,10 @@ class EventRouter:
         Returns:
             List of listeners that match the event pattern
         """
-        matching = []
-        event_type = event.type.value
-
-        async with self._lock:
-            for pattern, listeners in self._listeners.items():
-                if self._matches_pattern(event_type, pattern):
-                    matching.extend(listeners)
-
-        return matching
+        route = self._table.get(event.type.value) or self._build_route(
+            event.type.value, self._subscriptions
+        )
+        return [s.listener for s in route.all]
 
     def _matches_pattern(self, event_type: str, pattern: str) -> bool:
         """Check if event type matches a pattern.
@@ -251,7 +431,6 @@ class EventRouter:
             logical_turn: The LogicalTurn to update
         """
         # Record side effects via TOOL_EXECUTED event type
-        from ruche.runtime.acf.events import ACFEventType
         from ruche.runtime.acf.models import SideEffect, SideEffectPolicy
 
         if event.type != ACFEventType.TOOL_EXECUTED:
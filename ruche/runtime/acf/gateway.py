@@ -12,6 +12,7 @@ from uuid import UUID
 from pydantic import BaseModel, Field
 
 from ruche.observability.logging import get_logger
+from ruche.runtime.acf.affinity import ShardRing
 
 logger = get_logger(__name__)
 
@@ -50,6 +51,14 @@ class TurnDecision(BaseModel):
         default=None,
         description="Position in queue (for QUEUE action)",
     )
+    shard: int | None = Field(
+        default=None,
+        description="Session shard (for TRIGGER_NEW under session affinity)",
+    )
+    worker_id: str | None = Field(
+        default=None,
+        description="Worker owning the shard; dispatch to its queue",
+    )
 
 
 class ActiveTurnIndex:
@@ -108,10 +117,12 @@ class TurnGateway:
         active_turn_index: ActiveTurnIndex,
         rate_limiter=None,
         workflow_client=None,
+        shard_ring: ShardRing | None = None,
     ):
         self._index = active_turn_index
         self._rate_limiter = rate_limiter
         self._workflow_client = workflow_client
+        self._shard_ring = shard_ring
 
     def _make_session_key(
         self,
@@ -180,9 +191,19 @@ class TurnGateway:
                 workflow_id=active_workflow_id,
             )
 
-        # 3. Trigger new workflow
-        logger.info("triggering_new_workflow", session_key=session_key)
-        return TurnDecision(action=TurnAction.TRIGGER_NEW)
+        # 3. Trigger new workflow, on the session's worker under affinity
+        if self._shard_ring is None:
+            logger.info("triggering_new_workflow", session_key=session_key)
+            return TurnDecision(action=TurnAction.TRIGGER_NEW)
+
+        shard, worker_id = await self._shard_ring.route(session_key)
+        logger.info(
+            "triggering_new_workflow",
+            session_key=session_key,
+            shard=shard,
+            worker_id=worker_id,
+        )
+        return TurnDecision(action=TurnAction.TRIGGER_NEW, shard=shard, worker_id=worker_id)
 
     async def register_workflow(
         self,
@@ -0,0 +1,142 @@
+"""Turn-scoped state hand-off between workflow steps.
+
+Hatchet persists every step output and hands it to later steps, so a
+LogicalTurn, the full response and its segments would otherwise travel
+through the orchestrator on every step. TurnStateStore keeps these bulky
+fields in a Redis hash per turn (one field per step, short TTL) and the
+step output carries only a reference and a small summary.
+
+Blobs are msgpack when the `handoff` extra is installed, compact JSON
+otherwise. A leading format byte keeps workers with and without msgpack
+able to read each other's state during a rollout.
+"""
+
+import json
+from typing import Any
+
+from redis.asyncio import Redis
+
+from ruche.observability.logging import get_logger
+from ruche.observability.metrics import ACF_HANDOFF_BYTES
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional speedup
+    msgpack = None  # type: ignore[assignment]
+
+logger = get_logger(__name__)
+
+_FORMAT_JSON = b"j"
+_FORMAT_MSGPACK = b"m"
+
+# Step output fields moved to Redis; everything else stays inline
+BULKY_FIELDS = ("turn", "response", "response_segments")
+
+
+class TurnStateExpiredError(RuntimeError):
+    """Step state referenced by a step output is no longer in Redis."""
+
+
+def encode_state(state: dict[str, Any]) -> bytes:
+    """Encode JSON-compatible step state as a tagged blob."""
+    if msgpack is not None:
+        return _FORMAT_MSGPACK + msgpack.packb(state, use_bin_type=True)
+    return _FORMAT_JSON + json.dumps(state, separators=(",", ":")).encode()
+
+
+def decode_state(blob: bytes) -> dict[str, Any]:
+    """Decode a blob written by encode_state.
+
+    Raises:
+        ValueError: If the format byte is unknown or msgpack is missing
+    """
+    fmt, payload = blob[:1], blob[1:]
+    if fmt == _FORMAT_JSON:
+        return json.loads(payload)
+    if fmt == _FORMAT_MSGPACK:
+        if msgpack is None:
+            raise ValueError("Turn state is msgpack-encoded but msgpack is not installed")
+        return msgpack.unpackb(payload, raw=False)
+    raise ValueError(f"Unknown turn state format: {fmt!r}")
+
+
+class TurnStateStore:
+    """Redis-backed hand-off of bulky step state for one logical turn.
+
+    Key format: {prefix}:{turn_id} (hash, field per step)
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        ttl_seconds: int = 900,
+        key_prefix: str = "turnstate",
+    ) -> None:
+        """Initialize store.
+
+        Args:
+            redis: Redis client instance
+            ttl_seconds: Expiry of a turn's state, refreshed on every write
+            key_prefix: Prefix for Redis keys
+        """
+        self._redis = redis
+        self._ttl_seconds = ttl_seconds
+        self._key_prefix = key_prefix
+
+    def _key(self, turn_id: str) -> str:
+        """Build Redis key for a turn."""
+        return f"{self._key_prefix}:{turn_id}"
+
+    async def offload(self, turn_id: str, step: str, output: dict[str, Any]) -> dict[str, Any]:
+        """Move the bulky fields of a step output to Redis.
+
+        Args:
+            turn_id: Logical turn identifier
+            step: Name of the step that produced output
+            output: Step output as returned by the workflow method
+
+        Returns:
+            The output without BULKY_FIELDS, plus turn_id and state_ref
+        """
+        state = {field: output[field] for field in BULKY_FIELDS if field in output}
+        if not state:
+            return output
+
+        blob = encode_state(state)
+        key = self._key(turn_id)
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.hset(key, step, blob)
+        pipe.expire(key, self._ttl_seconds)
+        await pipe.execute()
+        ACF_HANDOFF_BYTES.labels(step=step).observe(len(blob))
+
+        summary = {field: value for field, value in output.items() if field not in state}
+        summary["turn_id"] = turn_id
+        summary["state_ref"] = {"key": key, "step": step}
+        logger.debug("turn_state_offloaded", turn_id=turn_id, step=step, size_bytes=len(blob))
+        return summary
+
+    async def load(self, output: dict[str, Any]) -> dict[str, Any]:
+        """Restore a step output written by offload().
+
+        Outputs without a state_ref (skipped steps, or steps that ran
+        before the hand-off was enabled) are returned unchanged.
+
+        Raises:
+            TurnStateExpiredError: If the referenced state has expired
+        """
+        ref = output.get("state_ref")
+        if ref is None:
+            return output
+
+        blob = await self._redis.hget(ref["key"], ref["step"])
+        if blob is None:
+            raise TurnStateExpiredError(f"No state for step {ref['step']!r} at {ref['key']}")
+
+        restored = {field: value for field, value in output.items() if field != "state_ref"}
+        restored.update(decode_state(blob))
+        return restored
+
+    async def discard(self, turn_id: str) -> None:
+        """Delete all hand-off state of a turn."""
+        await self._redis.delete(self._key(turn_id))
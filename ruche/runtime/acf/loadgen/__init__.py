@@ -0,0 +1,37 @@
+"""Load generation and benchmarking for the ACF turn path.
+
+Replays synthetic or recorded conversation traces against
+LogicalTurnWorkflow (mutex -> accumulate -> run_agent -> commit) with a
+synthetic brain, and reports turn throughput, mutex waits, accumulation
+overshoot, superseded turns and latency percentiles per tenant.
+
+Usage:
+    python -m ruche.runtime.acf.loadgen --sessions 500 --workers 50
+"""
+
+from ruche.runtime.acf.loadgen.brain import BrainLatency, SyntheticAgentRuntime, SyntheticBrain
+from ruche.runtime.acf.loadgen.harness import HarnessConfig, LoadHarness
+from ruche.runtime.acf.loadgen.report import LoadReport, TurnSample, TurnStats
+from ruche.runtime.acf.loadgen.traces import (
+    ConversationTrace,
+    TraceMessage,
+    dump_traces,
+    load_traces,
+    synthetic_traces,
+)
+
+__all__ = [
+    "BrainLatency",
+    "ConversationTrace",
+    "HarnessConfig",
+    "LoadHarness",
+    "LoadReport",
+    "SyntheticAgentRuntime",
+    "SyntheticBrain",
+    "TraceMessage",
+    "TurnSample",
+    "TurnStats",
+    "dump_traces",
+    "load_traces",
+    "synthetic_traces",
+]
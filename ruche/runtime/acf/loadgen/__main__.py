@@ -0,0 +1,135 @@
+"""CLI for the ACF load generator.
+
+Usage:
+    # Synthetic traffic against fakeredis
+    python -m ruche.runtime.acf.loadgen --sessions 500 --duration 60 --workers 50
+
+    # Recorded traces against a local Redis, report as JSON
+    python -m ruche.runtime.acf.loadgen --trace traces.jsonl \\
+        --redis-url redis://localhost:6379/15 --json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from redis.asyncio import Redis
+
+from ruche.observability.logging import setup_logging
+from ruche.runtime.acf.loadgen.brain import BrainLatency
+from ruche.runtime.acf.loadgen.harness import HarnessConfig, LoadHarness
+from ruche.runtime.acf.loadgen.report import LoadReport
+from ruche.runtime.acf.loadgen.traces import dump_traces, load_traces, synthetic_traces
+
+
+def create_redis(url: str | None) -> Redis:
+    """Redis client for the session mutex: a server if url is set, else fakeredis.
+
+    The mutex runs Lua scripts, so fakeredis needs its lua extra (lupa).
+
+    Raises:
+        RuntimeError: If no url is given and fakeredis is not installed
+    """
+    if url:
+        return Redis.from_url(url)
+    try:
+        from fakeredis import FakeAsyncRedis  # type: ignore[import-not-found]
+    except ImportError as err:
+        raise RuntimeError(
+            "fakeredis is required when --redis-url is not set. "
+            "Install with: uv add 'ruche[loadgen]'"
+        ) from err
+    return FakeAsyncRedis()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="ruche-loadgen",
+        description="Replay conversation traces against the ACF turn workflow.",
+    )
+    parser.add_argument("--redis-url", help="Redis server (default: in-process fakeredis)")
+    parser.add_argument("--trace", help="Recorded trace file (JSON lines) instead of synthetic")
+    parser.add_argument("--save-trace", help="Write the replayed traces to this file")
+
+    synthetic = parser.add_argument_group("synthetic traffic")
+    synthetic.add_argument("--tenants", type=int, default=3)
+    synthetic.add_argument("--agents-per-tenant", type=int, default=2)
+    synthetic.add_argument("--sessions", type=int, default=200)
+    synthetic.add_argument("--turns-per-session", type=int, default=4)
+    synthetic.add_argument(
+        "--duration", type=float, default=60.0, help="Seconds over which sessions start"
+    )
+    synthetic.add_argument(
+        "--tenant-skew", type=float, default=1.0, help="Zipf exponent of sessions per tenant"
+    )
+
+    harness = parser.add_argument_group("harness")
+    harness.add_argument("--workers", type=int, default=100, help="Concurrent workflow runs")
+    harness.add_argument("--speed", type=float, default=1.0, help="Trace replay speed")
+    harness.add_argument("--brain-median-ms", type=float, default=800.0)
+    harness.add_argument("--brain-sigma", type=float, default=0.5)
+    harness.add_argument("--brain-error-rate", type=float, default=0.0)
+    harness.add_argument("--mutex-blocking-timeout", type=float, default=10.0)
+    harness.add_argument("--seed", type=int, default=0)
+
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--log-level", default="WARNING")
+    return parser
+
+
+async def run(args: argparse.Namespace) -> LoadReport:
+    """Build traces and harness from arguments and run the load test."""
+    if args.trace:
+        traces = load_traces(args.trace)
+    else:
+        traces = synthetic_traces(
+            tenants=args.tenants,
+            agents_per_tenant=args.agents_per_tenant,
+            sessions=args.sessions,
+            turns_per_session=args.turns_per_session,
+            duration_s=args.duration,
+            tenant_skew=args.tenant_skew,
+            seed=args.seed,
+        )
+    if args.save_trace:
+        dump_traces(traces, args.save_trace)
+
+    redis = create_redis(args.redis_url)
+    config = HarnessConfig(
+        workers=args.workers,
+        speed=args.speed,
+        mutex_blocking_timeout_s=args.mutex_blocking_timeout,
+        brain_latency=BrainLatency(
+            median_ms=args.brain_median_ms,
+            sigma=args.brain_sigma,
+            error_rate=args.brain_error_rate,
+        ),
+        seed=args.seed,
+    )
+    try:
+        return await LoadHarness(redis, config).run(traces)
+    finally:
+        await redis.aclose()
+
+
+def main() -> None:
+    """CLI entrypoint."""
+    args = build_parser().parse_args()
+    setup_logging(level=args.log_level)
+
+    try:
+        report = asyncio.run(run(args))
+    except (RuntimeError, ValueError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(report.format_table())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Synthetic Brain and AgentRuntime for ACF load generation.
+
+The synthetic brain does no work: it sleeps for a latency drawn from a
+lognormal distribution and answers with a fixed segment, so a load test
+measures ACF (mutex, accumulation, commit) rather than LLM providers.
+"""
+
+import asyncio
+import random
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from ruche.brains.focal.models.brain_result import BrainResult, ResponseSegment
+
+
+@dataclass(frozen=True)
+class BrainLatency:
+    """Latency distribution of the synthetic brain.
+
+    Attributes:
+        median_ms: Median think() duration
+        sigma: Lognormal shape (0 = always median_ms; 0.5 puts p99 near 3.2x)
+        error_rate: Fraction of turns that raise
+    """
+
+    median_ms: float = 800.0
+    sigma: float = 0.5
+    error_rate: float = 0.0
+
+
+class SyntheticBrainError(RuntimeError):
+    """Failure injected by SyntheticBrain."""
+
+
+class SyntheticBrain:
+    """Brain that sleeps for a sampled latency, then answers."""
+
+    def __init__(self, latency: BrainLatency, rng: random.Random) -> None:
+        """Initialize brain.
+
+        Args:
+            latency: Latency distribution
+            rng: Random source (shared, so runs are reproducible per seed)
+        """
+        self._latency = latency
+        self._rng = rng
+
+    async def think(self, _ctx: Any) -> BrainResult:
+        """Sleep for a sampled latency and return a canned response."""
+        delay_ms = self._latency.median_ms * self._rng.lognormvariate(0, self._latency.sigma)
+        await asyncio.sleep(delay_ms / 1000)
+
+        if self._rng.random() < self._latency.error_rate:
+            raise SyntheticBrainError("injected brain failure")
+
+        return BrainResult(response_segments=[ResponseSegment(content="ok")])
+
+
+@dataclass
+class _SyntheticAgentContext:
+    """The part of AgentContext the workflow uses."""
+
+    brain: SyntheticBrain
+
+
+class SyntheticAgentRuntime:
+    """AgentRuntime stand-in handing out synthetic brains."""
+
+    def __init__(self, latency: BrainLatency | None = None, seed: int = 0) -> None:
+        """Initialize runtime.
+
+        Args:
+            latency: Latency distribution of every agent's brain
+            seed: Random seed
+        """
+        self._brain = SyntheticBrain(latency or BrainLatency(), random.Random(seed))
+
+    async def get_or_create(self, _tenant_id: UUID, _agent_id: UUID) -> _SyntheticAgentContext:
+        """Return the agent context of any agent."""
+        return _SyntheticAgentContext(brain=self._brain)
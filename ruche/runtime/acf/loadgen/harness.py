@@ -0,0 +1,306 @@
+"""Load harness driving LogicalTurnWorkflow with replayed traces.
+
+The harness plays the part of the channel gateway and of Hatchet:
+
+1. Messages are dispatched at their trace offsets (open loop)
+2. A message for a session whose newest run is still waiting for the
+   mutex or accumulating is routed to that run, like a new_message event
+3. Any other message starts a new workflow run, which takes a worker slot
+   and then waits for the session mutex
+4. Runs execute the workflow steps the way the Hatchet wrapper does:
+   acquire_mutex -> accumulate -> run_agent -> commit_and_respond
+
+Every run is timed into a TurnSample; the samples make up the LoadReport.
+"""
+
+import asyncio
+import contextlib
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+from uuid import uuid4
+
+from redis.asyncio import Redis
+
+from ruche.observability.logging import get_logger
+from ruche.runtime.acf.loadgen.brain import BrainLatency, SyntheticAgentRuntime
+from ruche.runtime.acf.loadgen.report import LoadReport, TurnSample
+from ruche.runtime.acf.loadgen.traces import ConversationTrace, TraceMessage
+from ruche.runtime.acf.turn_manager import TurnManager
+from ruche.runtime.acf.workflow import LogicalTurnWorkflow
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class HarnessConfig:
+    """Load harness configuration.
+
+    Attributes:
+        workers: Workflow runs executing at once (worker slots)
+        speed: Replay speed; 2.0 plays trace offsets twice as fast (brain
+            latency and accumulation windows are not scaled)
+        mutex_timeout_s: Lock expiry of the session mutex
+        mutex_blocking_timeout_s: How long a run waits for the mutex
+        brain_latency: Latency distribution of the synthetic brain
+        seed: Random seed of the synthetic brain
+    """
+
+    workers: int = 100
+    speed: float = 1.0
+    mutex_timeout_s: int = 300
+    mutex_blocking_timeout_s: float = 10.0
+    brain_latency: BrainLatency = field(default_factory=BrainLatency)
+    seed: int = 0
+
+
+@dataclass
+class _Pending:
+    """A message routed to a run, with its arrival time."""
+
+    message: TraceMessage
+    arrived: float
+
+
+@dataclass
+class _Run:
+    """One workflow run and the messages routed to it."""
+
+    trace: ConversationTrace
+    sample: TurnSample
+    inbox: deque[_Pending] = field(default_factory=deque)
+    signal: asyncio.Event = field(default_factory=asyncio.Event)
+    closed: bool = False
+
+
+@dataclass
+class _Session:
+    """Runs of one session."""
+
+    # Newest run still taking messages (waiting for the mutex or accumulating)
+    open_run: _Run | None = None
+    # Runs whose brain is executing
+    processing: list[_Run] = field(default_factory=list)
+
+
+class LoadHarness:
+    """Replays traces against LogicalTurnWorkflow and measures each turn."""
+
+    def __init__(
+        self,
+        redis: Redis,
+        config: HarnessConfig | None = None,
+        turn_manager: TurnManager | None = None,
+    ) -> None:
+        """Initialize harness.
+
+        Args:
+            redis: Redis client for the session mutex (fakeredis or a real server)
+            config: Harness configuration
+            turn_manager: Accumulation policy under test
+        """
+        self._config = config or HarnessConfig()
+        self._workflow = LogicalTurnWorkflow(
+            redis=redis,
+            agent_runtime=SyntheticAgentRuntime(self._config.brain_latency, self._config.seed),
+            session_store=None,
+            message_store=None,
+            audit_store=None,
+            turn_manager=turn_manager,
+            mutex_timeout=self._config.mutex_timeout_s,
+            mutex_blocking_timeout=self._config.mutex_blocking_timeout_s,
+        )
+        self._sessions: dict[str, _Session] = {}
+        self._samples: list[TurnSample] = []
+        self._tasks: set[asyncio.Task] = set()
+        self._slots: asyncio.Semaphore | None = None
+
+    async def run(self, traces: list[ConversationTrace]) -> LoadReport:
+        """Replay traces and wait for every turn to finish.
+
+        Args:
+            traces: Conversations to replay (offsets are shifted so the
+                earliest message is sent immediately)
+
+        Returns:
+            Aggregated report
+        """
+        loop = asyncio.get_running_loop()
+        self._slots = asyncio.Semaphore(self._config.workers)
+        schedule = sorted(
+            (
+                (message.offset_ms, i, trace, message)
+                for trace in traces
+                for i, message in enumerate(trace.messages)
+            ),
+            key=lambda entry: (entry[0], entry[1]),
+        )
+        origin = schedule[0][0] if schedule else 0.0
+
+        logger.info(
+            "load_run_started",
+            sessions=len(traces),
+            messages=len(schedule),
+            workers=self._config.workers,
+        )
+
+        start = loop.time()
+        for offset_ms, _, trace, message in schedule:
+            delay = start + (offset_ms - origin) / 1000 / self._config.speed - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._dispatch(trace, message, loop.time())
+
+        # Runs started from leftovers add tasks while others finish
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks))
+        elapsed = loop.time() - start
+
+        report = LoadReport.from_samples(
+            self._samples,
+            elapsed_s=elapsed,
+            messages=len(schedule),
+            config=asdict(self._config),
+        )
+        logger.info(
+            "load_run_complete",
+            turns=report.overall.turns,
+            elapsed_s=report.elapsed_s,
+            throughput_per_s=report.overall.throughput_per_s,
+        )
+        return report
+
+    def _dispatch(self, trace: ConversationTrace, message: TraceMessage, arrived: float) -> None:
+        """Route an arriving message to an open run or start a new one."""
+        session = self._sessions.setdefault(trace.session_key, _Session())
+
+        # The answers being computed for this session are already stale
+        for run in session.processing:
+            run.sample.superseded = True
+
+        if session.open_run is not None:
+            run = session.open_run
+            run.inbox.append(_Pending(message, arrived))
+            run.signal.set()
+            return
+
+        self._start_run(trace, [_Pending(message, arrived)])
+
+    def _start_run(self, trace: ConversationTrace, pending: list[_Pending]) -> None:
+        """Start a workflow run for the first pending message."""
+        sample = TurnSample(
+            tenant_id=trace.tenant_id,
+            session_key=trace.session_key,
+            channel=trace.channel,
+        )
+        run = _Run(trace=trace, sample=sample, inbox=deque(pending[1:]))
+        self._samples.append(sample)
+        self._sessions[trace.session_key].open_run = run
+
+        task = asyncio.create_task(self._execute(run, pending[0]))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _close(self, run: _Run) -> None:
+        """Stop routing messages to a run; leftovers start the next run."""
+        if run.closed:
+            return
+        run.closed = True
+
+        session = self._sessions[run.trace.session_key]
+        if session.open_run is run:
+            session.open_run = None
+
+        # Messages that were routed but never absorbed (no accumulation on
+        # the channel, or the mutex was not acquired)
+        if run.inbox:
+            self._start_run(run.trace, list(run.inbox))
+            run.inbox.clear()
+
+    async def _execute(self, run: _Run, first: _Pending) -> None:
+        """Execute one workflow run, step by step."""
+        loop = asyncio.get_running_loop()
+        trace, sample = run.trace, run.sample
+        session = self._sessions[trace.session_key]
+
+        queued_at = loop.time()
+        async with self._slots:
+            sample.slot_wait_ms = (loop.time() - queued_at) * 1000
+
+            mutex_started = loop.time()
+            mutex = await self._workflow.acquire_mutex(trace.session_key)
+            sample.mutex_wait_ms = (loop.time() - mutex_started) * 1000
+            lock_key = mutex.get("lock_key")
+            lock_token = mutex.get("lock_token")
+            if mutex["status"] == "lock_failed":
+                sample.status = "lock_failed"
+                self._close(run)
+                return
+
+            try:
+                accumulated = await self._workflow.accumulate(
+                    turn_id=uuid4(),
+                    session_key=trace.session_key,
+                    initial_message_id=str(first.message.message_id),
+                    initial_content=first.message.content,
+                    channel=trace.channel,
+                    wait_for_event=lambda timeout_ms: self._wait_for_event(run, timeout_ms),
+                )
+                self._close(run)
+                sample.messages = accumulated["message_count"]
+
+                async def check_pending() -> bool:
+                    return sample.superseded
+
+                session.processing.append(run)
+                try:
+                    output = await self._workflow.run_agent(
+                        turn_data=accumulated["turn"],
+                        tenant_id=trace.tenant_id,
+                        agent_id=trace.agent_id,
+                        interlocutor_id=trace.interlocutor_id,
+                        channel=trace.channel,
+                        check_pending=check_pending,
+                        lock_token=lock_token,
+                    )
+                finally:
+                    session.processing.remove(run)
+
+                result = await self._workflow.commit_and_respond(
+                    pipeline_output=output,
+                    lock_key=lock_key,
+                    session_key=trace.session_key,
+                    lock_token=lock_token,
+                )
+                sample.status = "complete" if result["status"] == "complete" else "failed"
+            except Exception as e:
+                sample.status = "failed"
+                self._close(run)
+                await self._workflow.on_failure(lock_key, trace.session_key, str(e), lock_token)
+
+        sample.latency_ms = (loop.time() - first.arrived) * 1000
+
+    async def _wait_for_event(self, run: _Run, timeout_ms: int) -> dict[str, Any] | None:
+        """Next message routed to the run, or None once the window expires."""
+        loop = asyncio.get_running_loop()
+        if not run.inbox:
+            run.signal.clear()
+            started = loop.time()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(run.signal.wait(), timeout=timeout_ms / 1000)
+
+            if not run.inbox:
+                overshoot = (loop.time() - started) * 1000 - timeout_ms
+                run.sample.overshoot_ms.append(max(overshoot, 0.0))
+                # Close before returning so a message arriving from now on
+                # starts the next turn instead of being lost
+                self._close(run)
+                return None
+
+        pending = run.inbox.popleft()
+        return {
+            "message_id": str(pending.message.message_id),
+            "content": pending.message.content,
+            "timestamp": datetime.now(UTC).isoformat(),
+        }
@@ -0,0 +1,159 @@
+"""Per-turn samples and the aggregated load test report."""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+
+@dataclass
+class TurnSample:
+    """Measurements of one LogicalTurn workflow run.
+
+    Attributes:
+        tenant_id: Tenant of the session
+        session_key: Session the turn ran on
+        channel: Channel of the session
+        status: "complete", "failed" or "lock_failed"
+        messages: Messages accumulated into the turn
+        slot_wait_ms: Time waiting for a free worker slot
+        mutex_wait_ms: Time spent in acquire_mutex
+        overshoot_ms: How long each accumulation window ran past the
+            window TurnManager asked for
+        latency_ms: First message arrival to commit (end to end)
+        superseded: Whether a message for the session arrived while the
+            brain was running (the turn's answer is already stale)
+    """
+
+    tenant_id: str
+    session_key: str
+    channel: str
+    status: str = "complete"
+    messages: int = 1
+    slot_wait_ms: float = 0.0
+    mutex_wait_ms: float = 0.0
+    overshoot_ms: list[float] = field(default_factory=list)
+    latency_ms: float = 0.0
+    superseded: bool = False
+
+
+def _quantiles(values: list[float]) -> dict[str, float]:
+    """p50/p95/p99/max of values (zeros when empty)."""
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "p50": round(float(p50), 1),
+        "p95": round(float(p95), 1),
+        "p99": round(float(p99), 1),
+        "max": round(float(max(values)), 1),
+    }
+
+
+@dataclass
+class TurnStats:
+    """Aggregated measurements of a set of turns."""
+
+    turns: int
+    completed: int
+    failed: int
+    lock_failed: int
+    throughput_per_s: float
+    superseded_rate: float
+    messages_per_turn: float
+    slot_wait_ms: dict[str, float]
+    mutex_wait_ms: dict[str, float]
+    overshoot_ms: dict[str, float]
+    latency_ms: dict[str, float]
+
+    @classmethod
+    def from_samples(cls, samples: list[TurnSample], elapsed_s: float) -> "TurnStats":
+        """Aggregate samples collected over elapsed_s seconds."""
+        completed = [s for s in samples if s.status == "complete"]
+        return cls(
+            turns=len(samples),
+            completed=len(completed),
+            failed=sum(1 for s in samples if s.status == "failed"),
+            lock_failed=sum(1 for s in samples if s.status == "lock_failed"),
+            throughput_per_s=round(len(completed) / elapsed_s, 2) if elapsed_s > 0 else 0.0,
+            superseded_rate=(
+                round(sum(1 for s in samples if s.superseded) / len(samples), 4) if samples else 0.0
+            ),
+            messages_per_turn=(
+                round(sum(s.messages for s in samples) / len(samples), 2) if samples else 0.0
+            ),
+            slot_wait_ms=_quantiles([s.slot_wait_ms for s in samples]),
+            mutex_wait_ms=_quantiles([s.mutex_wait_ms for s in samples]),
+            overshoot_ms=_quantiles([o for s in samples for o in s.overshoot_ms]),
+            latency_ms=_quantiles([s.latency_ms for s in completed]),
+        )
+
+
+@dataclass
+class LoadReport:
+    """Result of a load test run."""
+
+    elapsed_s: float
+    messages: int
+    overall: TurnStats
+    per_tenant: dict[str, TurnStats]
+    config: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_samples(
+        cls,
+        samples: list[TurnSample],
+        *,
+        elapsed_s: float,
+        messages: int,
+        config: dict[str, Any] | None = None,
+    ) -> "LoadReport":
+        """Aggregate samples overall and per tenant."""
+        by_tenant: dict[str, list[TurnSample]] = {}
+        for sample in samples:
+            by_tenant.setdefault(sample.tenant_id, []).append(sample)
+
+        return cls(
+            elapsed_s=round(elapsed_s, 3),
+            messages=messages,
+            overall=TurnStats.from_samples(samples, elapsed_s),
+            per_tenant={
+                tenant_id: TurnStats.from_samples(tenant_samples, elapsed_s)
+                for tenant_id, tenant_samples in sorted(
+                    by_tenant.items(), key=lambda item: -len(item[1])
+                )
+            },
+            config=config or {},
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable report."""
+        return {
+            "elapsed_s": self.elapsed_s,
+            "messages": self.messages,
+            "config": self.config,
+            "overall": vars(self.overall),
+            "per_tenant": {tenant_id: vars(stats) for tenant_id, stats in self.per_tenant.items()},
+        }
+
+    def format_table(self) -> str:
+        """Human-readable summary, one row per tenant."""
+        header = (
+            f"{'tenant':<38} {'turns':>6} {'ok':>6} {'fail':>5} {'turn/s':>7} "
+            f"{'supers%':>7} {'mutex p95':>9} {'overshoot p95':>13} "
+            f"{'lat p50':>8} {'lat p95':>8} {'lat p99':>8}"
+        )
+        rows = [
+            f"{self.messages} messages in {self.elapsed_s:.1f}s",
+            header,
+            "-" * len(header),
+        ]
+        for name, stats in [*self.per_tenant.items(), ("ALL", self.overall)]:
+            rows.append(
+                f"{name:<38} {stats.turns:>6} {stats.completed:>6} "
+                f"{stats.failed + stats.lock_failed:>5} {stats.throughput_per_s:>7.2f} "
+                f"{stats.superseded_rate * 100:>7.1f} {stats.mutex_wait_ms['p95']:>9.0f} "
+                f"{stats.overshoot_ms['p95']:>13.0f} {stats.latency_ms['p50']:>8.0f} "
+                f"{stats.latency_ms['p95']:>8.0f} {stats.latency_ms['p99']:>8.0f}"
+            )
+        return "\n".join(rows)
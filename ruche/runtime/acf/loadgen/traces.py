@@ -0,0 +1,230 @@
+"""Conversation traces for ACF load generation.
+
+A trace is the list of raw messages one interlocutor sends on one channel,
+each with its offset from the start of the run. Traces are either loaded
+from a recording (JSON lines) or generated synthetically with per-channel
+burst timing: users on chat channels send a request as a burst of short
+messages, then read the answer before the next burst.
+"""
+
+import json
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+from uuid import UUID, uuid4
+
+from ruche.runtime.acf.mutex import build_session_key
+
+
+@dataclass(frozen=True)
+class TraceMessage:
+    """One raw message of a trace."""
+
+    offset_ms: float
+    content: str
+    message_id: UUID = field(default_factory=uuid4)
+
+
+@dataclass
+class ConversationTrace:
+    """Messages one interlocutor sends to one agent on one channel."""
+
+    tenant_id: str
+    agent_id: str
+    interlocutor_id: str
+    channel: str
+    messages: list[TraceMessage] = field(default_factory=list)
+
+    @property
+    def session_key(self) -> str:
+        """Session key the messages are serialized on."""
+        return build_session_key(self.tenant_id, self.agent_id, self.interlocutor_id, self.channel)
+
+
+@dataclass(frozen=True)
+class ChannelTiming:
+    """Message timing of a channel.
+
+    Attributes:
+        burst_sizes: Relative weights of 1, 2, 3... messages per burst
+        intra_burst_ms: (min, max) gap between messages of a burst
+        think_time_median_ms: Median gap between bursts (lognormal)
+    """
+
+    burst_sizes: tuple[float, ...]
+    intra_burst_ms: tuple[float, float]
+    think_time_median_ms: float
+
+
+CHANNEL_TIMING: dict[str, ChannelTiming] = {
+    "whatsapp": ChannelTiming((0.45, 0.3, 0.15, 0.1), (300, 2500), 9000),
+    "telegram": ChannelTiming((0.5, 0.3, 0.2), (300, 2000), 8000),
+    "webchat": ChannelTiming((0.65, 0.25, 0.1), (200, 1200), 7000),
+    "sms": ChannelTiming((0.8, 0.2), (800, 4000), 20000),
+    "email": ChannelTiming((1.0,), (0, 0), 60000),
+}
+
+DEFAULT_CHANNEL_MIX: dict[str, float] = {
+    "whatsapp": 0.5,
+    "webchat": 0.3,
+    "sms": 0.1,
+    "email": 0.1,
+}
+
+# Burst openers, fragments and complete requests, so TurnManager sees the
+# message shapes it adapts the accumulation window to
+_OPENERS = ["hi", "hello", "hey", "good morning"]
+_FRAGMENTS = ["I need help with my order", "about order #", "so basically,", "the thing is..."]
+_REQUESTS = [
+    "Can you check the status of order 4512?",
+    "I want to change my delivery address.",
+    "Why was I charged twice this month?",
+    "Please cancel my subscription, thanks",
+    "Is the store open on Sunday?",
+]
+
+
+def _burst(rng: random.Random, size: int) -> list[str]:
+    """Texts of one burst: optional opener and fragments, then a request."""
+    texts: list[str] = []
+    if size > 1 and rng.random() < 0.4:
+        texts.append(rng.choice(_OPENERS))
+    while len(texts) < size - 1:
+        texts.append(rng.choice(_FRAGMENTS))
+    texts.append(rng.choice(_REQUESTS))
+    return texts
+
+
+def synthetic_traces(
+    *,
+    tenants: int = 3,
+    agents_per_tenant: int = 2,
+    sessions: int = 200,
+    turns_per_session: int = 4,
+    duration_s: float = 60.0,
+    tenant_skew: float = 1.0,
+    channel_mix: dict[str, float] | None = None,
+    seed: int = 0,
+) -> list[ConversationTrace]:
+    """Generate synthetic conversation traces.
+
+    Sessions start uniformly over the run and are spread over tenants with
+    a Zipf-like skew, so the first tenant is the noisy neighbour.
+
+    Args:
+        tenants: Number of tenants
+        agents_per_tenant: Agents per tenant
+        sessions: Total number of conversations
+        turns_per_session: Bursts (user turns) per conversation
+        duration_s: Window over which conversations start
+        tenant_skew: Zipf exponent of sessions per tenant (0 = uniform)
+        channel_mix: Relative channel weights
+        seed: Random seed
+
+    Returns:
+        One trace per conversation
+    """
+    rng = random.Random(seed)
+    mix = channel_mix or DEFAULT_CHANNEL_MIX
+    channels = list(mix)
+    tenant_ids = [str(UUID(int=rng.getrandbits(128))) for _ in range(tenants)]
+    agent_ids = {
+        tenant_id: [str(UUID(int=rng.getrandbits(128))) for _ in range(agents_per_tenant)]
+        for tenant_id in tenant_ids
+    }
+    tenant_weights = [1 / (rank + 1) ** tenant_skew for rank in range(tenants)]
+
+    traces: list[ConversationTrace] = []
+    for _ in range(sessions):
+        tenant_id = rng.choices(tenant_ids, tenant_weights)[0]
+        channel = rng.choices(channels, [mix[c] for c in channels])[0]
+        timing = CHANNEL_TIMING.get(channel, CHANNEL_TIMING["webchat"])
+        trace = ConversationTrace(
+            tenant_id=tenant_id,
+            agent_id=rng.choice(agent_ids[tenant_id]),
+            interlocutor_id=str(UUID(int=rng.getrandbits(128))),
+            channel=channel,
+        )
+
+        offset = rng.uniform(0, duration_s * 1000)
+        for turn in range(turns_per_session):
+            if turn:
+                offset += rng.lognormvariate(0, 0.6) * timing.think_time_median_ms
+            size = rng.choices(range(1, len(timing.burst_sizes) + 1), timing.burst_sizes)[0]
+            for i, text in enumerate(_burst(rng, size)):
+                if i:
+                    offset += rng.uniform(*timing.intra_burst_ms)
+                trace.messages.append(
+                    TraceMessage(
+                        offset_ms=offset, content=text, message_id=UUID(int=rng.getrandbits(128))
+                    )
+                )
+        traces.append(trace)
+
+    return traces
+
+
+def load_traces(path: str | Path) -> list[ConversationTrace]:
+    """Load recorded traces from a JSON lines file.
+
+    Each line is one message with tenant_id, agent_id, interlocutor_id,
+    channel, offset_ms and content (message_id is optional). Messages are
+    grouped into one trace per session.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Traces with messages in offset order
+
+    Raises:
+        ValueError: If a line is not valid JSON or misses a field
+    """
+    traces: dict[tuple[str, str, str, str], ConversationTrace] = {}
+    with Path(path).open(encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                key = (
+                    str(record["tenant_id"]),
+                    str(record["agent_id"]),
+                    str(record["interlocutor_id"]),
+                    str(record["channel"]),
+                )
+                message = TraceMessage(
+                    offset_ms=float(record["offset_ms"]),
+                    content=str(record["content"]),
+                    message_id=UUID(record["message_id"]) if "message_id" in record else uuid4(),
+                )
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"Invalid trace record on line {line_no}: {e}") from e
+            trace = traces.setdefault(key, ConversationTrace(*key))
+            trace.messages.append(message)
+
+    for trace in traces.values():
+        trace.messages.sort(key=lambda m: m.offset_ms)
+    return list(traces.values())
+
+
+def dump_traces(traces: list[ConversationTrace], path: str | Path) -> None:
+    """Write traces as JSON lines readable by load_traces().
+
+    Args:
+        traces: Traces to write
+        path: File to write
+    """
+    with Path(path).open("w", encoding="utf-8") as f:
+        for trace in traces:
+            for message in trace.messages:
+                record = {
+                    "tenant_id": trace.tenant_id,
+                    "agent_id": trace.agent_id,
+                    "interlocutor_id": trace.interlocutor_id,
+                    "channel": trace.channel,
+                    "offset_ms": round(message.offset_ms, 3),
+                    "content": message.content,
+                    "message_id": str(message.message_id),
+                }
+                f.write(json.dumps(record) + "\n")
@@ -2,13 +2,90 @@
 
 Redis-backed distributed lock ensuring single-writer rule per conversation.
 ACF owns mutex acquisition, extension, and release during turn processing.
+
+Acquire, extend and release are Lua scripts that check the holder's token,
+so a holder whose lease expired can never release or renew the next
+holder's lock. Every acquisition also takes the next value of a
+per-session counter, a fencing token. No store checks it on write yet:
+the commit step only verifies that its token still holds the lock, which
+narrows but does not close the window in which a replaced holder writes.
+
+Waiters do not poll. A release pushes onto a per-session wake-up list and
+one waiter blocked on BLPOP retries immediately; a waiter never blocks
+past the current lease expiry, so a crashed holder costs at most the
+remaining lease.
 """
 
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from dataclasses import dataclass
+from uuid import uuid4
 
 from redis.asyncio import Redis
 
+from ruche.observability.logging import get_logger
+from ruche.observability.metrics import (
+    SESSION_MUTEX_LEASE_LOST,
+    SESSION_MUTEX_WAIT,
+    SESSION_MUTEX_WAKEUPS,
+)
+
+logger = get_logger(__name__)
+
+# KEYS: lock, fence
+# ARGV: token, lease_ms, fence_ttl_ms
+# Returns {1, fence} when acquired, else {0, pttl of the current holder}
+_ACQUIRE_SCRIPT = """
+if redis.call('SET', KEYS[1], ARGV[1], 'NX', 'PX', ARGV[2]) then
+    local fence = redis.call('INCR', KEYS[2])
+    redis.call('PEXPIRE', KEYS[2], ARGV[3])
+    return {1, fence}
+end
+return {0, redis.call('PTTL', KEYS[1])}
+"""
+
+# KEYS: lock, wake
+# ARGV: token, wake_ttl_ms
+# The wake-up list holds at most one entry so stale wake-ups cannot pile up
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    redis.call('DEL', KEYS[2])
+    redis.call('RPUSH', KEYS[2], '1')
+    redis.call('PEXPIRE', KEYS[2], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+# KEYS: lock
+# ARGV: token, lease_ms
+_EXTEND_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+@dataclass(frozen=True)
+class MutexLease:
+    """A held session lock.
+
+    Attributes:
+        session_key: Session the lock belongs to
+        lock_key: Redis lock key
+        token: Holder token; only this token can extend or release
+        fence: Fencing token, increasing with every acquisition of the session
+    """
+
+    session_key: str
+    lock_key: str
+    token: str
+    fence: int
+
 
 class SessionMutex:
     """Redis-backed distributed lock for session-level mutual exclusion.
@@ -21,6 +98,8 @@ class SessionMutex:
     - Audit trail corruption
 
     Lock key format: sesslock:{tenant}:{agent}:{customer}:{channel}
+    Fence key format: sessfence:{tenant}:{agent}:{customer}:{channel}
+    Wake-up key format: sesswake:{tenant}:{agent}:{customer}:{channel}
     """
 
     def __init__(
@@ -28,6 +107,7 @@ class SessionMutex:
         redis: Redis,
         lock_timeout: int = 30,
         blocking_timeout: float = 5.0,
+        fence_ttl: int = 30 * 86400,
     ):
         """Initialize session mutex.
 
@@ -35,15 +115,33 @@ class SessionMutex:
             redis: Redis client instance
             lock_timeout: How long lock is held before auto-release (seconds)
             blocking_timeout: How long to wait when trying to acquire (seconds)
+            fence_ttl: How long an idle session keeps its fence counter (seconds)
         """
         self._redis = redis
         self._lock_timeout = lock_timeout
         self._blocking_timeout = blocking_timeout
+        self._fence_ttl = fence_ttl
+        self._acquire_script = redis.register_script(_ACQUIRE_SCRIPT)
+        self._release_script = redis.register_script(_RELEASE_SCRIPT)
+        self._extend_script = redis.register_script(_EXTEND_SCRIPT)
 
     def _key(self, session_key: str) -> str:
         """Build Redis lock key."""
         return f"sesslock:{session_key}"
 
+    def _fence_key(self, session_key: str) -> str:
+        """Build Redis fence counter key."""
+        return f"sessfence:{session_key}"
+
+    def _wake_key(self, session_key: str) -> str:
+        """Build Redis wake-up list key."""
+        return f"sesswake:{session_key}"
+
+    @staticmethod
+    def _session_key(lock_key: str) -> str:
+        """Session key of a lock key."""
+        return lock_key.removeprefix("sesslock:")
+
     @asynccontextmanager
     async def acquire(
         self,
@@ -66,24 +164,14 @@ class SessionMutex:
                 else:
                     # Lock not acquired, handle accordingly
         """
-        timeout = blocking_timeout or self._blocking_timeout
-
-        lock = self._redis.lock(
-            self._key(session_key),
-            timeout=self._lock_timeout,
-            blocking_timeout=timeout,
-        )
-
-        acquired = await lock.acquire()
+        lease = await self.acquire_direct(session_key, blocking_timeout)
         try:
-            yield acquired
+            yield lease is not None
         finally:
-            if acquired:
-                try:
-                    await lock.release()
-                except Exception:
-                    # Lock may have expired, that's okay
-                    pass
+            if lease is not None:
+                # On failure the lock expires on its own
+                with contextlib.suppress(Exception):
+                    await self.release_direct(lease.lock_key, lease.token)
 
     async def is_locked(self, session_key: str) -> bool:
         """Check if a session is currently locked."""
@@ -97,27 +185,107 @@ class SessionMutex:
         Returns:
             True if lock was released, False if it didn't exist
         """
-        return await self._redis.delete(self._key(session_key)) > 0
-
-    async def extend(self, session_key: str, additional_time: int = 30) -> bool:
-        """Extend lock timeout for long-running operations.
+        released = await self._redis.delete(self._key(session_key)) > 0
+        if released:
+            await self._wake(session_key)
+        return released
+
+    async def _wake(self, session_key: str) -> None:
+        """Wake one waiter after a release done outside the release script."""
+        wake_key = self._wake_key(session_key)
+        await self._redis.rpush(wake_key, "1")
+        await self._redis.pexpire(wake_key, int(self._lock_timeout * 1000))
+
+    async def extend(
+        self,
+        session_key: str,
+        token: str,
+        lease_time: int | None = None,
+    ) -> bool:
+        """Renew the lease of a held lock.
 
         Call this periodically during long pipeline runs to prevent
-        the lock from expiring mid-execution.
+        the lock from expiring mid-execution (see heartbeat()).
 
         Args:
             session_key: Session identifier
-            additional_time: Seconds to extend
+            token: Token of the holder (MutexLease.token)
+            lease_time: New lease in seconds (default: lock_timeout)
 
         Returns:
-            True if extended successfully
+            True if renewed, False if the lock is no longer held by token
         """
-        lock = self._redis.lock(self._key(session_key))
-        return await lock.extend(additional_time)
+        lease_ms = int((lease_time or self._lock_timeout) * 1000)
+        renewed = await self._extend_script(
+            keys=[self._key(session_key)],
+            args=[token, lease_ms],
+        )
+        return bool(renewed)
+
+    async def holds(self, session_key: str, token: str) -> bool:
+        """Check that token still holds the session lock."""
+        value = await self._redis.get(self._key(session_key))
+        if isinstance(value, bytes):
+            value = value.decode()
+        return value == token
+
+    async def current_fence(self, session_key: str) -> int:
+        """Latest fencing token issued for a session (0 if none).
+
+        A store that records the fence of its last write can reject a
+        write carrying a lower fence: that writer's lease was taken over.
+        """
+        value = await self._redis.get(self._fence_key(session_key))
+        return int(value) if value is not None else 0
+
+    @asynccontextmanager
+    async def heartbeat(
+        self,
+        session_key: str,
+        token: str,
+        interval: float | None = None,
+    ) -> AsyncGenerator[None, None]:
+        """Renew the lease in the background while the body runs.
+
+        A failed renewal means the lease was lost; it is logged and
+        counted, and renewal stops. The body is not interrupted; commit
+        checks ownership with holds().
+
+        Args:
+            session_key: Session identifier
+            token: Token of the holder
+            interval: Seconds between renewals (default: a third of lock_timeout)
+        """
+        period = interval or self._lock_timeout / 3
+
+        async def renew() -> None:
+            while True:
+                await asyncio.sleep(period)
+                try:
+                    renewed = await self.extend(session_key, token)
+                except Exception as e:
+                    logger.warning(
+                        "mutex_heartbeat_failed",
+                        session_key=session_key,
+                        error=str(e),
+                    )
+                    continue
+                if not renewed:
+                    SESSION_MUTEX_LEASE_LOST.inc()
+                    logger.warning("mutex_lease_lost", session_key=session_key)
+                    return
+
+        task = asyncio.create_task(renew())
+        try:
+            yield
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
 
     async def acquire_direct(
         self, session_key: str, blocking_timeout: float | None = None
-    ) -> str | None:
+    ) -> MutexLease | None:
         """Acquire lock directly without context manager.
 
         CRITICAL: For Hatchet workflows where lock must persist across steps.
@@ -128,23 +296,70 @@ class SessionMutex:
             blocking_timeout: Override default blocking timeout
 
         Returns:
-            Lock key if acquired, None if failed
+            MutexLease if acquired, None if failed
         """
+        loop = asyncio.get_running_loop()
         timeout = blocking_timeout or self._blocking_timeout
+        started = loop.time()
+        deadline = started + timeout
         lock_key = self._key(session_key)
+        token = uuid4().hex
 
-        lock = self._redis.lock(lock_key, timeout=self._lock_timeout)
-        acquired = await lock.acquire(blocking_timeout=timeout)
-
-        return lock_key if acquired else None
-
-    async def release_direct(self, lock_key: str) -> None:
-        """Release a directly-acquired lock.
+        while True:
+            acquired, value = await self._acquire_script(
+                keys=[lock_key, self._fence_key(session_key)],
+                args=[token, int(self._lock_timeout * 1000), int(self._fence_ttl * 1000)],
+            )
+            if acquired:
+                SESSION_MUTEX_WAIT.labels(outcome="acquired").observe(loop.time() - started)
+                return MutexLease(
+                    session_key=session_key,
+                    lock_key=lock_key,
+                    token=token,
+                    fence=int(value),
+                )
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                SESSION_MUTEX_WAIT.labels(outcome="timeout").observe(loop.time() - started)
+                return None
+
+            # value is the holder's remaining lease in ms (-2: released
+            # since, -1: no expiry); PTTL truncates, so round up by 1ms
+            pttl = int(value)
+            if pttl == -2:
+                continue
+            wait = remaining if pttl == -1 else min(remaining, (pttl + 1) / 1000)
+            woken = await self._redis.blpop([self._wake_key(session_key)], timeout=max(wait, 0.01))
+            SESSION_MUTEX_WAKEUPS.labels(reason="released" if woken else "expired").inc()
+
+    async def release_direct(self, lock_key: str, token: str | None = None) -> bool:
+        """Release a directly-acquired lock and wake one waiter.
 
         Args:
             lock_key: The full Redis key from acquire_direct()
+            token: Token of the holder. Without it the key is deleted
+                unconditionally, which is only safe for step outputs
+                written before locks carried tokens.
+
+        Returns:
+            True if the lock was released, False if token no longer held it
         """
-        await self._redis.delete(lock_key)
+        session_key = self._session_key(lock_key)
+        if token is None:
+            logger.warning("mutex_released_without_token", session_key=session_key)
+            await self._redis.delete(lock_key)
+            await self._wake(session_key)
+            return True
+
+        released = await self._release_script(
+            keys=[lock_key, self._wake_key(session_key)],
+            args=[token, int(self._lock_timeout * 1000)],
+        )
+        if not released:
+            SESSION_MUTEX_LEASE_LOST.inc()
+            logger.warning("mutex_release_not_held", session_key=session_key)
+        return bool(released)
 
 
 def build_session_key(
@@ -13,15 +13,21 @@ Usage:
 """
 
 import asyncio
+import os
 import signal
+import socket
 import sys
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from redis.asyncio import Redis
 
 from ruche.config import get_settings
 from ruche.infrastructure.jobs.client import HatchetClient
-from ruche.observability.logging import get_logger, setup_logging
+from ruche.observability.logging import get_logger, setup_logging_from_config
+from ruche.runtime.acf.affinity import SessionAffinity
+from ruche.runtime.acf.cadence import TypingCadenceStore
+from ruche.runtime.acf.handoff import TurnStateStore
 from ruche.runtime.acf.workflow import LogicalTurnWorkflow, register_workflow
 
 logger = get_logger(__name__)
@@ -190,6 +196,47 @@ async def create_agent_runtime(settings) -> Any:
     return agent_runtime
 
 
+async def warm_agent_runtime(
+    agent_runtime: Any,
+    audit_store: Any,
+    settings: Any,
+) -> int:
+    """Pre-build AgentContexts for the most active agents.
+
+    Agents are ranked by recent turn count from the audit store. Failures
+    are logged and never block worker startup.
+
+    Args:
+        agent_runtime: Runtime whose context cache is warmed
+        audit_store: Audit store used to rank agents
+        settings: Application settings (api.warmup)
+
+    Returns:
+        Number of contexts built
+    """
+    config = settings.api.warmup
+    if not config.enabled or config.top_agents == 0:
+        return 0
+
+    try:
+        agents = await asyncio.wait_for(
+            audit_store.list_active_agents(
+                since=datetime.now(UTC) - timedelta(hours=config.lookback_hours),
+                limit=config.top_agents,
+            ),
+            timeout=config.timeout_seconds,
+        )
+        built = await asyncio.wait_for(
+            agent_runtime.warm_up(agents), timeout=config.timeout_seconds
+        )
+    except Exception as e:
+        logger.warning("agent_runtime_warm_up_failed", error=str(e))
+        return 0
+
+    logger.info("agent_runtime_warmed", agents=built)
+    return built
+
+
 async def create_worker() -> tuple[Any, LogicalTurnWorkflow]:
     """Create and configure Hatchet worker with LogicalTurnWorkflow.
 
@@ -227,6 +274,42 @@ async def create_worker() -> tuple[Any, LogicalTurnWorkflow]:
     # Create AgentRuntime
     agent_runtime = await create_agent_runtime(settings)
 
+    # Pre-build contexts for the busiest agents before taking work
+    await warm_agent_runtime(agent_runtime, audit_store, settings)
+
+    # Learned typing cadence shares the mutex Redis
+    cadence_config = settings.acf.cadence
+    cadence_store = (
+        TypingCadenceStore(
+            redis,
+            ttl_seconds=cadence_config.ttl_seconds,
+            max_gap_ms=cadence_config.max_gap_ms,
+            half_life_samples=cadence_config.half_life_samples,
+        )
+        if cadence_config.enabled
+        else None
+    )
+
+    handoff_config = settings.acf.handoff
+    state_store = (
+        TurnStateStore(redis, ttl_seconds=handoff_config.ttl_seconds)
+        if handoff_config.enabled
+        else None
+    )
+
+    # Session affinity: join the worker ring before taking work
+    affinity_config = settings.acf.affinity
+    affinity = None
+    if affinity_config.enabled:
+        affinity = SessionAffinity(
+            redis,
+            worker_id=f"{socket.gethostname()}:{os.getpid()}",
+            num_shards=affinity_config.num_shards,
+            member_ttl_seconds=affinity_config.member_ttl_seconds,
+            refresh_interval_seconds=affinity_config.refresh_interval_seconds,
+        )
+        await affinity.start()
+
     # Create LogicalTurnWorkflow instance
     workflow = LogicalTurnWorkflow(
         redis=redis,
@@ -236,6 +319,9 @@ async def create_worker() -> tuple[Any, LogicalTurnWorkflow]:
         audit_store=audit_store,
         mutex_timeout=300,  # 5 minutes
         mutex_blocking_timeout=10.0,  # 10 seconds
+        cadence_store=cadence_store,
+        state_store=state_store,
+        affinity=affinity,
     )
 
     logger.info("logical_turn_workflow_created")
@@ -275,8 +361,7 @@ async def run_worker() -> None:
     settings = get_settings()
 
     # Setup logging
-    log_level = settings.observability.logging.level
-    setup_logging(level=log_level)
+    setup_logging_from_config(settings.observability.logging)
 
     logger.info(
         "acf_worker_starting",
@@ -328,6 +413,10 @@ async def run_worker() -> None:
         except asyncio.CancelledError:
             pass
 
+        # Leave the ring so this worker's shards move right away
+        if workflow.affinity is not None:
+            await workflow.affinity.stop()
+
         logger.info("acf_worker_stopped")
 
     except Exception as e:
@@ -7,6 +7,8 @@ This module IS the Agent Conversation Fabric. It orchestrates:
 - Commit and response (persistence)
 """
 
+import asyncio
+import contextlib
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, Callable
@@ -15,9 +17,13 @@ from uuid import UUID, uuid4
 from redis.asyncio import Redis
 
 from ruche.observability.logging import get_logger
+from ruche.runtime.acf.affinity import SessionAffinity
+from ruche.runtime.acf.cadence import TypingCadenceStore
+from ruche.runtime.acf.event_router import EventRouter
+from ruche.runtime.acf.handoff import TurnStateStore
 from ruche.runtime.acf.models import LogicalTurn, LogicalTurnStatus
 from ruche.runtime.acf.mutex import SessionMutex, build_session_key
-from ruche.runtime.acf.turn_manager import TurnManager
+from ruche.runtime.acf.turn_manager import TurnManager, UserCadenceStats
 
 logger = get_logger(__name__)
 
@@ -38,6 +44,7 @@ class WorkflowInput:
     message_id: str
     message_content: str
     session_key: str | None = None  # Computed if not provided
+    shard: int | None = None  # Set by the gateway under session affinity
 
     def get_session_key(self) -> str:
         """Get or compute session key."""
@@ -91,6 +98,10 @@ class LogicalTurnWorkflow:
         turn_manager: TurnManager | None = None,
         mutex_timeout: int = 300,
         mutex_blocking_timeout: float = 10.0,
+        cadence_store: TypingCadenceStore | None = None,
+        event_router: EventRouter | None = None,
+        state_store: TurnStateStore | None = None,
+        affinity: SessionAffinity | None = None,
     ) -> None:
         """Initialize workflow.
 
@@ -103,6 +114,11 @@ class LogicalTurnWorkflow:
             turn_manager: Adaptive accumulation manager
             mutex_timeout: How long lock is held before auto-release
             mutex_blocking_timeout: How long to wait for lock acquisition
+            cadence_store: Learned typing cadence (channel defaults if None)
+            event_router: Dispatches emitted events to listeners (logged only if None)
+            state_store: Redis hand-off of bulky step state (inline outputs if None)
+            affinity: Shard ownership and local locks of this worker (every
+                turn takes the Redis mutex cold if None)
         """
         self._redis = redis
         self._agent_runtime = agent_runtime
@@ -110,27 +126,60 @@ class LogicalTurnWorkflow:
         self._message_store = message_store
         self._audit_store = audit_store
         self._turn_manager = turn_manager or TurnManager()
+        self._cadence_store = cadence_store
+        self._event_router = event_router
+        self._state_store = state_store
+        self._affinity = affinity
+        self._mutex_blocking_timeout = mutex_blocking_timeout
         self._mutex = SessionMutex(
             redis=redis,
             lock_timeout=mutex_timeout,
             blocking_timeout=mutex_blocking_timeout,
         )
 
-    async def acquire_mutex(self, session_key: str) -> dict[str, Any]:
+    @property
+    def affinity(self) -> SessionAffinity | None:
+        """Session affinity of this worker, if enabled."""
+        return self._affinity
+
+    async def acquire_mutex(self, session_key: str, shard: int | None = None) -> dict[str, Any]:
         """Step 1: Acquire exclusive session lock.
 
         IMPORTANT: Do NOT use context manager - lock must persist across steps.
         Lock is released explicitly in commit_and_respond or on_failure.
 
+        On a worker owning the session's shard, turns of the session queue
+        on a local lock while acquiring, so only one of them at a time waits
+        on Redis. The local lock is held only within this step; the Redis
+        lease alone spans the steps, since later steps may run elsewhere.
+
         Args:
             session_key: Composite session identifier
+            shard: Session shard from the gateway (computed if None)
 
         Returns:
             Step result with lock status
         """
-        lock_key = await self._mutex.acquire_direct(session_key)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._mutex_blocking_timeout
+        shard = self._shard(session_key, shard)
+        local_lock = self._local_lock(session_key, shard)
+        if local_lock is not None:
+            try:
+                await asyncio.wait_for(local_lock.acquire(), timeout=self._mutex_blocking_timeout)
+            except TimeoutError:
+                lease = None
+            else:
+                try:
+                    lease = await self._mutex.acquire_direct(
+                        session_key, max(deadline - loop.time(), 0.01)
+                    )
+                finally:
+                    local_lock.release()
+        else:
+            lease = await self._mutex.acquire_direct(session_key)
 
-        if lock_key is None:
+        if lease is None:
             logger.warning(
                 "mutex_acquisition_failed",
                 session_key=session_key,
@@ -144,16 +193,33 @@ class LogicalTurnWorkflow:
         logger.info(
             "mutex_acquired",
             session_key=session_key,
-            lock_key=lock_key,
+            lock_key=lease.lock_key,
+            fence=lease.fence,
+            local=local_lock is not None,
         )
 
         return {
             "status": "locked",
             "session_key": session_key,
-            "lock_key": lock_key,
+            "lock_key": lease.lock_key,
+            "lock_token": lease.token,
+            "fence": lease.fence,
+            "shard": shard,
             "locked_at": utc_now().isoformat(),
         }
 
+    def _shard(self, session_key: str, shard: int | None) -> int | None:
+        """Session shard: the gateway's, else computed (None without affinity)."""
+        if shard is not None or self._affinity is None:
+            return shard
+        return self._affinity.shard_for(session_key)
+
+    def _local_lock(self, session_key: str, shard: int | None) -> asyncio.Lock | None:
+        """Local lock of a session this worker owns, else None."""
+        if self._affinity is None or shard is None or not self._affinity.owns(shard):
+            return None
+        return self._affinity.local_lock(session_key)
+
     async def accumulate(
         self,
         turn_id: UUID,
@@ -162,6 +228,7 @@ class LogicalTurnWorkflow:
         initial_content: str,
         channel: str,
         wait_for_event: Callable[[int], Any] | None = None,
+        initial_timestamp: datetime | None = None,
     ) -> dict[str, Any]:
         """Step 2: Accumulate messages until turn is complete.
 
@@ -175,11 +242,16 @@ class LogicalTurnWorkflow:
             initial_content: First message content
             channel: Communication channel
             wait_for_event: Callback to wait for new message events
+            initial_timestamp: When the first message was sent (now if None)
 
         Returns:
             Step result with accumulated turn
         """
         now = utc_now()
+        cadence_key = (
+            self._cadence_store.key_for_session(session_key) if self._cadence_store else None
+        )
+        user_cadence = await self._observe_cadence(cadence_key, initial_timestamp or now)
 
         # Create initial turn
         turn = LogicalTurn(
@@ -194,6 +266,7 @@ class LogicalTurnWorkflow:
         wait_ms = self._turn_manager.suggest_wait_ms(
             message_content=initial_content,
             channel=channel,
+            user_cadence=user_cadence,
             messages_in_turn=1,
         )
 
@@ -202,6 +275,7 @@ class LogicalTurnWorkflow:
             turn_id=str(turn_id),
             initial_wait_ms=wait_ms,
             channel=channel,
+            learned_cadence=user_cadence is not None,
         )
 
         # If no event callback provided, skip accumulation loop
@@ -273,9 +347,11 @@ class LogicalTurnWorkflow:
                 )
 
                 # Recalculate wait time
+                user_cadence = await self._observe_cadence(cadence_key, timestamp)
                 wait_ms = self._turn_manager.suggest_wait_ms(
                     message_content=new_content,
                     channel=channel,
+                    user_cadence=user_cadence,
                     messages_in_turn=len(turn.messages),
                 )
 
@@ -302,6 +378,22 @@ class LogicalTurnWorkflow:
                     "queued_message_id": new_message_id,
                 }
 
+    async def _observe_cadence(
+        self, cadence_key: str | None, at: datetime
+    ) -> UserCadenceStats | None:
+        """Record a message in the user's cadence and return the stats.
+
+        Cadence only tunes the window, so Redis errors fall back to the
+        channel default instead of failing the turn.
+        """
+        if self._cadence_store is None or cadence_key is None:
+            return None
+        try:
+            return await self._cadence_store.observe(cadence_key, at)
+        except Exception as e:
+            logger.warning("typing_cadence_unavailable", key=cadence_key, error=str(e))
+            return None
+
     async def run_agent(
         self,
         turn_data: dict[str, Any],
@@ -310,10 +402,12 @@ class LogicalTurnWorkflow:
         interlocutor_id: str,
         channel: str,
         check_pending: Callable[[], bool] | None = None,
+        lock_token: str | None = None,
     ) -> dict[str, Any]:
         """Step 3: Execute the Agent's Brain.
 
-        Runs the Brain via AgentRuntime with interrupt checking.
+        Runs the Brain via AgentRuntime with interrupt checking. While the
+        Brain runs, the session mutex lease is renewed in the background.
 
         Args:
             turn_data: Serialized LogicalTurn from accumulate step
@@ -322,6 +416,7 @@ class LogicalTurnWorkflow:
             interlocutor_id: Customer UUID string
             channel: Communication channel
             check_pending: Callback to check for pending messages
+            lock_token: Mutex token from acquire_mutex (no lease renewal if None)
 
         Returns:
             Step result with pipeline output
@@ -377,8 +472,14 @@ class LogicalTurnWorkflow:
                 agent_context=agent_ctx,
             )
 
-            # Run Brain
-            result = await agent_ctx.brain.think(turn_ctx)
+            # Run Brain, keeping the session lease alive
+            heartbeat = (
+                self._mutex.heartbeat(turn.session_key, lock_token)
+                if lock_token
+                else contextlib.nullcontext()
+            )
+            async with heartbeat:
+                result = await agent_ctx.brain.think(turn_ctx)
 
             turn.mark_complete()
 
@@ -446,15 +547,18 @@ class LogicalTurnWorkflow:
         pipeline_output: dict[str, Any],
         lock_key: str | None,
         session_key: str,
+        lock_token: str | None = None,
     ) -> dict[str, Any]:
         """Step 4: Commit changes and send response.
 
-        Persists the turn record and releases the mutex.
+        Persists the turn record and releases the mutex. If the lease was
+        lost (expired and taken by another turn), nothing is committed.
 
         Args:
             pipeline_output: Result from run_agent step
             lock_key: Redis lock key to release
             session_key: Session identifier
+            lock_token: Mutex token from acquire_mutex
 
         Returns:
             Final workflow result
@@ -465,6 +569,24 @@ class LogicalTurnWorkflow:
         response = pipeline_output.get("response")
 
         try:
+            if (
+                status == "complete"
+                and lock_token
+                and not await self._mutex.holds(session_key, lock_token)
+            ):
+                logger.warning(
+                    "commit_lease_lost",
+                    turn_id=turn_id,
+                    session_key=session_key,
+                )
+                return {
+                    "status": "superseded",
+                    "turn_id": turn_id,
+                    "response": None,
+                    "response_sent": False,
+                    "reason": "lease_lost",
+                }
+
             if status == "complete":
                 # Save turn record to audit store
                 if self._audit_store:
@@ -491,17 +613,52 @@ class LogicalTurnWorkflow:
         finally:
             # Always release mutex
             if lock_key:
-                await self._release_mutex(lock_key, session_key)
+                await self._release_mutex(lock_key, session_key, lock_token)
+
+    async def handoff(self, step: str, output: dict[str, Any]) -> dict[str, Any]:
+        """Prepare a step output for the orchestrator.
+
+        With a state store, the turn and response move to Redis and only
+        a reference and summary are returned.
+
+        Args:
+            step: Name of the step that produced output
+            output: Step output
+
+        Returns:
+            Output to return from the Hatchet step
+        """
+        if self._state_store is None or "turn" not in output:
+            return output
+        return await self._state_store.offload(str(output["turn"]["id"]), step, output)
+
+    async def restore(self, output: dict[str, Any]) -> dict[str, Any]:
+        """Restore a step output prepared by handoff()."""
+        if self._state_store is None:
+            return output
+        return await self._state_store.load(output)
+
+    async def discard_state(self, turn_id: str) -> None:
+        """Drop the hand-off state of a finished turn (it expires otherwise)."""
+        if self._state_store is None:
+            return
+        try:
+            await self._state_store.discard(turn_id)
+        except Exception as e:
+            logger.warning("turn_state_discard_failed", turn_id=turn_id, error=str(e))
 
-    async def _release_mutex(self, lock_key: str, session_key: str) -> None:
+    async def _release_mutex(
+        self, lock_key: str, session_key: str, lock_token: str | None = None
+    ) -> None:
         """Release the session mutex.
 
         Args:
             lock_key: Redis lock key
             session_key: Session identifier for logging
+            lock_token: Mutex token from acquire_mutex
         """
         try:
-            await self._mutex.release_direct(lock_key)
+            await self._mutex.release_direct(lock_key, lock_token)
             logger.info(
                 "mutex_released",
                 session_key=session_key,
@@ -542,18 +699,16 @@ class LogicalTurnWorkflow:
             payload_keys=list(event.payload.keys()) if event.payload else [],
         )
 
-        # TODO: Future enhancements:
-        # - Store events in AuditStore for turn history
-        # - Route to analytics/observability systems
-        # - Forward to live UIs via WebSocket/SSE
-        # - Trigger external webhooks for specific event types
-        # - Update LogicalTurn.side_effects for TOOL_* events
+        # Only synchronous listeners delay the step; the rest are queued
+        if self._event_router is not None:
+            await self._event_router.route(event)
 
     async def on_failure(
         self,
         lock_key: str | None,
         session_key: str | None,
         error: str,
+        lock_token: str | None = None,
     ) -> None:
         """Handle workflow failure.
 
@@ -563,9 +718,10 @@ class LogicalTurnWorkflow:
             lock_key: Redis lock key if acquired
             session_key: Session identifier
             error: Error message
+            lock_token: Mutex token from acquire_mutex
         """
         if lock_key and session_key:
-            await self._release_mutex(lock_key, session_key)
+            await self._release_mutex(lock_key, session_key, lock_token)
 
         logger.error(
             "logical_turn_workflow_failed",
@@ -588,10 +744,11 @@ class LogicalTurnWorkflow:
         session_key = input_data.get_session_key()
         turn_id = uuid4()
         lock_key: str | None = None
+        lock_token: str | None = None
 
         try:
             # Step 1: Acquire mutex
-            mutex_result = await self.acquire_mutex(session_key)
+            mutex_result = await self.acquire_mutex(session_key, input_data.shard)
             if mutex_result["status"] == "lock_failed":
                 return WorkflowOutput(
                     turn_id=str(turn_id),
@@ -599,6 +756,7 @@ class LogicalTurnWorkflow:
                     error="Could not acquire session lock",
                 )
             lock_key = mutex_result.get("lock_key")
+            lock_token = mutex_result.get("lock_token")
 
             # Step 2: Accumulate (no event callback for now - single message)
             accumulate_result = await self.accumulate(
@@ -617,6 +775,7 @@ class LogicalTurnWorkflow:
                 agent_id=input_data.agent_id,
                 interlocutor_id=input_data.interlocutor_id,
                 channel=input_data.channel,
+                lock_token=lock_token,
             )
 
             # Step 4: Commit and respond
@@ -624,6 +783,7 @@ class LogicalTurnWorkflow:
                 pipeline_output=pipeline_result,
                 lock_key=lock_key,
                 session_key=session_key,
+                lock_token=lock_token,
             )
 
             return WorkflowOutput(
@@ -634,7 +794,7 @@ class LogicalTurnWorkflow:
             )
 
         except Exception as e:
-            await self.on_failure(lock_key, session_key, str(e))
+            await self.on_failure(lock_key, session_key, str(e), lock_token)
             return WorkflowOutput(
                 turn_id=str(turn_id),
                 status="failed",
@@ -666,7 +826,7 @@ def register_workflow(hatchet: Any, workflow: LogicalTurnWorkflow) -> Any:
                 input_data["interlocutor_id"],
                 input_data["channel"],
             )
-            return await workflow.acquire_mutex(session_key)
+            return await workflow.acquire_mutex(session_key, input_data.get("shard"))
 
         @hatchet.step()
         async def accumulate(self, ctx: Any) -> dict:
@@ -687,52 +847,66 @@ def register_workflow(hatchet: Any, workflow: LogicalTurnWorkflow) -> Any:
                     event_types=["new_message"],
                 )
 
-            return await workflow.accumulate(
+            result = await workflow.accumulate(
                 turn_id=turn_id,
                 session_key=session_key,
                 initial_message_id=input_data["message_id"],
                 initial_content=input_data.get("message_content", ""),
                 channel=input_data["channel"],
                 wait_for_event=wait_for_event,
+                initial_timestamp=(
+                    datetime.fromisoformat(input_data["timestamp"])
+                    if input_data.get("timestamp")
+                    else None
+                ),
             )
+            return await workflow.handoff("accumulate", result)
 
         @hatchet.step()
         async def run_agent(self, ctx: Any) -> dict:
             """Step 3: Execute agent brain."""
             input_data = ctx.workflow_input() or {}
+            mutex_output = ctx.step_output("acquire_mutex") or {}
             accumulate_output = ctx.step_output("accumulate")
 
             if accumulate_output.get("status") == "skipped":
                 return {"status": "skipped", "reason": "accumulate_skipped"}
 
+            accumulate_output = await workflow.restore(accumulate_output)
+
             async def check_pending() -> bool:
                 """Check for pending messages."""
                 event = await ctx.check_event("new_message", block=False)
                 return event is not None
 
-            return await workflow.run_agent(
+            result = await workflow.run_agent(
                 turn_data=accumulate_output["turn"],
                 tenant_id=input_data["tenant_id"],
                 agent_id=input_data["agent_id"],
                 interlocutor_id=input_data["interlocutor_id"],
                 channel=input_data["channel"],
                 check_pending=check_pending,
+                lock_token=mutex_output.get("lock_token"),
             )
+            return await workflow.handoff("run_agent", result)
 
         @hatchet.step()
         async def commit_and_respond(self, ctx: Any) -> dict:
             """Step 4: Commit and respond."""
             mutex_output = ctx.step_output("acquire_mutex")
-            pipeline_output = ctx.step_output("run_agent")
+            pipeline_output = await workflow.restore(ctx.step_output("run_agent"))
 
             lock_key = mutex_output.get("lock_key")
             session_key = mutex_output.get("session_key", "")
 
-            return await workflow.commit_and_respond(
+            result = await workflow.commit_and_respond(
                 pipeline_output=pipeline_output,
                 lock_key=lock_key,
                 session_key=session_key,
+                lock_token=mutex_output.get("lock_token"),
             )
+            await workflow.discard_state(result["turn_id"])
+            return result
 
         @hatchet.on_failure()
         async def handle_failure(self, ctx: Any) -> None:
@@ -745,6 +919,7 @@ def register_workflow(hatchet: Any, workflow: LogicalTurnWorkflow) -> Any:
                 lock_key=lock_key,
                 session_key=session_key,
                 error=str(ctx.error) if hasattr(ctx, "error") else "Unknown error",
+                lock_token=mutex_output.get("lock_token"),
             )
 
     return HatchetLogicalTurnWorkflow
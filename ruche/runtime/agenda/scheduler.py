@@ -1,13 +1,17 @@
 """Agenda scheduler for proactive task execution.
 
 The scheduler:
-1. Polls for due tasks
-2. Acquires task locks (distributed)
-3. Executes tasks via TaskWorkflow
-4. Updates task status
+1. Claims due tasks from the store (atomic, leased, multi-replica safe),
+   never more than it has free execution slots
+2. Executes them via TaskWorkflow in the background, renewing each
+   claim's lease from the moment it is claimed until the task finishes
+3. Updates task status
+4. Sleeps until the next due time, a newly scheduled task or a freed
+   slot, capped by the poll interval
 """
 
 import asyncio
+import contextlib
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 from uuid import UUID
@@ -42,21 +46,30 @@ class AgendaScheduler:
         task_workflow: "TaskWorkflow",
         poll_interval_seconds: int = 60,
         max_tasks_per_batch: int = 100,
+        max_concurrency: int = 10,
+        lease_seconds: int = 300,
     ):
         """Initialize scheduler.
 
         Args:
             task_store: Task persistence store
             task_workflow: Workflow executor for tasks
-            poll_interval_seconds: How often to check for due tasks
-            max_tasks_per_batch: Maximum tasks to process per poll
+            poll_interval_seconds: Maximum idle sleep between claims
+            max_tasks_per_batch: Maximum tasks to claim per iteration
+            max_concurrency: Maximum tasks executing at once
+            lease_seconds: Claim lease; tasks not finished by then are
+                claimed again (e.g. after a replica crash)
         """
         self._task_store = task_store
         self._task_workflow = task_workflow
         self._poll_interval_seconds = poll_interval_seconds
         self._max_tasks_per_batch = max_tasks_per_batch
+        self._max_concurrency = max_concurrency
+        self._lease_seconds = lease_seconds
         self._running = False
         self._poll_task: asyncio.Task | None = None
+        self._in_flight: set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
 
     async def start(self) -> None:
         """Start the scheduler loop.
@@ -74,6 +87,7 @@ class AgendaScheduler:
             "scheduler_started",
             poll_interval_seconds=self._poll_interval_seconds,
             max_tasks_per_batch=self._max_tasks_per_batch,
+            max_concurrency=self._max_concurrency,
         )
 
     async def stop(self) -> None:
@@ -85,13 +99,21 @@ class AgendaScheduler:
 
         if self._poll_task:
             self._poll_task.cancel()
-            try:
+            with contextlib.suppress(asyncio.CancelledError):
                 await self._poll_task
-            except asyncio.CancelledError:
-                pass
+
+        # Interrupted tasks keep their claim until the lease expires
+        for task in self._in_flight:
+            task.cancel()
+        await asyncio.gather(*self._in_flight, return_exceptions=True)
 
         logger.info("scheduler_stopped")
 
+    async def join(self) -> None:
+        """Wait until every claimed task has finished executing."""
+        while self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
     async def schedule_task(
         self,
         tenant_id: UUID,
@@ -109,6 +131,7 @@ class AgendaScheduler:
             Task ID
         """
         await self._task_store.save(task)
+        self._wakeup.set()
 
         logger.info(
             "task_scheduled",
@@ -155,25 +178,64 @@ class AgendaScheduler:
         return True
 
     async def _poll_loop(self) -> None:
-        """Background polling loop for due tasks."""
+        """Background loop: claim due tasks, then sleep until the next one."""
         while self._running:
+            claimed = 0
             try:
-                await self._process_due_tasks()
+                claimed = await self._process_due_tasks()
             except Exception as e:
                 logger.error("poll_loop_error", error=str(e))
 
-            await asyncio.sleep(self._poll_interval_seconds)
+            if claimed >= self._max_tasks_per_batch and self._free_slots() > 0:
+                # Backlog: claim the next batch straight away
+                continue
+
+            await self._wait_for_next_due()
+
+    async def _wait_for_next_due(self) -> None:
+        """Sleep until the next due task, a new schedule, a freed slot, or the poll interval."""
+        # Cleared before the lookup, so a wake-up during it is not lost
+        self._wakeup.clear()
+        timeout = float(self._poll_interval_seconds)
+        if self._free_slots() > 0:
+            try:
+                next_due = await self._task_store.next_due_at()
+            except Exception as e:
+                logger.warning("next_due_lookup_failed", error=str(e))
+                next_due = None
+
+            if next_due is not None:
+                until_due = (next_due - datetime.now(UTC)).total_seconds()
+                timeout = min(timeout, max(until_due, 0.0))
+
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+
+    def _free_slots(self) -> int:
+        return self._max_concurrency - len(self._in_flight)
+
+    async def _process_due_tasks(self) -> int:
+        """Claim due tasks for the free execution slots and start them.
+
+        Tasks run in the background; a finished task frees its slot and
+        wakes the poll loop.
+
+        Returns:
+            Number of tasks claimed
+        """
+        limit = min(self._max_tasks_per_batch, self._free_slots())
+        if limit <= 0:
+            return 0
 
-    async def _process_due_tasks(self) -> None:
-        """Find and execute due tasks."""
         now = datetime.now(UTC)
-        due_tasks = await self._task_store.get_due_tasks(
+        due_tasks = await self._task_store.claim_due_tasks(
             before=now,
-            limit=self._max_tasks_per_batch,
+            limit=limit,
+            lease_seconds=self._lease_seconds,
         )
 
         if not due_tasks:
-            return
+            return 0
 
         logger.info(
             "processing_due_tasks",
@@ -181,17 +243,45 @@ class AgendaScheduler:
         )
 
         for task in due_tasks:
-            if not self._running:
-                break
+            heartbeat = asyncio.create_task(self._renew_lease(task.id))
+            running = asyncio.create_task(self._run_claimed(task, heartbeat))
+            self._in_flight.add(running)
+            running.add_done_callback(self._on_task_done)
+
+        return len(due_tasks)
 
+    async def _run_claimed(self, task: Task, heartbeat: asyncio.Task) -> None:
+        """Execute a claimed task, then stop renewing its lease."""
+        try:
+            await self._execute_task(task)
+        except Exception as e:
+            logger.error(
+                "task_execution_failed",
+                task_id=str(task.id),
+                error=str(e),
+            )
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        self._in_flight.discard(task)
+        self._wakeup.set()
+
+    async def _renew_lease(self, task_id: UUID) -> None:
+        """Extend the task's claim every third of the lease until cancelled.
+
+        Keeps tasks that run longer than lease_seconds from being reclaimed
+        (and executed twice) by another replica.
+        """
+        interval = self._lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
             try:
-                await self._execute_task(task)
+                await self._task_store.extend_lease(task_id, self._lease_seconds)
             except Exception as e:
-                logger.error(
-                    "task_execution_failed",
-                    task_id=str(task.id),
-                    error=str(e),
-                )
+                logger.warning("task_lease_renewal_failed", task_id=str(task_id), error=str(e))
 
     async def _execute_task(self, task: Task) -> None:
         """Execute a scheduled task.
@@ -58,6 +58,53 @@ class TaskStore(ABC):
         """
         pass
 
+    @abstractmethod
+    async def claim_due_tasks(
+        self,
+        before: datetime,
+        limit: int = 100,
+        *,
+        lease_seconds: int = 300,
+    ) -> list[Task]:
+        """Atomically claim due tasks for execution.
+
+        Claimed tasks move to status=RUNNING so no other scheduler replica
+        picks them up. RUNNING tasks whose lease expired (e.g. the replica
+        crashed mid-execution) are claimed again.
+
+        Args:
+            before: Time threshold for due tasks
+            limit: Maximum tasks to claim
+            lease_seconds: How long a claim is held before it can be reclaimed
+
+        Returns:
+            Claimed tasks ordered by scheduled_for ascending
+        """
+        pass
+
+    @abstractmethod
+    async def extend_lease(self, task_id: UUID, lease_seconds: int) -> None:
+        """Push back the lease of a claimed task.
+
+        Called periodically while a task executes so long-running tasks are
+        not reclaimed by another replica. No-op if the task is not RUNNING.
+
+        Args:
+            task_id: Task identifier
+            lease_seconds: New lease duration, counted from now
+        """
+        pass
+
+    async def next_due_at(self) -> datetime | None:
+        """Get the earliest time a scheduled task becomes due.
+
+        Lets the scheduler sleep until the next task instead of polling.
+
+        Returns:
+            Earliest due time, or None if unknown/no scheduled tasks
+        """
+        return None
+
     @abstractmethod
     async def get_interlocutor_tasks(
         self,
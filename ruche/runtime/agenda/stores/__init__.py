@@ -2,8 +2,12 @@
 
 from ruche.runtime.agenda.store import TaskStore
 from ruche.runtime.agenda.stores.inmemory import InMemoryTaskStore
+from ruche.runtime.agenda.stores.postgres import PostgresTaskStore
+from ruche.runtime.agenda.stores.redis import RedisTaskStore
 
 __all__ = [
     "TaskStore",
     "InMemoryTaskStore",
+    "PostgresTaskStore",
+    "RedisTaskStore",
 ]
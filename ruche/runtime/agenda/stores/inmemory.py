@@ -1,6 +1,7 @@
 """In-memory implementation of TaskStore."""
 
-from datetime import UTC, datetime
+import heapq
+from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 from ruche.domain.agenda import Task, TaskStatus
@@ -10,17 +11,25 @@ from ruche.runtime.agenda.store import TaskStore
 class InMemoryTaskStore(TaskStore):
     """In-memory implementation of TaskStore for testing and development.
 
-    Uses simple dict storage with linear scan for queries.
-    Not suitable for production use.
+    Scheduled tasks are indexed in a min-heap keyed by due time, so due-task
+    queries only touch tasks that are actually due. Heap entries are
+    invalidated lazily: an entry is stale once its task is no longer
+    scheduled or has been rescheduled. Claimed tasks hold a lease; RUNNING
+    tasks whose lease expired are claimed again.
+    Not suitable for production use (single process, not durable).
     """
 
     def __init__(self) -> None:
         """Initialize empty storage."""
         self._tasks: dict[UUID, Task] = {}
+        self._due_heap: list[tuple[datetime, int, UUID]] = []
+        self._seq = 0
+        self._leases: dict[UUID, datetime] = {}
 
     async def save(self, task: Task) -> None:
         """Save or update a task."""
         self._tasks[task.id] = task
+        self._index(task)
 
     async def get(self, task_id: UUID) -> Task | None:
         """Get a task by ID."""
@@ -32,31 +41,52 @@ class InMemoryTaskStore(TaskStore):
         limit: int = 100,
     ) -> list[Task]:
         """Get tasks that are due for execution."""
-        now = datetime.now(UTC)
-        results = []
-
-        for task in self._tasks.values():
-            # Only scheduled tasks
-            if task.status != TaskStatus.SCHEDULED:
-                continue
-
-            # Check if expired
-            if task.is_expired:
-                continue
-
-            # Check scheduled_for
-            if task.scheduled_for > before:
-                continue
-
-            # Check execute_after if set
-            if task.execute_after and task.execute_after > before:
-                continue
-
-            results.append(task)
+        due = self._pop_due(before, limit)
+        # Non-destructive query: restore the entries
+        for entry in due:
+            heapq.heappush(self._due_heap, entry)
+        return [self._tasks[task_id] for _, _, task_id in due]
 
-        # Sort by scheduled_for ascending (oldest first)
-        results.sort(key=lambda t: t.scheduled_for)
-        return results[:limit]
+    async def claim_due_tasks(
+        self,
+        before: datetime,
+        limit: int = 100,
+        *,
+        lease_seconds: int = 300,
+    ) -> list[Task]:
+        """Claim due (or lease-expired) tasks, marking them RUNNING."""
+        now = datetime.now(UTC)
+        lease_until = now + timedelta(seconds=lease_seconds)
+        expired = [
+            task_id
+            for task_id, until in self._leases.items()
+            if until < now and self._tasks[task_id].status == TaskStatus.RUNNING
+        ][:limit]
+        due = self._pop_due(before, limit - len(expired))
+
+        claimed = []
+        for task_id in [*expired, *(task_id for _, _, task_id in due)]:
+            task = self._tasks[task_id]
+            task.status = TaskStatus.RUNNING
+            task.started_at = now
+            self._leases[task_id] = lease_until
+            claimed.append(task)
+        claimed.sort(key=lambda t: t.due_at)
+        return claimed
+
+    async def extend_lease(self, task_id: UUID, lease_seconds: int) -> None:
+        """Push back the lease of a RUNNING task."""
+        if task_id in self._leases:
+            self._leases[task_id] = datetime.now(UTC) + timedelta(seconds=lease_seconds)
+
+    async def next_due_at(self) -> datetime | None:
+        """Get the earliest due time among scheduled tasks."""
+        while self._due_heap:
+            due_at, _, task_id = self._due_heap[0]
+            if self._is_current(due_at, task_id):
+                return due_at
+            heapq.heappop(self._due_heap)
+        return None
 
     async def get_interlocutor_tasks(
         self,
@@ -98,3 +128,46 @@ class InMemoryTaskStore(TaskStore):
                 setattr(task, key, value)
 
         self._tasks[task_id] = task
+        self._index(task)
+
+    # =========================================================================
+    # Due-time index
+    # =========================================================================
+
+    def _index(self, task: Task) -> None:
+        if task.status != TaskStatus.RUNNING:
+            self._leases.pop(task.id, None)
+        if task.status == TaskStatus.SCHEDULED:
+            self._seq += 1
+            heapq.heappush(self._due_heap, (task.due_at, self._seq, task.id))
+
+    def _is_current(self, due_at: datetime, task_id: UUID) -> bool:
+        task = self._tasks.get(task_id)
+        return (
+            task is not None
+            and task.status == TaskStatus.SCHEDULED
+            and task.due_at == due_at
+        )
+
+    def _pop_due(
+        self, before: datetime, limit: int
+    ) -> list[tuple[datetime, int, UUID]]:
+        """Pop up to `limit` current, unexpired entries due at or before `before`.
+
+        Stale entries are discarded. Expired tasks are dropped from the index
+        (they can never become due again).
+        """
+        due: list[tuple[datetime, int, UUID]] = []
+        seen: set[UUID] = set()
+        while self._due_heap and len(due) < limit:
+            due_at, seq, task_id = self._due_heap[0]
+            if due_at > before:
+                break
+            heapq.heappop(self._due_heap)
+            if task_id in seen or not self._is_current(due_at, task_id):
+                continue
+            if self._tasks[task_id].is_expired:
+                continue
+            seen.add(task_id)
+            due.append((due_at, seq, task_id))
+        return due
@@ -0,0 +1,303 @@
+"""PostgreSQL implementation of TaskStore.
+
+Durable task storage that supports several scheduler replicas: due tasks
+are claimed with FOR UPDATE SKIP LOCKED, so concurrent claimers never block
+on or double-claim the same rows. Claimed tasks carry a lease
+(locked_until); tasks whose lease expires are claimed again.
+"""
+
+import json
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+
+from ruche.domain.agenda import Task, TaskPriority, TaskStatus, TaskType
+from ruche.infrastructure.db.errors import ConnectionError
+from ruche.observability.logging import get_logger
+from ruche.runtime.agenda.store import TaskStore
+
+logger = get_logger(__name__)
+
+_COLUMNS = (
+    "id, tenant_id, agent_id, task_type, priority, interlocutor_id, session_id, "
+    "scheduled_for, execute_after, expires_at, payload, status, created_at, "
+    "started_at, completed_at, attempts, max_attempts, last_error, metadata"
+)
+
+_UPDATABLE_FIELDS = {
+    "started_at",
+    "completed_at",
+    "attempts",
+    "last_error",
+    "scheduled_for",
+    "execute_after",
+}
+
+
+class PostgresTaskStore(TaskStore):
+    """PostgreSQL implementation of TaskStore.
+
+    Uses the agenda_tasks table (migration 018). The due-task claim is
+    served by a partial index on (status, due_at) WHERE status='scheduled'.
+    """
+
+    def __init__(self, pool: asyncpg.Pool) -> None:
+        """Initialize PostgreSQL task store.
+
+        Args:
+            pool: asyncpg connection pool
+        """
+        self._pool = pool
+
+    async def save(self, task: Task) -> None:
+        """Save or update a task."""
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.execute(
+                    f"""
+                    INSERT INTO agenda_tasks ({_COLUMNS}, due_at)
+                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12,
+                            $13, $14, $15, $16, $17, $18, $19, $20)
+                    ON CONFLICT (id) DO UPDATE SET
+                        priority = EXCLUDED.priority,
+                        scheduled_for = EXCLUDED.scheduled_for,
+                        execute_after = EXCLUDED.execute_after,
+                        expires_at = EXCLUDED.expires_at,
+                        due_at = EXCLUDED.due_at,
+                        payload = EXCLUDED.payload,
+                        status = EXCLUDED.status,
+                        started_at = EXCLUDED.started_at,
+                        completed_at = EXCLUDED.completed_at,
+                        attempts = EXCLUDED.attempts,
+                        max_attempts = EXCLUDED.max_attempts,
+                        last_error = EXCLUDED.last_error,
+                        metadata = EXCLUDED.metadata,
+                        locked_until = CASE
+                            WHEN EXCLUDED.status = 'running' THEN agenda_tasks.locked_until
+                            ELSE NULL
+                        END
+                    """,
+                    task.id,
+                    task.tenant_id,
+                    task.agent_id,
+                    task.task_type.value,
+                    task.priority.value,
+                    task.interlocutor_id,
+                    task.session_id,
+                    task.scheduled_for,
+                    task.execute_after,
+                    task.expires_at,
+                    json.dumps(task.payload, default=str),
+                    task.status.value,
+                    task.created_at,
+                    task.started_at,
+                    task.completed_at,
+                    task.attempts,
+                    task.max_attempts,
+                    task.last_error,
+                    json.dumps(task.metadata, default=str),
+                    task.due_at,
+                )
+        except asyncpg.PostgresError as e:
+            logger.error("agenda_task_save_error", task_id=str(task.id), error=str(e))
+            raise ConnectionError(f"Failed to save task: {e}", cause=e) from e
+
+    async def get(self, task_id: UUID) -> Task | None:
+        """Get a task by ID."""
+        try:
+            async with self._pool.acquire() as conn:
+                row = await conn.fetchrow(
+                    f"SELECT {_COLUMNS} FROM agenda_tasks WHERE id = $1",
+                    task_id,
+                )
+        except asyncpg.PostgresError as e:
+            logger.error("agenda_task_get_error", task_id=str(task_id), error=str(e))
+            raise ConnectionError(f"Failed to get task: {e}", cause=e) from e
+
+        return self._row_to_task(row) if row else None
+
+    async def get_due_tasks(
+        self,
+        before: datetime,
+        limit: int = 100,
+    ) -> list[Task]:
+        """Get tasks that are due for execution (read-only)."""
+        try:
+            async with self._pool.acquire() as conn:
+                rows = await conn.fetch(
+                    f"""
+                    SELECT {_COLUMNS} FROM agenda_tasks
+                    WHERE status = 'scheduled'
+                      AND due_at <= $1
+                      AND (expires_at IS NULL OR expires_at > NOW())
+                    ORDER BY due_at
+                    LIMIT $2
+                    """,
+                    before,
+                    limit,
+                )
+        except asyncpg.PostgresError as e:
+            logger.error("agenda_due_tasks_error", error=str(e))
+            raise ConnectionError(f"Failed to get due tasks: {e}", cause=e) from e
+
+        return [self._row_to_task(row) for row in rows]
+
+    async def claim_due_tasks(
+        self,
+        before: datetime,
+        limit: int = 100,
+        *,
+        lease_seconds: int = 300,
+    ) -> list[Task]:
+        """Claim due (or lease-expired) tasks with FOR UPDATE SKIP LOCKED.
+
+        Rows locked by another replica's in-flight claim are skipped rather
+        than waited on, so replicas claim disjoint batches.
+        """
+        now = datetime.now(UTC)
+        try:
+            async with self._pool.acquire() as conn:
+                rows = await conn.fetch(
+                    f"""
+                    WITH batch AS (
+                        SELECT id FROM agenda_tasks
+                        WHERE (
+                            status = 'scheduled'
+                            AND due_at <= $1
+                            AND (expires_at IS NULL OR expires_at > $2)
+                        ) OR (
+                            status = 'running' AND locked_until < $2
+                        )
+                        ORDER BY due_at
+                        LIMIT $3
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    UPDATE agenda_tasks t
+                    SET status = 'running',
+                        started_at = $2,
+                        locked_until = $4
+                    FROM batch
+                    WHERE t.id = batch.id
+                    RETURNING {", ".join(f"t.{c.strip()}" for c in _COLUMNS.split(","))}
+                    """,
+                    before,
+                    now,
+                    limit,
+                    now + timedelta(seconds=lease_seconds),
+                )
+        except asyncpg.PostgresError as e:
+            logger.error("agenda_claim_error", error=str(e))
+            raise ConnectionError(f"Failed to claim tasks: {e}", cause=e) from e
+
+        tasks = [self._row_to_task(row) for row in rows]
+        tasks.sort(key=lambda t: t.due_at)
+        return tasks
+
+    async def extend_lease(self, task_id: UUID, lease_seconds: int) -> None:
+        """Push back locked_until of a RUNNING task."""
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.execute(
+                    """
+                    UPDATE agenda_tasks SET locked_until = $2
+                    WHERE id = $1 AND status = 'running'
+                    """,
+                    task_id,
+                    datetime.now(UTC) + timedelta(seconds=lease_seconds),
+                )
+        except asyncpg.PostgresError as e:
+            logger.error("agenda_extend_lease_error", task_id=str(task_id), error=str(e))
+            raise ConnectionError(f"Failed to extend lease: {e}", cause=e) from e
+
+    async def next_due_at(self) -> datetime | None:
+        """Get the earliest due time among scheduled tasks."""
+        try:
+            async with self._pool.acquire() as conn:
+                return await conn.fetchval(
+                    """
+                    SELECT due_at FROM agenda_tasks
+                    WHERE status = 'scheduled'
+                    ORDER BY due_at
+                    LIMIT 1
+                    """
+                )
+        except asyncpg.PostgresError as e:
+            logger.warning("agenda_next_due_error", error=str(e))
+            return None
+
+    async def get_interlocutor_tasks(
+        self,
+        tenant_id: UUID,
+        interlocutor_id: UUID,
+        status: TaskStatus | None = None,
+    ) -> list[Task]:
+        """Get all tasks for an interlocutor."""
+        query = f"""
+            SELECT {_COLUMNS} FROM agenda_tasks
+            WHERE tenant_id = $1 AND interlocutor_id = $2
+        """
+        params: list[Any] = [tenant_id, interlocutor_id]
+        if status is not None:
+            query += " AND status = $3"
+            params.append(status.value)
+        query += " ORDER BY scheduled_for DESC"
+
+        try:
+            async with self._pool.acquire() as conn:
+                rows = await conn.fetch(query, *params)
+        except asyncpg.PostgresError as e:
+            logger.error("agenda_interlocutor_tasks_error", error=str(e))
+            raise ConnectionError(f"Failed to get tasks: {e}", cause=e) from e
+
+        return [self._row_to_task(row) for row in rows]
+
+    async def update_status(
+        self,
+        task_id: UUID,
+        status: TaskStatus,
+        **fields: dict,
+    ) -> None:
+        """Update task status and optional fields."""
+        assignments = ["status = $2"]
+        params: list[Any] = [task_id, status.value]
+        placeholders: dict[str, str] = {}
+        for key, value in fields.items():
+            if key not in _UPDATABLE_FIELDS:
+                continue
+            params.append(value)
+            placeholders[key] = f"${len(params)}"
+            assignments.append(f"{key} = {placeholders[key]}")
+        if status != TaskStatus.RUNNING:
+            assignments.append("locked_until = NULL")
+        if "scheduled_for" in placeholders or "execute_after" in placeholders:
+            # SET expressions see the old row, so reference the new values
+            scheduled_for = placeholders.get("scheduled_for", "scheduled_for")
+            execute_after = placeholders.get("execute_after", "execute_after")
+            assignments.append(
+                f"due_at = GREATEST({scheduled_for}, COALESCE({execute_after}, {scheduled_for}))"
+            )
+
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.execute(
+                    f"UPDATE agenda_tasks SET {', '.join(assignments)} WHERE id = $1",
+                    *params,
+                )
+        except asyncpg.PostgresError as e:
+            logger.error("agenda_update_status_error", task_id=str(task_id), error=str(e))
+            raise ConnectionError(f"Failed to update task: {e}", cause=e) from e
+
+    def _row_to_task(self, row: Any) -> Task:
+        """Convert database row to Task model."""
+        data = dict(row)
+        data["task_type"] = TaskType(data["task_type"])
+        data["priority"] = TaskPriority(data["priority"])
+        data["status"] = TaskStatus(data["status"])
+        for key in ("payload", "metadata"):
+            if isinstance(data.get(key), str):
+                data[key] = json.loads(data[key])
+            elif data.get(key) is None:
+                data[key] = {}
+        return Task.model_validate(data)
@@ -0,0 +1,193 @@
+"""Redis implementation of TaskStore.
+
+Due tasks are indexed in a sorted set scored by due time. Claiming moves
+ids from the due set to a running set (scored by lease expiry) inside a
+Lua script, so concurrent scheduler replicas never claim the same task.
+Tasks whose lease expires are moved back to the due set on the next claim.
+
+Key structure:
+- {prefix}:task:{task_id} - Task JSON
+- {prefix}:due - Sorted set of scheduled task ids by due time
+- {prefix}:running - Sorted set of claimed task ids by lease expiry
+- {prefix}:interlocutor:{tenant_id}:{interlocutor_id} - Task ids per interlocutor
+"""
+
+from datetime import UTC, datetime
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from ruche.domain.agenda import Task, TaskStatus
+from ruche.observability.logging import get_logger
+from ruche.runtime.agenda.store import TaskStore
+
+logger = get_logger(__name__)
+
+# KEYS: due, running
+# ARGV: now, before, limit, lease_until
+_CLAIM_SCRIPT = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', '(' .. ARGV[1], 'LIMIT', 0, ARGV[3])
+for _, id in ipairs(expired) do
+    redis.call('ZREM', KEYS[2], id)
+    redis.call('ZADD', KEYS[1], ARGV[1], id)
+end
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[2], 'LIMIT', 0, ARGV[3])
+for _, id in ipairs(ids) do
+    redis.call('ZREM', KEYS[1], id)
+    redis.call('ZADD', KEYS[2], ARGV[4], id)
+end
+return ids
+"""
+
+
+def _decode(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class RedisTaskStore(TaskStore):
+    """Redis implementation of TaskStore with atomic multi-replica claims."""
+
+    def __init__(self, redis: Redis, key_prefix: str = "agenda") -> None:
+        """Initialize Redis task store.
+
+        Args:
+            redis: Redis client instance
+            key_prefix: Prefix for Redis keys
+        """
+        self._redis = redis
+        self._prefix = key_prefix
+        self._claim = redis.register_script(_CLAIM_SCRIPT)
+
+    def _task_key(self, task_id: UUID | str) -> str:
+        return f"{self._prefix}:task:{task_id}"
+
+    @property
+    def _due_key(self) -> str:
+        return f"{self._prefix}:due"
+
+    @property
+    def _running_key(self) -> str:
+        return f"{self._prefix}:running"
+
+    def _interlocutor_key(self, tenant_id: UUID, interlocutor_id: UUID) -> str:
+        return f"{self._prefix}:interlocutor:{tenant_id}:{interlocutor_id}"
+
+    async def save(self, task: Task) -> None:
+        """Save or update a task and its index entries."""
+        task_id = str(task.id)
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.set(self._task_key(task_id), task.model_dump_json())
+
+        if task.status == TaskStatus.SCHEDULED:
+            pipe.zadd(self._due_key, {task_id: task.due_at.timestamp()})
+            pipe.zrem(self._running_key, task_id)
+        elif task.status == TaskStatus.RUNNING:
+            # Keep any existing lease; the claim owns the running entry
+            pipe.zrem(self._due_key, task_id)
+        else:
+            pipe.zrem(self._due_key, task_id)
+            pipe.zrem(self._running_key, task_id)
+
+        if task.interlocutor_id is not None:
+            pipe.sadd(self._interlocutor_key(task.tenant_id, task.interlocutor_id), task_id)
+
+        await pipe.execute()
+
+    async def get(self, task_id: UUID) -> Task | None:
+        """Get a task by ID."""
+        raw = await self._redis.get(self._task_key(task_id))
+        return Task.model_validate_json(_decode(raw)) if raw else None
+
+    async def get_due_tasks(
+        self,
+        before: datetime,
+        limit: int = 100,
+    ) -> list[Task]:
+        """Get tasks that are due for execution (read-only)."""
+        ids = await self._redis.zrangebyscore(
+            self._due_key, "-inf", before.timestamp(), start=0, num=limit
+        )
+        tasks = await self._load(ids)
+        return [
+            t for t in tasks if t.status == TaskStatus.SCHEDULED and not t.is_expired
+        ]
+
+    async def claim_due_tasks(
+        self,
+        before: datetime,
+        limit: int = 100,
+        *,
+        lease_seconds: int = 300,
+    ) -> list[Task]:
+        """Atomically claim due (or lease-expired) tasks."""
+        now = datetime.now(UTC)
+        ids = await self._claim(
+            keys=[self._due_key, self._running_key],
+            args=[now.timestamp(), before.timestamp(), limit, now.timestamp() + lease_seconds],
+        )
+
+        claimed: list[Task] = []
+        for task in await self._load(ids):
+            if task.is_expired or task.status not in (TaskStatus.SCHEDULED, TaskStatus.RUNNING):
+                await self._redis.zrem(self._running_key, str(task.id))
+                continue
+            task.status = TaskStatus.RUNNING
+            task.started_at = now
+            await self._redis.set(self._task_key(task.id), task.model_dump_json())
+            claimed.append(task)
+
+        if claimed:
+            logger.debug("agenda_tasks_claimed", count=len(claimed))
+        return claimed
+
+    async def extend_lease(self, task_id: UUID, lease_seconds: int) -> None:
+        """Push back the lease of a claimed task (only if still in the running set)."""
+        lease_until = datetime.now(UTC).timestamp() + lease_seconds
+        await self._redis.zadd(self._running_key, {str(task_id): lease_until}, xx=True)
+
+    async def next_due_at(self) -> datetime | None:
+        """Get the earliest due time among scheduled tasks."""
+        head = await self._redis.zrange(self._due_key, 0, 0, withscores=True)
+        if not head:
+            return None
+        _, score = head[0]
+        return datetime.fromtimestamp(float(score), UTC)
+
+    async def get_interlocutor_tasks(
+        self,
+        tenant_id: UUID,
+        interlocutor_id: UUID,
+        status: TaskStatus | None = None,
+    ) -> list[Task]:
+        """Get all tasks for an interlocutor."""
+        ids = await self._redis.smembers(self._interlocutor_key(tenant_id, interlocutor_id))
+        tasks = [
+            t for t in await self._load(list(ids)) if status is None or t.status == status
+        ]
+        tasks.sort(key=lambda t: t.scheduled_for, reverse=True)
+        return tasks
+
+    async def update_status(
+        self,
+        task_id: UUID,
+        status: TaskStatus,
+        **fields: dict,
+    ) -> None:
+        """Update task status and optional fields."""
+        task = await self.get(task_id)
+        if not task:
+            return
+
+        task.status = status
+        for key, value in fields.items():
+            if hasattr(task, key):
+                setattr(task, key, value)
+
+        await self.save(task)
+
+    async def _load(self, ids: list[bytes | str]) -> list[Task]:
+        """Load tasks by id, preserving order and skipping missing ones."""
+        if not ids:
+            return []
+        raws = await self._redis.mget([self._task_key(_decode(i)) for i in ids])
+        return [Task.model_validate_json(_decode(raw)) for raw in raws if raw]
@@ -12,6 +12,7 @@ import json
 from typing import TYPE_CHECKING
 from uuid import UUID
 
+from ruche.observability.logging import get_logger
 from ruche.runtime.agent.context import AgentContext
 
 if TYPE_CHECKING:
@@ -19,6 +20,8 @@ if TYPE_CHECKING:
     from ruche.runtime.brain.factory import BrainFactory
     from ruche.runtime.toolbox.gateway import ToolGateway
 
+logger = get_logger(__name__)
+
 
 class AgentRuntime:
     """Manages agent lifecycle and execution context caching.
@@ -98,6 +101,26 @@ class AgentRuntime:
 
         return context
 
+    async def warm_up(self, agents: list[tuple[UUID, UUID]]) -> int:
+        """Pre-build and cache AgentContexts ahead of the first turn.
+
+        Agents that are missing or fail to build are skipped.
+
+        Args:
+            agents: (tenant_id, agent_id) pairs, most important first
+
+        Returns:
+            Number of contexts built
+        """
+        built = 0
+        for tenant_id, agent_id in agents[: self._max_cache_size]:
+            try:
+                await self.get_or_create(tenant_id, agent_id)
+                built += 1
+            except Exception as e:
+                logger.warning("agent_context_warm_up_failed", agent_id=str(agent_id), error=str(e))
+        return built
+
     async def _get_agent_version(self, tenant_id: UUID, agent_id: UUID) -> str:
         """Get current agent version for cache invalidation.
 
@@ -48,26 +48,46 @@ class HybridScorer:
         Raises:
             ValueError: If score lists have different lengths
         """
-        if len(vector_scores) != len(bm25_scores):
-            raise ValueError(
-                f"Score lists must have same length: {len(vector_scores)} vs {len(bm25_scores)}"
-            )
+        return self.combine_arrays(
+            np.asarray(vector_scores, dtype=np.float64),
+            np.asarray(bm25_scores, dtype=np.float64),
+        ).tolist()
 
-        if not vector_scores:
-            return []
+    def combine_arrays(
+        self,
+        vector_scores: np.ndarray,
+        bm25_scores: np.ndarray,
+    ) -> np.ndarray:
+        """Combine and normalize score arrays without per-item Python work.
+
+        Args:
+            vector_scores: Cosine similarity scores (0-1 range)
+            bm25_scores: Raw BM25 scores (unbounded), parallel to vector_scores
+
+        Returns:
+            Combined scores (0-1 range), in the dtype of vector_scores
+            (float32 on the retrieval path)
 
-        # Normalize BM25 scores to 0-1 range
-        norm_bm25 = self._normalize(bm25_scores)
+        Raises:
+            ValueError: If score arrays have different lengths
+        """
+        vector = np.asarray(vector_scores)
+        if vector.dtype.kind != "f":
+            vector = vector.astype(np.float32)
+        bm25 = np.asarray(bm25_scores, dtype=vector.dtype)
 
-        # Weighted combination
-        combined = [
-            (v * self.vector_weight + b * self.bm25_weight)
-            for v, b in zip(vector_scores, norm_bm25)
-        ]
+        if len(vector) != len(bm25):
+            raise ValueError(f"Score lists must have same length: {len(vector)} vs {len(bm25)}")
 
-        return combined
+        if len(vector) == 0:
+            return vector
 
-    def _normalize(self, scores: list[float]) -> list[float]:
+        # Normalize BM25 scores to 0-1 range, then weighted combination
+        norm_bm25 = self._normalize(bm25)
+        weight = vector.dtype.type
+        return vector * weight(self.vector_weight) + norm_bm25 * weight(self.bm25_weight)
+
+    def _normalize(self, scores: np.ndarray) -> np.ndarray:
         """Normalize scores to 0-1 range.
 
         Args:
@@ -76,20 +96,23 @@ class HybridScorer:
         Returns:
             Normalized scores (0-1 range)
         """
-        if not scores:
-            return []
+        arr = np.asarray(scores)
+        if arr.dtype.kind != "f":
+            arr = arr.astype(np.float64)
+        if len(arr) == 0:
+            return arr
 
         if self.normalization == "min_max":
-            return self._min_max_normalize(scores)
+            return self._min_max_normalize(arr)
         elif self.normalization == "z_score":
-            return self._z_score_normalize(scores)
+            return self._z_score_normalize(arr)
         elif self.normalization == "softmax":
-            return self._softmax_normalize(scores)
+            return self._softmax_normalize(arr)
         else:
             # Fallback to min_max
-            return self._min_max_normalize(scores)
+            return self._min_max_normalize(arr)
 
-    def _min_max_normalize(self, scores: list[float]) -> list[float]:
+    def _min_max_normalize(self, scores: np.ndarray) -> np.ndarray:
         """Min-max normalization to [0, 1] range.
 
         Args:
@@ -98,16 +121,17 @@ class HybridScorer:
         Returns:
             Normalized scores
         """
-        min_score = min(scores)
-        max_score = max(scores)
+        arr = np.asarray(scores)
+        min_score = arr.min()
+        max_score = arr.max()
 
         if max_score == min_score:
             # All scores are identical - return all 1.0
-            return [1.0] * len(scores)
+            return np.ones_like(arr)
 
-        return [(s - min_score) / (max_score - min_score) for s in scores]
+        return (arr - min_score) / (max_score - min_score)
 
-    def _z_score_normalize(self, scores: list[float]) -> list[float]:
+    def _z_score_normalize(self, scores: np.ndarray) -> np.ndarray:
         """Z-score normalization then scale to [0, 1].
 
         Args:
@@ -116,24 +140,22 @@ class HybridScorer:
         Returns:
             Normalized scores
         """
-        arr = np.array(scores)
+        arr = np.asarray(scores)
         mean = np.mean(arr)
         std = np.std(arr)
 
         if std == 0:
             # All scores are identical
-            return [0.5] * len(scores)
+            return np.full_like(arr, 0.5)
 
         # Z-score normalization
         z_scores = (arr - mean) / std
 
         # Scale to [0, 1] using sigmoid-like transformation
         # Using tanh to map (-inf, inf) to (-1, 1), then scale to [0, 1]
-        normalized = (np.tanh(z_scores) + 1) / 2
-
-        return normalized.tolist()
+        return (np.tanh(z_scores) + 1) / 2
 
-    def _softmax_normalize(self, scores: list[float]) -> list[float]:
+    def _softmax_normalize(self, scores: np.ndarray) -> np.ndarray:
         """Softmax normalization to probability distribution.
 
         Args:
@@ -142,7 +164,7 @@ class HybridScorer:
         Returns:
             Normalized scores (sum to 1)
         """
-        arr = np.array(scores)
+        arr = np.asarray(scores)
 
         # Prevent overflow by subtracting max
         max_score = np.max(arr)
@@ -151,10 +173,7 @@ class HybridScorer:
         sum_exp = np.sum(exp_scores)
         if sum_exp == 0:
             # Edge case: all scores are very negative
-            return [1.0 / len(scores)] * len(scores)
+            return np.full_like(exp_scores, 1.0 / len(arr))
 
         # Return softmax (this will sum to 1, not necessarily in [0,1] per item)
-        # For hybrid scoring, we want individual scores in [0,1], so we'll
-        # scale by dividing by the maximum possible softmax value
-        softmax = exp_scores / sum_exp
-        return softmax.tolist()
+        return exp_scores / sum_exp
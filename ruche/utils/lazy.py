@@ -0,0 +1,65 @@
+"""Lazy attribute loading for package facades (PEP 562).
+
+Package ``__init__`` modules re-export many classes for convenience.
+Importing them eagerly pulls in every backend SDK (asyncpg, redis, qdrant,
+openai, ...) even when the caller needs one component. ``lazy_exports``
+builds module-level ``__getattr__``/``__dir__`` functions that import an
+export's defining module on first access and cache the result.
+
+Example:
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            "RedisSessionStore": "ruche.conversation.stores.redis",
+            "BrainSupersede": "ruche.runtime.brain:SupersedeDecision",
+        },
+    )
+"""
+
+import importlib
+import sys
+from collections.abc import Callable, Iterable
+from typing import Any
+
+
+def lazy_exports(
+    package: str,
+    exports: dict[str, str],
+    *,
+    optional: Iterable[str] = (),
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build ``__getattr__`` and ``__dir__`` for a package facade.
+
+    Args:
+        package: The facade's ``__name__``
+        exports: Export name -> defining module, or ``"module:attribute"``
+            when the export is an alias
+        optional: Exports that resolve to None when their module's
+            dependencies are not installed
+
+    Returns:
+        (__getattr__, __dir__) to assign at module level
+    """
+    optional_names = frozenset(optional)
+
+    def __getattr__(name: str) -> Any:
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        module_path, _, attribute = target.partition(":")
+        try:
+            value = getattr(importlib.import_module(module_path), attribute or name)
+        except ImportError:
+            if name not in optional_names:
+                raise
+            value = None
+
+        # Cache on the module so __getattr__ is not hit again
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,6 +1,9 @@
 """Vector utility functions."""
 
 import math
+from collections.abc import Sequence
+
+import numpy as np
 
 
 def cosine_similarity(vec_a: list[float], vec_b: list[float]) -> float:
@@ -35,3 +38,36 @@ def cosine_similarity(vec_a: list[float], vec_b: list[float]) -> float:
         return 0.0
 
     return dot_product / (norm_a * norm_b)
+
+
+def cosine_similarities(
+    query: Sequence[float],
+    vectors: Sequence[Sequence[float] | None],
+) -> np.ndarray:
+    """Compute the cosine similarity of a query against many vectors at once.
+
+    Vectors that are missing, empty or of another dimension than the query
+    score 0.0, as retrievers score an entity without a usable embedding.
+
+    Args:
+        query: Query vector
+        vectors: Candidate vectors
+
+    Returns:
+        float32 array of scores between -1 and 1, parallel to vectors
+    """
+    query_arr = np.asarray(query, dtype=np.float32)
+    scores = np.zeros(len(vectors), dtype=np.float32)
+    dim = len(query_arr)
+    rows = [i for i, vec in enumerate(vectors) if vec is not None and len(vec) == dim]
+    if dim == 0 or not rows:
+        return scores
+
+    matrix = np.asarray([vectors[i] for i in rows], dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query_arr)
+    dots = matrix @ query_arr
+    similarities = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+
+    # float32 rounding can land just outside [-1, 1] for parallel vectors
+    scores[rows] = np.clip(similarities, -1.0, 1.0)
+    return scores
@@ -1,17 +1,22 @@
 """Vector storage and similarity search."""
 
-from ruche.vector.embedding_manager import EmbeddingManager
-from ruche.vector.factory import create_vector_store, ensure_vector_collections
-from ruche.vector.stores.base import (
-    EntityType,
-    VectorDocument,
-    VectorMetadata,
-    VectorSearchResult,
-    VectorStore,
-)
-from ruche.vector.stores.inmemory import InMemoryVectorStore
-from ruche.vector.stores.pgvector import PgVectorStore
-from ruche.vector.stores.qdrant import QdrantVectorStore
+from typing import TYPE_CHECKING
+
+from ruche.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ruche.vector.embedding_manager import EmbeddingManager
+    from ruche.vector.factory import create_vector_store, ensure_vector_collections
+    from ruche.vector.stores.base import (
+        EntityType,
+        VectorDocument,
+        VectorMetadata,
+        VectorSearchResult,
+        VectorStore,
+    )
+    from ruche.vector.stores.inmemory import InMemoryVectorStore
+    from ruche.vector.stores.pgvector import PgVectorStore
+    from ruche.vector.stores.qdrant import QdrantVectorStore
 
 __all__ = [
     "EmbeddingManager",
@@ -26,3 +31,21 @@ __all__ = [
     "create_vector_store",
     "ensure_vector_collections",
 ]
+
+# Resolved on first access (PEP 562) so importing this package stays cheap
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "EmbeddingManager": "ruche.vector.embedding_manager",
+        "create_vector_store": "ruche.vector.factory",
+        "ensure_vector_collections": "ruche.vector.factory",
+        "EntityType": "ruche.vector.stores.base",
+        "VectorDocument": "ruche.vector.stores.base",
+        "VectorMetadata": "ruche.vector.stores.base",
+        "VectorSearchResult": "ruche.vector.stores.base",
+        "VectorStore": "ruche.vector.stores.base",
+        "InMemoryVectorStore": "ruche.vector.stores.inmemory",
+        "PgVectorStore": "ruche.vector.stores.pgvector",
+        "QdrantVectorStore": "ruche.vector.stores.qdrant",
+    },
+)
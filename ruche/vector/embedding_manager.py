@@ -67,7 +67,7 @@ class EmbeddingManager:
             rule: Rule to sync
             generate_embedding: Whether to generate embedding if missing
         """
-        vector = rule.condition_embedding
+        vector = rule.embedding
 
         # Generate embedding if needed
         if vector is None and generate_embedding:
@@ -124,12 +124,12 @@ class EmbeddingManager:
             scenario: Scenario to sync
             generate_embedding: Whether to generate embedding if missing
         """
-        vector = scenario.entry_embedding
+        vector = scenario.entry_condition_embedding
 
         # Generate embedding if needed
-        if vector is None and generate_embedding and scenario.entry_condition:
+        if vector is None and generate_embedding and scenario.entry_condition_text:
             vector = await self._embedding_provider.embed_single(
-                scenario.entry_condition,
+                scenario.entry_condition_text,
                 task="retrieval.passage",
             )
             logger.debug(
@@ -156,7 +156,7 @@ class EmbeddingManager:
                 enabled=scenario.enabled,
                 extra={"version": scenario.version},
             ),
-            text=scenario.entry_condition,
+            text=scenario.entry_condition_text,
         )
 
         await self._vector_store.upsert([doc], collection=self._collection)
@@ -282,15 +282,15 @@ class EmbeddingManager:
         synced = 0
 
         # Separate rules with/without embeddings
-        with_embedding = [r for r in rules if r.condition_embedding]
-        without_embedding = [r for r in rules if not r.condition_embedding]
+        with_embedding = [r for r in rules if r.embedding]
+        without_embedding = [r for r in rules if not r.embedding]
 
         # Sync rules that already have embeddings
         if with_embedding:
             docs = [
                 VectorDocument(
                     id=VectorDocument.create_id(EntityType.RULE, rule.id),
-                    vector=rule.condition_embedding,
+                    vector=rule.embedding,
                     metadata=VectorMetadata(
                         tenant_id=rule.tenant_id,
                         agent_id=rule.agent_id,
@@ -15,8 +15,6 @@ from ruche.config.models.storage import VectorStoreConfig
 from ruche.observability.logging import get_logger
 from ruche.vector.stores.base import VectorStore
 from ruche.vector.stores.inmemory import InMemoryVectorStore
-from ruche.vector.stores.pgvector import PgVectorStore
-from ruche.vector.stores.qdrant import QdrantVectorStore
 
 logger = get_logger(__name__)
 
@@ -47,6 +45,8 @@ def create_vector_store(config: VectorStoreConfig) -> VectorStore:
         return InMemoryVectorStore(dimensions=config.dimensions)
 
     elif backend == "qdrant":
+        from ruche.vector.stores.qdrant import QdrantVectorStore
+
         # Read connection details from environment
         url = os.environ.get("QDRANT_URL", "http://localhost:6333")
         api_key = os.environ.get("QDRANT_API_KEY")
@@ -69,6 +69,7 @@ def create_vector_store(config: VectorStoreConfig) -> VectorStore:
 
     elif backend == "pgvector":
         from ruche.infrastructure.db.pool import PostgresPool
+        from ruche.vector.stores.pgvector import PgVectorStore
 
         # PostgresPool reads from DATABASE_URL or RUCHE_DATABASE_URL env vars
         pool = PostgresPool()
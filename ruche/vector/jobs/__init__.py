@@ -0,0 +1,32 @@
+"""Embedding job queue and worker."""
+
+from typing import TYPE_CHECKING
+
+from ruche.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ruche.vector.jobs.inmemory import InMemoryEmbeddingJobQueue
+    from ruche.vector.jobs.models import EmbeddingJob
+    from ruche.vector.jobs.postgres import PostgresEmbeddingJobQueue
+    from ruche.vector.jobs.queue import EmbeddingJobQueue
+    from ruche.vector.jobs.worker import EmbeddingJobWorker
+
+__all__ = [
+    "EmbeddingJob",
+    "EmbeddingJobQueue",
+    "EmbeddingJobWorker",
+    "InMemoryEmbeddingJobQueue",
+    "PostgresEmbeddingJobQueue",
+]
+
+# Resolved on first access (PEP 562) so importing this package stays cheap
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "EmbeddingJob": "ruche.vector.jobs.models",
+        "EmbeddingJobQueue": "ruche.vector.jobs.queue",
+        "EmbeddingJobWorker": "ruche.vector.jobs.worker",
+        "InMemoryEmbeddingJobQueue": "ruche.vector.jobs.inmemory",
+        "PostgresEmbeddingJobQueue": "ruche.vector.jobs.postgres",
+    },
+)
@@ -0,0 +1,88 @@
+"""In-memory implementation of EmbeddingJobQueue."""
+
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from ruche.vector.jobs.models import EmbeddingJob
+from ruche.vector.jobs.queue import EmbeddingJobQueue
+from ruche.vector.stores.base import EntityType
+
+_JobKey = tuple[UUID, EntityType, UUID]
+
+
+class InMemoryEmbeddingJobQueue(EmbeddingJobQueue):
+    """In-memory implementation of EmbeddingJobQueue for testing and development.
+
+    Not suitable for production use (single process, not durable).
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty queue."""
+        self._jobs: dict[_JobKey, EmbeddingJob] = {}
+        self._leases: dict[_JobKey, datetime] = {}
+
+    async def enqueue(self, jobs: list[EmbeddingJob]) -> None:
+        """Add jobs, replacing pending jobs for the same entities."""
+        for job in jobs:
+            self._jobs[job.key] = job.model_copy()
+            # A re-enqueued job is claimable again once its ready time passes
+            self._leases.pop(job.key, None)
+
+    async def claim(self, *, now: datetime, limit: int, lease_seconds: float) -> list[EmbeddingJob]:
+        """Claim ready jobs of the agent with the oldest ready job."""
+        ready = sorted(
+            (job for job in self._jobs.values() if self._is_ready(job, now)),
+            key=lambda job: job.ready_at,
+        )
+        if not ready:
+            return []
+
+        agent = (ready[0].tenant_id, ready[0].agent_id)
+        lease_until = now + timedelta(seconds=lease_seconds)
+        claimed = []
+        for job in ready:
+            if (job.tenant_id, job.agent_id) != agent:
+                continue
+            self._leases[job.key] = lease_until
+            claimed.append(job.model_copy())
+            if len(claimed) >= limit:
+                break
+        return claimed
+
+    async def complete(self, jobs: list[EmbeddingJob]) -> None:
+        """Remove claimed jobs that were not re-enqueued since their claim."""
+        for job in jobs:
+            current = self._jobs.get(job.key)
+            if current is not None and current.enqueued_at == job.enqueued_at:
+                del self._jobs[job.key]
+                self._leases.pop(job.key, None)
+
+    async def release(self, jobs: list[EmbeddingJob], *, retry_at: datetime) -> None:
+        """Return claimed jobs to the queue after a failure."""
+        for job in jobs:
+            current = self._jobs.get(job.key)
+            if current is None or current.enqueued_at != job.enqueued_at:
+                continue
+            current.attempts = job.attempts + 1
+            current.ready_at = retry_at
+            self._leases.pop(job.key, None)
+
+    async def pending_count(self, tenant_id: UUID, agent_id: UUID) -> int:
+        """Number of queued or claimed jobs of an agent."""
+        return sum(
+            1
+            for job in self._jobs.values()
+            if job.tenant_id == tenant_id and job.agent_id == agent_id
+        )
+
+    async def next_ready_at(self) -> datetime | None:
+        """Earliest time a queued job becomes claimable (None if empty)."""
+        ready_times = [
+            max(job.ready_at, self._leases[job.key]) if job.key in self._leases else job.ready_at
+            for job in self._jobs.values()
+        ]
+        return min(ready_times, default=None)
+
+    def _is_ready(self, job: EmbeddingJob, now: datetime) -> bool:
+        lease_until = self._leases.get(job.key)
+        return job.ready_at <= now and (lease_until is None or lease_until <= now)
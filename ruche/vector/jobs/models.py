@@ -0,0 +1,67 @@
+"""Embedding job model."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from ruche.vector.stores.base import EntityType
+
+
+def utc_now() -> datetime:
+    """Return current UTC time."""
+    return datetime.now(UTC)
+
+
+class EmbeddingJob(BaseModel):
+    """Request to (re)compute the embedding of one config entity.
+
+    Jobs are keyed by (tenant_id, entity_type, entity_id): enqueueing an
+    entity that already has a pending job replaces it, so repeated edits
+    cost one embedding.
+    """
+
+    tenant_id: UUID = Field(..., description="Tenant owning the entity")
+    agent_id: UUID = Field(..., description="Agent owning the entity")
+    entity_type: EntityType = Field(..., description="Rule, scenario or intent")
+    entity_id: UUID = Field(..., description="Entity to embed")
+    enqueued_at: datetime = Field(default_factory=utc_now, description="Last enqueue time")
+    ready_at: datetime = Field(default_factory=utc_now, description="Claimable from")
+    attempts: int = Field(default=0, ge=0, description="Failed attempts so far")
+
+    @property
+    def key(self) -> tuple[UUID, EntityType, UUID]:
+        """Queue key of the job."""
+        return (self.tenant_id, self.entity_type, self.entity_id)
+
+    @classmethod
+    def for_entity(
+        cls,
+        tenant_id: UUID,
+        agent_id: UUID,
+        entity_type: EntityType,
+        entity_id: UUID,
+        *,
+        coalesce_ms: int = 0,
+    ) -> "EmbeddingJob":
+        """Create a job claimable coalesce_ms from now.
+
+        Args:
+            tenant_id: Tenant owning the entity
+            agent_id: Agent owning the entity
+            entity_type: Rule, scenario or intent
+            entity_id: Entity to embed
+            coalesce_ms: Delay letting writes that arrive together share a batch
+
+        Returns:
+            New job
+        """
+        now = utc_now()
+        return cls(
+            tenant_id=tenant_id,
+            agent_id=agent_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            enqueued_at=now,
+            ready_at=now + timedelta(milliseconds=coalesce_ms),
+        )
@@ -0,0 +1,221 @@
+"""PostgreSQL implementation of EmbeddingJobQueue.
+
+Durable job storage shared by API replicas (producers) and embedding
+workers (consumers). Jobs are upserted on their entity key, so repeated
+edits of an entity coalesce into one row. Claims lock rows with FOR UPDATE
+SKIP LOCKED and set a lease (locked_until); jobs whose lease expires are
+claimed again.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+
+from ruche.infrastructure.db.errors import ConnectionError
+from ruche.observability.logging import get_logger
+from ruche.vector.jobs.models import EmbeddingJob
+from ruche.vector.jobs.queue import EmbeddingJobQueue
+from ruche.vector.stores.base import EntityType
+
+logger = get_logger(__name__)
+
+_COLUMNS = "tenant_id, agent_id, entity_type, entity_id, enqueued_at, ready_at, attempts"
+
+_READY = "ready_at <= $1 AND (locked_until IS NULL OR locked_until <= $1)"
+
+
+class PostgresEmbeddingJobQueue(EmbeddingJobQueue):
+    """PostgreSQL implementation of EmbeddingJobQueue.
+
+    Uses the embedding_jobs table (migration 024).
+    """
+
+    def __init__(self, pool: asyncpg.Pool) -> None:
+        """Initialize PostgreSQL embedding job queue.
+
+        Args:
+            pool: asyncpg connection pool
+        """
+        self._pool = pool
+
+    async def enqueue(self, jobs: list[EmbeddingJob]) -> None:
+        """Upsert jobs in one statement, resetting attempts and lease."""
+        if not jobs:
+            return
+        # ON CONFLICT cannot touch the same row twice in one statement
+        jobs = list({job.key: job for job in jobs}.values())
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.execute(
+                    f"""
+                    INSERT INTO embedding_jobs ({_COLUMNS})
+                    SELECT * FROM unnest(
+                        $1::uuid[], $2::uuid[], $3::text[], $4::uuid[],
+                        $5::timestamptz[], $6::timestamptz[], $7::int[]
+                    )
+                    ON CONFLICT (tenant_id, entity_type, entity_id) DO UPDATE SET
+                        agent_id = EXCLUDED.agent_id,
+                        enqueued_at = EXCLUDED.enqueued_at,
+                        ready_at = EXCLUDED.ready_at,
+                        attempts = 0,
+                        locked_until = NULL
+                    """,
+                    [job.tenant_id for job in jobs],
+                    [job.agent_id for job in jobs],
+                    [job.entity_type.value for job in jobs],
+                    [job.entity_id for job in jobs],
+                    [job.enqueued_at for job in jobs],
+                    [job.ready_at for job in jobs],
+                    [job.attempts for job in jobs],
+                )
+        except asyncpg.PostgresError as e:
+            logger.error("postgres_enqueue_embedding_jobs_error", count=len(jobs), error=str(e))
+            raise ConnectionError(f"Failed to enqueue embedding jobs: {e}", cause=e) from e
+
+    async def claim(self, *, now: datetime, limit: int, lease_seconds: float) -> list[EmbeddingJob]:
+        """Claim ready jobs of one agent with FOR UPDATE SKIP LOCKED.
+
+        The agent is the one owning the oldest ready job; rows locked by
+        another worker's in-flight claim are skipped rather than waited on.
+        """
+        try:
+            async with self._pool.acquire() as conn:
+                rows = await conn.fetch(
+                    f"""
+                    WITH head AS (
+                        SELECT tenant_id, agent_id FROM embedding_jobs
+                        WHERE {_READY}
+                        ORDER BY ready_at
+                        LIMIT 1
+                        FOR UPDATE SKIP LOCKED
+                    ), batch AS (
+                        SELECT j.tenant_id, j.entity_type, j.entity_id
+                        FROM embedding_jobs j
+                        JOIN head h ON j.tenant_id = h.tenant_id AND j.agent_id = h.agent_id
+                        WHERE j.ready_at <= $1
+                          AND (j.locked_until IS NULL OR j.locked_until <= $1)
+                        ORDER BY j.ready_at
+                        LIMIT $2
+                        FOR UPDATE OF j SKIP LOCKED
+                    )
+                    UPDATE embedding_jobs t
+                    SET locked_until = $3
+                    FROM batch
+                    WHERE t.tenant_id = batch.tenant_id
+                      AND t.entity_type = batch.entity_type
+                      AND t.entity_id = batch.entity_id
+                    RETURNING {", ".join(f"t.{c.strip()}" for c in _COLUMNS.split(","))}
+                    """,
+                    now,
+                    limit,
+                    now + timedelta(seconds=lease_seconds),
+                )
+        except asyncpg.PostgresError as e:
+            logger.error("postgres_claim_embedding_jobs_error", error=str(e))
+            raise ConnectionError(f"Failed to claim embedding jobs: {e}", cause=e) from e
+
+        jobs = [self._row_to_job(row) for row in rows]
+        jobs.sort(key=lambda job: job.ready_at)
+        return jobs
+
+    async def complete(self, jobs: list[EmbeddingJob]) -> None:
+        """Delete claimed jobs whose enqueued_at is unchanged since the claim."""
+        if not jobs:
+            return
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.execute(
+                    """
+                    DELETE FROM embedding_jobs j
+                    USING unnest($1::uuid[], $2::text[], $3::uuid[], $4::timestamptz[])
+                        AS d(tenant_id, entity_type, entity_id, enqueued_at)
+                    WHERE j.tenant_id = d.tenant_id
+                      AND j.entity_type = d.entity_type
+                      AND j.entity_id = d.entity_id
+                      AND j.enqueued_at = d.enqueued_at
+                    """,
+                    *self._key_arrays(jobs),
+                )
+        except asyncpg.PostgresError as e:
+            logger.error("postgres_complete_embedding_jobs_error", count=len(jobs), error=str(e))
+            raise ConnectionError(f"Failed to complete embedding jobs: {e}", cause=e) from e
+
+    async def release(self, jobs: list[EmbeddingJob], *, retry_at: datetime) -> None:
+        """Clear the lease, count the attempt and delay the jobs."""
+        if not jobs:
+            return
+        try:
+            async with self._pool.acquire() as conn:
+                await conn.execute(
+                    """
+                    UPDATE embedding_jobs j
+                    SET attempts = j.attempts + 1,
+                        ready_at = $5,
+                        locked_until = NULL
+                    FROM unnest($1::uuid[], $2::text[], $3::uuid[], $4::timestamptz[])
+                        AS d(tenant_id, entity_type, entity_id, enqueued_at)
+                    WHERE j.tenant_id = d.tenant_id
+                      AND j.entity_type = d.entity_type
+                      AND j.entity_id = d.entity_id
+                      AND j.enqueued_at = d.enqueued_at
+                    """,
+                    *self._key_arrays(jobs),
+                    retry_at,
+                )
+        except asyncpg.PostgresError as e:
+            logger.error("postgres_release_embedding_jobs_error", count=len(jobs), error=str(e))
+            raise ConnectionError(f"Failed to release embedding jobs: {e}", cause=e) from e
+
+    async def pending_count(self, tenant_id: UUID, agent_id: UUID) -> int:
+        """Number of queued or claimed jobs of an agent."""
+        try:
+            async with self._pool.acquire() as conn:
+                count = await conn.fetchval(
+                    """
+                    SELECT count(*) FROM embedding_jobs
+                    WHERE tenant_id = $1 AND agent_id = $2
+                    """,
+                    tenant_id,
+                    agent_id,
+                )
+        except asyncpg.PostgresError as e:
+            logger.error("postgres_count_embedding_jobs_error", error=str(e))
+            raise ConnectionError(f"Failed to count embedding jobs: {e}", cause=e) from e
+        return int(count or 0)
+
+    async def next_ready_at(self) -> datetime | None:
+        """Earliest time a queued job becomes claimable (None if empty)."""
+        try:
+            async with self._pool.acquire() as conn:
+                return await conn.fetchval(
+                    """
+                    SELECT min(GREATEST(ready_at, COALESCE(locked_until, ready_at)))
+                    FROM embedding_jobs
+                    """
+                )
+        except asyncpg.PostgresError as e:
+            logger.error("postgres_next_embedding_job_error", error=str(e))
+            raise ConnectionError(f"Failed to read next embedding job: {e}", cause=e) from e
+
+    @staticmethod
+    def _key_arrays(jobs: list[EmbeddingJob]) -> tuple[list[Any], ...]:
+        return (
+            [job.tenant_id for job in jobs],
+            [job.entity_type.value for job in jobs],
+            [job.entity_id for job in jobs],
+            [job.enqueued_at for job in jobs],
+        )
+
+    @staticmethod
+    def _row_to_job(row: Any) -> EmbeddingJob:
+        return EmbeddingJob(
+            tenant_id=row["tenant_id"],
+            agent_id=row["agent_id"],
+            entity_type=EntityType(row["entity_type"]),
+            entity_id=row["entity_id"],
+            enqueued_at=row["enqueued_at"],
+            ready_at=row["ready_at"],
+            attempts=row["attempts"],
+        )
@@ -0,0 +1,64 @@
+"""EmbeddingJobQueue abstract interface."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+
+from ruche.vector.jobs.models import EmbeddingJob
+
+
+class EmbeddingJobQueue(ABC):
+    """Durable queue of pending embedding jobs.
+
+    Claims are per agent: one claim returns jobs of a single agent so the
+    worker embeds them together. Claimed jobs carry a lease and are claimed
+    again once it expires (e.g. after a worker crash).
+    """
+
+    @abstractmethod
+    async def enqueue(self, jobs: list[EmbeddingJob]) -> None:
+        """Add jobs, replacing pending jobs for the same entities.
+
+        A job re-enqueued while claimed stays in the queue when the claim
+        completes, since the entity changed after it was read.
+        """
+        pass
+
+    @abstractmethod
+    async def claim(self, *, now: datetime, limit: int, lease_seconds: float) -> list[EmbeddingJob]:
+        """Claim ready jobs of the agent with the oldest ready job.
+
+        Args:
+            now: Current time
+            limit: Maximum jobs to claim
+            lease_seconds: Lease on the claimed jobs
+
+        Returns:
+            Claimed jobs, all of one agent (empty if nothing is ready)
+        """
+        pass
+
+    @abstractmethod
+    async def complete(self, jobs: list[EmbeddingJob]) -> None:
+        """Remove claimed jobs that were not re-enqueued since their claim."""
+        pass
+
+    @abstractmethod
+    async def release(self, jobs: list[EmbeddingJob], *, retry_at: datetime) -> None:
+        """Return claimed jobs to the queue after a failure.
+
+        Args:
+            jobs: Jobs to release
+            retry_at: When the jobs become claimable again
+        """
+        pass
+
+    @abstractmethod
+    async def pending_count(self, tenant_id: UUID, agent_id: UUID) -> int:
+        """Number of queued or claimed jobs of an agent."""
+        pass
+
+    @abstractmethod
+    async def next_ready_at(self) -> datetime | None:
+        """Earliest time a queued job becomes claimable (None if empty)."""
+        pass
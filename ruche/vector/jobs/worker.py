@@ -0,0 +1,312 @@
+"""Embedding job worker.
+
+The worker:
+1. Claims ready jobs of one agent from the queue (leased, multi-replica safe)
+2. Loads the agent's rules, scenarios and intents once per entity type
+3. Embeds every job's text in batched provider calls
+4. Writes the vectors back to the config store (and the vector store),
+   skipping entities whose text changed while they were being embedded
+5. Completes the jobs, or releases them for a retry on failure
+"""
+
+import asyncio
+import contextlib
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from ruche.brains.focal.models import Intent, Rule, Scenario
+from ruche.brains.focal.retrieval.embedding_backfill import (
+    embed_texts,
+    intent_texts,
+    mean_embedding,
+)
+from ruche.brains.focal.stores import AgentConfigStore
+from ruche.config.models.jobs import EmbeddingJobsConfig
+from ruche.infrastructure.providers.embedding import EmbeddingProvider
+from ruche.observability.logging import get_logger
+from ruche.observability.metrics import EMBEDDING_JOB_BATCH_SIZE, EMBEDDING_JOBS
+from ruche.vector.embedding_manager import EmbeddingManager
+from ruche.vector.jobs.models import EmbeddingJob
+from ruche.vector.jobs.queue import EmbeddingJobQueue
+from ruche.vector.stores.base import EntityType
+
+logger = get_logger(__name__)
+
+_Entity = Rule | Scenario | Intent
+
+
+def embedding_texts(entity_type: EntityType, entity: _Entity) -> list[str]:
+    """Texts an entity's embedding is computed from (empty if none)."""
+    if entity_type == EntityType.RULE:
+        return [entity.condition_text]
+    if entity_type == EntityType.SCENARIO:
+        return [entity.entry_condition_text] if entity.entry_condition_text else []
+    return intent_texts(entity)
+
+
+class EmbeddingJobWorker:
+    """Consumes the embedding job queue in per-agent batches."""
+
+    def __init__(
+        self,
+        queue: EmbeddingJobQueue,
+        config_store: AgentConfigStore,
+        embedding_provider: EmbeddingProvider,
+        embedding_manager: EmbeddingManager | None = None,
+        config: EmbeddingJobsConfig | None = None,
+    ) -> None:
+        """Initialize worker.
+
+        Args:
+            queue: Embedding job queue
+            config_store: Store the entities are loaded from and saved to
+            embedding_provider: Provider for the batched embed() calls
+            embedding_manager: Optional manager syncing vectors to the vector store
+            config: Worker configuration
+        """
+        self._queue = queue
+        self._config_store = config_store
+        self._embedding_provider = embedding_provider
+        self._embedding_manager = embedding_manager
+        self._config = config or EmbeddingJobsConfig()
+        self._running = False
+        self._poll_task: asyncio.Task | None = None
+        self._wakeup = asyncio.Event()
+
+    async def start(self) -> None:
+        """Start the worker loop."""
+        if self._running:
+            logger.warning("embedding_worker_already_running")
+            return
+
+        self._running = True
+        self._poll_task = asyncio.create_task(self._poll_loop())
+        logger.info(
+            "embedding_worker_started",
+            max_jobs_per_claim=self._config.max_jobs_per_claim,
+            provider_batch_size=self._config.provider_batch_size,
+        )
+
+    async def stop(self) -> None:
+        """Stop the worker loop."""
+        if not self._running:
+            return
+
+        self._running = False
+        if self._poll_task:
+            self._poll_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._poll_task
+
+        logger.info("embedding_worker_stopped")
+
+    def notify(self) -> None:
+        """Wake the worker after jobs were enqueued in this process."""
+        self._wakeup.set()
+
+    async def run_once(self) -> int:
+        """Claim and process one batch of jobs.
+
+        Returns:
+            Number of jobs claimed
+        """
+        jobs = await self._queue.claim(
+            now=datetime.now(UTC),
+            limit=self._config.max_jobs_per_claim,
+            lease_seconds=self._config.lease_seconds,
+        )
+        if not jobs:
+            return 0
+
+        EMBEDDING_JOB_BATCH_SIZE.observe(len(jobs))
+        try:
+            await self._process(jobs)
+        except Exception as e:
+            logger.error(
+                "embedding_jobs_failed",
+                tenant_id=str(jobs[0].tenant_id),
+                agent_id=str(jobs[0].agent_id),
+                count=len(jobs),
+                error=str(e),
+            )
+            await self._fail(jobs)
+        return len(jobs)
+
+    async def _poll_loop(self) -> None:
+        """Background loop: claim ready jobs, then sleep until the next one."""
+        while self._running:
+            claimed = 0
+            try:
+                claimed = await self.run_once()
+            except Exception as e:
+                logger.error("embedding_worker_poll_error", error=str(e))
+
+            if claimed >= self._config.max_jobs_per_claim:
+                # Backlog: claim the next batch straight away
+                continue
+
+            await self._wait_for_next_ready()
+
+    async def _wait_for_next_ready(self) -> None:
+        """Sleep until the next job is ready, a notify(), or the poll interval."""
+        # Cleared before the lookup, so a notify() during it is not lost
+        self._wakeup.clear()
+        timeout = self._config.poll_interval_ms / 1000
+        try:
+            next_ready = await self._queue.next_ready_at()
+        except Exception as e:
+            logger.warning("embedding_next_ready_lookup_failed", error=str(e))
+            next_ready = None
+
+        if next_ready is not None:
+            until_ready = (next_ready - datetime.now(UTC)).total_seconds()
+            timeout = min(timeout, max(until_ready, 0.0))
+
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+
+    async def _process(self, jobs: list[EmbeddingJob]) -> None:
+        """Embed one agent's jobs in batched calls and write the vectors back."""
+        tenant_id, agent_id = jobs[0].tenant_id, jobs[0].agent_id
+        entity_types = {job.entity_type for job in jobs}
+        entities = await self._load_entities(tenant_id, agent_id, entity_types)
+
+        # Flatten all texts into one list; spans map them back to their jobs
+        texts: list[str] = []
+        spans: list[tuple[EmbeddingJob, _Entity, list[str], int]] = []
+        done: list[EmbeddingJob] = []
+        for job in jobs:
+            entity = entities[job.entity_type].get(job.entity_id)
+            entity_texts = embedding_texts(job.entity_type, entity) if entity else []
+            if not entity_texts:
+                # Deleted, or nothing to embed anymore
+                EMBEDDING_JOBS.labels(entity_type=job.entity_type.value, outcome="missing").inc()
+                done.append(job)
+                continue
+            spans.append((job, entity, entity_texts, len(texts)))
+            texts.extend(entity_texts)
+
+        vectors: list[list[float]] = []
+        model = None
+        if texts:
+            vectors, model = await embed_texts(
+                self._embedding_provider, texts, self._config.provider_batch_size
+            )
+
+        # Re-read before saving: an entity edited since it was loaded keeps
+        # its newer text, and its newer job embeds it
+        current = await self._load_entities(tenant_id, agent_id, entity_types)
+        failed: list[EmbeddingJob] = []
+        saved_rules: list[Rule] = []
+        for job, _, entity_texts, offset in spans:
+            entity = current[job.entity_type].get(job.entity_id)
+            if entity is None or embedding_texts(job.entity_type, entity) != entity_texts:
+                EMBEDDING_JOBS.labels(entity_type=job.entity_type.value, outcome="stale").inc()
+                done.append(job)
+                continue
+            try:
+                await self._save(
+                    job.entity_type, entity, vectors[offset : offset + len(entity_texts)], model
+                )
+            except Exception as e:
+                logger.warning(
+                    "embedding_job_save_failed",
+                    entity_type=job.entity_type.value,
+                    entity_id=str(job.entity_id),
+                    error=str(e),
+                )
+                failed.append(job)
+                continue
+            if job.entity_type == EntityType.RULE:
+                saved_rules.append(entity)
+            EMBEDDING_JOBS.labels(entity_type=job.entity_type.value, outcome="embedded").inc()
+            done.append(job)
+
+        if self._embedding_manager is not None and saved_rules:
+            await self._embedding_manager.sync_rules_batch(saved_rules, generate_embeddings=False)
+
+        await self._queue.complete(done)
+        if failed:
+            await self._fail(failed)
+
+        logger.info(
+            "embedding_jobs_processed",
+            tenant_id=str(tenant_id),
+            agent_id=str(agent_id),
+            jobs=len(jobs),
+            texts=len(texts),
+            failed=len(failed),
+        )
+
+    async def _load_entities(
+        self,
+        tenant_id: UUID,
+        agent_id: UUID,
+        entity_types: set[EntityType],
+    ) -> dict[EntityType, dict[UUID, Any]]:
+        """Load the agent's entities of the given types, keyed by ID."""
+        loaded: dict[EntityType, dict[UUID, Any]] = {t: {} for t in entity_types}
+        if EntityType.RULE in entity_types:
+            rules = await self._config_store.get_rules(tenant_id, agent_id, enabled_only=False)
+            loaded[EntityType.RULE] = {r.id: r for r in rules}
+        if EntityType.SCENARIO in entity_types:
+            scenarios = await self._config_store.get_scenarios(
+                tenant_id, agent_id, enabled_only=False
+            )
+            loaded[EntityType.SCENARIO] = {s.id: s for s in scenarios}
+        if EntityType.INTENT in entity_types:
+            intents = await self._config_store.get_intents(tenant_id, agent_id, enabled_only=False)
+            loaded[EntityType.INTENT] = {i.id: i for i in intents}
+        return loaded
+
+    async def _save(
+        self,
+        entity_type: EntityType,
+        entity: _Entity,
+        vectors: list[list[float]],
+        model: str | None,
+    ) -> None:
+        """Write an entity's new embedding to the config store."""
+        if entity_type == EntityType.RULE:
+            entity.embedding = vectors[0]
+            entity.embedding_model = model
+            await self._config_store.save_rule(entity)
+        elif entity_type == EntityType.SCENARIO:
+            entity.entry_condition_embedding = vectors[0]
+            await self._config_store.save_scenario(entity)
+            if self._embedding_manager is not None:
+                await self._embedding_manager.sync_scenario(entity, generate_embedding=False)
+        else:
+            entity.embedding = mean_embedding(vectors)
+            entity.embedding_model = model
+            await self._config_store.save_intent(entity)
+
+    async def _fail(self, jobs: list[EmbeddingJob]) -> None:
+        """Release failed jobs for a retry, dropping those out of attempts."""
+        retry: list[EmbeddingJob] = []
+        dropped: list[EmbeddingJob] = []
+        for job in jobs:
+            (dropped if job.attempts + 1 >= self._config.max_attempts else retry).append(job)
+
+        for job in dropped:
+            EMBEDDING_JOBS.labels(entity_type=job.entity_type.value, outcome="dropped").inc()
+            logger.error(
+                "embedding_job_dropped",
+                tenant_id=str(job.tenant_id),
+                entity_type=job.entity_type.value,
+                entity_id=str(job.entity_id),
+                attempts=job.attempts + 1,
+            )
+        for job in retry:
+            EMBEDDING_JOBS.labels(entity_type=job.entity_type.value, outcome="retried").inc()
+
+        try:
+            await self._queue.complete(dropped)
+            await self._queue.release(
+                retry,
+                retry_at=datetime.now(UTC) + timedelta(seconds=self._config.retry_backoff_seconds),
+            )
+        except Exception as e:
+            # The claim lease expires and the jobs are claimed again
+            logger.warning("embedding_job_release_failed", count=len(jobs), error=str(e))
@@ -1,14 +1,19 @@
 """Vector store implementations."""
 
-from ruche.vector.stores.base import (
-    EntityType,
-    VectorDocument,
-    VectorMetadata,
-    VectorSearchResult,
-    VectorStore,
-)
-from ruche.vector.stores.inmemory import InMemoryVectorStore
-from ruche.vector.stores.qdrant import QdrantVectorStore
+from typing import TYPE_CHECKING
+
+from ruche.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ruche.vector.stores.base import (
+        EntityType,
+        VectorDocument,
+        VectorMetadata,
+        VectorSearchResult,
+        VectorStore,
+    )
+    from ruche.vector.stores.inmemory import InMemoryVectorStore
+    from ruche.vector.stores.qdrant import QdrantVectorStore
 
 __all__ = [
     "EntityType",
@@ -19,3 +24,17 @@ __all__ = [
     "VectorSearchResult",
     "VectorStore",
 ]
+
+# Resolved on first access (PEP 562) so importing this package stays cheap
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "EntityType": "ruche.vector.stores.base",
+        "VectorDocument": "ruche.vector.stores.base",
+        "VectorMetadata": "ruche.vector.stores.base",
+        "VectorSearchResult": "ruche.vector.stores.base",
+        "VectorStore": "ruche.vector.stores.base",
+        "InMemoryVectorStore": "ruche.vector.stores.inmemory",
+        "QdrantVectorStore": "ruche.vector.stores.qdrant",
+    },
+)
@@ -28,6 +28,7 @@ class EntityType(str, Enum):
     EPISODE = "episode"
     ENTITY = "entity"  # Knowledge graph entity
     TEMPLATE = "template"
+    INTENT = "intent"
 
 
 class VectorMetadata(BaseModel):
@@ -521,3 +521,27 @@ class TestPostgresMemoryStoreBulkOperations:
 
         assert len(episodes) == 0
         assert len(entities) == 0
+
+    async def test_delete_by_group_resets_summary_counters(
+        self, memory_store, clean_postgres
+    ):
+        """Test that a recreated group starts with fresh summary counters."""
+        group_id = "tenant1:session1"
+
+        for i in range(3):
+            await memory_store.add_episode(
+                Episode(
+                    id=uuid4(),
+                    group_id=group_id,
+                    content=f"Episode {i}",
+                    content_type="message",
+                    source="user",
+                    occurred_at=datetime.now(UTC),
+                )
+            )
+
+        await memory_store.delete_by_group(group_id)
+
+        counters = await memory_store.get_summary_counters(group_id)
+        assert counters.total_turns == 0
+        assert counters.unsummarized_turns == 0
@@ -0,0 +1,63 @@
+"""Cold-import time budget for process entry points.
+
+Package facades resolve their exports lazily, and backend SDKs (qdrant,
+sentence-transformers, scikit-learn, ...) are imported only when used.
+These tests import each entry point in a fresh interpreter and fail if
+it exceeds its budget or pulls in a heavy SDK it does not need.
+
+Budgets can be scaled for slow machines with RUCHE_IMPORT_BUDGET_SCALE.
+Run with:
+    pytest tests/performance/test_import_time.py -v
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+BUDGET_SCALE = float(os.environ.get("RUCHE_IMPORT_BUDGET_SCALE", "1.0"))
+
+# Modules that must not be imported as a side effect of startup
+HEAVY_MODULES = ["qdrant_client", "sentence_transformers", "sklearn", "scipy"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "loaded": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def _cold_import(module: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize(
+    ("module", "budget_seconds"),
+    [
+        ("ruche.api.app", 3.0),
+        ("ruche.runtime.acf.worker", 1.5),
+    ],
+)
+def test_cold_import_within_budget(module: str, budget_seconds: float) -> None:
+    """Entry points import within budget and without heavy SDKs."""
+    probe = _cold_import(module)
+
+    assert probe["loaded"] == [], f"{module} imported heavy modules: {probe['loaded']}"
+    assert probe["seconds"] < budget_seconds * BUDGET_SCALE, (
+        f"{module} took {probe['seconds']:.2f}s to import "
+        f"(budget {budget_seconds * BUDGET_SCALE:.2f}s)"
+    )
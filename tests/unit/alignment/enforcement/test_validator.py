@@ -1,5 +1,7 @@
 """Unit tests for EnforcementValidator with two-lane dispatch."""
 
+import asyncio
+import json
 from typing import Any
 from uuid import uuid4
 
@@ -9,8 +11,9 @@ from ruche.brains.focal.phases.context.situation_snapshot import SituationSnapsh
 from ruche.brains.focal.phases.enforcement.validator import EnforcementValidator
 from ruche.brains.focal.phases.filtering.models import MatchedRule
 from ruche.brains.focal.phases.generation.generator import ResponseGenerator
-from ruche.brains.focal.models import Rule, Scope
+from ruche.brains.focal.models import Agent, Rule, Scope
 from ruche.config.models.pipeline import EnforcementConfig
+from ruche.conversation.models import Channel, Session
 from ruche.infrastructure.providers.llm import LLMExecutor, LLMMessage, LLMResponse
 
 
@@ -547,3 +550,265 @@ async def test_validator_no_retry_when_max_retries_zero(tenant_id, agent_id, sna
     assert result.regeneration_attempts == 0
     assert result.passed is False
     assert "$75" in result.final_response  # Original response, not regenerated
+
+
+def _subjective_rule(tenant_id, agent_id, name: str) -> Rule:
+    return Rule(
+        id=uuid4(),
+        tenant_id=tenant_id,
+        agent_id=agent_id,
+        name=name,
+        condition_text="Always",
+        action_text=name,
+        scope=Scope.GLOBAL,
+        is_hard_constraint=True,
+    )
+
+
+def _verdicts(*entries: tuple[Rule, str, str]) -> str:
+    return json.dumps(
+        {
+            "verdicts": [
+                {"rule_id": str(rule.id), "verdict": verdict, "reason": reason}
+                for rule, verdict, reason in entries
+            ]
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_validator_judges_subjective_rules_in_one_call(tenant_id, agent_id, snapshot) -> None:
+    """All subjective rules are judged by a single batched LLM call."""
+    rules = [_subjective_rule(tenant_id, agent_id, n) for n in ("Polite", "No slang", "Concise")]
+    llm = MockLLMExecutor(
+        responses=[
+            _verdicts(
+                (rules[0], "PASS", ""),
+                (rules[1], "FAIL", "Uses slang"),
+                (rules[2], "PASS", ""),
+            )
+        ]
+    )
+    validator = EnforcementValidator(
+        response_generator=MockGenerator("clean response"),
+        agent_config_store=MockConfigStore(global_rules=rules),
+        llm_executor=llm,
+        config=EnforcementConfig(max_retries=0),
+    )
+
+    result = await validator.validate(
+        response="yo, sure thing",
+        snapshot=snapshot,
+        matched_rules=[],
+        tenant_id=tenant_id,
+        agent_id=agent_id,
+    )
+
+    assert llm._call_count == 1
+    assert [v.rule_id for v in result.violations] == [rules[1].id]
+    assert result.violations[0].details == "Uses slang"
+
+
+@pytest.mark.asyncio
+async def test_validator_chunks_subjective_rules(tenant_id, agent_id, snapshot) -> None:
+    """Rules beyond llm_judge_max_rules_per_call go to further calls."""
+    rules = [_subjective_rule(tenant_id, agent_id, f"Rule {i}") for i in range(3)]
+    llm = MockLLMExecutor(responses=[_verdicts(*((rule, "PASS", "") for rule in rules))])
+    validator = EnforcementValidator(
+        response_generator=MockGenerator("clean response"),
+        agent_config_store=MockConfigStore(global_rules=rules),
+        llm_executor=llm,
+        config=EnforcementConfig(llm_judge_max_rules_per_call=2),
+    )
+
+    result = await validator.validate(
+        response="Happy to help.",
+        snapshot=snapshot,
+        matched_rules=[],
+        tenant_id=tenant_id,
+        agent_id=agent_id,
+    )
+
+    assert result.passed is True
+    assert llm._call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_validator_judges_missing_verdicts_individually(
+    tenant_id, agent_id, snapshot
+) -> None:
+    """A rule left out of the batch verdicts gets its own judgment."""
+    rules = [_subjective_rule(tenant_id, agent_id, n) for n in ("Polite", "No slang")]
+    llm = MockLLMExecutor(
+        responses=[_verdicts((rules[0], "PASS", "")), "FAIL: Uses slang"],
+    )
+    validator = EnforcementValidator(
+        response_generator=MockGenerator("clean response"),
+        agent_config_store=MockConfigStore(global_rules=rules),
+        llm_executor=llm,
+        config=EnforcementConfig(max_retries=0),
+    )
+
+    result = await validator.validate(
+        response="yo, sure thing",
+        snapshot=snapshot,
+        matched_rules=[],
+        tenant_id=tenant_id,
+        agent_id=agent_id,
+    )
+
+    assert llm._call_count == 2
+    assert [v.rule_id for v in result.violations] == [rules[1].id]
+
+
+def _deterministic_rule(tenant_id, agent_id, expression: str) -> Rule:
+    return Rule(
+        id=uuid4(),
+        tenant_id=tenant_id,
+        agent_id=agent_id,
+        name="Amount limit",
+        condition_text="When processing refunds",
+        action_text="Limit refunds",
+        scope=Scope.GLOBAL,
+        is_hard_constraint=True,
+        enforcement_expression=expression,
+    )
+
+
+class VersionedConfigStore(MockConfigStore):
+    """Config store with an agent whose version and rules can change."""
+
+    def __init__(self, tenant_id, agent_id, global_rules: list[Rule]):
+        super().__init__(global_rules=global_rules)
+        self.agent = Agent(id=agent_id, tenant_id=tenant_id, name="Support")
+        self.rule_fetches = 0
+
+    async def get_agent(self, tenant_id, agent_id) -> Agent | None:
+        return self.agent
+
+    async def get_rules(self, **kwargs) -> list[Rule]:
+        self.rule_fetches += 1
+        return await super().get_rules(**kwargs)
+
+    def publish(self, global_rules: list[Rule]) -> None:
+        self._global_rules = global_rules
+        self.agent.current_version += 1
+
+
+async def _validate_refund(validator, snapshot, tenant_id, agent_id, session=None):
+    return await validator.validate(
+        response="I can offer you a refund of $45",
+        snapshot=snapshot,
+        matched_rules=[],
+        tenant_id=tenant_id,
+        agent_id=agent_id,
+        session=session,
+    )
+
+
+@pytest.mark.asyncio
+async def test_validator_caches_global_constraints_per_version(
+    tenant_id, agent_id, snapshot
+) -> None:
+    """GLOBAL constraints are fetched once per agent version."""
+    store = VersionedConfigStore(
+        tenant_id, agent_id, [_deterministic_rule(tenant_id, agent_id, "amount <= 50")]
+    )
+    validator = EnforcementValidator(
+        response_generator=MockGenerator("clean response"),
+        agent_config_store=store,
+        llm_executor=MockLLMExecutor(),
+    )
+
+    for _ in range(3):
+        result = await _validate_refund(validator, snapshot, tenant_id, agent_id)
+        assert result.passed is True
+
+    assert store.rule_fetches == 1
+
+
+@pytest.mark.asyncio
+async def test_validator_enforces_global_rule_changed_under_session(
+    tenant_id, agent_id, snapshot
+) -> None:
+    """A publish mid-session is enforced on the session's next turn."""
+    store = VersionedConfigStore(
+        tenant_id, agent_id, [_deterministic_rule(tenant_id, agent_id, "amount <= 50")]
+    )
+    validator = EnforcementValidator(
+        response_generator=MockGenerator("clean response"),
+        agent_config_store=store,
+        llm_executor=MockLLMExecutor(),
+        config=EnforcementConfig(max_retries=0),
+    )
+    session = Session(
+        tenant_id=tenant_id,
+        agent_id=agent_id,
+        channel=Channel.WEBCHAT,
+        user_channel_id="user-1",
+        config_version=1,
+    )
+
+    first = await _validate_refund(validator, snapshot, tenant_id, agent_id, session)
+    store.publish([_deterministic_rule(tenant_id, agent_id, "amount <= 40")])
+    second = await _validate_refund(validator, snapshot, tenant_id, agent_id, session)
+
+    assert first.passed is True
+    assert second.passed is False
+    assert session.config_version == 1
+
+
+@pytest.mark.asyncio
+async def test_validator_refetches_global_constraints_after_ttl(
+    tenant_id, agent_id, snapshot
+) -> None:
+    """Rule edits without a publish are picked up once the TTL expires."""
+    store = VersionedConfigStore(
+        tenant_id, agent_id, [_deterministic_rule(tenant_id, agent_id, "amount <= 50")]
+    )
+    validator = EnforcementValidator(
+        response_generator=MockGenerator("clean response"),
+        agent_config_store=store,
+        llm_executor=MockLLMExecutor(),
+        config=EnforcementConfig(max_retries=0, global_rules_cache_ttl_seconds=0.01),
+    )
+
+    await _validate_refund(validator, snapshot, tenant_id, agent_id)
+    store._global_rules = [_deterministic_rule(tenant_id, agent_id, "amount <= 40")]
+    await asyncio.sleep(0.02)
+    result = await _validate_refund(validator, snapshot, tenant_id, agent_id)
+
+    assert result.passed is False
+    assert store.rule_fetches == 2
+
+
+@pytest.mark.asyncio
+async def test_validator_cancels_lane2_when_lane1_raises(tenant_id, agent_id, snapshot) -> None:
+    """A failing deterministic lane does not leave the judge task running."""
+    rules = [
+        _deterministic_rule(tenant_id, agent_id, "amount <= 50"),
+        _subjective_rule(tenant_id, agent_id, "Polite"),
+    ]
+    validator = EnforcementValidator(
+        response_generator=MockGenerator("clean response"),
+        agent_config_store=MockConfigStore(global_rules=rules),
+        llm_executor=MockLLMExecutor(),
+    )
+    judge_cancelled = asyncio.Event()
+
+    async def slow_judge(response, rules):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            judge_cancelled.set()
+            raise
+
+    def broken_lane1(rules, variables):
+        raise RuntimeError("boom")
+
+    validator._subjective_enforcer.evaluate_batch = slow_judge
+    validator._enforce_lane1 = broken_lane1
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await _validate_refund(validator, snapshot, tenant_id, agent_id)
+    await asyncio.wait_for(judge_cancelled.wait(), timeout=1)
@@ -319,6 +319,62 @@ class TestPromptBuilder:
         assert "item #456" in prompt
         assert "last week" in prompt
 
+    # Test build_prompt_layout
+
+    def test_layout_orders_stable_before_volatile(
+        self,
+        builder: PromptBuilder,
+        snapshot: SituationSnapshot,
+        matched_rules: list[MatchedRule],
+    ) -> None:
+        """Rules precede per-turn context; stable segments are breakpoints."""
+        layout = builder.build_prompt_layout(
+            matched_rules=matched_rules,
+            snapshot=snapshot,
+            memory_context="User ordered item #456",
+        )
+
+        names = [s.name for s in layout.segments]
+        assert names == ["instructions", "knowledge", "turn"]
+        assert [s.cache_breakpoint for s in layout.segments] == [True, True, False]
+        assert "Return Policy" in layout.segments[1].text
+        assert "item #456" in layout.segments[2].text
+        assert layout.text.index("Return Policy") < layout.text.index("item #456")
+
+    def test_layout_instructions_identical_across_turns(
+        self,
+        builder: PromptBuilder,
+        snapshot: SituationSnapshot,
+        matched_rules: list[MatchedRule],
+    ) -> None:
+        """Per-turn content never leaks into the instructions segment."""
+        other = SituationSnapshot(
+            message="Hi",
+            intent_changed=False,
+            topic_changed=False,
+            tone="frustrated",
+        )
+
+        first = builder.build_prompt_layout(matched_rules=matched_rules, snapshot=snapshot)
+        second = builder.build_prompt_layout(matched_rules=[], snapshot=other)
+
+        assert first.segments[0].text == second.segments[0].text
+        assert "{rules_section}" not in first.segments[0].text
+
+    def test_build_messages_from_layout(
+        self,
+        builder: PromptBuilder,
+        snapshot: SituationSnapshot,
+        matched_rules: list[MatchedRule],
+    ) -> None:
+        """A layout becomes one system message per non-empty segment."""
+        layout = builder.build_prompt_layout(matched_rules=matched_rules, snapshot=snapshot)
+
+        messages = builder.build_messages(system_prompt=layout, user_message="Hello")
+
+        assert [m["role"] for m in messages] == ["system", "system", "system", "user"]
+        assert [m.get("cache_breakpoint") for m in messages[:3]] == [True, True, False]
+
     # Test build_messages
 
     def test_build_messages_basic(
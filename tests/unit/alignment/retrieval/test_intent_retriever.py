@@ -9,7 +9,7 @@ from ruche.brains.focal.models.intent import Intent
 from ruche.brains.focal.retrieval.intent_retriever import IntentRetriever
 from ruche.brains.focal.stores.inmemory import InMemoryAgentConfigStore
 from ruche.config.models.selection import SelectionConfig
-from ruche.infrastructure.providers.embedding import EmbeddingProvider
+from ruche.infrastructure.providers.embedding import EmbeddingProvider, EmbeddingResponse
 
 
 class MockEmbeddingProvider(EmbeddingProvider):
@@ -288,3 +288,57 @@ class TestIntentRetriever:
 
         # Should successfully retrieve using cached embedding
         assert len(candidates) > 0
+
+    @pytest.mark.asyncio
+    async def test_retrieve_backfills_missing_intent_embeddings(
+        self, config_store, tenant_id, agent_id
+    ):
+        """Test that intents without embeddings are embedded in one batch and saved."""
+        batches = []
+
+        class RecordingProvider(MockEmbeddingProvider):
+            async def embed(self, texts: list[str], **kwargs) -> EmbeddingResponse:
+                batches.append(texts)
+                return EmbeddingResponse(
+                    embeddings=[[1.0, 0.0] if "cancel" in t else [0.0, 1.0] for t in texts],
+                    model="recording",
+                    dimensions=2,
+                )
+
+        for name, phrases in (
+            ("cancel", ["cancel my order", "stop my order"]),
+            ("refund", ["refund please"]),
+        ):
+            await config_store.save_intent(
+                Intent(
+                    id=uuid4(),
+                    tenant_id=tenant_id,
+                    agent_id=agent_id,
+                    name=name,
+                    example_phrases=phrases,
+                    created_at=datetime.now(UTC),
+                    updated_at=datetime.now(UTC),
+                )
+            )
+
+        retriever = IntentRetriever(
+            config_store=config_store,
+            embedding_provider=RecordingProvider(),
+            selection_config=SelectionConfig(max_k=5, min_k=1, min_score=0.0),
+        )
+        snapshot = SituationSnapshot(
+            message="cancel",
+            intent_changed=False,
+            topic_changed=False,
+            tone="neutral",
+            embedding=[1.0, 0.0],
+        )
+
+        candidates = await retriever.retrieve(tenant_id, agent_id, snapshot)
+        await retriever.retrieve(tenant_id, agent_id, snapshot)
+
+        assert batches == [["cancel my order", "stop my order", "refund please"]]
+        assert candidates[0].intent_name == "cancel"
+        stored = {i.name: i for i in await config_store.get_intents(tenant_id, agent_id)}
+        assert stored["cancel"].embedding == [0.5, 0.5]
+        assert stored["cancel"].embedding_model == "recording"
@@ -126,3 +126,57 @@ async def test_scenario_retriever_embeds_entry_text_when_missing_embedding() ->
 
     assert len(result) == 1
     assert result[0].scenario_name == "NeedsEmbedding"
+
+
+class CountingEmbeddingProvider(StaticEmbeddingProvider):
+    """Static provider recording each embed() batch."""
+
+    def __init__(self, embedding: list[float]) -> None:
+        super().__init__(embedding)
+        self.batches: list[list[str]] = []
+
+    async def embed(self, texts: list[str], **kwargs) -> EmbeddingResponse:
+        self.batches.append(texts)
+        return await super().embed(texts, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_scenario_retriever_backfills_missing_embeddings_once() -> None:
+    tenant_id = uuid4()
+    agent_id = uuid4()
+    store = InMemoryAgentConfigStore()
+
+    for name in ("First", "Second"):
+        step_id = uuid4()
+        await store.save_scenario(
+            Scenario(
+                id=uuid4(),
+                tenant_id=tenant_id,
+                agent_id=agent_id,
+                name=name,
+                entry_step_id=step_id,
+                steps=[ScenarioStep(id=step_id, scenario_id=step_id, name="entry", transitions=[])],
+                entry_condition_text=f"start {name}",
+            )
+        )
+
+    provider = CountingEmbeddingProvider([0.5, 0.5])
+    retriever = ScenarioRetriever(
+        config_store=store,
+        embedding_provider=provider,
+        selection_config=SelectionConfig(strategy="fixed_k", params={"k": 2}),
+    )
+    snapshot = SituationSnapshot(
+        message="hello",
+        intent_changed=False,
+        topic_changed=False,
+        tone="neutral",
+        embedding=[0.5, 0.5],
+    )
+
+    await retriever.retrieve(tenant_id, agent_id, snapshot)
+    await retriever.retrieve(tenant_id, agent_id, snapshot)
+
+    assert provider.batches == [["start First", "start Second"]]
+    stored = await store.get_scenarios(tenant_id, agent_id)
+    assert all(s.entry_condition_embedding == [0.5, 0.5] for s in stored)
@@ -1,5 +1,6 @@
 """Unit tests for selection strategies."""
 
+import numpy as np
 import pytest
 
 from ruche.brains.focal.retrieval.selection import (
@@ -330,6 +331,29 @@ class TestClusterSelectionStrategy:
         assert len(result.selected) >= 2
         assert "n_clusters" in result.metadata
 
+    @pytest.mark.parametrize("dtype", [np.float64, np.float32])
+    def test_gap_rounded_above_eps_splits_like_dbscan(self, dtype: type) -> None:
+        """Scores eps apart whose float gap exceeds eps split, as in DBSCAN."""
+        strategy = ClusterSelectionStrategy(eps=0.1, top_per_cluster=1, min_score=0.0)
+        scores = np.array([0.8, 0.7], dtype=dtype)
+
+        assert strategy._cluster_labels(scores).tolist() == [0, 1]
+
+        selection = strategy.select_scores(scores, max_k=10, min_k=1)
+        assert selection.indices.tolist() == [0, 1]
+        assert selection.metadata["n_clusters"] == 2
+
+    @pytest.mark.parametrize("dtype", [np.float64, np.float32])
+    def test_run_labels_match_dbscan(self, dtype: type) -> None:
+        """The min_samples=1 shortcut labels clusters like sklearn DBSCAN."""
+        cluster = pytest.importorskip("sklearn.cluster")
+        strategy = ClusterSelectionStrategy(eps=0.1, min_samples=1)
+        scores = np.array([0.8, 0.7, 0.55, 0.5, 0.3], dtype=dtype)
+
+        expected = cluster.DBSCAN(eps=0.1, min_samples=1).fit(scores.reshape(-1, 1))
+
+        assert strategy._cluster_labels(scores).tolist() == expected.labels_.tolist()
+
     def test_respects_min_score(self) -> None:
         """Test that min_score filters items before clustering."""
         strategy = ClusterSelectionStrategy(min_score=0.5)
@@ -446,3 +470,45 @@ class TestSelectionStrategyValidation:
 
         scores = [item.score for item in result.selected]
         assert scores == sorted(scores, reverse=True)
+
+
+class TestSelectScores:
+    """Tests for selection over score arrays."""
+
+    @pytest.mark.parametrize(
+        "strategy_name", ["fixed_k", "elbow", "adaptive_k", "entropy", "clustering"]
+    )
+    def test_matches_select_on_unsorted_float32(self, strategy_name: str) -> None:
+        """Test array selection picks the same items as select()."""
+        scores = [0.95, 0.93, 0.9, 0.6, 0.58, 0.3, 0.2, 0.1]
+        strategy = create_selection_strategy(strategy_name)
+        expected = strategy.select(
+            [ScoredItem(item=i, score=s) for i, s in enumerate(scores)], max_k=5, min_k=1
+        )
+
+        permutation = np.array([5, 0, 7, 3, 1, 6, 2, 4])
+        shuffled = np.array(scores, dtype=np.float32)[permutation]
+        result = strategy.select_scores(shuffled, max_k=5, min_k=1)
+
+        assert list(permutation[result.indices]) == [item.item for item in expected.selected]
+        assert result.method == strategy_name
+
+    def test_min_score_pool_falls_back_below_min_k(self) -> None:
+        """Test min_score narrows the pool unless fewer than min_k pass."""
+        strategy = FixedKSelectionStrategy(k=5)
+        scores = np.array([0.2, 0.9, 0.4], dtype=np.float32)
+
+        narrowed = strategy.select_scores(scores, max_k=5, min_k=1, min_score=0.5)
+        widened = strategy.select_scores(scores, max_k=5, min_k=2, min_score=0.5)
+
+        assert list(narrowed.indices) == [1]
+        assert narrowed.cutoff_score == pytest.approx(0.9)
+        assert list(widened.indices) == [1, 2, 0]
+
+    def test_empty_scores(self) -> None:
+        """Test empty score array."""
+        result = ElbowSelectionStrategy().select_scores(np.empty(0, dtype=np.float32))
+
+        assert len(result.indices) == 0
+        assert result.cutoff_score == 0.0
+
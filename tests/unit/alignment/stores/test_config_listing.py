@@ -0,0 +1,188 @@
+"""Tests for keyset-paginated config listings."""
+
+import json
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from ruche.brains.focal.models import Rule, Template
+from ruche.brains.focal.stores import InMemoryAgentConfigStore
+from ruche.brains.focal.stores.listing import DEFAULT_COUNT_CAP, decode_cursor, encode_cursor
+from ruche.brains.focal.stores.postgres import PostgresAgentConfigStore
+
+
+def _rule(tenant_id, agent_id, i: int, **kwargs) -> Rule:
+    return Rule(
+        tenant_id=tenant_id,
+        agent_id=agent_id,
+        name=f"Rule {i:02d}",
+        condition_text=f"condition {i}",
+        action_text="act",
+        priority=i % 3,
+        **kwargs,
+    )
+
+
+class TestCursor:
+    """Tests for cursor encoding."""
+
+    def test_round_trip(self) -> None:
+        item_id = uuid4()
+        now = datetime.now(UTC)
+
+        cursor = encode_cursor("created_at", "desc", now, item_id)
+
+        assert decode_cursor(cursor, "created_at", "desc") == (now, item_id)
+
+    def test_rejects_other_sort_and_garbage(self) -> None:
+        cursor = encode_cursor("priority", "desc", 3, uuid4())
+
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, "name", "desc")
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor", "priority", "desc")
+
+
+class TestInMemoryListing:
+    """Tests for the in-memory listings."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_cover_all_rules_once(self) -> None:
+        store = InMemoryAgentConfigStore()
+        tenant_id, agent_id = uuid4(), uuid4()
+        for i in range(25):
+            await store.save_rule(_rule(tenant_id, agent_id, i))
+
+        seen = []
+        cursor = None
+        while True:
+            page = await store.list_rules(
+                tenant_id, agent_id, sort_by="priority", limit=10, cursor=cursor
+            )
+            seen.extend(page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert len({r.id for r in seen}) == 25
+        priorities = [r.priority for r in seen]
+        assert priorities == sorted(priorities, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_filters_total_and_embedding_projection(self) -> None:
+        store = InMemoryAgentConfigStore()
+        tenant_id, agent_id = uuid4(), uuid4()
+        embedded = _rule(tenant_id, agent_id, 1, embedding=[0.1, 0.2])
+        await store.save_rule(embedded)
+        await store.save_rule(_rule(tenant_id, agent_id, 2, enabled=False))
+
+        page = await store.list_rules(tenant_id, agent_id, enabled=True, include_total=True)
+
+        assert page.total == 1
+        assert page.items[0].embedding is None
+        assert page.embedded_ids == {embedded.id}
+        assert embedded.embedding == [0.1, 0.2]
+
+    @pytest.mark.asyncio
+    async def test_templates_sort_by_name_case_insensitively(self) -> None:
+        store = InMemoryAgentConfigStore()
+        tenant_id, agent_id = uuid4(), uuid4()
+        for name in ("beta", "Alpha", "gamma"):
+            await store.save_template(
+                Template(tenant_id=tenant_id, agent_id=agent_id, name=name, content="hi")
+            )
+
+        page = await store.list_templates(tenant_id, agent_id, sort_by="name", sort_order="asc")
+
+        assert [t.name for t in page.items] == ["Alpha", "beta", "gamma"]
+
+
+@pytest.fixture
+def conn() -> MagicMock:
+    conn = MagicMock()
+    conn.fetch = AsyncMock()
+    conn.fetchval = AsyncMock()
+    return conn
+
+
+@pytest.fixture
+def pool(conn) -> MagicMock:
+    pool = MagicMock()
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    pool.acquire = acquire
+    return pool
+
+
+def _rule_row(tenant_id, agent_id, i: int, created_at: datetime) -> dict:
+    return {
+        "id": uuid4(),
+        "tenant_id": tenant_id,
+        "agent_id": agent_id,
+        "name": f"Rule {i}",
+        "description": None,
+        "condition_text": "c",
+        "condition_embedding": None,
+        "has_embedding": i == 0,
+        "embedding_model": None,
+        "action_type": "a",
+        "action_config": json.dumps({}),
+        "scope": "GLOBAL",
+        "scope_id": None,
+        "priority": 0,
+        "enabled": True,
+        "created_at": created_at,
+        "updated_at": created_at,
+        "deleted_at": None,
+        "sort_key": created_at,
+    }
+
+
+class TestPostgresListing:
+    """Tests for the keyset SQL (mocked connection)."""
+
+    @pytest.mark.asyncio
+    async def test_keyset_query_projects_and_pages(self, pool, conn) -> None:
+        tenant_id, agent_id = uuid4(), uuid4()
+        now = datetime.now(UTC)
+        conn.fetch.return_value = [
+            _rule_row(tenant_id, agent_id, i, now - timedelta(minutes=i)) for i in range(3)
+        ]
+        conn.fetchval.return_value = DEFAULT_COUNT_CAP + 1
+        store = PostgresAgentConfigStore(pool)
+        cursor = encode_cursor("created_at", "desc", now, uuid4())
+
+        page = await store.list_rules(
+            tenant_id,
+            agent_id,
+            enabled=True,
+            sort_by="created_at",
+            limit=2,
+            cursor=cursor,
+            include_total=True,
+        )
+
+        query, *params = conn.fetch.await_args.args
+        assert "(created_at, id) < ($4, $5)" in query
+        assert "ORDER BY created_at DESC, id DESC" in query
+        assert "NULL::bytea AS condition_embedding" in query
+        assert params[-1] == 3
+        assert len(page.items) == 2
+        assert page.embedded_ids == {page.items[0].id}
+        assert decode_cursor(page.next_cursor, "created_at", "desc")[1] == page.items[1].id
+        assert page.total == DEFAULT_COUNT_CAP
+        assert page.total_is_estimate
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_raises_value_error(self, pool, conn) -> None:
+        store = PostgresAgentConfigStore(pool)
+
+        with pytest.raises(ValueError):
+            await store.list_templates(uuid4(), uuid4(), cursor="bogus")
+        conn.fetch.assert_not_awaited()
@@ -8,9 +8,12 @@ import pytest
 from ruche.brains.focal.phases.context.models import Turn
 from ruche.brains.focal.phases.context.situation_snapshot import SituationSnapshot
 from ruche.brains.focal.pipeline import FocalCognitivePipeline as AlignmentEngine
+from ruche.brains.focal.pipeline import _SpeculativeRetrieval
 from ruche.brains.focal.models import Rule
 from ruche.brains.focal.result import AlignmentResult, PipelineStepTiming
+from ruche.brains.focal.retrieval.models import RetrievalResult
 from ruche.brains.focal.stores import AgentConfigStore
+from ruche.brains.focal.stores.listing import ListPage
 from ruche.config.models.pipeline import PipelineConfig
 from ruche.infrastructure.providers.embedding import EmbeddingProvider, EmbeddingResponse
 
@@ -68,6 +71,9 @@ class MockAgentConfigStore(AgentConfigStore):
             rules = [r for r in rules if r.enabled]
         return rules
 
+    async def list_rules(self, tenant_id, agent_id, **kwargs):
+        return ListPage(items=self._rules)
+
     async def save_rule(self, rule: Rule):
         self._rules.append(rule)
         return rule.id
@@ -86,6 +92,9 @@ class MockAgentConfigStore(AgentConfigStore):
     async def get_scenarios(self, tenant_id, agent_id, *, enabled_only=True):
         return []
 
+    async def list_scenarios(self, tenant_id, agent_id, **kwargs):
+        return ListPage()
+
     async def save_scenario(self, scenario):
         return scenario.id
 
@@ -99,6 +108,9 @@ class MockAgentConfigStore(AgentConfigStore):
     async def get_templates(self, tenant_id, agent_id, *, scope=None, scope_id=None):
         return []
 
+    async def list_templates(self, tenant_id, agent_id, **kwargs):
+        return ListPage()
+
     async def save_template(self, template):
         return template.id
 
@@ -694,3 +706,47 @@ class TestPipelineStepTiming:
 
         assert timing.skipped is True
         assert timing.skip_reason == "Step disabled"
+
+
+
+class TestSpeculativeRetrieval:
+    """Tests for validating speculative retrieval against the sensed snapshot."""
+
+    def _speculation(self) -> _SpeculativeRetrieval:
+        from datetime import datetime
+
+        now = datetime.utcnow()
+        return _SpeculativeRetrieval(
+            query=SituationSnapshot(
+                message="hola",
+                embedding=[0.1, 0.2],
+                intent_changed=False,
+                topic_changed=False,
+                tone="neutral",
+            ),
+            result=RetrievalResult(),
+            intent_candidates=[],
+            timing=PipelineStepTiming(
+                step="retrieval", started_at=now, ended_at=now, duration_ms=1.0
+            ),
+        )
+
+    def test_same_message_and_language_is_valid(self) -> None:
+        """The speculation is kept when the sensor changes nothing retrieval reads."""
+        snapshot = SituationSnapshot(
+            message="hola", intent_changed=False, topic_changed=False, tone="neutral"
+        )
+
+        assert self._speculation().is_valid_for(snapshot)
+
+    def test_other_language_is_invalid(self) -> None:
+        """A detected non-default language discards the speculation."""
+        snapshot = SituationSnapshot(
+            message="hola",
+            language="es",
+            intent_changed=False,
+            topic_changed=False,
+            tone="neutral",
+        )
+
+        assert not self._speculation().is_valid_for(snapshot)
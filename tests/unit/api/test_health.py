@@ -15,6 +15,7 @@ from ruche.api.dependencies import (
     reset_dependencies,
 )
 from ruche.api.routes.health import router
+from ruche.api.warmup import get_warmup_state, reset_warmup_state
 from ruche.audit.stores.inmemory import InMemoryAuditStore
 from ruche.conversation.stores.inmemory import InMemorySessionStore
 
@@ -112,6 +113,34 @@ class TestHealthEndpoint:
         assert data["version"] == "1.0.0"
 
 
+class TestReadinessEndpoint:
+    """Tests for GET /ready endpoint."""
+
+    def test_ready_returns_503_while_warming_up(self, client: TestClient) -> None:
+        """Readiness is 503 until warm-up completes."""
+        reset_warmup_state()
+
+        response = client.get("/ready")
+
+        assert response.status_code == 503
+        assert response.json()["status"] == "warming_up"
+
+    def test_ready_returns_200_after_warm_up(self, client: TestClient) -> None:
+        """Readiness is 200 with stage outcomes once warm-up completes."""
+        reset_warmup_state()
+        state = get_warmup_state()
+        state.stages["stores"] = "ok"
+        state.ready = True
+
+        response = client.get("/ready")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "ready"
+        assert data["stages"] == {"stores": "ok"}
+        reset_warmup_state()
+
+
 class TestMetricsEndpoint:
     """Tests for GET /metrics endpoint."""
 
@@ -0,0 +1,110 @@
+"""Unit tests for startup warm-up."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from ruche.api import dependencies
+from ruche.api.warmup import get_warmup_state, reset_warmup_state, run_warmup
+from ruche.audit.models import TurnRecord
+from ruche.audit.stores.inmemory import InMemoryAuditStore
+from ruche.brains.focal.stores.inmemory import InMemoryAgentConfigStore
+from ruche.config.models.api import APIConfig, WarmupConfig
+from ruche.conversation.stores.inmemory import InMemorySessionStore
+from ruche.infrastructure.providers.embedding.mock import MockEmbeddingProvider
+from ruche.infrastructure.stores.memory.inmemory import InMemoryMemoryStore
+
+
+@pytest.fixture
+def audit_store() -> InMemoryAuditStore:
+    """In-memory audit store."""
+    return InMemoryAuditStore()
+
+
+@pytest.fixture
+def engine() -> MagicMock:
+    """Alignment engine double."""
+    engine = MagicMock()
+    engine.warm_up = AsyncMock(return_value=1)
+    return engine
+
+
+@pytest.fixture
+async def wired(audit_store: InMemoryAuditStore, engine: MagicMock):
+    """Pre-populate cached dependencies with in-memory instances."""
+    await dependencies.reset_dependencies()
+    reset_warmup_state()
+    dependencies._config_store = InMemoryAgentConfigStore()
+    dependencies._session_store = InMemorySessionStore()
+    dependencies._audit_store = audit_store
+    dependencies._memory_store = InMemoryMemoryStore()
+    dependencies._redis_client = AsyncMock()
+    dependencies._embedding_provider = MockEmbeddingProvider(dimensions=8)
+    dependencies._alignment_engine = engine
+    yield
+    await dependencies.reset_dependencies()
+    reset_warmup_state()
+
+
+def _settings(**warmup: object) -> MagicMock:
+    settings = MagicMock()
+    settings.api = APIConfig(warmup=WarmupConfig(**warmup))
+    settings.pipeline.response_cache.enabled = False
+    return settings
+
+
+def _turn(tenant_id, agent_id) -> TurnRecord:
+    return TurnRecord(
+        turn_id=uuid4(),
+        tenant_id=tenant_id,
+        agent_id=agent_id,
+        session_id=uuid4(),
+        turn_number=1,
+        user_message="hi",
+        agent_response="hello",
+        latency_ms=10,
+        tokens_used=5,
+        timestamp=datetime.now(UTC),
+    )
+
+
+class TestRunWarmup:
+    """Tests for run_warmup."""
+
+    @pytest.mark.asyncio
+    async def test_preloads_most_active_agents(
+        self, wired, audit_store: InMemoryAuditStore, engine: MagicMock
+    ) -> None:
+        """Warm-up ranks agents by recent turns and marks the process ready."""
+        tenant_id = uuid4()
+        busy, quiet = uuid4(), uuid4()
+        for agent_id in (busy, busy, quiet):
+            await audit_store.save_turn(_turn(tenant_id, agent_id))
+
+        state = await run_warmup(_settings(top_agents=1))
+
+        assert state.ready is True
+        assert state.stages["stores"] == "ok"
+        assert state.stages["embeddings"] == "ok"
+        assert state.stages["agents"] == "ok (1 agents)"
+        engine.warm_up.assert_awaited_once_with([(tenant_id, busy)])
+
+    @pytest.mark.asyncio
+    async def test_stage_failure_still_becomes_ready(self, wired, engine: MagicMock) -> None:
+        """A failing stage is recorded but never blocks readiness."""
+        engine.warm_up = AsyncMock(side_effect=RuntimeError("boom"))
+
+        state = await run_warmup(_settings())
+
+        assert state.ready is True
+        assert state.stages["agents"] == "failed: boom"
+
+    @pytest.mark.asyncio
+    async def test_disabled_is_ready_immediately(self, wired, engine: MagicMock) -> None:
+        """Disabled warm-up marks ready without touching dependencies."""
+        await run_warmup(_settings(enabled=False))
+
+        assert get_warmup_state().ready is True
+        engine.warm_up.assert_not_called()
@@ -0,0 +1,205 @@
+"""Tests for AuditBatchWriter and the batched PostgresAuditStore (mocked pool)."""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from ruche.audit.models import AuditEvent, TurnRecord
+from ruche.audit.stores.batch_writer import AuditBatchWriter
+from ruche.audit.stores.postgres import PostgresAuditStore
+from ruche.config.models.storage import AuditWriterConfig
+
+
+def _turn() -> TurnRecord:
+    return TurnRecord(
+        turn_id=uuid4(),
+        tenant_id=uuid4(),
+        agent_id=uuid4(),
+        session_id=uuid4(),
+        turn_number=1,
+        user_message="Hello",
+        agent_response="Hi there!",
+        latency_ms=150,
+        tokens_used=50,
+        timestamp=datetime.now(UTC),
+    )
+
+
+def _event() -> AuditEvent:
+    return AuditEvent(tenant_id=uuid4(), event_type="rule_matched", event_data={"score": 0.9})
+
+
+@pytest.fixture
+def conn() -> MagicMock:
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    conn.executemany = AsyncMock()
+    conn.copy_records_to_table = AsyncMock()
+
+    @asynccontextmanager
+    async def transaction():
+        yield
+
+    conn.transaction = transaction
+    return conn
+
+
+@pytest.fixture
+def pool(conn) -> MagicMock:
+    pool = MagicMock()
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    pool.acquire = acquire
+    return pool
+
+
+class TestAuditBatchWriter:
+    """Tests for buffering, flushing and spilling."""
+
+    @pytest.mark.asyncio
+    async def test_flush_copies_both_tables_in_one_batch(self, pool, conn) -> None:
+        writer = AuditBatchWriter(pool)
+        writer.add_turn(_turn())
+        writer.add_turn(_turn())
+        writer.add_event(_event())
+
+        written = await writer.flush()
+        await writer.close()
+
+        assert written == 3
+        assert writer.pending == 0
+        tables = [call.args[0] for call in conn.copy_records_to_table.await_args_list]
+        assert tables == ["turn_records", "audit_events"]
+        assert len(conn.copy_records_to_table.await_args_list[0].kwargs["records"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_copy_failure_falls_back_to_inserts(self, pool, conn) -> None:
+        conn.copy_records_to_table.side_effect = RuntimeError("duplicate key")
+        writer = AuditBatchWriter(pool)
+        writer.add_turn(_turn())
+
+        assert await writer.flush() == 1
+        await writer.close()
+        sql = conn.executemany.await_args.args[0]
+        assert "ON CONFLICT (id, created_at) DO NOTHING" in sql
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_records(self, pool, conn) -> None:
+        conn.copy_records_to_table.side_effect = RuntimeError("down")
+        conn.executemany.side_effect = RuntimeError("down")
+        writer = AuditBatchWriter(pool)
+        turn = _turn()
+        writer.add_turn(turn)
+
+        assert await writer.flush() == 0
+        assert writer.get_pending_turn(turn.turn_id) is turn
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_overflow_spills_and_replays_after_flush(self, pool, tmp_path) -> None:
+        config = AuditWriterConfig(max_buffer_size=1, spill_dir=str(tmp_path))
+        writer = AuditBatchWriter(pool, config)
+        writer.add_turn(_turn())
+        spilled = _event()
+        writer.add_event(spilled)
+
+        assert writer.pending == 1
+        assert list(tmp_path.glob("audit-*.jsonl"))
+
+        await writer.flush()
+
+        assert writer.get_pending_event(spilled.id) == spilled
+        assert not list(tmp_path.glob("audit-*"))
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_close_spills_what_cannot_be_written(self, pool, conn, tmp_path) -> None:
+        conn.copy_records_to_table.side_effect = RuntimeError("down")
+        conn.executemany.side_effect = RuntimeError("down")
+        writer = AuditBatchWriter(pool, AuditWriterConfig(spill_dir=str(tmp_path)))
+        writer.add_turn(_turn())
+
+        await writer.close()
+
+        assert writer.pending == 0
+        (spill_file,) = tmp_path.glob("audit-*.jsonl")
+        assert len(spill_file.read_text().splitlines()) == 1
+
+    @pytest.mark.asyncio
+    async def test_corrupt_spill_line_is_set_aside(self, pool, tmp_path) -> None:
+        turn, event = _turn(), _event()
+        spill = tmp_path / "audit-1.jsonl"
+        spill.write_text(
+            json.dumps({"kind": "turn", "record": turn.model_dump(mode="json")})
+            + "\n{truncated\n"
+            + json.dumps({"kind": "event", "record": event.model_dump(mode="json")})
+            + "\n"
+        )
+        writer = AuditBatchWriter(pool, AuditWriterConfig(spill_dir=str(tmp_path)))
+        writer.add_turn(_turn())
+
+        await writer.flush()
+
+        assert writer.get_pending_turn(turn.turn_id) == turn
+        assert writer.get_pending_event(event.id) == event
+        assert not spill.exists()
+        assert (tmp_path / "audit-1.bad").read_text() == "{truncated\n"
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_unreadable_spill_file_is_moved_aside(self, pool, tmp_path) -> None:
+        (tmp_path / "audit-1.jsonl").write_bytes(b"\xff\xfe not utf-8")
+        writer = AuditBatchWriter(pool, AuditWriterConfig(spill_dir=str(tmp_path)))
+        writer.add_turn(_turn())
+
+        assert await writer.flush() == 1
+
+        assert [p.name for p in tmp_path.iterdir()] == ["audit-1.bad"]
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_loop_survives_errors(self, pool, conn) -> None:
+        writer = AuditBatchWriter(pool, AuditWriterConfig(flush_interval_ms=10))
+        real_flush = writer.flush
+        calls = 0
+
+        async def flaky_flush() -> int:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("boom")
+            return await real_flush()
+
+        writer.flush = flaky_flush
+        writer.add_turn(_turn())
+
+        await asyncio.sleep(0.05)
+
+        assert calls > 1
+        assert writer.pending == 0
+        assert not writer._task.done()
+        await writer.close()
+
+
+class TestBatchedPostgresAuditStore:
+    """Tests for PostgresAuditStore writing through a batch writer."""
+
+    @pytest.mark.asyncio
+    async def test_saved_turn_is_readable_before_flush(self, pool, conn) -> None:
+        store = PostgresAuditStore(pool, writer=AuditBatchWriter(pool))
+        turn = _turn()
+
+        assert await store.save_turn(turn) == turn.turn_id
+        assert await store.get_turn(turn.turn_id) is turn
+        conn.execute.assert_not_awaited()
+
+        await store.close()
+        conn.copy_records_to_table.assert_awaited_once()
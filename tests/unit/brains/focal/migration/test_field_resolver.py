@@ -496,3 +496,107 @@ class TestLineageTracking:
         # Should track extraction as source
         assert result.source == ResolutionSource.EXTRACTION
         assert result.extraction_quote is not None
+
+
+# =============================================================================
+# Tests: MissingFieldResolver.fill_multiple() batched extraction
+# =============================================================================
+
+
+class MockBatchLLMExecutor:
+    """Mock LLM executor answering batched extraction prompts."""
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.calls = 0
+
+    async def generate(self, messages, max_tokens=None):
+        """Return the configured per-field payload."""
+        import json
+        from types import SimpleNamespace
+
+        self.calls += 1
+        return SimpleNamespace(content=json.dumps(self.payload))
+
+
+class TestFillMultipleBatch:
+    """Tests for batched fill_multiple()."""
+
+    @pytest.fixture
+    def profile_store(self):
+        """Create a mock profile store."""
+        return MockProfileStore()
+
+    @pytest.fixture
+    def sample_session(self, tenant_id, agent_id):
+        """Create a sample session with message history."""
+        from types import SimpleNamespace
+
+        session = Session(
+            tenant_id=tenant_id,
+            agent_id=agent_id,
+            channel="api",
+            user_channel_id="test_user",
+            config_version=1,
+        )
+        object.__setattr__(session, "message_history", [
+            SimpleNamespace(role="user", content="I'm Ana, born 1990-04-02, ana@example.com"),
+        ])
+        return session
+
+    @pytest.mark.asyncio
+    async def test_extracts_all_missing_fields_in_one_call(
+        self,
+        profile_store,
+        sample_session,
+        tenant_id,
+    ):
+        """Profile/session hits skip the LLM; the rest share one call."""
+        interlocutor_id = uuid4()
+        sample_session.interlocutor_id = interlocutor_id
+        sample_session.variables = {"plan": "gold"}
+        profile_store.set_field(tenant_id, interlocutor_id, "first_name", "Ana")
+
+        llm = MockBatchLLMExecutor({
+            "email": {"found": True, "value": "ana@example.com", "confidence": 0.97},
+            "birth_date": {"found": True, "value": "1990-04-02", "confidence": 0.9},
+            "city": {"found": False, "value": None, "confidence": 0.0},
+        })
+        resolver = MissingFieldResolver(profile_store=profile_store, llm_executor=llm)
+
+        results = await resolver.fill_multiple(
+            field_names=["first_name", "plan", "email", "birth_date", "city"],
+            session=sample_session,
+        )
+
+        assert llm.calls == 1
+        assert list(results) == ["first_name", "plan", "email", "birth_date", "city"]
+        assert results["first_name"].source == ResolutionSource.PROFILE
+        assert results["plan"].source == ResolutionSource.SESSION
+        assert results["email"].source == ResolutionSource.EXTRACTION
+        assert results["email"].needs_confirmation is False
+        assert results["birth_date"].needs_confirmation is True
+        assert results["city"].filled is False
+
+    @pytest.mark.asyncio
+    async def test_no_llm_call_when_everything_resolved(self, sample_session):
+        """No extraction call is made when session covers every field."""
+        sample_session.variables = {"email": "a@b.c"}
+        llm = MockBatchLLMExecutor({})
+        resolver = MissingFieldResolver(llm_executor=llm)
+
+        results = await resolver.fill_multiple(["email"], session=sample_session)
+
+        assert llm.calls == 0
+        assert results["email"].filled is True
+
+    @pytest.mark.asyncio
+    async def test_invalid_batch_response_marks_fields_not_found(self, sample_session):
+        """Unparseable batch output leaves every field unfilled."""
+        llm = MockBatchLLMExecutor(["not", "an", "object"])
+        resolver = MissingFieldResolver(llm_executor=llm)
+
+        results = await resolver.fill_multiple(["email", "city"], session=sample_session)
+
+        assert all(not r.filled for r in results.values())
+        assert all(r.source == ResolutionSource.NOT_FOUND for r in results.values())
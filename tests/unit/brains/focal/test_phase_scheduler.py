@@ -0,0 +1,152 @@
+"""Tests for the dependency-declared FOCAL phase scheduler."""
+
+import asyncio
+
+import pytest
+
+from ruche.brains.focal.phase_scheduler import Phase, PhaseScheduler
+
+
+def _sleeper(value, delay=0.05, log=None, name=None):
+    async def run(results):
+        if log is not None:
+            log.append(("start", name))
+        await asyncio.sleep(delay)
+        if log is not None:
+            log.append(("end", name))
+        return value(results) if callable(value) else value
+
+    return run
+
+
+class TestPhaseScheduler:
+    """Tests for PhaseScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_independent_phases_overlap(self):
+        """Phases without a dependency between them run concurrently."""
+        phases = [
+            Phase("a", _sleeper(1)),
+            Phase("b", _sleeper(2), depends_on=("a",)),
+            Phase("c", _sleeper(3), depends_on=("a",)),
+            Phase("d", _sleeper(lambda r: r["b"] + r["c"]), depends_on=("b", "c")),
+        ]
+
+        report = await PhaseScheduler(phases).run()
+
+        assert report.results["d"] == 5
+        # b and c overlap: wall time is ~3 sleeps, not 4
+        assert report.wall_time_ms < report.sequential_time_ms
+        assert {r.name for r in report.runs} == {"a", "b", "c", "d"}
+
+    @pytest.mark.asyncio
+    async def test_sequential_mode_preserves_declaration_order(self):
+        """concurrent=False runs phases one after another."""
+        log = []
+        phases = [
+            Phase("a", _sleeper(1, 0.01, log, "a")),
+            Phase("b", _sleeper(2, 0.01, log, "b"), depends_on=("a",)),
+            Phase("c", _sleeper(3, 0.01, log, "c"), depends_on=("a",)),
+        ]
+
+        await PhaseScheduler(phases, concurrent=False).run()
+
+        assert log == [
+            ("start", "a"), ("end", "a"),
+            ("start", "b"), ("end", "b"),
+            ("start", "c"), ("end", "c"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_valid_speculation_is_kept(self):
+        """A speculative result is used when upstream did not invalidate it."""
+        calls = []
+
+        async def run(results):
+            calls.append("run")
+            return "recomputed"
+
+        phases = [
+            Phase("sensor", _sleeper("hello", 0.05)),
+            Phase(
+                "retrieval",
+                run,
+                depends_on=("sensor",),
+                speculate=_sleeper("speculative", 0.05),
+                is_valid=lambda results, _: results["sensor"] == "hello",
+            ),
+        ]
+
+        report = await PhaseScheduler(phases).run()
+
+        assert report.results["retrieval"] == "speculative"
+        assert calls == []
+        assert report.discarded == []
+        # Speculation overlapped the sensor
+        assert report.wall_time_ms < 90
+
+    @pytest.mark.asyncio
+    async def test_invalidated_speculation_is_discarded(self):
+        """Upstream output that changes the inputs forces a re-run."""
+        phases = [
+            Phase("sensor", _sleeper("rewritten query", 0.01)),
+            Phase(
+                "retrieval",
+                _sleeper(lambda r: f"results for {r['sensor']}", 0.01),
+                depends_on=("sensor",),
+                speculate=_sleeper("results for raw message", 0.01),
+                is_valid=lambda results, _: results["sensor"] == "raw message",
+            ),
+        ]
+
+        report = await PhaseScheduler(phases).run()
+
+        assert report.results["retrieval"] == "results for rewritten query"
+        assert [r.name for r in report.discarded] == ["retrieval"]
+
+    @pytest.mark.asyncio
+    async def test_failed_speculation_falls_back_to_run(self):
+        """Errors in the speculative variant are not fatal."""
+
+        async def boom(results):
+            raise RuntimeError("embedding provider down")
+
+        phases = [
+            Phase("sensor", _sleeper("x", 0.01)),
+            Phase("retrieval", _sleeper("ok", 0.01), depends_on=("sensor",), speculate=boom),
+        ]
+
+        report = await PhaseScheduler(phases).run()
+
+        assert report.results["retrieval"] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_phase_error_propagates_and_cancels_others(self):
+        """A failing phase aborts the run like the sequential pipeline."""
+        cancelled = asyncio.Event()
+
+        async def slow(results):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def fail(results):
+            raise ValueError("bad phase")
+
+        phases = [Phase("slow", slow), Phase("fail", fail)]
+
+        with pytest.raises(ValueError, match="bad phase"):
+            await PhaseScheduler(phases).run()
+        assert cancelled.is_set()
+
+    def test_rejects_unknown_dependency(self):
+        """Dependencies must refer to earlier phases."""
+        with pytest.raises(ValueError, match="unknown or declared later"):
+            PhaseScheduler([Phase("a", _sleeper(1), depends_on=("b",))])
+
+    def test_rejects_duplicate_names(self):
+        """Phase names must be unique."""
+        with pytest.raises(ValueError, match="Duplicate"):
+            PhaseScheduler([Phase("a", _sleeper(1)), Phase("a", _sleeper(2))])
@@ -0,0 +1,294 @@
+"""Tests for delta-encoded session persistence."""
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import asyncpg
+import pytest
+import redis.asyncio as redis
+
+from ruche.config.models.storage import SessionPersistenceConfig
+from ruche.conversation.models import Channel, Session, SessionStatus, StepVisit
+from ruche.conversation.stores.delta import (
+    SessionDelta,
+    apply_delta,
+    cap_step_history,
+    compute_delta,
+    mark_persisted,
+    pending_deltas,
+)
+from ruche.conversation.stores.postgres import (
+    STEP_ARCHIVE_DELETE_SQL,
+    PostgresSessionStore,
+    delta_update_query,
+)
+from ruche.conversation.stores.redis import RedisSessionStore
+
+
+def _visit(turn: int, *, checkpoint: bool = False) -> StepVisit:
+    return StepVisit(
+        step_id=uuid4(),
+        entered_at=datetime.now(UTC),
+        turn_number=turn,
+        is_checkpoint=checkpoint,
+    )
+
+
+@pytest.fixture
+def session() -> Session:
+    return Session(
+        tenant_id=uuid4(),
+        agent_id=uuid4(),
+        channel=Channel.WEBCHAT,
+        user_channel_id="user123",
+        config_version=1,
+        step_history=[_visit(1)],
+        variables={"name": "Ada", "plan": "basic"},
+        rule_fires={"r1": 1},
+    )
+
+
+def _round_trip(session: Session) -> Session:
+    """Reload a session the way a store reads its snapshot."""
+    loaded = Session.model_validate_json(session.model_dump_json())
+    mark_persisted(loaded)
+    return loaded
+
+
+class TestComputeDelta:
+    """Tests for compute_delta."""
+
+    def test_unpersisted_session_needs_snapshot(self, session) -> None:
+        assert compute_delta(session) is None
+
+    def test_delta_holds_only_changes(self, session) -> None:
+        mark_persisted(session)
+        new_visit = _visit(2)
+        session.step_history.append(new_visit)
+        session.variables["plan"] = "pro"
+        del session.variables["name"]
+        session.rule_fires["r1"] += 1
+        session.turn_count = 2
+
+        delta = compute_delta(session)
+
+        assert delta is not None
+        assert delta.step_visits == [new_visit]
+        assert delta.maps["variables"].set == {"plan": "pro"}
+        assert delta.maps["variables"].unset == ["name"]
+        assert delta.maps["rule_fires"].set == {"r1": 2}
+        assert "rule_last_fire_turn" not in delta.maps
+        assert delta.fields == {"turn_count": 2}
+
+    def test_in_place_variable_mutation_is_detected(self, session) -> None:
+        session.variables["cart"] = {"items": []}
+        mark_persisted(session)
+        session.variables["cart"]["items"].append("sku-1")
+
+        delta = compute_delta(session)
+
+        assert delta.maps["variables"].set == {"cart": {"items": ["sku-1"]}}
+
+    def test_rewritten_history_needs_snapshot(self, session) -> None:
+        mark_persisted(session)
+        session.step_history = [_visit(5)]
+
+        assert compute_delta(session) is None
+
+
+class TestApplyDelta:
+    """Tests for rebuilding a session from snapshot and deltas."""
+
+    def test_snapshot_plus_deltas_matches_session(self, session) -> None:
+        snapshot = session.model_dump_json()
+        mark_persisted(session)
+        deltas = []
+        for turn in range(2, 5):
+            session.step_history.append(_visit(turn))
+            session.variables[f"v{turn}"] = turn
+            session.variable_updated_at[f"v{turn}"] = datetime.now(UTC)
+            session.status = SessionStatus.IDLE if turn == 4 else SessionStatus.ACTIVE
+            deltas.append(compute_delta(session).model_dump_json())
+            mark_persisted(session, deltas=pending_deltas(session) + 1)
+
+        rebuilt = Session.model_validate_json(snapshot)
+        for raw in deltas:
+            apply_delta(rebuilt, SessionDelta.model_validate_json(raw))
+
+        assert rebuilt.model_dump() == session.model_dump()
+        assert pending_deltas(session) == 3
+
+    def test_delta_of_reloaded_session(self, session) -> None:
+        loaded = _round_trip(session)
+        loaded.variables["plan"] = "pro"
+
+        delta = compute_delta(loaded)
+
+        assert delta.step_visits == []
+        assert delta.maps["variables"].set == {"plan": "pro"}
+
+
+class TestCapStepHistory:
+    """Tests for cap_step_history."""
+
+    def test_archives_oldest_visits(self, session) -> None:
+        session.step_history = [_visit(turn) for turn in range(10)]
+
+        archived = cap_step_history(session, 4)
+
+        assert [v.turn_number for v in archived] == list(range(6))
+        assert [v.turn_number for v in session.step_history] == [6, 7, 8, 9]
+
+    def test_keeps_latest_checkpoint(self, session) -> None:
+        session.step_history = [_visit(turn, checkpoint=turn == 2) for turn in range(10)]
+
+        archived = cap_step_history(session, 4)
+
+        assert [v.turn_number for v in session.step_history] == [2, 6, 7, 8, 9]
+        assert 2 not in [v.turn_number for v in archived]
+
+
+@pytest.fixture
+def conn() -> MagicMock:
+    conn = MagicMock()
+    conn.execute = AsyncMock(return_value="UPDATE 1")
+
+    @asynccontextmanager
+    async def transaction():
+        yield
+
+    conn.transaction = transaction
+    return conn
+
+
+@pytest.fixture
+def pool(conn) -> MagicMock:
+    pool = MagicMock()
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    pool.acquire = acquire
+    return pool
+
+
+class TestPostgresSessionDeltas:
+    """Tests for PostgresSessionStore delta saves (mocked connection)."""
+
+    def test_update_query_appends_and_merges(self, session) -> None:
+        mark_persisted(session)
+        session.step_history.append(_visit(2))
+        session.variables["plan"] = "pro"
+        session.status = SessionStatus.CLOSED
+
+        sql, args = delta_update_query(session, compute_delta(session))
+
+        assert "step_history = COALESCE(step_history, '[]'::jsonb) || $2::jsonb" in sql
+        assert "variables = (COALESCE(variables, '{}'::jsonb) - $3::text[]) || $4::jsonb" in sql
+        assert "status = $" in sql
+        assert "closed" in args
+        assert sql.endswith("WHERE session_id = $1")
+
+    @pytest.mark.asyncio
+    async def test_save_writes_delta_then_compacts(self, pool, conn, session) -> None:
+        store = PostgresSessionStore(
+            pool, SessionPersistenceConfig(compaction_interval=2, max_step_history=1)
+        )
+        mark_persisted(session)
+
+        for turn in range(2, 5):
+            session.step_history.append(_visit(turn))
+            await store.save(session)
+
+        statements = [call.args[0] for call in conn.execute.await_args_list]
+        assert statements[0].startswith("UPDATE sessions")
+        assert statements[1].startswith("UPDATE sessions")
+        assert "INSERT INTO sessions" in statements[2]
+        assert "INSERT INTO session_step_archive" in statements[3]
+        assert len(session.step_history) == 1
+        assert pending_deltas(session) == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_step_archive(self, pool, conn, session) -> None:
+        conn.execute.return_value = "DELETE 1"
+        store = PostgresSessionStore(pool)
+
+        assert await store.delete(session.session_id) is True
+
+        statements = [call.args[0] for call in conn.execute.await_args_list]
+        assert "DELETE FROM sessions" in statements[0]
+        assert statements[1] == STEP_ARCHIVE_DELETE_SQL
+        assert conn.execute.await_args_list[1].args[1] == session.session_id
+
+
+class TestRedisSessionDeltas:
+    """Tests for RedisSessionStore delta ordering (mocked clients)."""
+
+    @pytest.fixture
+    def client(self) -> MagicMock:
+        client = MagicMock()
+        client.pipeline.return_value.execute = AsyncMock(return_value=[True, 1, True])
+        client.delete = AsyncMock()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_failed_postgres_write_leaves_redis_untouched(
+        self, client, pool, conn, session
+    ) -> None:
+        conn.execute.side_effect = asyncpg.PostgresError("down")
+        store = RedisSessionStore(client, pg_pool=pool)
+        mark_persisted(session)
+        session.step_history.append(_visit(2))
+
+        with pytest.raises(asyncpg.PostgresError):
+            await store._save_delta(session, compute_delta(session))
+
+        client.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_redis_write_drops_cached_copy(self, client, pool, session) -> None:
+        client.pipeline.return_value.execute.side_effect = redis.RedisError("down")
+        store = RedisSessionStore(client, pg_pool=pool)
+        mark_persisted(session)
+        session.step_history.append(_visit(2))
+
+        with pytest.raises(redis.RedisError):
+            await store._save_delta(session, compute_delta(session))
+
+        client.delete.assert_awaited_once_with(
+            store._hot_key(session.session_id), store._delta_key(session.session_id)
+        )
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_step_archive(self, client, pool, conn, session) -> None:
+        store = RedisSessionStore(client, pg_pool=pool)
+
+        await store._delete_from_postgres(session.session_id)
+
+        assert conn.execute.await_args_list[1].args == (STEP_ARCHIVE_DELETE_SQL, session.session_id)
+
+    @pytest.mark.asyncio
+    async def test_step_hash_scan_handles_bytes_keys(self, session) -> None:
+        """The scan fallback works with a client that does not decode responses."""
+        session.active_scenario_id = uuid4()
+        session.active_scenario_version = 1
+        session.step_history[-1].step_content_hash = "abc"
+        store = RedisSessionStore(MagicMock())
+        hot_key = store._hot_key(session.session_id).encode()
+
+        async def scan_iter(match):
+            yield hot_key
+
+        store._client.scan_iter = scan_iter
+        store._client.pipeline.return_value.execute = AsyncMock(
+            return_value=[session.model_dump_json().encode(), []]
+        )
+
+        found = await store.find_sessions_by_step_hash(
+            session.tenant_id, session.active_scenario_id, 1, "abc"
+        )
+
+        assert [s.session_id for s in found] == [session.session_id]
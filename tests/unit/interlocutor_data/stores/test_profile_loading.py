@@ -0,0 +1,200 @@
+"""Tests for single-query profile loading and the turn-scoped profile memo."""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from ruche.conversation.models import Channel
+from ruche.infrastructure.stores.interlocutor.postgres import PostgresInterlocutorDataStore
+from ruche.infrastructure.stores.interlocutor.turn_memo import (
+    clear_profile_memo,
+    forget_profile,
+    get_profile,
+    remember_profile,
+    start_profile_memo,
+)
+from ruche.interlocutor_data.models import InterlocutorDataStore
+
+
+def _profile_row(tenant_id, profile_id) -> dict:
+    now = datetime.now(UTC)
+    return {
+        "id": profile_id,
+        "tenant_id": tenant_id,
+        "external_id": None,
+        "created_at": now,
+        "updated_at": now,
+        "identities": json.dumps(
+            [
+                {"channel": "webchat", "channel_user_id": "u1", "verified": True},
+                {"channel": "email", "channel_user_id": "a@b.c", "verified": None},
+            ]
+        ),
+        "fields": json.dumps(
+            [
+                {
+                    "id": str(uuid4()),
+                    "field_name": "email",
+                    "field_value": "new@example.com",
+                    "source": "USER_PROVIDED",
+                    "valid_from": "2026-10-02T10:00:00+00:00",
+                    "status": "active",
+                    "source_metadata": {"turn": 3},
+                },
+                {
+                    "id": str(uuid4()),
+                    "field_name": "email",
+                    "field_value": "old@example.com",
+                    "source": "USER_PROVIDED",
+                    "valid_from": "2026-10-01T10:00:00+00:00",
+                    "status": "active",
+                },
+            ]
+        ),
+        "assets": json.dumps(
+            [
+                {
+                    "id": str(uuid4()),
+                    "asset_type": "document",
+                    "asset_reference": "s3://bucket/id.pdf",
+                    "metadata": {"name": "id.pdf", "mime_type": "application/pdf"},
+                    "created_at": "2026-10-01T10:00:00+00:00",
+                    "status": "active",
+                }
+            ]
+        ),
+    }
+
+
+@pytest.fixture
+def conn() -> MagicMock:
+    conn = MagicMock()
+    conn.fetchrow = AsyncMock()
+    conn.fetch = AsyncMock()
+    return conn
+
+
+@pytest.fixture
+def pool(conn) -> MagicMock:
+    pool = MagicMock()
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    pool.acquire = acquire
+    return pool
+
+
+class TestPostgresProfileLoading:
+    """Tests for loading a full profile in one query (mocked connection)."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_interlocutor_id_is_one_round_trip(self, pool, conn) -> None:
+        tenant_id, profile_id = uuid4(), uuid4()
+        conn.fetchrow.return_value = _profile_row(tenant_id, profile_id)
+        store = PostgresInterlocutorDataStore(pool)
+
+        profile = await store.get_by_interlocutor_id(tenant_id, profile_id)
+
+        conn.fetchrow.assert_awaited_once()
+        conn.fetch.assert_not_awaited()
+        assert "json_agg" in conn.fetchrow.await_args.args[0]
+        assert profile.interlocutor_id == profile_id
+        assert [i.channel for i in profile.channel_identities] == [
+            Channel.WEBCHAT,
+            Channel.EMAIL,
+        ]
+        assert profile.channel_identities[0].primary
+        assert not profile.channel_identities[1].verified
+        assert profile.fields["email"].value == "new@example.com"
+        assert profile.fields["email"].source_metadata == {"turn": 3}
+        assert profile.assets[0].name == "id.pdf"
+
+    @pytest.mark.asyncio
+    async def test_get_by_channel_identity_is_one_round_trip(self, pool, conn) -> None:
+        tenant_id, profile_id = uuid4(), uuid4()
+        conn.fetchrow.return_value = _profile_row(tenant_id, profile_id)
+        store = PostgresInterlocutorDataStore(pool)
+
+        profile = await store.get_by_channel_identity(tenant_id, Channel.WEBCHAT, "u1")
+
+        conn.fetchrow.assert_awaited_once()
+        conn.fetch.assert_not_awaited()
+        assert conn.fetchrow.await_args.args[1:] == (tenant_id, "webchat", "u1")
+        assert profile.id == profile_id
+
+    @pytest.mark.asyncio
+    async def test_missing_profile_returns_none(self, pool, conn) -> None:
+        conn.fetchrow.return_value = None
+        store = PostgresInterlocutorDataStore(pool)
+
+        assert await store.get_by_interlocutor_id(uuid4(), uuid4()) is None
+
+
+class TestTurnProfileMemo:
+    """Tests for the turn-scoped profile memo."""
+
+    @pytest.fixture
+    def profile(self) -> InterlocutorDataStore:
+        profile_id = uuid4()
+        return InterlocutorDataStore(id=profile_id, tenant_id=uuid4(), interlocutor_id=profile_id)
+
+    @pytest.fixture
+    def store(self, profile) -> MagicMock:
+        store = MagicMock()
+        store.get_by_interlocutor_id = AsyncMock(return_value=profile)
+        return store
+
+    @pytest.mark.asyncio
+    async def test_without_memo_reads_store_each_time(self, store, profile) -> None:
+        await get_profile(store, profile.tenant_id, profile.interlocutor_id)
+        await get_profile(store, profile.tenant_id, profile.interlocutor_id)
+
+        assert store.get_by_interlocutor_id.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_loads_once_per_turn(self, store, profile) -> None:
+        token = start_profile_memo()
+        try:
+            results = await asyncio.gather(
+                *(get_profile(store, profile.tenant_id, profile.interlocutor_id) for _ in range(3))
+            )
+            results.append(await get_profile(store, profile.tenant_id, profile.interlocutor_id))
+        finally:
+            clear_profile_memo(token)
+
+        assert all(result is profile for result in results)
+        store.get_by_interlocutor_id.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_remembered_profile_skips_load(self, store, profile) -> None:
+        token = start_profile_memo()
+        try:
+            remember_profile(profile)
+            result = await get_profile(store, profile.tenant_id, profile.interlocutor_id)
+        finally:
+            clear_profile_memo(token)
+
+        assert result is profile
+        store.get_by_interlocutor_id.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_forget_and_failure_allow_reload(self, store, profile) -> None:
+        store.get_by_interlocutor_id.side_effect = [RuntimeError("down"), profile, profile]
+        token = start_profile_memo()
+        try:
+            with pytest.raises(RuntimeError):
+                await get_profile(store, profile.tenant_id, profile.interlocutor_id)
+            await get_profile(store, profile.tenant_id, profile.interlocutor_id)
+            forget_profile(profile.tenant_id, profile.interlocutor_id)
+            await get_profile(store, profile.tenant_id, profile.interlocutor_id)
+        finally:
+            clear_profile_memo(token)
+
+        assert store.get_by_interlocutor_id.await_count == 3
@@ -231,6 +231,31 @@ class TestFieldDefinitionSuggestions:
         assert suggestions[0].collection_prompt is not None
         assert "email" in suggestions[0].collection_prompt.lower()
 
+    @pytest.mark.asyncio
+    async def test_suggest_multiple_fields_uses_single_llm_call(
+        self, extractor_with_llm, mock_llm, tenant_id, agent_id
+    ):
+        """Test multiple fields are suggested with one batched LLM call."""
+        mock_llm.generate.return_value = '''
+        {
+            "email": {"collection_prompt": "What is your email?"},
+            "phone_number": {"collection_prompt": "What is your phone number?"}
+        }
+        '''
+
+        suggestions = await extractor_with_llm.suggest_field_definitions(
+            field_names=["email", "phone_number", "loyalty_tier"],
+            tenant_id=tenant_id,
+            agent_id=agent_id,
+        )
+
+        assert mock_llm.generate.await_count == 1
+        assert [s.name for s in suggestions] == ["email", "phone_number", "loyalty_tier"]
+        assert suggestions[0].collection_prompt == "What is your email?"
+        assert suggestions[0].confidence == 0.9
+        # Field missing from the response falls back to a basic suggestion
+        assert suggestions[2].confidence == 0.5
+
 
 class TestNeedsHumanReviewFlag:
     """Tests for needs_human_review flag (T143)."""
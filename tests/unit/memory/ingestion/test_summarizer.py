@@ -196,6 +196,81 @@ class TestConversationSummarizerThreshold:
         assert summary.content_type == "summary"
 
 
+    @pytest.mark.asyncio
+    async def test_check_and_summarize_summarizes_oldest_pending_window(
+        self, memory_store, llm_provider, group_id
+    ):
+        """Should summarize the claimed window only, in chronological order."""
+        from datetime import timedelta
+
+        from ruche.config.models.pipeline import SummarizationConfig
+
+        config = SummarizationConfig()
+        config.window.turns_per_summary = 3
+        summarizer = ConversationSummarizer(
+            llm_executor=llm_provider,
+            memory_store=memory_store,
+            config=config,
+        )
+
+        start = datetime.now(UTC)
+        episodes = [
+            Episode(
+                group_id=group_id,
+                content=f"Message {i}",
+                source="user",
+                occurred_at=start + timedelta(seconds=i),
+            )
+            for i in range(4)
+        ]
+        for episode in episodes:
+            await memory_store.add_episode(episode)
+
+        summary = await summarizer.check_and_summarize_if_needed(group_id)
+
+        assert summary.source_metadata["episode_ids"] == [str(e.id) for e in episodes[:3]]
+        counters = await memory_store.get_summary_counters(group_id)
+        assert counters.unsummarized_turns == 1
+        assert counters.summaries_since_meta == 1
+        # Nothing left to claim until the next window fills
+        assert await summarizer.check_and_summarize_if_needed(group_id) is None
+
+    @pytest.mark.asyncio
+    async def test_check_and_summarize_releases_claim_on_failure(
+        self, memory_store, group_id
+    ):
+        """Should give the window back when summary generation fails."""
+        from unittest.mock import AsyncMock
+
+        from ruche.config.models.pipeline import SummarizationConfig
+        from ruche.memory.ingestion.errors import SummarizationError
+
+        config = SummarizationConfig()
+        config.window.turns_per_summary = 2
+        llm = AsyncMock()
+        llm.generate.side_effect = RuntimeError("llm down")
+        summarizer = ConversationSummarizer(
+            llm_executor=llm,
+            memory_store=memory_store,
+            config=config,
+        )
+        for i in range(2):
+            await memory_store.add_episode(
+                Episode(
+                    group_id=group_id,
+                    content=f"Message {i}",
+                    source="user",
+                    occurred_at=datetime.now(UTC),
+                )
+            )
+
+        with pytest.raises(SummarizationError):
+            await summarizer.check_and_summarize_if_needed(group_id)
+
+        counters = await memory_store.get_summary_counters(group_id)
+        assert counters.unsummarized_turns == 2
+
+
 class TestConversationSummarizerCompression:
     """Tests for compression ratio validation."""
 
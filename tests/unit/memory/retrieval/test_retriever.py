@@ -6,6 +6,7 @@ from uuid import uuid4
 import pytest
 
 from ruche.brains.focal.phases.context.situation_snapshot import SituationSnapshot
+from ruche.config.models.pipeline import HybridRetrievalConfig
 from ruche.config.models.selection import SelectionConfig
 from ruche.memory.models.episode import Episode
 from ruche.memory.retrieval.retriever import MemoryRetriever
@@ -81,3 +82,58 @@ async def test_memory_retriever_returns_top_results() -> None:
 
     assert len(results) == 1
     assert results[0].content == "Return policy details"
+
+
+@pytest.mark.asyncio
+async def test_memory_retriever_hybrid_uses_lexical_scores() -> None:
+    tenant_id = uuid4()
+    agent_id = uuid4()
+    group_id = f"{tenant_id}:{agent_id}"
+
+    store = InMemoryMemoryStore()
+    lexical_match = Episode(
+        group_id=group_id,
+        content="refund requested for order",
+        source="user",
+        occurred_at=datetime.utcnow(),
+        embedding=[0.9, 0.1, 0.0],
+    )
+    vector_match = Episode(
+        group_id=group_id,
+        content="shipping delayed again",
+        source="user",
+        occurred_at=datetime.utcnow(),
+        embedding=[1.0, 0.0, 0.0],
+    )
+    filler = Episode(
+        group_id=group_id,
+        content="greeting and small talk",
+        source="user",
+        occurred_at=datetime.utcnow(),
+        embedding=[0.0, 1.0, 0.0],
+    )
+    for episode in (lexical_match, vector_match, filler):
+        await store.add_episode(episode)
+
+    retriever = MemoryRetriever(
+        memory_store=store,
+        embedding_provider=StaticEmbeddingProvider([1.0, 0.0, 0.0]),
+        selection_config=SelectionConfig(strategy="fixed_k", params={"k": 1}),
+        hybrid_config=HybridRetrievalConfig(enabled=True, vector_weight=0.3, bm25_weight=0.7),
+    )
+
+    snapshot = SituationSnapshot(
+        message="refund",
+        embedding=[1.0, 0.0, 0.0],
+        intent_changed=False,
+        topic_changed=False,
+        tone="neutral",
+    )
+
+    results = await retriever.retrieve(
+        tenant_id=tenant_id,
+        agent_id=agent_id,
+        snapshot=snapshot,
+    )
+
+    assert [r.content for r in results] == ["refund requested for order"]
@@ -0,0 +1,162 @@
+"""Tests for index-friendly pgvector queries."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ruche.config.models.storage import AnnSearchConfig
+from ruche.infrastructure.db.ann import (
+    ann_search,
+    build_ann_query,
+    hnsw_index_sql,
+    tenant_index_sql,
+)
+
+
+def _conn(*pages: list[dict]) -> MagicMock:
+    """Connection whose fetch() returns each page in turn."""
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    conn.fetch = AsyncMock(side_effect=list(pages))
+
+    @asynccontextmanager
+    async def transaction():
+        yield
+
+    conn.transaction = transaction
+    return conn
+
+
+def _rows(*distances: float) -> list[dict]:
+    return [{"id": i, "distance": d} for i, d in enumerate(distances)]
+
+
+class TestBuildAnnQuery:
+    """Tests for build_ann_query."""
+
+    def test_orders_by_raw_distance_with_limit(self) -> None:
+        """The query sorts by the operator and keeps the threshold out of SQL."""
+        sql = build_ann_query(
+            table="rules",
+            columns="id",
+            embedding_column="condition_embedding",
+            filters=["tenant_id = $2", "agent_id = $3"],
+        )
+
+        assert "ORDER BY condition_embedding <=> $1::vector LIMIT $4" in sql
+        assert "condition_embedding IS NOT NULL" in sql
+        assert ">=" not in sql
+
+    def test_repeated_placeholder_counts_once(self) -> None:
+        """A filter parameter used twice does not shift the limit parameter."""
+        sql = build_ann_query(
+            table="episodes",
+            columns="id",
+            embedding_column="embedding",
+            filters=["group_id = $2", "tenant_key = split_part($2, ':', 1)"],
+        )
+
+        assert sql.endswith("LIMIT $3")
+
+
+class TestAnnSearch:
+    """Tests for ann_search."""
+
+    @pytest.mark.asyncio
+    async def test_applies_threshold_after_fetch(self) -> None:
+        """Rows below min_score are dropped and scores are 1 - distance."""
+        conn = _conn(_rows(0.1, 0.2, 0.6, 0.7))
+
+        results = await ann_search(
+            conn,
+            "q",
+            [0.1],
+            "g",
+            limit=2,
+            min_score=0.5,
+            config=AnnSearchConfig(),
+            table="episodes",
+        )
+
+        assert [round(score, 2) for _, score in results] == [0.9, 0.8]
+        conn.execute.assert_any_await("SET LOCAL ivfflat.probes = 10")
+        conn.execute.assert_any_await("SET LOCAL plan_cache_mode = force_custom_plan")
+
+    @pytest.mark.asyncio
+    async def test_expands_when_filter_starves_scan(self) -> None:
+        """Too few rows, all above threshold, triggers a wider second round."""
+        conn = _conn(_rows(0.1), _rows(0.1, 0.2, 0.3))
+        config = AnnSearchConfig(hnsw_ef_search=40, expansion_factor=4)
+
+        results = await ann_search(
+            conn,
+            "q",
+            [0.1],
+            "g",
+            limit=3,
+            min_score=0.0,
+            config=config,
+            table="episodes",
+        )
+
+        assert len(results) == 3
+        assert conn.fetch.await_count == 2
+        # Candidate limit grows from 3 * 2 to 24
+        assert conn.fetch.await_args_list[1].args[-1] == 24
+        conn.execute.assert_any_await("SET LOCAL hnsw.ef_search = 160")
+
+    @pytest.mark.asyncio
+    async def test_stops_when_threshold_reached(self) -> None:
+        """A row below the threshold means a wider search cannot help."""
+        conn = _conn(_rows(0.1, 0.9))
+
+        results = await ann_search(
+            conn,
+            "q",
+            [0.1],
+            "g",
+            limit=5,
+            min_score=0.5,
+            config=AnnSearchConfig(),
+            table="episodes",
+        )
+
+        assert len(results) == 1
+        assert conn.fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_respects_max_rounds(self) -> None:
+        """Expansion stops after max_rounds."""
+        conn = _conn(_rows(0.1), _rows(0.1))
+
+        results = await ann_search(
+            conn,
+            "q",
+            [0.1],
+            "g",
+            limit=5,
+            min_score=0.0,
+            config=AnnSearchConfig(max_rounds=2),
+            table="episodes",
+        )
+
+        assert len(results) == 1
+        assert conn.fetch.await_count == 2
+
+
+class TestIndexSql:
+    """Tests for index DDL helpers."""
+
+    def test_hnsw_partial_index(self) -> None:
+        sql = hnsw_index_sql("idx", "episodes", "embedding", where="embedding IS NOT NULL")
+
+        assert "USING hnsw (embedding vector_cosine_ops)" in sql
+        assert sql.endswith("WHERE embedding IS NOT NULL")
+
+    def test_tenant_index_quotes_tenant(self) -> None:
+        sql = tenant_index_sql("episodes", "embedding", "tenant_key", "acme'co")
+
+        assert "CONCURRENTLY" in sql
+        assert "tenant_key = 'acme''co'" in sql
+        assert "idx_episodes_embedding_t_acmeco" in sql
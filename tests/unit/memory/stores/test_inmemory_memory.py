@@ -99,6 +99,41 @@ class TestEpisodeOperations:
         assert retrieved is None
 
 
+class TestSummaryCounters:
+    """Tests for summary counters."""
+
+    @pytest.mark.asyncio
+    async def test_add_episode_updates_counters(self, store, group_id):
+        """Should count turns and window summaries, not meta-summaries."""
+        for content_type in ("message", "event", "summary", "meta_summary"):
+            await store.add_episode(
+                Episode(
+                    group_id=group_id,
+                    content="x",
+                    content_type=content_type,
+                    source="system",
+                    occurred_at=datetime.now(UTC),
+                )
+            )
+
+        counters = await store.get_summary_counters(group_id)
+        assert counters.total_turns == 2
+        assert counters.unsummarized_turns == 2
+        assert counters.summaries_since_meta == 1
+
+    @pytest.mark.asyncio
+    async def test_consume_requires_enough_pending(self, store, group_id):
+        """Should claim only when enough turns are pending."""
+        await store.add_episode(
+            Episode(group_id=group_id, content="x", source="user", occurred_at=datetime.now(UTC))
+        )
+
+        assert await store.consume_summary_counters(group_id, turns=2) is None
+        claimed = await store.consume_summary_counters(group_id, turns=1)
+        assert claimed.unsummarized_turns == 0
+        assert claimed.total_turns == 1
+
+
 class TestVectorSearch:
     """Tests for vector search functionality."""
 
@@ -375,3 +410,20 @@ class TestBulkOperations:
         entities = await store.get_entities(group_id)
         assert len(episodes) == 0
         assert len(entities) == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_by_group_resets_summary_counters(self, store, group_id):
+        """A recreated group should not inherit the old group's counters."""
+        for _ in range(3):
+            await store.add_episode(
+                Episode(group_id=group_id, content="x", source="user", occurred_at=datetime.now(UTC))
+            )
+
+        await store.delete_by_group(group_id)
+        await store.add_episode(
+            Episode(group_id=group_id, content="x", source="user", occurred_at=datetime.now(UTC))
+        )
+
+        counters = await store.get_summary_counters(group_id)
+        assert counters.total_turns == 1
+        assert counters.unsummarized_turns == 1
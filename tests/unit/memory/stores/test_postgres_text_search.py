@@ -0,0 +1,124 @@
+"""Tests for PostgresMemoryStore full-text search (mocked connection)."""
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from ruche.config.models.storage import TextSearchConfig
+from ruche.infrastructure.db.text_search import regconfig_for_language
+from ruche.memory.stores.postgres import PostgresMemoryStore
+
+
+def _row(content: str) -> dict:
+    return {
+        "id": uuid4(),
+        "group_id": "t:s",
+        "content": content,
+        "content_type": "message",
+        "source": "user",
+        "source_metadata": None,
+        "occurred_at": datetime.now(UTC),
+        "recorded_at": datetime.now(UTC),
+        "embedding": None,
+        "embedding_model": None,
+        "entity_ids": [],
+    }
+
+
+@pytest.fixture
+def conn() -> MagicMock:
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    conn.fetch = AsyncMock()
+
+    @asynccontextmanager
+    async def transaction():
+        yield
+
+    conn.transaction = transaction
+    return conn
+
+
+@pytest.fixture
+def pool(conn) -> MagicMock:
+    pool = MagicMock()
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    pool.acquire = acquire
+    return pool
+
+
+class TestRegconfigForLanguage:
+    """Tests for regconfig_for_language."""
+
+    def test_maps_language_codes(self) -> None:
+        assert regconfig_for_language("fr") == "french"
+        assert regconfig_for_language("en-US") == "english"
+
+    def test_unsupported_language_uses_simple(self) -> None:
+        assert regconfig_for_language("ja") == "simple"
+
+    def test_missing_language_uses_default(self) -> None:
+        assert regconfig_for_language(None, "es") == "spanish"
+
+
+class TestTextSearchEpisodes:
+    """Tests for PostgresMemoryStore.text_search_episodes."""
+
+    @pytest.mark.asyncio
+    async def test_uses_query_language_config(self, pool, conn) -> None:
+        conn.fetch.return_value = [_row("remboursement")]
+        store = PostgresMemoryStore(pool)
+
+        results = await store.text_search_episodes("remboursement", "t:s", language="fr")
+
+        assert [e.content for e in results] == ["remboursement"]
+        sql, group_id, regconfig, query, limit = conn.fetch.await_args.args
+        assert "content_tsv @@ query" in sql
+        assert (group_id, regconfig, query, limit) == ("t:s", "french", "remboursement", 10)
+
+    @pytest.mark.asyncio
+    async def test_fuzzy_fallback_fills_results(self, pool, conn) -> None:
+        exact = _row("refund policy")
+        conn.fetch.side_effect = [[exact], [_row("refunded order")]]
+        store = PostgresMemoryStore(pool, text_search_config=TextSearchConfig(fuzzy_fallback=True))
+
+        results = await store.text_search_episodes("refnd", "t:s", limit=5)
+
+        assert [e.content for e in results] == ["refund policy", "refunded order"]
+        fuzzy_args = conn.fetch.await_args_list[1].args
+        assert "<% content" in fuzzy_args[0]
+        assert fuzzy_args[3:] == ([exact["id"]], 4)
+        conn.execute.assert_awaited_once_with("SET LOCAL pg_trgm.word_similarity_threshold = 0.4")
+
+
+class TestHybridSearchEpisodes:
+    """Tests for PostgresMemoryStore.hybrid_search_episodes."""
+
+    @pytest.mark.asyncio
+    async def test_vector_leg_uses_ann_search(self, pool, conn) -> None:
+        near = [{**_row("refund policy"), "distance": 0.1}, {**_row("returns"), "distance": 0.2}]
+        fused = {
+            **_row("refund policy"),
+            "id": near[0]["id"],
+            "vector_score": 0.9,
+            "text_score": 0.5,
+        }
+        conn.fetch.side_effect = [near, [fused]]
+        store = PostgresMemoryStore(pool)
+
+        results = await store.hybrid_search_episodes([0.1, 0.2], "refund", "t:s", limit=2)
+
+        assert [(e.content, v, t) for e, v, t in results] == [("refund policy", 0.9, 0.5)]
+        ann_sql = conn.fetch.await_args_list[0].args[0]
+        assert "ORDER BY embedding <=> $1::vector" in ann_sql
+        conn.execute.assert_any_await("SET LOCAL hnsw.ef_search = 40")
+        hybrid_args = conn.fetch.await_args_list[1].args
+        assert "id = ANY($6::uuid[])" in hybrid_args[0]
+        assert hybrid_args[2:] == ("t:s", "english", "refund", 2, [n["id"] for n in near])
@@ -1,6 +1,7 @@
 """Tests for structured logging."""
 
 import json
+import threading
 from io import StringIO
 from uuid import uuid4
 
@@ -8,7 +9,10 @@ import pytest
 import structlog
 
 from ruche.observability.logging import (
+    EventSampler,
     PIIRedactor,
+    QueuedLogWriter,
+    _json_dumps,
     get_logger,
     setup_logging,
 )
@@ -164,6 +168,104 @@ class TestPIIRedactor:
         result = redactor(None, None, event_dict)  # type: ignore
         assert result == event_dict
 
+    def test_clean_event_is_not_copied(self, redactor: PIIRedactor) -> None:
+        """Should return the same objects when nothing needs redaction."""
+        nested = {"ids": ["a", "b"], "count": 2}
+        event_dict = {"event": "rules_retrieved", "details": nested}
+        result = redactor(None, None, event_dict)  # type: ignore
+        assert result is event_dict
+        assert result["details"] is nested
+
+    def test_redacts_ssn_and_extra_patterns(self) -> None:
+        """Should apply built-in and configured patterns in one pass."""
+        redactor = PIIRedactor(extra_patterns=[r"ACCT-\d{6}"])
+        event_dict = {"message": "ssn 123-45-6789 account ACCT-123456 mail a@b.io"}
+        result = redactor(None, None, event_dict)  # type: ignore
+        assert "123-45-6789" not in result["message"]
+        assert "[REDACTED]" in result["message"]
+        assert "[EMAIL]" in result["message"]
+        assert event_dict["message"].startswith("ssn 123")
+
+    def test_extra_patterns_apply_to_short_strings(self) -> None:
+        """Should not skip short values when custom patterns are configured."""
+        redactor = PIIRedactor(extra_patterns=[r"K\d{2}"])
+        result = redactor(None, None, {"code": "K42"})  # type: ignore
+        assert result["code"] == "[REDACTED]"
+
+
+class TestEventSampler:
+    """Tests for per-event sampling."""
+
+    def test_drops_events_with_zero_rate(self) -> None:
+        """Should drop events sampled at 0 and keep unlisted events."""
+        sampler = EventSampler({"noisy_event": 0.0})
+        with pytest.raises(structlog.DropEvent):
+            sampler(None, None, {"event": "noisy_event"})  # type: ignore
+        assert sampler(None, None, {"event": "other"}) == {"event": "other"}  # type: ignore
+
+    def test_keeps_events_with_full_rate(self) -> None:
+        """Should always keep events sampled at 1."""
+        sampler = EventSampler({"noisy_event": 1.0})
+        assert sampler(None, None, {"event": "noisy_event"})  # type: ignore
+
+
+class TestQueuedLogWriter:
+    """Tests for the background log writer."""
+
+    def test_writes_lines_in_order(self) -> None:
+        """Should write queued lines to the stream."""
+        output = StringIO()
+        writer = QueuedLogWriter(output)
+        for i in range(3):
+            writer.write(f"line {i}")
+        writer.flush()
+        writer.close()
+        assert output.getvalue() == "line 0\nline 1\nline 2\n"
+
+    def test_drop_policy_discards_when_full(self) -> None:
+        """Should drop lines instead of blocking when the queue is full."""
+        started = threading.Event()
+        release = threading.Event()
+
+        class SlowStream(StringIO):
+            def write(self, s: str) -> int:
+                started.set()
+                release.wait(timeout=5)
+                return super().write(s)
+
+        output = SlowStream()
+        writer = QueuedLogWriter(output, max_queue_size=1, overflow_policy="drop")
+        writer.write("first")
+        started.wait(timeout=5)
+        writer.write("second")
+        writer.write("dropped")
+        release.set()
+        writer.flush()
+        writer.close()
+        assert output.getvalue() == "first\nsecond\n"
+
+    def test_stream_errors_are_reported_and_writer_survives(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should report a failed write on stderr and keep writing later lines."""
+        errors = StringIO()
+        monkeypatch.setattr("sys.__stderr__", errors)
+
+        class FlakyStream(StringIO):
+            def write(self, s: str) -> int:
+                if s.startswith("bad"):
+                    raise OSError("disk full")
+                return super().write(s)
+
+        output = FlakyStream()
+        writer = QueuedLogWriter(output)
+        writer.write("bad")
+        writer.write("good")
+        writer.flush()
+        writer.close()
+        assert output.getvalue() == "good\n"
+        assert "disk full" in errors.getvalue()
+
 
 class TestJSONLogging:
     """Tests for JSON log output format."""
@@ -200,3 +302,10 @@ class TestJSONLogging:
         assert parsed["key"] == "value"
         assert "timestamp" in parsed
         assert "level" in parsed
+
+    def test_fast_serializer_handles_non_json_types(self) -> None:
+        """Should serialize UUIDs and fall back to str for unknown types."""
+        value = uuid4()
+        parsed = json.loads(_json_dumps({"id": value, "obj": object, 1: "x"}))
+        assert parsed["id"] == str(value)
+        assert parsed["1"] == "x"
@@ -1,11 +1,14 @@
 """Tests for LLM providers."""
 
+from types import SimpleNamespace
+
 import pytest
 from pydantic import BaseModel
 
 from ruche.infrastructure.providers.llm import (
     AuthenticationError,
     ContentFilterError,
+    LLMExecutor,
     LLMMessage,
     LLMResponse,
     MockLLMProvider,
@@ -192,6 +195,66 @@ class TestMockLLMProvider:
         assert response.usage.total_tokens > 0
 
 
+class TestLLMExecutorPromptCaching:
+    """Tests for prompt layout handling in LLMExecutor."""
+
+    @pytest.fixture
+    def messages(self) -> list[LLMMessage]:
+        return [
+            LLMMessage(role="system", content="Instructions", cache_breakpoint=True),
+            LLMMessage(role="system", content="Rules", cache_breakpoint=True),
+            LLMMessage(role="system", content="Turn context"),
+            LLMMessage(role="user", content="Hello"),
+        ]
+
+    def test_system_blocks_split_at_breakpoints(self, messages):
+        """Each breakpoint closes a cacheable block; the tail is uncached."""
+        executor = LLMExecutor(model="mock/test")
+
+        blocks = executor._get_system_blocks(messages)
+
+        assert blocks == [
+            ("Instructions", True),
+            ("Rules", True),
+            ("Turn context", False),
+        ]
+
+    def test_non_anthropic_gets_ordered_single_prompt(self, messages):
+        """Prefix-caching providers receive all segments in order."""
+        pytest.importorskip("agno.models.openai")
+        executor = LLMExecutor(model="openai/gpt-4o-mini")
+
+        agent = executor._build_agent("openai/gpt-4o-mini", "openai", messages)
+
+        assert agent.instructions == ["Instructions\n\nRules\n\nTurn context"]
+
+    def test_calls_do_not_share_system_prompt(self, messages):
+        """Each call gets its own agent; only the model is cached."""
+        pytest.importorskip("agno.models.openai")
+        executor = LLMExecutor(model="openai/gpt-4o-mini")
+        other = [LLMMessage(role="system", content="Other"), LLMMessage(role="user", content="Hi")]
+
+        first = executor._build_agent("openai/gpt-4o-mini", "openai", messages)
+        second = executor._build_agent("openai/gpt-4o-mini", "openai", other)
+
+        assert first is not second
+        assert first.model is second.model
+        assert first.instructions == ["Instructions\n\nRules\n\nTurn context"]
+        assert second.instructions == ["Other"]
+
+    def test_cached_prompt_tokens_recorded(self):
+        """Provider cache usage is surfaced in response metadata."""
+        executor = LLMExecutor(model="mock/test", step_name="generation")
+        run_response = SimpleNamespace(
+            metrics=SimpleNamespace(input_tokens=120, cache_read_tokens=6000, cache_write_tokens=0)
+        )
+        metadata: dict = {}
+
+        executor._record_prompt_tokens(run_response, metadata)
+
+        assert metadata == {"input_tokens": 120, "cache_read_tokens": 6000}
+
+
 class TestErrorClasses:
     """Tests for error class hierarchy."""
 
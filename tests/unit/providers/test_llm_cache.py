@@ -0,0 +1,171 @@
+"""Tests for the exact-match LLM response cache."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from ruche.config.models.pipeline import LLMResponseCacheConfig
+from ruche.infrastructure.providers.llm import (
+    LLMExecutor,
+    LLMMessage,
+    LLMResponse,
+    LLMResponseCache,
+)
+
+
+@pytest.fixture
+def config() -> LLMResponseCacheConfig:
+    """Enabled cache config with small bounds."""
+    return LLMResponseCacheConfig(
+        enabled=True,
+        steps=["rule_filtering"],
+        l1_max_entries=2,
+        compression_min_bytes=64,
+    )
+
+
+@pytest.fixture
+def mock_redis():
+    """Dict-backed mock Redis client."""
+    data: dict[str, str] = {}
+    redis = AsyncMock()
+    redis.data = data
+
+    async def get(key):
+        return data.get(key)
+
+    async def set(key, value, ex=None):
+        data[key] = value
+        return True
+
+    redis.get = AsyncMock(side_effect=get)
+    redis.set = AsyncMock(side_effect=set)
+    return redis
+
+
+def _key(content: str = "Hello", version: int | None = 1) -> str:
+    return LLMResponseCache.make_key(
+        model="openai/gpt-4o-mini",
+        step="rule_filtering",
+        messages=[LLMMessage(role="user", content=content)],
+        max_tokens=1000,
+        temperature=0.0,
+        config_version=version,
+    )
+
+
+class TestLLMResponseCacheKeys:
+    """Tests for cache key construction."""
+
+    def test_key_is_stable(self):
+        """Identical inputs produce identical keys."""
+        assert _key() == _key()
+
+    def test_key_changes_with_prompt_and_version(self):
+        """Prompt or config version changes produce new keys."""
+        assert _key("Hello") != _key("Hello!")
+        assert _key(version=1) != _key(version=2)
+
+    def test_is_cacheable_respects_step_and_temperature(self, config):
+        """Only listed steps at deterministic temperature are cached."""
+        cache = LLMResponseCache(config)
+        assert cache.is_cacheable("rule_filtering", 0.0)
+        assert not cache.is_cacheable("rule_filtering", 0.7)
+        assert not cache.is_cacheable("generation", 0.0)
+        assert not cache.is_cacheable(None, 0.0)
+
+
+class TestLLMResponseCacheTiers:
+    """Tests for L1/L2 behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_l1_round_trip(self, config):
+        """Stored responses are served from L1."""
+        cache = LLMResponseCache(config)
+        await cache.set("rule_filtering", _key(), LLMResponse(content="[]", model="m"))
+
+        cached = await cache.get("rule_filtering", _key())
+
+        assert cached is not None
+        assert cached.content == "[]"
+        assert cached.metadata["cache_hit"] is True
+
+    @pytest.mark.asyncio
+    async def test_l1_evicts_least_recently_used(self, config):
+        """L1 is bounded by l1_max_entries."""
+        cache = LLMResponseCache(config)
+        for content in ("a", "b", "c"):
+            await cache.set("rule_filtering", _key(content), LLMResponse(content=content, model="m"))
+
+        assert await cache.get("rule_filtering", _key("a")) is None
+        assert await cache.get("rule_filtering", _key("c")) is not None
+
+    @pytest.mark.asyncio
+    async def test_l2_hit_is_promoted_to_l1(self, config, mock_redis):
+        """A value found only in Redis is returned and cached locally."""
+        writer = LLMResponseCache(config, redis=mock_redis)
+        await writer.set("rule_filtering", _key(), LLMResponse(content="x" * 200, model="m"))
+
+        reader = LLMResponseCache(config, redis=mock_redis)
+        cached = await reader.get("rule_filtering", _key())
+        assert cached is not None
+        assert cached.content == "x" * 200
+
+        mock_redis.get.reset_mock()
+        assert await reader.get("rule_filtering", _key()) is not None
+        mock_redis.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_large_values_are_compressed(self, config, mock_redis):
+        """Values above the threshold are stored compressed in Redis."""
+        cache = LLMResponseCache(config, redis=mock_redis)
+        await cache.set("rule_filtering", _key(), LLMResponse(content="y" * 500, model="m"))
+
+        (stored,) = mock_redis.data.values()
+        assert stored.startswith("z:")
+        assert len(stored) < 500
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_misses(self, config):
+        """Redis failures never fail the call."""
+        redis = AsyncMock()
+        redis.get = AsyncMock(side_effect=ConnectionError("down"))
+        redis.set = AsyncMock(side_effect=ConnectionError("down"))
+        cache = LLMResponseCache(config.model_copy(update={"l1_max_entries": 0}), redis=redis)
+
+        await cache.set("rule_filtering", _key(), LLMResponse(content="[]", model="m"))
+        assert await cache.get("rule_filtering", _key()) is None
+
+
+class TestLLMExecutorWithCache:
+    """Tests for executor integration."""
+
+    @pytest.mark.asyncio
+    async def test_deterministic_calls_hit_cache(self, config):
+        """Second identical call is served from the cache."""
+        cache = LLMResponseCache(config)
+        executor = LLMExecutor(
+            model="mock/test", step_name="rule_filtering", response_cache=cache
+        )
+        messages = [LLMMessage(role="user", content="yes")]
+
+        first = await executor.generate(messages, temperature=0.0)
+        second = await executor.generate(messages, temperature=0.0)
+
+        assert "cache_hit" not in first.metadata
+        assert second.metadata["cache_hit"] is True
+        assert second.content == first.content
+
+    @pytest.mark.asyncio
+    async def test_sampled_calls_bypass_cache(self, config):
+        """Non-zero temperature is never cached."""
+        cache = LLMResponseCache(config)
+        executor = LLMExecutor(
+            model="mock/test", step_name="rule_filtering", response_cache=cache
+        )
+        messages = [LLMMessage(role="user", content="yes")]
+
+        await executor.generate(messages, temperature=0.7)
+        second = await executor.generate(messages, temperature=0.7)
+
+        assert "cache_hit" not in second.metadata
@@ -0,0 +1,225 @@
+"""Shared fixtures for ACF tests."""
+
+import asyncio
+from collections import defaultdict, deque
+
+import pytest
+
+from ruche.runtime.acf import mutex
+
+
+class FakePipeline:
+    """Queues commands and runs them against the fake on execute()."""
+
+    def __init__(self, redis: "FakeMutexRedis") -> None:
+        self._redis = redis
+        self._calls: list = []
+
+    def __getattr__(self, name: str):
+        command = getattr(self._redis, name)
+
+        def queue(*args, **kwargs) -> "FakePipeline":
+            self._calls.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list:
+        calls, self._calls = self._calls, []
+        return [await command(*args, **kwargs) for command, args, kwargs in calls]
+
+
+class FakeMutexRedis:
+    """In-process Redis with the commands and scripts the ACF runtime uses.
+
+    Covers the SessionMutex scripts, the hashes of the turn state hand-off
+    and the sorted set of the worker ring. Keys expire on the event loop
+    clock and BLPOP blocks until a push, so lock hand-off timing can be
+    tested without a server.
+    """
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.expiry: dict[str, float] = {}
+        self.lists: dict[str, deque[str]] = defaultdict(deque)
+        self.hashes: dict[str, dict[str, bytes]] = defaultdict(dict)
+        self.zsets: dict[str, dict[str, float]] = defaultdict(dict)
+        # TTL in seconds last set with EXPIRE, per key
+        self.ttls: dict[str, int] = {}
+        self.commands: list[str] = []
+        # Clients blocked in BLPOP now, and the most at any one time
+        self.blocked = 0
+        self.max_blocked = 0
+        self._pushed = asyncio.Condition()
+
+    def _now(self) -> float:
+        return asyncio.get_running_loop().time()
+
+    def _alive(self, key: str) -> bool:
+        if key in self.expiry and self.expiry[key] <= self._now():
+            self.values.pop(key, None)
+            self.expiry.pop(key, None)
+        return key in self.values
+
+    def _pttl(self, key: str) -> int:
+        if not self._alive(key):
+            return -2
+        if key not in self.expiry:
+            return -1
+        return int((self.expiry[key] - self._now()) * 1000)
+
+    async def get(self, key: str) -> bytes | None:
+        self.commands.append("get")
+        return self.values[key].encode() if self._alive(key) else None
+
+    async def set(self, key, value, nx=False, px=None, ex=None, **kwargs):
+        self.commands.append("set")
+        if nx and self._alive(key):
+            return None
+        self.values[key] = value.decode() if isinstance(value, bytes) else str(value)
+        self.expiry.pop(key, None)
+        if px is not None:
+            self.expiry[key] = self._now() + px / 1000
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        self.commands.append("delete")
+        deleted = 0
+        for key in keys:
+            deleted += self._alive(key)
+            self.values.pop(key, None)
+            self.expiry.pop(key, None)
+            deleted += bool(self.lists.pop(key, None))
+            deleted += bool(self.hashes.pop(key, None))
+            deleted += bool(self.zsets.pop(key, None))
+        return deleted
+
+    async def exists(self, *keys: str) -> int:
+        return sum(self._alive(key) for key in keys)
+
+    async def rpush(self, key: str, *values: str) -> int:
+        self.commands.append("rpush")
+        async with self._pushed:
+            self.lists[key].extend(values)
+            self._pushed.notify_all()
+        return len(self.lists[key])
+
+    async def pexpire(self, key: str, ms: int) -> bool:
+        return True
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        self.ttls[key] = seconds
+        return True
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def hset(self, key: str, field: str, value: bytes) -> int:
+        self.commands.append("hset")
+        added = field not in self.hashes[key]
+        self.hashes[key][field] = value
+        return int(added)
+
+    async def hget(self, key: str, field: str) -> bytes | None:
+        self.commands.append("hget")
+        return self.hashes.get(key, {}).get(field)
+
+    async def zadd(self, key: str, mapping: dict[str, float], xx: bool = False) -> int:
+        self.commands.append("zadd")
+        zset = self.zsets[key]
+        added = 0
+        for member, score in mapping.items():
+            if xx and member not in zset:
+                continue
+            added += member not in zset
+            zset[member] = float(score)
+        return added
+
+    async def zrem(self, key: str, *members: str) -> int:
+        self.commands.append("zrem")
+        zset = self.zsets.get(key, {})
+        return sum(zset.pop(member, None) is not None for member in members)
+
+    async def zrangebyscore(self, key: str, low, high) -> list[bytes]:
+        self.commands.append("zrangebyscore")
+        members = sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1])
+        return [m.encode() for m, score in members if float(low) <= score <= float(high)]
+
+    async def zremrangebyscore(self, key: str, low, high) -> int:
+        self.commands.append("zremrangebyscore")
+        zset = self.zsets.get(key, {})
+        doomed = [m for m, score in zset.items() if float(low) <= score <= float(high)]
+        for member in doomed:
+            del zset[member]
+        return len(doomed)
+
+    async def blpop(self, keys: list[str], timeout: float = 0):
+        self.commands.append("blpop")
+
+        def pop():
+            for key in keys:
+                if self.lists.get(key):
+                    return key.encode(), self.lists[key].popleft().encode()
+            return None
+
+        self.blocked += 1
+        self.max_blocked = max(self.max_blocked, self.blocked)
+        try:
+            async with self._pushed:
+                try:
+                    await asyncio.wait_for(
+                        self._pushed.wait_for(lambda: any(self.lists.get(k) for k in keys)),
+                        timeout=timeout or None,
+                    )
+                except TimeoutError:
+                    return None
+                return pop()
+        finally:
+            self.blocked -= 1
+
+    def register_script(self, script: str):
+        handlers = {
+            mutex._ACQUIRE_SCRIPT: self._acquire,
+            mutex._RELEASE_SCRIPT: self._release,
+            mutex._EXTEND_SCRIPT: self._extend,
+        }
+        handler = handlers[script]
+
+        async def run(keys=None, args=None):
+            self.commands.append("evalsha")
+            return await handler(list(keys or []), list(args or []))
+
+        return run
+
+    async def _acquire(self, keys, args):
+        lock, fence = keys
+        token, lease_ms, _fence_ttl_ms = args
+        if self._alive(lock):
+            return [0, self._pttl(lock)]
+        self.values[lock] = token
+        self.expiry[lock] = self._now() + int(lease_ms) / 1000
+        self.values[fence] = str(int(self.values.get(fence, 0)) + 1)
+        return [1, int(self.values[fence])]
+
+    async def _release(self, keys, args):
+        lock, wake = keys
+        if not self._alive(lock) or self.values[lock] != args[0]:
+            return 0
+        self.values.pop(lock)
+        self.expiry.pop(lock, None)
+        self.lists.pop(wake, None)
+        await self.rpush(wake, "1")
+        return 1
+
+    async def _extend(self, keys, args):
+        (lock,) = keys
+        if not self._alive(lock) or self.values[lock] != args[0]:
+            return 0
+        self.expiry[lock] = self._now() + int(args[1]) / 1000
+        return 1
+
+
+@pytest.fixture
+def fake_redis() -> FakeMutexRedis:
+    """In-process Redis for the session mutex, turn hand-off and worker ring."""
+    return FakeMutexRedis()
@@ -0,0 +1,255 @@
+"""Tests for session-affine worker routing.
+
+Tests cover:
+- Shard hashing and rendezvous ownership
+- SessionAffinity membership and rebalancing
+- Local mutex fast path in LogicalTurnWorkflow
+- Gateway routing decisions
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from ruche.runtime.acf.affinity import (
+    SessionAffinity,
+    ShardRing,
+    rendezvous_owner,
+    shard_for,
+)
+from ruche.runtime.acf.gateway import ActiveTurnIndex, RawMessage, TurnAction, TurnGateway
+from ruche.runtime.acf.workflow import LogicalTurnWorkflow
+
+SESSION_KEY = "tenant:agent:customer:web"
+MEMBERS_KEY = "acf:workers"
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+def _affinity(redis, worker_id: str, num_shards: int = 64) -> SessionAffinity:
+    return SessionAffinity(redis, worker_id=worker_id, num_shards=num_shards)
+
+
+# =============================================================================
+# Tests: hashing
+# =============================================================================
+
+
+class TestHashing:
+    """Tests for shard hashing and rendezvous ownership."""
+
+    def test_shard_is_stable_and_in_range(self) -> None:
+        """A session key always maps to the same shard."""
+        shard = shard_for(SESSION_KEY, 64)
+
+        assert 0 <= shard < 64
+        assert shard_for(SESSION_KEY, 64) == shard
+
+    def test_removing_worker_moves_only_its_shards(self) -> None:
+        """Shards of the remaining workers keep their owner."""
+        workers = ["w1", "w2", "w3", "w4"]
+        before = {shard: rendezvous_owner(shard, workers) for shard in range(256)}
+        after = {shard: rendezvous_owner(shard, ["w1", "w2", "w4"]) for shard in range(256)}
+
+        moved = {shard for shard in before if before[shard] != after[shard]}
+
+        assert moved == {shard for shard, owner in before.items() if owner == "w3"}
+
+    def test_adding_worker_takes_shards_only_for_itself(self) -> None:
+        """A joining worker takes a share of shards; no others move."""
+        before = {shard: rendezvous_owner(shard, ["w1", "w2"]) for shard in range(256)}
+        after = {shard: rendezvous_owner(shard, ["w1", "w2", "w3"]) for shard in range(256)}
+
+        moved = [shard for shard in before if before[shard] != after[shard]]
+
+        assert moved
+        assert all(after[shard] == "w3" for shard in moved)
+
+    def test_no_owner_without_workers(self) -> None:
+        """Returns None when the ring is empty."""
+        assert rendezvous_owner(3, []) is None
+
+
+# =============================================================================
+# Tests: SessionAffinity
+# =============================================================================
+
+
+class TestSessionAffinity:
+    """Tests for membership and rebalancing."""
+
+    @pytest.mark.asyncio
+    async def test_workers_partition_shards(self, fake_redis) -> None:
+        """Every shard has exactly one owner among live workers."""
+        w1, w2 = _affinity(fake_redis, "w1"), _affinity(fake_redis, "w2")
+        await w1.refresh()
+        await w2.refresh()
+        await w1.refresh()
+
+        assert w1.owned_shards.isdisjoint(w2.owned_shards)
+        assert w1.owned_shards | w2.owned_shards == set(range(64))
+
+    @pytest.mark.asyncio
+    async def test_joining_worker_takes_shards(self, fake_redis) -> None:
+        """A joining worker takes shards from the existing one."""
+        w1 = _affinity(fake_redis, "w1")
+        await w1.refresh()
+
+        w2 = _affinity(fake_redis, "w2")
+        await w2.refresh()
+        await w1.refresh()
+
+        assert 0 < len(w1.owned_shards) < 64
+        assert all(w1.owns(shard) for shard in range(64) if not w2.owns(shard))
+
+    @pytest.mark.asyncio
+    async def test_stopped_worker_leaves_ring(self, fake_redis) -> None:
+        """After a worker stops, the others take over all of its shards."""
+        w1, w2 = _affinity(fake_redis, "w1"), _affinity(fake_redis, "w2")
+        await w1.start()
+        await w2.start()
+
+        await w2.stop()
+        await w1.refresh()
+
+        assert w1.owned_shards == set(range(64))
+        assert w2.owned_shards == set()
+        await w1.stop()
+
+    @pytest.mark.asyncio
+    async def test_expired_heartbeat_drops_worker(self, fake_redis) -> None:
+        """A worker that stops refreshing falls out of the ring."""
+        await fake_redis.zadd(MEMBERS_KEY, {"crashed": 0.0})
+        w1 = _affinity(fake_redis, "w1")
+
+        assert await w1.refresh() == ("w1",)
+
+    @pytest.mark.asyncio
+    async def test_gateway_ring_agrees_with_worker(self, fake_redis) -> None:
+        """ShardRing.route() names the worker that owns the shard."""
+        w1, w2 = _affinity(fake_redis, "w1"), _affinity(fake_redis, "w2")
+        await w1.refresh()
+        await w2.refresh()
+        await w1.refresh()
+
+        shard, worker_id = await ShardRing(fake_redis, num_shards=64).route(SESSION_KEY)
+
+        owner = w1 if w1.owns(shard) else w2
+        assert worker_id == owner.worker_id
+
+
+# =============================================================================
+# Tests: LogicalTurnWorkflow with affinity
+# =============================================================================
+
+
+class TestWorkflowAffinity:
+    """Tests for the local mutex fast path."""
+
+    async def _workflow(
+        self, fake_redis, worker_id: str | None = "w1"
+    ) -> LogicalTurnWorkflow:
+        affinity = None
+        if worker_id is not None:
+            affinity = _affinity(fake_redis, worker_id)
+            await affinity.refresh()
+        return LogicalTurnWorkflow(
+            redis=fake_redis,
+            agent_runtime=AsyncMock(),
+            session_store=AsyncMock(),
+            message_store=AsyncMock(),
+            audit_store=AsyncMock(),
+            mutex_blocking_timeout=1.0,
+            affinity=affinity,
+        )
+
+    @pytest.mark.asyncio
+    async def test_owned_session_waiters_queue_locally(self, fake_redis) -> None:
+        """Only one waiting turn of an owned session blocks on Redis at a time."""
+        workflow = await self._workflow(fake_redis)
+        first = await workflow.acquire_mutex(SESSION_KEY)
+
+        second = asyncio.create_task(workflow.acquire_mutex(SESSION_KEY))
+        third = asyncio.create_task(workflow.acquire_mutex(SESSION_KEY))
+        await asyncio.sleep(0.05)
+        assert not second.done() and not third.done()
+
+        await workflow._release_mutex(first["lock_key"], SESSION_KEY, first["lock_token"])
+        result = await second
+        await workflow._release_mutex(result["lock_key"], SESSION_KEY, result["lock_token"])
+
+        assert result["status"] == "locked"
+        assert result["shard"] == first["shard"]
+        assert (await third)["status"] == "locked"
+        assert fake_redis.max_blocked == 1
+
+    @pytest.mark.asyncio
+    async def test_release_on_another_worker_frees_session(self, fake_redis) -> None:
+        """A turn committed by a different workflow instance does not wedge the owner."""
+        owner = await self._workflow(fake_redis)
+        other = await self._workflow(fake_redis, worker_id=None)
+        first = await owner.acquire_mutex(SESSION_KEY)
+
+        await other._release_mutex(first["lock_key"], SESSION_KEY, first["lock_token"])
+        second = await owner.acquire_mutex(SESSION_KEY)
+
+        assert second["status"] == "locked"
+
+    @pytest.mark.asyncio
+    async def test_local_timeout_reports_lock_failed(self, fake_redis) -> None:
+        """Waiting on the local lock is bounded by the blocking timeout."""
+        workflow = await self._workflow(fake_redis)
+        workflow._mutex_blocking_timeout = 0.05
+        await workflow.acquire_mutex(SESSION_KEY)
+
+        result = await workflow.acquire_mutex(SESSION_KEY)
+
+        assert result["status"] == "lock_failed"
+
+    @pytest.mark.asyncio
+    async def test_unowned_shard_skips_fast_path(self, fake_redis) -> None:
+        """Turns routed for a shard owned elsewhere take the Redis mutex only."""
+        workflow = await self._workflow(fake_redis)
+        await fake_redis.zadd(MEMBERS_KEY, {"w2": 1e12})
+        await workflow.affinity.refresh()
+        foreign = next(s for s in range(64) if not workflow.affinity.owns(s))
+
+        result = await workflow.acquire_mutex(SESSION_KEY, shard=foreign)
+
+        assert result["status"] == "locked"
+        assert workflow._local_lock(SESSION_KEY, foreign) is None
+
+
+# =============================================================================
+# Tests: TurnGateway with a shard ring
+# =============================================================================
+
+
+class TestGatewayRouting:
+    """Tests for shard stamping in gateway decisions."""
+
+    @pytest.mark.asyncio
+    async def test_new_turn_names_shard_and_worker(self, fake_redis) -> None:
+        """TRIGGER_NEW decisions carry the shard and its owning worker."""
+        await fake_redis.zadd(MEMBERS_KEY, {"w1": 1e12})
+        gateway = TurnGateway(
+            active_turn_index=ActiveTurnIndex(),
+            shard_ring=ShardRing(fake_redis, num_shards=64),
+        )
+
+        decision = await gateway.receive_message(
+            tenant_id=uuid4(),
+            agent_id=uuid4(),
+            channel="web",
+            channel_user_id="user-1",
+            message=RawMessage(content="hello", message_id="m1"),
+        )
+
+        assert decision.action == TurnAction.TRIGGER_NEW
+        assert 0 <= decision.shard < 64
+        assert decision.worker_id == "w1"
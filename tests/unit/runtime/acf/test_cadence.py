@@ -0,0 +1,286 @@
+"""Tests for learned typing cadence.
+
+Tests cover:
+- CadenceSketch quantiles, decay and encoding
+- TypingCadenceStore gap recording and key scoping
+- LogicalTurnWorkflow.accumulate() feeding cadence to TurnManager
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from ruche.runtime.acf.cadence import CadenceSketch, TypingCadenceStore
+from ruche.runtime.acf.turn_manager import TurnManager
+from ruche.runtime.acf.workflow import LogicalTurnWorkflow
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def redis():
+    """Mock Redis backed by a dict for get/set."""
+    data: dict[str, str] = {}
+    redis = AsyncMock()
+    redis.get = AsyncMock(side_effect=lambda key: data.get(key))
+
+    async def set_(key, value, ex=None):
+        data[key] = value
+        return True
+
+    redis.set = AsyncMock(side_effect=set_)
+    redis.data = data
+    return redis
+
+
+@pytest.fixture
+def store(redis) -> TypingCadenceStore:
+    """Cadence store with a 5s gap horizon."""
+    return TypingCadenceStore(redis, ttl_seconds=3600, max_gap_ms=5000)
+
+
+SESSION_KEY = "tenant:agent:customer:whatsapp"
+
+
+# =============================================================================
+# Tests: CadenceSketch
+# =============================================================================
+
+
+class TestCadenceSketch:
+    """Tests for the quantile sketch."""
+
+    def test_empty_sketch_has_no_stats(self) -> None:
+        """Returns None before any gap is recorded."""
+        assert CadenceSketch().stats() is None
+
+    def test_quantiles_within_relative_accuracy(self) -> None:
+        """Quantiles are within 5% of the exact values."""
+        sketch = CadenceSketch()
+        gaps = list(range(100, 2100, 20))  # 100 gaps, 100..2080ms
+        for gap in gaps:
+            sketch.add(gap)
+
+        stats = sketch.stats()
+
+        assert stats.sample_count == 100
+        assert abs(stats.inter_message_p50_ms - 1080) <= 1080 * 0.05
+        assert abs(stats.inter_message_p95_ms - 1980) <= 1980 * 0.05
+
+    def test_decay_follows_recent_behavior(self) -> None:
+        """Recent gaps outweigh older ones."""
+        sketch = CadenceSketch()
+        decay = 0.5 ** (1 / 10)
+        for _ in range(50):
+            sketch.add(2000, decay)
+        for _ in range(30):
+            sketch.add(300, decay)
+
+        assert sketch.stats().inter_message_p50_ms < 400
+
+    def test_json_round_trip(self) -> None:
+        """Encoding preserves quantiles, count and last message time."""
+        sketch = CadenceSketch(last_at_ms=123)
+        for gap in (150, 400, 900, 4000):
+            sketch.add(gap)
+
+        decoded = CadenceSketch.from_json(sketch.to_json())
+
+        assert decoded.stats() == sketch.stats()
+        assert decoded.last_at_ms == 123
+
+
+# =============================================================================
+# Tests: TypingCadenceStore
+# =============================================================================
+
+
+class TestTypingCadenceStore:
+    """Tests for the Redis-backed store."""
+
+    def test_key_is_scoped_to_interlocutor_and_channel(self, store) -> None:
+        """Agent is dropped from the session key; non-composite keys are skipped."""
+        assert store.key_for_session(SESSION_KEY) == "cadence:tenant:customer:whatsapp"
+        assert store.key_for_session("test:session") is None
+
+    @pytest.mark.asyncio
+    async def test_records_gaps_between_messages(self, store, redis) -> None:
+        """Each message after the first records its gap."""
+        key = store.key_for_session(SESSION_KEY)
+
+        assert await store.observe(key, START) is None
+        for i in range(1, 6):
+            stats = await store.observe(key, START + timedelta(milliseconds=300 * i))
+
+        assert stats.sample_count == 5
+        assert abs(stats.inter_message_p50_ms - 300) <= 15
+        assert redis.set.call_args.kwargs["ex"] == 3600
+        assert await store.get(key) == stats
+
+    @pytest.mark.asyncio
+    async def test_ignores_gaps_beyond_horizon(self, store) -> None:
+        """A long pause is not a typing gap, but resets the reference time."""
+        key = store.key_for_session(SESSION_KEY)
+
+        await store.observe(key, START)
+        assert await store.observe(key, START + timedelta(seconds=60)) is None
+        stats = await store.observe(key, START + timedelta(seconds=60, milliseconds=500))
+
+        assert stats.sample_count == 1
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_message_is_not_a_gap(self, store, redis) -> None:
+        """An older timestamp neither records a gap nor moves time back."""
+        key = store.key_for_session(SESSION_KEY)
+
+        await store.observe(key, START)
+        await store.observe(key, START - timedelta(milliseconds=200))
+
+        sketch = CadenceSketch.from_json(redis.data[key])
+        assert sketch.count == 0
+        assert sketch.last_at_ms == int(START.timestamp() * 1000)
+
+
+# =============================================================================
+# Tests: LogicalTurnWorkflow.accumulate() with cadence
+# =============================================================================
+
+
+class TestWorkflowCadence:
+    """Tests for cadence in the accumulate step."""
+
+    def _workflow(self, cadence_store) -> LogicalTurnWorkflow:
+        return LogicalTurnWorkflow(
+            redis=MagicMock(),
+            agent_runtime=AsyncMock(),
+            session_store=AsyncMock(),
+            message_store=AsyncMock(),
+            audit_store=AsyncMock(),
+            turn_manager=TurnManager(min_wait_ms=100, max_wait_ms=3000),
+            cadence_store=cadence_store,
+        )
+
+    @pytest.mark.asyncio
+    async def test_fast_typist_gets_shorter_window(self, store) -> None:
+        """Learned short gaps shrink the window below the channel default."""
+        key = store.key_for_session(SESSION_KEY)
+        for i in range(10):
+            await store.observe(key, START + timedelta(milliseconds=150 * i))
+
+        waits = []
+
+        async def wait_for_event(timeout_ms):
+            waits.append(timeout_ms)
+            return None
+
+        await self._workflow(store).accumulate(
+            turn_id=uuid4(),
+            session_key=SESSION_KEY,
+            initial_message_id=str(uuid4()),
+            initial_content="Where is my order?",
+            channel="whatsapp",
+            wait_for_event=wait_for_event,
+            initial_timestamp=START + timedelta(milliseconds=1500),
+        )
+        default = TurnManager(min_wait_ms=100, max_wait_ms=3000).suggest_wait_ms(
+            "Where is my order?", "whatsapp"
+        )
+
+        assert waits[0] < default
+
+    @pytest.mark.asyncio
+    async def test_absorbed_messages_update_cadence(self, store, redis) -> None:
+        """Every absorbed message is recorded with its event timestamp."""
+        events = [
+            {
+                "message_id": str(uuid4()),
+                "content": "and another thing",
+                "timestamp": (START + timedelta(milliseconds=400)).isoformat(),
+            },
+            None,
+        ]
+
+        async def wait_for_event(timeout_ms):
+            return events.pop(0)
+
+        await self._workflow(store).accumulate(
+            turn_id=uuid4(),
+            session_key=SESSION_KEY,
+            initial_message_id=str(uuid4()),
+            initial_content="hi",
+            channel="whatsapp",
+            wait_for_event=wait_for_event,
+            initial_timestamp=START,
+        )
+
+        sketch = CadenceSketch.from_json(redis.data["cadence:tenant:customer:whatsapp"])
+        assert sketch.count == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_typist_window_widens(self, store, redis) -> None:
+        """Follow-ups that miss the window start turns, and widen it."""
+        waits = []
+
+        async def wait_for_event(timeout_ms):
+            waits.append(timeout_ms)
+            return None
+
+        for i in range(8):
+            await self._workflow(store).accumulate(
+                turn_id=uuid4(),
+                session_key=SESSION_KEY,
+                initial_message_id=str(uuid4()),
+                initial_content="Where is my order?",
+                channel="whatsapp",
+                wait_for_event=wait_for_event,
+                initial_timestamp=START + timedelta(milliseconds=2500 * i),
+            )
+
+        sketch = CadenceSketch.from_json(redis.data["cadence:tenant:customer:whatsapp"])
+        assert sketch.count == 7
+        assert abs(sketch.stats().inter_message_p95_ms - 2500) <= 125
+        assert waits[-1] > waits[0]
+
+    @pytest.mark.asyncio
+    async def test_gap_after_long_pause_is_not_recorded(self, store, redis) -> None:
+        """A turn started after a pause beyond the horizon adds no gap."""
+
+        async def wait_for_event(timeout_ms):
+            return None
+
+        for started_at in (START, START + timedelta(seconds=60)):
+            await self._workflow(store).accumulate(
+                turn_id=uuid4(),
+                session_key=SESSION_KEY,
+                initial_message_id=str(uuid4()),
+                initial_content="hi",
+                channel="whatsapp",
+                wait_for_event=wait_for_event,
+                initial_timestamp=started_at,
+            )
+
+        sketch = CadenceSketch.from_json(redis.data["cadence:tenant:customer:whatsapp"])
+        assert sketch.count == 0
+
+    @pytest.mark.asyncio
+    async def test_redis_error_falls_back_to_channel_default(self, store, redis) -> None:
+        """Cadence failures never fail accumulation."""
+        redis.get = AsyncMock(side_effect=ConnectionError("down"))
+
+        result = await self._workflow(store).accumulate(
+            turn_id=uuid4(),
+            session_key=SESSION_KEY,
+            initial_message_id=str(uuid4()),
+            initial_content="Hello.",
+            channel="whatsapp",
+            wait_for_event=AsyncMock(return_value=None),
+        )
+
+        assert result["status"] == "ready_to_process"
@@ -1,18 +1,21 @@
 """Unit tests for EventRouter pattern matching and dispatch."""
 
+import asyncio
 from uuid import UUID, uuid4
 
 import pytest
 
-from ruche.runtime.acf.event_router import EventRouter
+from ruche.runtime.acf.event_router import EventRouter, OverflowPolicy
 from ruche.runtime.acf.events import ACFEvent, ACFEventType
 from ruche.runtime.acf.models import LogicalTurn, LogicalTurnStatus, SideEffect, SideEffectPolicy
 
 
 @pytest.fixture
-def router() -> EventRouter:
+async def router():
     """Create fresh event router."""
-    return EventRouter()
+    router = EventRouter()
+    yield router
+    await router.close()
 
 
 @pytest.fixture
@@ -135,6 +138,7 @@ class TestEventRouting:
 
         await router.register_listener("turn.started", test_listener)
         await router.route(sample_event)
+        await router.flush()
 
         assert len(listener_called) == 1
         assert listener_called[0] == sample_event
@@ -150,6 +154,7 @@ class TestEventRouting:
 
         await router.register_listener("turn.*", test_listener)
         await router.route(sample_event)
+        await router.flush()
 
         assert len(listener_called) == 1
 
@@ -169,6 +174,7 @@ class TestEventRouting:
         await router.register_listener("turn.started", exact_listener)
         await router.register_listener("turn.*", wildcard_listener)
         await router.route(sample_event)
+        await router.flush()
 
         assert len(exact_called) == 1
         assert len(wildcard_called) == 1
@@ -191,6 +197,150 @@ class TestEventRouting:
         await router.route(sample_event)
 
 
+class TestDelivery:
+    """Tests for synchronous and queued delivery."""
+
+    async def test_synchronous_listener_runs_before_route_returns(
+        self, router: EventRouter, sample_event: ACFEvent
+    ) -> None:
+        """route() awaits synchronous listeners."""
+        received = []
+
+        async def listener(event: ACFEvent) -> None:
+            await asyncio.sleep(0.01)
+            received.append(event)
+
+        await router.register_listener("turn.started", listener, synchronous=True)
+        await router.route(sample_event)
+
+        assert received == [sample_event]
+
+    async def test_slow_listener_does_not_block_route(
+        self, router: EventRouter, sample_event: ACFEvent
+    ) -> None:
+        """route() returns while a queued listener is still running."""
+        release = asyncio.Event()
+        received = []
+
+        async def slow_listener(event: ACFEvent) -> None:
+            await release.wait()
+            received.append(event)
+
+        await router.register_listener("*", slow_listener)
+        await asyncio.wait_for(router.route(sample_event), timeout=1)
+
+        assert received == []
+        release.set()
+        await router.flush()
+        assert received == [sample_event]
+
+    async def test_queued_listener_receives_events_in_order(
+        self, router: EventRouter, sample_event: ACFEvent
+    ) -> None:
+        """Events reach a queued listener in routing order."""
+        received = []
+
+        async def listener(event: ACFEvent) -> None:
+            received.append(event.payload["n"])
+
+        await router.register_listener("turn.*", listener)
+        for n in range(5):
+            await router.route(sample_event.model_copy(update={"payload": {"n": n}}))
+        await router.flush()
+
+        assert received == [0, 1, 2, 3, 4]
+
+    @pytest.mark.parametrize(
+        ("overflow", "expected"),
+        [(OverflowPolicy.DROP_OLDEST, [0, 3]), (OverflowPolicy.DROP_NEWEST, [0, 1])],
+    )
+    async def test_full_queue_drops_by_policy(
+        self,
+        router: EventRouter,
+        sample_event: ACFEvent,
+        overflow: OverflowPolicy,
+        expected: list[int],
+    ) -> None:
+        """A full queue drops the oldest or the newest event."""
+        release = asyncio.Event()
+        received = []
+
+        async def listener(event: ACFEvent) -> None:
+            await release.wait()
+            received.append(event.payload["n"])
+
+        await router.register_listener("*", listener, queue_size=1, overflow=overflow)
+        await router.route(sample_event.model_copy(update={"payload": {"n": 0}}))
+        await asyncio.sleep(0)  # listener takes event 0 and waits
+        for n in (1, 2, 3):
+            await router.route(sample_event.model_copy(update={"payload": {"n": n}}))
+        release.set()
+        await router.flush()
+
+        assert received == expected
+
+    async def test_block_policy_applies_backpressure(
+        self, router: EventRouter, sample_event: ACFEvent
+    ) -> None:
+        """With BLOCK, route() waits for queue space instead of dropping."""
+        release = asyncio.Event()
+        received = []
+
+        async def listener(event: ACFEvent) -> None:
+            await release.wait()
+            received.append(event.payload["n"])
+
+        await router.register_listener(
+            "*", listener, queue_size=1, overflow=OverflowPolicy.BLOCK
+        )
+        for n in (0, 1):
+            await router.route(sample_event.model_copy(update={"payload": {"n": n}}))
+        await asyncio.sleep(0)
+
+        blocked = asyncio.create_task(
+            router.route(sample_event.model_copy(update={"payload": {"n": 2}}))
+        )
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        release.set()
+        await blocked
+        await router.flush()
+        assert received == [0, 1, 2]
+
+    async def test_unregister_rebuilds_dispatch_table(
+        self, router: EventRouter, sample_event: ACFEvent
+    ) -> None:
+        """An unregistered listener no longer receives events."""
+        received = []
+
+        async def listener(event: ACFEvent) -> None:
+            received.append(event)
+
+        await router.register_listener("turn.*", listener, synchronous=True)
+        assert router._table["turn.started"].all
+        await router.unregister_listener("turn.*", listener)
+        await router.route(sample_event)
+
+        assert not router._table["turn.started"].all
+        assert received == []
+
+    async def test_route_records_side_effect_without_listeners(
+        self, router: EventRouter, logical_turn: LogicalTurn
+    ) -> None:
+        """Side effects are recorded even when nothing listens."""
+        event = ACFEvent(
+            type=ACFEventType.TOOL_EXECUTED,
+            logical_turn_id=logical_turn.id,
+            session_key=logical_turn.session_key,
+            payload={"tool_name": "send_email", "policy": "irreversible"},
+        )
+
+        await router.route(event, logical_turn)
+
+        assert len(logical_turn.side_effects) == 1
+
+
 class TestSideEffectRecording:
     """Tests for side effect recording in LogicalTurn."""
 
@@ -421,6 +571,7 @@ class TestCategorySupport:
             session_key="test:session",
         )
         await router.route(tool_event, None)
+        await router.flush()
 
         assert len(received) == 1
         assert received[0].type == ACFEventType.TURN_STARTED
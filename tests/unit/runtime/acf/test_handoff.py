@@ -0,0 +1,191 @@
+"""Tests for turn state hand-off between workflow steps.
+
+Tests cover:
+- Blob encoding and format detection
+- TurnStateStore offload, load and discard
+- LogicalTurnWorkflow.handoff()/restore() around the step methods
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from ruche.runtime.acf import handoff
+from ruche.runtime.acf.handoff import (
+    TurnStateExpiredError,
+    TurnStateStore,
+    decode_state,
+    encode_state,
+)
+from ruche.runtime.acf.models import LogicalTurn
+from ruche.runtime.acf.workflow import LogicalTurnWorkflow
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def store(fake_redis) -> TurnStateStore:
+    """Hand-off store with a 60s TTL."""
+    return TurnStateStore(fake_redis, ttl_seconds=60)
+
+
+def _turn() -> LogicalTurn:
+    now = datetime.now(UTC)
+    return LogicalTurn(
+        session_key="tenant:agent:customer:web",
+        messages=[uuid4(), uuid4()],
+        first_at=now,
+        last_at=now,
+    )
+
+
+def _agent_output(turn: LogicalTurn) -> dict:
+    return {
+        "status": "complete",
+        "turn": turn.model_dump(mode="json"),
+        "response": "Your order ships tomorrow.",
+        "response_segments": [{"text": "Your order ships tomorrow."}],
+    }
+
+
+# =============================================================================
+# Tests: encoding
+# =============================================================================
+
+
+class TestEncoding:
+    """Tests for blob encoding."""
+
+    def test_json_round_trip(self, monkeypatch) -> None:
+        """Without msgpack, state is tagged compact JSON."""
+        monkeypatch.setattr(handoff, "msgpack", None)
+        state = {"turn": {"id": "abc", "messages": ["m1"]}, "response": "hi"}
+
+        blob = encode_state(state)
+
+        assert blob.startswith(b"j{")
+        assert decode_state(blob) == state
+
+    def test_msgpack_round_trip(self) -> None:
+        """With msgpack, state is tagged msgpack."""
+        pytest.importorskip("msgpack")
+        state = {"turn": {"id": "abc"}, "response_segments": [{"text": "hi"}]}
+
+        blob = encode_state(state)
+
+        assert blob.startswith(b"m")
+        assert decode_state(blob) == state
+
+    def test_unknown_format_rejected(self) -> None:
+        """An unknown format byte raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown turn state format"):
+            decode_state(b"x{}")
+
+
+# =============================================================================
+# Tests: TurnStateStore
+# =============================================================================
+
+
+class TestTurnStateStore:
+    """Tests for the Redis-backed store."""
+
+    @pytest.mark.asyncio
+    async def test_offload_keeps_only_summary_inline(self, store, fake_redis) -> None:
+        """Bulky fields move to the turn hash; the summary stays inline."""
+        turn = _turn()
+
+        summary = await store.offload(str(turn.id), "run_agent", _agent_output(turn))
+
+        assert summary == {
+            "status": "complete",
+            "turn_id": str(turn.id),
+            "state_ref": {"key": f"turnstate:{turn.id}", "step": "run_agent"},
+        }
+        assert fake_redis.ttls[f"turnstate:{turn.id}"] == 60
+
+    @pytest.mark.asyncio
+    async def test_load_restores_output(self, store) -> None:
+        """load() returns the original output plus turn_id."""
+        turn = _turn()
+        output = _agent_output(turn)
+
+        restored = await store.load(await store.offload(str(turn.id), "run_agent", output))
+
+        assert restored == {**output, "turn_id": str(turn.id)}
+
+    @pytest.mark.asyncio
+    async def test_output_without_bulky_fields_is_untouched(self, store, fake_redis) -> None:
+        """Skipped-step outputs pass through both ways without Redis."""
+        output = {"status": "skipped", "reason": "lock_failed"}
+
+        assert await store.offload("t1", "accumulate", output) == output
+        assert await store.load(output) == output
+        assert fake_redis.hashes == {}
+
+    @pytest.mark.asyncio
+    async def test_load_after_discard_raises(self, store) -> None:
+        """A reference to discarded state raises TurnStateExpiredError."""
+        turn = _turn()
+        summary = await store.offload(str(turn.id), "run_agent", _agent_output(turn))
+
+        await store.discard(str(turn.id))
+
+        with pytest.raises(TurnStateExpiredError):
+            await store.load(summary)
+
+
+# =============================================================================
+# Tests: LogicalTurnWorkflow hand-off
+# =============================================================================
+
+
+class TestWorkflowHandoff:
+    """Tests for hand-off around the workflow steps."""
+
+    def _workflow(self, state_store) -> LogicalTurnWorkflow:
+        redis = MagicMock()
+        redis.register_script = MagicMock(return_value=AsyncMock(return_value=[1, 1]))
+        workflow = LogicalTurnWorkflow(
+            redis=redis,
+            agent_runtime=AsyncMock(),
+            session_store=AsyncMock(),
+            message_store=AsyncMock(),
+            audit_store=AsyncMock(),
+            state_store=state_store,
+        )
+        workflow._mutex.release_direct = AsyncMock(return_value=True)
+        return workflow
+
+    @pytest.mark.asyncio
+    async def test_without_store_outputs_stay_inline(self) -> None:
+        """No state store means step outputs are returned as they are."""
+        output = _agent_output(_turn())
+
+        workflow = self._workflow(None)
+
+        assert await workflow.handoff("run_agent", output) is output
+        assert await workflow.restore(output) is output
+
+    @pytest.mark.asyncio
+    async def test_commit_from_handed_off_output(self, store, fake_redis) -> None:
+        """commit_and_respond works on a restored run_agent output."""
+        turn = _turn()
+        workflow = self._workflow(store)
+
+        summary = await workflow.handoff("run_agent", _agent_output(turn))
+        result = await workflow.commit_and_respond(
+            pipeline_output=await workflow.restore(summary),
+            lock_key="sesslock:tenant:agent:customer:web",
+            session_key="tenant:agent:customer:web",
+        )
+        await workflow.discard_state(result["turn_id"])
+
+        assert result["response"] == "Your order ships tomorrow."
+        assert result["turn_id"] == str(turn.id)
+        workflow._audit_store.save_turn_record.assert_awaited_once()
+        assert fake_redis.hashes == {}
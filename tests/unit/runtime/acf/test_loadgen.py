@@ -0,0 +1,144 @@
+"""Tests for the ACF load generator.
+
+Tests cover:
+- Synthetic trace generation and JSON lines round trip
+- Harness accumulation, supersede detection and mutex waits
+- Report aggregation per tenant
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from ruche.runtime.acf.loadgen import (
+    BrainLatency,
+    ConversationTrace,
+    HarnessConfig,
+    LoadHarness,
+    TraceMessage,
+    dump_traces,
+    load_traces,
+    synthetic_traces,
+)
+from ruche.runtime.acf.turn_manager import TurnManager
+
+TENANT_A = str(uuid4())
+TENANT_B = str(uuid4())
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def harness(fake_redis) -> LoadHarness:
+    """Harness with short accumulation windows and a 100ms brain."""
+    return LoadHarness(
+        fake_redis,
+        HarnessConfig(workers=10, brain_latency=BrainLatency(median_ms=100, sigma=0)),
+        turn_manager=TurnManager(min_wait_ms=10, max_wait_ms=50),
+    )
+
+
+def _trace(tenant_id: str, channel: str, offsets: list[float]) -> ConversationTrace:
+    return ConversationTrace(
+        tenant_id=tenant_id,
+        agent_id=str(uuid4()),
+        interlocutor_id=str(uuid4()),
+        channel=channel,
+        messages=[TraceMessage(offset_ms=o, content="hello there friend.") for o in offsets],
+    )
+
+
+# =============================================================================
+# Tests: Traces
+# =============================================================================
+
+
+class TestTraces:
+    """Tests for trace generation and persistence."""
+
+    def test_synthetic_traces_are_deterministic_and_ordered(self) -> None:
+        """Test the same seed yields the same traffic."""
+        first = synthetic_traces(tenants=2, sessions=20, seed=7)
+        second = synthetic_traces(tenants=2, sessions=20, seed=7)
+
+        assert [t.session_key for t in first] == [t.session_key for t in second]
+        assert len({t.tenant_id for t in first}) == 2
+        for trace in first:
+            offsets = [m.offset_ms for m in trace.messages]
+            assert offsets == sorted(offsets)
+            assert len(offsets) >= 4
+
+    def test_dump_and_load_round_trip(self, tmp_path) -> None:
+        """Test recorded traces load back grouped by session."""
+        traces = synthetic_traces(tenants=1, sessions=3, turns_per_session=2, seed=1)
+        path = tmp_path / "traces.jsonl"
+
+        dump_traces(traces, path)
+        loaded = {t.session_key: t for t in load_traces(path)}
+
+        assert loaded.keys() == {t.session_key for t in traces}
+        for trace in traces:
+            assert [m.message_id for m in loaded[trace.session_key].messages] == [
+                m.message_id for m in trace.messages
+            ]
+
+    def test_load_rejects_incomplete_record(self, tmp_path) -> None:
+        """Test a record without offset is reported with its line."""
+        path = tmp_path / "bad.jsonl"
+        path.write_text('{"tenant_id": "t", "agent_id": "a", "interlocutor_id": "i"}\n')
+
+        with pytest.raises(ValueError, match="line 1"):
+            load_traces(path)
+
+
+# =============================================================================
+# Tests: Harness
+# =============================================================================
+
+
+class TestLoadHarness:
+    """Tests for driving the workflow."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_accumulated_into_one_turn(self, harness) -> None:
+        """Test messages within the window become one turn."""
+        report = await harness.run([_trace(TENANT_A, "webchat", [0, 5, 10])])
+
+        assert report.overall.turns == 1
+        assert report.overall.completed == 1
+        assert report.overall.messages_per_turn == 3
+        assert report.overall.superseded_rate == 0
+        assert report.overall.latency_ms["p50"] >= 100
+
+    @pytest.mark.asyncio
+    async def test_message_during_brain_supersedes_and_waits_for_mutex(self, harness) -> None:
+        """Test a message arriving mid-turn marks it stale and queues on the mutex."""
+        report = await harness.run(
+            [_trace(TENANT_A, "webchat", [0, 120]), _trace(TENANT_B, "webchat", [0])]
+        )
+
+        tenant_a = report.per_tenant[TENANT_A]
+        assert tenant_a.turns == 2
+        assert tenant_a.completed == 2
+        assert tenant_a.superseded_rate == 0.5
+        assert tenant_a.mutex_wait_ms["max"] > 0
+        assert report.per_tenant[TENANT_B].superseded_rate == 0
+        assert report.to_dict()["overall"]["turns"] == 3
+
+    @pytest.mark.asyncio
+    async def test_brain_failures_are_reported(self, fake_redis) -> None:
+        """Test failed turns are counted and release the mutex."""
+        harness = LoadHarness(
+            fake_redis,
+            HarnessConfig(brain_latency=BrainLatency(median_ms=1, sigma=0, error_rate=1.0)),
+            turn_manager=TurnManager(min_wait_ms=10, max_wait_ms=20),
+        )
+
+        report = await harness.run([_trace(TENANT_A, "email", [0, 50])])
+
+        assert report.overall.turns == 2
+        assert report.overall.failed == 2
+        assert TENANT_A in report.format_table()
@@ -3,11 +3,14 @@
 Tests cover:
 - Lock acquisition and release
 - Context manager behavior
-- Force release and extension
+- Force release, extension and lease heartbeat
 - Direct acquire/release for Hatchet workflows
+- Token-checked release, fencing tokens and waiter wake-up
 - Session key building
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
@@ -24,13 +27,7 @@ def mock_redis():
     """Create mock Redis client."""
     redis = AsyncMock()
 
-    # Mock lock object
-    mock_lock = AsyncMock()
-    mock_lock.acquire = AsyncMock(return_value=True)
-    mock_lock.release = AsyncMock()
-    mock_lock.extend = AsyncMock(return_value=True)
-
-    redis.lock = MagicMock(return_value=mock_lock)
+    redis.register_script = MagicMock(return_value=AsyncMock(return_value=[1, 1]))
     redis.exists = AsyncMock(return_value=0)
     redis.delete = AsyncMock(return_value=1)
 
@@ -47,6 +44,16 @@ def mutex(mock_redis):
     )
 
 
+@pytest.fixture
+def fake_mutex(fake_redis):
+    """Create SessionMutex over the in-process Redis."""
+    return SessionMutex(
+        redis=fake_redis,
+        lock_timeout=30,
+        blocking_timeout=1.0,
+    )
+
+
 # =============================================================================
 # Tests: SessionMutex initialization
 # =============================================================================
@@ -97,40 +104,27 @@ class TestSessionMutexAcquire:
     """Tests for acquire context manager."""
 
     @pytest.mark.asyncio
-    async def test_acquires_lock_successfully(self, mutex, mock_redis):
+    async def test_acquires_lock_successfully(self, fake_mutex):
         """Acquires lock and yields True."""
-        async with mutex.acquire("test:session") as acquired:
+        async with fake_mutex.acquire("test:session") as acquired:
             assert acquired is True
 
     @pytest.mark.asyncio
-    async def test_yields_false_when_lock_unavailable(self, mutex, mock_redis):
+    async def test_yields_false_when_lock_unavailable(self, fake_mutex):
         """Yields False when lock cannot be acquired."""
-        mock_lock = mock_redis.lock.return_value
-        mock_lock.acquire = AsyncMock(return_value=False)
+        await fake_mutex.acquire_direct("test:session")
 
-        async with mutex.acquire("test:session") as acquired:
+        async with fake_mutex.acquire("test:session", blocking_timeout=0.05) as acquired:
             assert acquired is False
 
     @pytest.mark.asyncio
-    async def test_releases_lock_on_exit(self, mutex, mock_redis):
+    async def test_releases_lock_on_exit(self, fake_mutex):
         """Releases lock when exiting context."""
-        mock_lock = mock_redis.lock.return_value
-
-        async with mutex.acquire("test:session") as acquired:
+        async with fake_mutex.acquire("test:session") as acquired:
             assert acquired is True
+            assert await fake_mutex.is_locked("test:session") is True
 
-        mock_lock.release.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_uses_custom_blocking_timeout(self, mutex, mock_redis):
-        """Uses custom blocking timeout when provided."""
-        async with mutex.acquire("test:session", blocking_timeout=15.0):
-            pass
-
-        # Verify lock was created with custom timeout
-        mock_redis.lock.assert_called_once()
-        call_kwargs = mock_redis.lock.call_args.kwargs
-        assert call_kwargs["blocking_timeout"] == 15.0
+        assert await fake_mutex.is_locked("test:session") is False
 
 
 # =============================================================================
@@ -190,32 +184,42 @@ class TestSessionMutexForceRelease:
 
 
 # =============================================================================
-# Tests: SessionMutex.extend()
+# Tests: SessionMutex.extend() and heartbeat()
 # =============================================================================
 
 
 class TestSessionMutexExtend:
-    """Tests for lock extension."""
+    """Tests for lease renewal."""
 
     @pytest.mark.asyncio
-    async def test_extends_lock_timeout(self, mutex, mock_redis):
-        """Extends lock timeout successfully."""
-        mock_lock = mock_redis.lock.return_value
-        mock_lock.extend = AsyncMock(return_value=True)
+    async def test_extends_lease_for_holder(self, fake_mutex, fake_redis):
+        """Renews the lease when the token holds the lock."""
+        lease = await fake_mutex.acquire_direct("test:session")
 
-        result = await mutex.extend("test:session", additional_time=60)
+        result = await fake_mutex.extend("test:session", lease.token, lease_time=60)
 
         assert result is True
-        mock_lock.extend.assert_called_with(60)
+        assert fake_redis._pttl(lease.lock_key) > 30_000
 
     @pytest.mark.asyncio
-    async def test_uses_default_extension_time(self, mutex, mock_redis):
-        """Uses default 30 second extension."""
-        mock_lock = mock_redis.lock.return_value
+    async def test_rejects_other_token(self, fake_mutex):
+        """Does not renew a lock held by someone else."""
+        await fake_mutex.acquire_direct("test:session")
+
+        assert await fake_mutex.extend("test:session", "not-the-holder") is False
 
-        await mutex.extend("test:session")
+    @pytest.mark.asyncio
+    async def test_heartbeat_keeps_lease_alive(self, fake_redis):
+        """Lease outlives its timeout while the heartbeat runs."""
+        mutex = SessionMutex(redis=fake_redis, lock_timeout=0.2, blocking_timeout=0.05)
+        lease = await mutex.acquire_direct("test:session")
 
-        mock_lock.extend.assert_called_with(30)
+        async with mutex.heartbeat("test:session", lease.token, interval=0.05):
+            await asyncio.sleep(0.4)
+            assert await mutex.holds("test:session", lease.token) is True
+
+        await asyncio.sleep(0.3)
+        assert await mutex.holds("test:session", lease.token) is False
 
 
 # =============================================================================
@@ -227,33 +231,61 @@ class TestSessionMutexAcquireDirect:
     """Tests for direct lock acquisition (Hatchet workflows)."""
 
     @pytest.mark.asyncio
-    async def test_returns_lock_key_on_success(self, mutex, mock_redis):
-        """Returns lock key when acquisition succeeds."""
-        mock_lock = mock_redis.lock.return_value
-        mock_lock.acquire = AsyncMock(return_value=True)
+    async def test_returns_lease_on_success(self, fake_mutex):
+        """Returns a lease with lock key, token and fence."""
+        lease = await fake_mutex.acquire_direct("test:session")
+
+        assert lease.lock_key == "sesslock:test:session"
+        assert lease.session_key == "test:session"
+        assert lease.token
+        assert lease.fence == 1
 
-        result = await mutex.acquire_direct("test:session")
+    @pytest.mark.asyncio
+    async def test_returns_none_on_timeout(self, fake_mutex):
+        """Returns None when the lock stays held."""
+        await fake_mutex.acquire_direct("test:session")
 
-        assert result == "sesslock:test:session"
+        assert await fake_mutex.acquire_direct("test:session", blocking_timeout=0.05) is None
 
     @pytest.mark.asyncio
-    async def test_returns_none_on_failure(self, mutex, mock_redis):
-        """Returns None when acquisition fails."""
-        mock_lock = mock_redis.lock.return_value
-        mock_lock.acquire = AsyncMock(return_value=False)
+    async def test_fence_increases_per_acquisition(self, fake_mutex):
+        """Each acquisition of a session gets a higher fence."""
+        first = await fake_mutex.acquire_direct("test:session")
+        await fake_mutex.release_direct(first.lock_key, first.token)
+        second = await fake_mutex.acquire_direct("test:session")
 
-        result = await mutex.acquire_direct("test:session")
+        assert second.fence > first.fence
+        assert await fake_mutex.current_fence("test:session") == second.fence
+        assert await fake_mutex.current_fence("other:session") == 0
 
-        assert result is None
+    @pytest.mark.asyncio
+    async def test_waiter_is_woken_by_release(self, fake_mutex, fake_redis):
+        """A blocked waiter acquires right after release, without polling."""
+        holder = await fake_mutex.acquire_direct("test:session")
+        waiter = asyncio.create_task(fake_mutex.acquire_direct("test:session"))
+        await asyncio.sleep(0.05)
+
+        loop = asyncio.get_running_loop()
+        released_at = loop.time()
+        await fake_mutex.release_direct(holder.lock_key, holder.token)
+        lease = await waiter
+
+        assert lease is not None
+        assert loop.time() - released_at < 0.05
+        assert fake_redis.commands.count("blpop") == 1
 
     @pytest.mark.asyncio
-    async def test_uses_custom_blocking_timeout(self, mutex, mock_redis):
-        """Uses custom blocking timeout."""
-        mock_lock = mock_redis.lock.return_value
+    async def test_waiter_takes_over_expired_lease(self, fake_redis):
+        """A crashed holder delays waiters only until its lease expires."""
+        mutex = SessionMutex(redis=fake_redis, lock_timeout=0.1, blocking_timeout=2.0)
+        await mutex.acquire_direct("test:session")
 
-        await mutex.acquire_direct("test:session", blocking_timeout=20.0)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        lease = await mutex.acquire_direct("test:session")
 
-        mock_lock.acquire.assert_called_with(blocking_timeout=20.0)
+        assert lease is not None
+        assert loop.time() - started < 0.5
 
 
 # =============================================================================
@@ -265,11 +297,31 @@ class TestSessionMutexReleaseDirect:
     """Tests for direct lock release."""
 
     @pytest.mark.asyncio
-    async def test_deletes_lock_key(self, mutex, mock_redis):
-        """Deletes the lock key directly."""
+    async def test_releases_with_holder_token(self, fake_mutex):
+        """Releases the lock held by the token."""
+        lease = await fake_mutex.acquire_direct("test:session")
+
+        assert await fake_mutex.release_direct(lease.lock_key, lease.token) is True
+        assert await fake_mutex.is_locked("test:session") is False
+
+    @pytest.mark.asyncio
+    async def test_expired_holder_cannot_release_next_holder(self, fake_redis):
+        """A holder whose lease expired leaves the new holder's lock alone."""
+        mutex = SessionMutex(redis=fake_redis, lock_timeout=0.05, blocking_timeout=1.0)
+        stale = await mutex.acquire_direct("test:session")
+        await asyncio.sleep(0.1)
+        current = await mutex.acquire_direct("test:session")
+
+        assert await mutex.release_direct(stale.lock_key, stale.token) is False
+        assert await mutex.holds("test:session", current.token) is True
+
+    @pytest.mark.asyncio
+    async def test_deletes_lock_key_without_token(self, mutex, mock_redis):
+        """Deletes the lock key when no token is given (pre-token step outputs)."""
         await mutex.release_direct("sesslock:test:session")
 
         mock_redis.delete.assert_called_with("sesslock:test:session")
+        mock_redis.rpush.assert_called_with("sesswake:test:session", "1")
 
 
 # =============================================================================
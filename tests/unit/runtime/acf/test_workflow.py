@@ -40,6 +40,9 @@ def mock_redis():
     redis.exists = AsyncMock(return_value=0)
     redis.delete = AsyncMock(return_value=1)
 
+    # Mutex Lua scripts: acquire returns (acquired, fence), release/extend succeed
+    redis.register_script = MagicMock(return_value=AsyncMock(return_value=[1, 1]))
+
     return redis
 
 
@@ -92,7 +95,7 @@ def workflow(
     mock_audit_store,
 ):
     """Create workflow instance with mocks."""
-    return LogicalTurnWorkflow(
+    workflow = LogicalTurnWorkflow(
         redis=mock_redis,
         agent_runtime=mock_agent_runtime,
         session_store=mock_session_store,
@@ -101,6 +104,8 @@ def workflow(
         mutex_timeout=30,
         mutex_blocking_timeout=5.0,
     )
+    workflow._mutex.holds = AsyncMock(return_value=True)
+    return workflow
 
 
 @pytest.fixture
@@ -221,6 +226,8 @@ class TestWorkflowAcquireMutex:
         result = await workflow.acquire_mutex("tenant:agent:customer:web")
 
         assert result["status"] == "locked"
+        assert result["lock_token"]
+        assert result["fence"] == 1
         assert result["session_key"] == "tenant:agent:customer:web"
         assert "lock_key" in result
         assert "locked_at" in result
@@ -467,6 +474,29 @@ class TestWorkflowCommitAndRespond:
         mock_redis.delete.assert_called()
 
 
+    @pytest.mark.asyncio
+    async def test_skips_commit_when_lease_lost(self, workflow, mock_audit_store):
+        """Commits nothing when another turn took over the session lock."""
+        workflow._mutex.holds = AsyncMock(return_value=False)
+        workflow._mutex.release_direct = AsyncMock(return_value=False)
+
+        result = await workflow.commit_and_respond(
+            pipeline_output={
+                "status": "complete",
+                "turn": {"id": str(uuid4()), "messages": []},
+                "response": "Late answer",
+            },
+            lock_key="sesslock:test:session",
+            session_key="test:session",
+            lock_token="stale-token",
+        )
+
+        assert result["status"] == "superseded"
+        assert result["response_sent"] is False
+        mock_audit_store.save_turn_record.assert_not_called()
+        workflow._mutex.release_direct.assert_called_with("sesslock:test:session", "stale-token")
+
+
 # =============================================================================
 # Tests: LogicalTurnWorkflow.on_failure()
 # =============================================================================
@@ -528,17 +558,20 @@ class TestWorkflowRun:
         assert "lock" in output.error.lower()
 
     @pytest.mark.asyncio
-    async def test_releases_mutex_on_exception(self, workflow, sample_input, mock_redis):
+    async def test_releases_mutex_on_exception(self, workflow, sample_input):
         """Releases mutex when exception occurs during processing."""
         workflow._agent_runtime.get_or_create = AsyncMock(
             side_effect=RuntimeError("Runtime error")
         )
+        workflow._mutex.release_direct = AsyncMock(return_value=True)
 
         output = await workflow.run(sample_input)
 
         assert output.status == "failed"
-        # Mutex should have been released via on_failure
-        mock_redis.delete.assert_called()
+        # Mutex should have been released via on_failure, with the holder token
+        lock_key, token = workflow._mutex.release_direct.call_args.args
+        assert lock_key == f"sesslock:{sample_input.get_session_key()}"
+        assert token is not None
 
     @pytest.mark.asyncio
     async def test_generates_unique_turn_id(self, workflow, sample_input):
@@ -572,6 +605,22 @@ class TestWorkflowRouteEvent:
         # Should not raise
         await workflow._route_event(event)
 
+    @pytest.mark.asyncio
+    async def test_forwards_event_to_router(self, workflow):
+        """Forwards events to the configured EventRouter."""
+        from ruche.runtime.acf.events import ACFEvent, ACFEventType
+
+        workflow._event_router = AsyncMock()
+        event = ACFEvent(
+            type=ACFEventType.TOOL_EXECUTED,
+            logical_turn_id=uuid4(),
+            session_key="test:session",
+        )
+
+        await workflow._route_event(event)
+
+        workflow._event_router.route.assert_awaited_once_with(event)
+
     @pytest.mark.asyncio
     async def test_logs_warning_for_invalid_event(self, workflow):
         """Logs warning for non-ACFEvent objects."""
@@ -141,6 +141,7 @@ class TestAgendaScheduler:
 
         try:
             await scheduler._process_due_tasks()
+            await scheduler.join()
         except Exception as e:
             pytest.fail(f"_process_due_tasks raised exception: {e}")
 
@@ -159,3 +160,134 @@ class TestAgendaScheduler:
 
         await scheduler.stop()
         assert scheduler._running is False
+
+    async def test_process_due_tasks_bounded_concurrency(self, task_store):
+        """Claimed tasks run concurrently up to max_concurrency."""
+        active = 0
+        peak = 0
+
+        class SlowWorkflow:
+            async def execute(self, task: Task) -> dict:
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return {"status": "complete"}
+
+        scheduler = AgendaScheduler(
+            task_store=task_store,
+            task_workflow=SlowWorkflow(),
+            max_tasks_per_batch=10,
+            max_concurrency=2,
+        )
+        for _ in range(5):
+            await task_store.save(
+                Task(
+                    tenant_id=uuid4(),
+                    agent_id=uuid4(),
+                    task_type=TaskType.FOLLOW_UP,
+                    scheduled_for=datetime.now(UTC) - timedelta(minutes=1),
+                )
+            )
+        scheduler._running = True
+
+        claimed = await scheduler._process_due_tasks()
+
+        # Only as many tasks as there are free slots are claimed
+        assert claimed == 2
+        assert await scheduler._process_due_tasks() == 0
+        waiting = await task_store.get_due_tasks(datetime.now(UTC), limit=10)
+        assert len(waiting) == 3
+
+        await scheduler.join()
+        assert peak == 2
+
+    async def test_freed_slot_claims_next_task(self, task_store, task_workflow):
+        """The poll loop claims waiting tasks as soon as a slot frees up."""
+        scheduler = AgendaScheduler(
+            task_store=task_store,
+            task_workflow=task_workflow,
+            poll_interval_seconds=60,
+            max_concurrency=1,
+        )
+        for _ in range(3):
+            await task_store.save(
+                Task(
+                    tenant_id=uuid4(),
+                    agent_id=uuid4(),
+                    task_type=TaskType.FOLLOW_UP,
+                    scheduled_for=datetime.now(UTC) - timedelta(minutes=1),
+                )
+            )
+
+        await scheduler.start()
+        try:
+            for _ in range(50):
+                if len(task_workflow.executed_tasks) == 3:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await scheduler.stop()
+
+        assert len(task_workflow.executed_tasks) == 3
+
+    async def test_lease_renewed_while_task_runs(self, task_store):
+        """A task outliving its lease keeps its claim through the heartbeat."""
+        release = asyncio.Event()
+
+        class BlockingWorkflow:
+            async def execute(self, task: Task) -> dict:
+                await release.wait()
+                return {"status": "complete"}
+
+        scheduler = AgendaScheduler(
+            task_store=task_store,
+            task_workflow=BlockingWorkflow(),
+            lease_seconds=0.03,
+        )
+        task = Task(
+            tenant_id=uuid4(),
+            agent_id=uuid4(),
+            task_type=TaskType.FOLLOW_UP,
+            scheduled_for=datetime.now(UTC) - timedelta(minutes=1),
+        )
+        await task_store.save(task)
+        scheduler._running = True
+
+        await scheduler._process_due_tasks()
+        await asyncio.sleep(0.1)
+        reclaimed = await task_store.claim_due_tasks(datetime.now(UTC), limit=10)
+        release.set()
+        await scheduler.join()
+
+        assert reclaimed == []
+
+    async def test_scheduler_wakes_for_newly_scheduled_task(self, task_store, task_workflow):
+        """A task scheduled while idle runs without waiting for the poll interval."""
+        scheduler = AgendaScheduler(
+            task_store=task_store,
+            task_workflow=task_workflow,
+            poll_interval_seconds=60,
+        )
+        await scheduler.start()
+        try:
+            await asyncio.sleep(0.01)
+            tenant_id = uuid4()
+            agent_id = uuid4()
+            task = Task(
+                tenant_id=tenant_id,
+                agent_id=agent_id,
+                task_type=TaskType.REMINDER,
+                scheduled_for=datetime.now(UTC) + timedelta(milliseconds=50),
+            )
+            await scheduler.schedule_task(tenant_id, agent_id, task)
+
+            for _ in range(50):
+                if task_workflow.executed_tasks:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await scheduler.stop()
+
+        assert [t.id for t in task_workflow.executed_tasks] == [task.id]
@@ -5,7 +5,7 @@ from uuid import uuid4
 
 import pytest
 
-from ruche.domain.agenda import Task, TaskPriority, TaskStatus, TaskType
+from ruche.domain.agenda import Task, TaskStatus, TaskType
 from ruche.runtime.agenda.stores.inmemory import InMemoryTaskStore
 
 
@@ -199,3 +199,107 @@ class TestInMemoryTaskStore:
         updated = await task_store.get(task.id)
         assert updated.status == TaskStatus.COMPLETED
         assert updated.completed_at is not None
+
+    async def test_claim_due_tasks_marks_running(self, task_store):
+        """Claimed tasks are RUNNING and are not claimed again."""
+        now = datetime.now(UTC)
+        task = Task(
+            tenant_id=uuid4(),
+            agent_id=uuid4(),
+            task_type=TaskType.FOLLOW_UP,
+            scheduled_for=now - timedelta(minutes=1),
+        )
+        await task_store.save(task)
+
+        claimed = await task_store.claim_due_tasks(now, limit=10)
+        assert [t.id for t in claimed] == [task.id]
+        assert (await task_store.get(task.id)).status == TaskStatus.RUNNING
+
+        assert await task_store.claim_due_tasks(now, limit=10) == []
+
+    async def test_claim_due_tasks_in_due_order_with_limit(self, task_store):
+        """Claims return the earliest due tasks first."""
+        now = datetime.now(UTC)
+        tasks = [
+            Task(
+                tenant_id=uuid4(),
+                agent_id=uuid4(),
+                task_type=TaskType.REMINDER,
+                scheduled_for=now - timedelta(minutes=minutes),
+            )
+            for minutes in (1, 3, 2)
+        ]
+        for task in tasks:
+            await task_store.save(task)
+
+        claimed = await task_store.claim_due_tasks(now, limit=2)
+        assert [t.id for t in claimed] == [tasks[1].id, tasks[2].id]
+
+    async def test_next_due_at_follows_reschedule(self, task_store):
+        """Rescheduling a task re-indexes its due time."""
+        now = datetime.now(UTC)
+        task = Task(
+            tenant_id=uuid4(),
+            agent_id=uuid4(),
+            task_type=TaskType.FOLLOW_UP,
+            scheduled_for=now + timedelta(hours=1),
+        )
+        await task_store.save(task)
+        assert await task_store.next_due_at() == task.scheduled_for
+
+        later = now + timedelta(hours=2)
+        await task_store.update_status(task.id, TaskStatus.SCHEDULED, scheduled_for=later)
+        assert await task_store.next_due_at() == later
+
+        await task_store.update_status(task.id, TaskStatus.CANCELLED)
+        assert await task_store.next_due_at() is None
+
+    async def test_claim_due_tasks_reclaims_expired_lease(self, task_store):
+        """A RUNNING task whose lease lapsed is claimed again."""
+        now = datetime.now(UTC)
+        task = Task(
+            tenant_id=uuid4(),
+            agent_id=uuid4(),
+            task_type=TaskType.FOLLOW_UP,
+            scheduled_for=now - timedelta(minutes=1),
+        )
+        await task_store.save(task)
+
+        assert len(await task_store.claim_due_tasks(now, limit=10, lease_seconds=0)) == 1
+        reclaimed = await task_store.claim_due_tasks(
+            datetime.now(UTC), limit=10, lease_seconds=60
+        )
+        assert [t.id for t in reclaimed] == [task.id]
+        assert await task_store.claim_due_tasks(datetime.now(UTC), limit=10) == []
+
+    async def test_extend_lease_keeps_task_claimed(self, task_store):
+        """Extending the lease stops the task from being reclaimed."""
+        now = datetime.now(UTC)
+        task = Task(
+            tenant_id=uuid4(),
+            agent_id=uuid4(),
+            task_type=TaskType.FOLLOW_UP,
+            scheduled_for=now - timedelta(minutes=1),
+        )
+        await task_store.save(task)
+
+        await task_store.claim_due_tasks(now, limit=10, lease_seconds=0)
+        await task_store.extend_lease(task.id, 60)
+
+        assert await task_store.claim_due_tasks(datetime.now(UTC), limit=10) == []
+
+    async def test_completed_task_is_not_reclaimed(self, task_store):
+        """Finishing a task drops its lease."""
+        now = datetime.now(UTC)
+        task = Task(
+            tenant_id=uuid4(),
+            agent_id=uuid4(),
+            task_type=TaskType.FOLLOW_UP,
+            scheduled_for=now - timedelta(minutes=1),
+        )
+        await task_store.save(task)
+
+        await task_store.claim_due_tasks(now, limit=10, lease_seconds=0)
+        await task_store.update_status(task.id, TaskStatus.COMPLETED)
+
+        assert await task_store.claim_due_tasks(datetime.now(UTC), limit=10) == []
@@ -1,8 +1,10 @@
 """Tests for hybrid scoring utilities."""
 
+import numpy as np
 import pytest
 
 from ruche.utils.hybrid import HybridScorer
+from ruche.utils.vector import cosine_similarities
 
 
 class TestHybridScorer:
@@ -147,3 +149,30 @@ class TestHybridScorer:
         # Should use min_max as fallback
         assert normalized[0] == 1.0
         assert normalized[-1] == 0.0
+
+    def test_combine_arrays_keeps_float32(self):
+        """Test array combination matches the list API and keeps float32."""
+        scorer = HybridScorer(vector_weight=0.7, bm25_weight=0.3)
+        vector_scores = np.array([0.8, 0.6, 0.4], dtype=np.float32)
+        bm25_scores = np.array([10.0, 5.0, 2.0])
+
+        combined = scorer.combine_arrays(vector_scores, bm25_scores)
+
+        assert combined.dtype == np.float32
+        assert combined == pytest.approx(
+            scorer.combine_scores([0.8, 0.6, 0.4], [10.0, 5.0, 2.0]), abs=1e-6
+        )
+
+
+class TestCosineSimilarities:
+    """Test batched cosine similarity."""
+
+    def test_scores_missing_and_mismatched_vectors_zero(self):
+        """Test vectors without a usable embedding score 0.0."""
+        scores = cosine_similarities(
+            [1.0, 0.0], [[2.0, 0.0], None, [0.0, 1.0], [1.0, 0.0, 0.0], [-1.0, 0.0], []]
+        )
+
+        assert scores.dtype == np.float32
+        assert scores.tolist() == [1.0, 0.0, 0.0, 0.0, -1.0, 0.0]
+
@@ -0,0 +1,69 @@
+"""Tests for lazy package facades."""
+
+import subprocess
+import sys
+import types
+
+import pytest
+
+from ruche.utils.lazy import lazy_exports
+
+
+@pytest.fixture
+def facade():
+    """A throwaway package module with lazy exports."""
+    module = types.ModuleType("ruche_test_facade")
+    sys.modules[module.__name__] = module
+    module.__getattr__, module.__dir__ = lazy_exports(
+        module.__name__,
+        {
+            "OrderedDict": "collections",
+            "Dq": "collections:deque",
+            "Missing": "ruche_no_such_module",
+        },
+        optional=["Missing"],
+    )
+    yield module
+    del sys.modules[module.__name__]
+
+
+class TestLazyExports:
+    """Tests for lazy_exports."""
+
+    def test_resolves_and_caches_export(self, facade) -> None:
+        """Exports import on first access and are cached on the module."""
+        from collections import OrderedDict
+
+        assert facade.OrderedDict is OrderedDict
+        assert vars(facade)["OrderedDict"] is OrderedDict
+
+    def test_resolves_alias(self, facade) -> None:
+        """module:attribute targets export under a different name."""
+        from collections import deque
+
+        assert facade.Dq is deque
+
+    def test_optional_export_is_none_when_unavailable(self, facade) -> None:
+        """Optional exports resolve to None when their module is missing."""
+        assert facade.Missing is None
+
+    def test_unknown_attribute_raises(self, facade) -> None:
+        """Unknown names raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = facade.Nope
+
+    def test_dir_lists_exports(self, facade) -> None:
+        """dir() includes unresolved exports."""
+        assert {"OrderedDict", "Dq", "Missing"} <= set(dir(facade))
+
+
+def test_facades_do_not_import_backends() -> None:
+    """Importing package facades does not pull in backend SDKs."""
+    code = (
+        "import sys, ruche.infrastructure, ruche.runtime, ruche.vector;"
+        "print(','.join(m for m in ('qdrant_client', 'asyncpg', 'openai') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
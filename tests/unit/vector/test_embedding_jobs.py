@@ -0,0 +1,257 @@
+"""Tests for the embedding job queue, worker and publish wait."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from ruche.api.services.publish import PublishService
+from ruche.brains.focal.models import Intent, PublishJob, Rule
+from ruche.brains.focal.stores import InMemoryAgentConfigStore
+from ruche.config.models.jobs import EmbeddingJobsConfig
+from ruche.infrastructure.providers.embedding import EmbeddingProvider, EmbeddingResponse
+from ruche.vector.embedding_manager import EmbeddingManager
+from ruche.vector.jobs import EmbeddingJob, EmbeddingJobWorker, InMemoryEmbeddingJobQueue
+from ruche.vector.stores.base import EntityType, VectorDocument
+from ruche.vector.stores.inmemory import InMemoryVectorStore
+
+
+class CountingEmbeddingProvider(EmbeddingProvider):
+    """Provider embedding each text as [len(text), 1.0], recording batches."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    @property
+    def provider_name(self) -> str:
+        return "counting"
+
+    @property
+    def dimensions(self) -> int:
+        return 2
+
+    async def embed(self, texts: list[str], **kwargs) -> EmbeddingResponse:
+        self.batches.append(texts)
+        return EmbeddingResponse(
+            embeddings=[[float(len(text)), 1.0] for text in texts],
+            model="counting",
+            dimensions=2,
+        )
+
+
+def _job(tenant_id, agent_id, entity_id=None, *, entity_type=EntityType.RULE) -> EmbeddingJob:
+    return EmbeddingJob.for_entity(tenant_id, agent_id, entity_type, entity_id or uuid4())
+
+
+def _later() -> datetime:
+    return datetime.now(UTC) + timedelta(seconds=1)
+
+
+class TestInMemoryEmbeddingJobQueue:
+    """Tests for coalescing, per-agent claims and completion."""
+
+    @pytest.mark.asyncio
+    async def test_reenqueue_coalesces_and_delays(self) -> None:
+        queue = InMemoryEmbeddingJobQueue()
+        tenant_id, agent_id, rule_id = uuid4(), uuid4(), uuid4()
+
+        await queue.enqueue([_job(tenant_id, agent_id, rule_id)])
+        await queue.enqueue(
+            [
+                EmbeddingJob.for_entity(
+                    tenant_id, agent_id, EntityType.RULE, rule_id, coalesce_ms=60_000
+                )
+            ]
+        )
+
+        assert await queue.pending_count(tenant_id, agent_id) == 1
+        assert await queue.claim(now=_later(), limit=10, lease_seconds=60) == []
+
+    @pytest.mark.asyncio
+    async def test_claim_returns_one_agent_and_leases(self) -> None:
+        queue = InMemoryEmbeddingJobQueue()
+        tenant_id, agent_a, agent_b = uuid4(), uuid4(), uuid4()
+        await queue.enqueue([_job(tenant_id, agent_a) for _ in range(3)])
+        await queue.enqueue([_job(tenant_id, agent_b) for _ in range(2)])
+
+        first = await queue.claim(now=_later(), limit=10, lease_seconds=60)
+        second = await queue.claim(now=_later(), limit=10, lease_seconds=60)
+        third = await queue.claim(now=_later(), limit=10, lease_seconds=60)
+
+        assert {job.agent_id for job in first} == {agent_a}
+        assert len(first) == 3
+        assert {job.agent_id for job in second} == {agent_b}
+        assert third == []
+
+    @pytest.mark.asyncio
+    async def test_complete_keeps_job_reenqueued_during_claim(self) -> None:
+        queue = InMemoryEmbeddingJobQueue()
+        tenant_id, agent_id, rule_id = uuid4(), uuid4(), uuid4()
+        await queue.enqueue([_job(tenant_id, agent_id, rule_id)])
+        claimed = await queue.claim(now=_later(), limit=10, lease_seconds=60)
+
+        await queue.enqueue([_job(tenant_id, agent_id, rule_id)])
+        await queue.complete(claimed)
+
+        assert await queue.pending_count(tenant_id, agent_id) == 1
+
+    @pytest.mark.asyncio
+    async def test_release_delays_and_counts_attempt(self) -> None:
+        queue = InMemoryEmbeddingJobQueue()
+        tenant_id, agent_id = uuid4(), uuid4()
+        await queue.enqueue([_job(tenant_id, agent_id)])
+        claimed = await queue.claim(now=_later(), limit=10, lease_seconds=60)
+
+        retry_at = datetime.now(UTC) + timedelta(minutes=5)
+        await queue.release(claimed, retry_at=retry_at)
+
+        assert await queue.claim(now=_later(), limit=10, lease_seconds=60) == []
+        retried = await queue.claim(now=retry_at + timedelta(seconds=1), limit=10, lease_seconds=60)
+        assert retried[0].attempts == 1
+
+
+class TestEmbeddingJobWorker:
+    """Tests for batched embedding and write-back."""
+
+    @pytest.fixture
+    def config_store(self) -> InMemoryAgentConfigStore:
+        return InMemoryAgentConfigStore()
+
+    @pytest.fixture
+    def provider(self) -> CountingEmbeddingProvider:
+        return CountingEmbeddingProvider()
+
+    @pytest.fixture
+    def queue(self) -> InMemoryEmbeddingJobQueue:
+        return InMemoryEmbeddingJobQueue()
+
+    @pytest.mark.asyncio
+    async def test_many_rules_embedded_in_one_batch(self, config_store, provider, queue) -> None:
+        tenant_id, agent_id = uuid4(), uuid4()
+        rules = [
+            Rule(
+                tenant_id=tenant_id,
+                agent_id=agent_id,
+                name=f"rule-{i}",
+                condition_text=f"condition {i}",
+                action_text="act",
+            )
+            for i in range(50)
+        ]
+        for rule in rules:
+            await config_store.save_rule(rule)
+        await queue.enqueue([_job(tenant_id, agent_id, rule.id) for rule in rules])
+        vector_store = InMemoryVectorStore()
+        worker = EmbeddingJobWorker(
+            queue,
+            config_store,
+            provider,
+            EmbeddingManager(vector_store, provider),
+            EmbeddingJobsConfig(coalesce_ms=0),
+        )
+
+        claimed = await worker.run_once()
+
+        assert claimed == 50
+        assert len(provider.batches) == 1
+        saved = await config_store.get_rules(tenant_id, agent_id, enabled_only=False)
+        assert all(rule.embedding is not None for rule in saved)
+        assert all(rule.embedding_model == "counting" for rule in saved)
+        docs = await vector_store.get(
+            [VectorDocument.create_id(EntityType.RULE, rule.id) for rule in rules]
+        )
+        assert len(docs) == 50
+        assert await queue.pending_count(tenant_id, agent_id) == 0
+
+    @pytest.mark.asyncio
+    async def test_intent_embedding_is_mean_of_phrases(self, config_store, provider, queue) -> None:
+        tenant_id, agent_id = uuid4(), uuid4()
+        now = datetime.now(UTC)
+        intent = Intent(
+            id=uuid4(),
+            tenant_id=tenant_id,
+            agent_id=agent_id,
+            name="refund",
+            example_phrases=["ab", "abcd"],
+            created_at=now,
+            updated_at=now,
+        )
+        await config_store.save_intent(intent)
+        await queue.enqueue([_job(tenant_id, agent_id, intent.id, entity_type=EntityType.INTENT)])
+
+        await EmbeddingJobWorker(queue, config_store, provider).run_once()
+
+        saved = await config_store.get_intent(tenant_id, intent.id)
+        assert saved.embedding == [3.0, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_failure_releases_then_drops(self, config_store, queue) -> None:
+        class FailingProvider(CountingEmbeddingProvider):
+            async def embed(self, texts: list[str], **kwargs) -> EmbeddingResponse:
+                raise RuntimeError("provider down")
+
+        tenant_id, agent_id = uuid4(), uuid4()
+        rule = Rule(
+            tenant_id=tenant_id,
+            agent_id=agent_id,
+            name="r",
+            condition_text="c",
+            action_text="a",
+        )
+        await config_store.save_rule(rule)
+        await queue.enqueue([_job(tenant_id, agent_id, rule.id)])
+        worker = EmbeddingJobWorker(
+            queue,
+            config_store,
+            FailingProvider(),
+            config=EmbeddingJobsConfig(max_attempts=2, retry_backoff_seconds=0),
+        )
+
+        await worker.run_once()
+        assert await queue.pending_count(tenant_id, agent_id) == 1
+        await worker.run_once()
+        assert await queue.pending_count(tenant_id, agent_id) == 0
+
+
+    @pytest.mark.asyncio
+    async def test_notify_during_next_ready_lookup_wakes_worker(
+        self, config_store, provider, queue
+    ) -> None:
+        worker = EmbeddingJobWorker(
+            queue, config_store, provider, config=EmbeddingJobsConfig(poll_interval_ms=60_000)
+        )
+        next_ready_at = queue.next_ready_at
+
+        async def notify_during_lookup():
+            worker.notify()
+            return await next_ready_at()
+
+        queue.next_ready_at = notify_during_lookup
+
+        await asyncio.wait_for(worker._wait_for_next_ready(), timeout=1.0)
+
+
+class TestPublishEmbeddingWait:
+    """Tests for publish waiting on pending embeddings."""
+
+    @pytest.mark.asyncio
+    async def test_compile_fails_while_embeddings_pending(self) -> None:
+        tenant_id, agent_id = uuid4(), uuid4()
+        queue = InMemoryEmbeddingJobQueue()
+        await queue.enqueue([_job(tenant_id, agent_id)])
+        service = PublishService(
+            InMemoryAgentConfigStore(),
+            queue,
+            embedding_wait_seconds=0.05,
+            embedding_poll_seconds=0.01,
+        )
+        job = PublishJob.create_with_stages(
+            tenant_id=tenant_id, agent_id=agent_id, version=2, started_at=datetime.now(UTC)
+        )
+
+        with pytest.raises(TimeoutError, match="1 embeddings still pending"):
+            await service._execute_stage(job, "compile")
+
+        await queue.complete(await queue.claim(now=_later(), limit=10, lease_seconds=60))
+        await service._execute_stage(job, "compile")